@@ -0,0 +1,108 @@
+"""carts_archive_table
+
+Revision ID: 566ded42288d
+Revises: f82269e25cac
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "566ded42288d"
+down_revision: Union[str, None] = "f82269e25cac"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only the archive is partitioned by created_at, the live carts, cart_items,
+    # carts_coupons and cart_notifications tables are not. A partitioned table's unique
+    # constraints have to include the partition key, so the one active cart per user
+    # index and the carts.id key the other tables reference would have to include
+    # created_at and stop guaranteeing anything. The live tables are kept small by
+    # moving the terminal carts into the archive instead, which the index below helps
+    # to find.
+    op.create_index(
+        "idx_carts_status_created_at",
+        "carts",
+        ["status", "created_at"],
+        unique=False,
+        schema="content",
+    )
+    op.create_table(
+        "carts_archive",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column(
+            "archived_at",
+            sa.DateTime(),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            postgresql.ENUM(name="cart_status_enum", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("data", postgresql.JSONB, nullable=False),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        schema="content",
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.create_index(
+        "idx_carts_archive_user_id",
+        "carts_archive",
+        ["user_id"],
+        unique=False,
+        schema="content",
+    )
+    op.execute(
+        "CREATE TABLE content.carts_archive_default "
+        "PARTITION OF content.carts_archive DEFAULT"
+    )
+    # Monthly partitions are created on demand by the archival job, right before it moves
+    # the carts of the covered months.
+    op.execute(
+        """
+        CREATE FUNCTION content.create_carts_archive_partitions(till timestamptz)
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            month_start timestamp;
+        BEGIN
+            SELECT date_trunc('month', min(created_at))
+            INTO month_start
+            FROM content.carts
+            WHERE status IN ('COMPLETED', 'DEACTIVATED') AND created_at < till;
+
+            WHILE month_start IS NOT NULL AND month_start < till LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS content.%I '
+                    'PARTITION OF content.carts_archive FOR VALUES FROM (%L) TO (%L)',
+                    'carts_archive_' || to_char(month_start, 'YYYY_MM'),
+                    month_start,
+                    month_start + interval '1 month'
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END;
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION content.create_carts_archive_partitions(timestamptz)")
+    op.drop_index(
+        "idx_carts_archive_user_id", table_name="carts_archive", schema="content"
+    )
+    op.drop_table("carts_archive", schema="content")
+    op.drop_index("idx_carts_status_created_at", table_name="carts", schema="content")
@@ -0,0 +1,71 @@
+"""cart_notifications_idempotency_key
+
+Revision ID: d7e1f3a9b2c4
+Revises: b4c0e4832a32
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7e1f3a9b2c4"
+down_revision: Union[str, None] = "b4c0e4832a32"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "cart_notifications",
+        sa.Column("cycle", sa.Integer(), server_default="1", nullable=False),
+        schema="content",
+    )
+    # already sent notifications are numbered in the order they were sent
+    op.execute(
+        """
+        UPDATE content.cart_notifications AS n
+        SET cycle = numbered.cycle
+        FROM (
+            SELECT
+                id,
+                row_number() OVER (PARTITION BY cart_id, type ORDER BY sent_at) AS cycle
+            FROM content.cart_notifications
+        ) AS numbered
+        WHERE n.id = numbered.id
+        """
+    )
+    op.alter_column(
+        "cart_notifications",
+        "sent_at",
+        existing_type=sa.DateTime(),
+        nullable=True,
+        schema="content",
+    )
+    op.create_index(
+        "idx_cart_notifications_idempotency_key",
+        "cart_notifications",
+        ["cart_id", "type", "cycle"],
+        unique=True,
+        schema="content",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_cart_notifications_idempotency_key",
+        table_name="cart_notifications",
+        schema="content",
+    )
+    op.execute("DELETE FROM content.cart_notifications WHERE sent_at IS NULL")
+    op.alter_column(
+        "cart_notifications",
+        "sent_at",
+        existing_type=sa.DateTime(),
+        nullable=False,
+        schema="content",
+    )
+    op.drop_column("cart_notifications", "cycle", schema="content")
@@ -0,0 +1,37 @@
+"""cart_items_pkey_cart_id_first
+
+Revision ID: 3f9c2d7a1e5b
+Revises: d7e1f3a9b2c4
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c2d7a1e5b"
+down_revision: Union[str, None] = "d7e1f3a9b2c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Every per-cart query filters by cart_id, so it leads the key. The table is locked
+    # while the index is rebuilt.
+    op.execute(
+        "ALTER TABLE content.cart_items "
+        "DROP CONSTRAINT cart_items_pkey, "
+        "ADD CONSTRAINT cart_items_pkey PRIMARY KEY (cart_id, id)"
+    )
+    # Only marks the index, so a maintenance `CLUSTER content.cart_items` stores the
+    # items of a cart together.
+    op.execute("ALTER TABLE content.cart_items CLUSTER ON cart_items_pkey")
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE content.cart_items "
+        "DROP CONSTRAINT cart_items_pkey, "
+        "ADD CONSTRAINT cart_items_pkey PRIMARY KEY (id, cart_id)"
+    )
@@ -0,0 +1,77 @@
+"""versioned_cart_item_limits
+
+Revision ID: a3d7f9b2c6e4
+Revises: f1b9d5e3a7c2
+Create Date: 2026-10-19 23:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3d7f9b2c6e4"
+down_revision: Union[str, None] = "f1b9d5e3a7c2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The limits become a part of the config version they are stored with. The
+    # existing limits belong to the latest version, the limits of the previous ones
+    # were already replaced.
+    op.add_column(
+        "cart_item_limits",
+        sa.Column("config_version", sa.Integer(), nullable=True),
+        schema="content",
+    )
+    op.execute(
+        "UPDATE content.cart_item_limits "
+        "SET config_version = (SELECT max(id) FROM content.cart_config)"
+    )
+    op.execute("DELETE FROM content.cart_item_limits WHERE config_version IS NULL")
+    op.alter_column(
+        "cart_item_limits", "config_version", nullable=False, schema="content"
+    )
+    op.drop_constraint(
+        "cart_item_limits_pkey", "cart_item_limits", type_="primary", schema="content"
+    )
+    op.create_primary_key(
+        "cart_item_limits_pkey",
+        "cart_item_limits",
+        ["config_version", "item_id"],
+        schema="content",
+    )
+    op.create_foreign_key(
+        "cart_item_limits_config_version_fkey",
+        "cart_item_limits",
+        "cart_config",
+        ["config_version"],
+        ["id"],
+        source_schema="content",
+        referent_schema="content",
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    # Only the limits of the latest version are the limits of the previous schema.
+    op.execute(
+        "DELETE FROM content.cart_item_limits "
+        "WHERE config_version != (SELECT max(id) FROM content.cart_config)"
+    )
+    op.drop_constraint(
+        "cart_item_limits_config_version_fkey",
+        "cart_item_limits",
+        type_="foreignkey",
+        schema="content",
+    )
+    op.drop_constraint(
+        "cart_item_limits_pkey", "cart_item_limits", type_="primary", schema="content"
+    )
+    op.create_primary_key(
+        "cart_item_limits_pkey", "cart_item_limits", ["item_id"], schema="content"
+    )
+    op.drop_column("cart_item_limits", "config_version", schema="content")
@@ -0,0 +1,92 @@
+"""carts_archive_partitions_lock
+
+Revision ID: fc2c0d75057f
+Revises: a3d7f9b2c6e4
+Create Date: 2026-10-19 23:50:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "fc2c0d75057f"
+down_revision: Union[str, None] = "a3d7f9b2c6e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_CREATE_PARTITION = """
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS content.%I '
+                    'PARTITION OF content.carts_archive FOR VALUES FROM (%L) TO (%L)',
+                    'carts_archive_' || to_char(month_start, 'YYYY_MM'),
+                    month_start,
+                    month_start + interval '1 month'
+                );
+"""
+
+
+def upgrade() -> None:
+    # The bound is a timestamp without time zone, like created_at. Overlapping archive
+    # runs could both miss a partition and fail on creating it twice, so a missing
+    # partition is created under a transaction advisory lock. Existing partitions are
+    # skipped without taking the lock.
+    op.execute("DROP FUNCTION content.create_carts_archive_partitions(timestamptz)")
+    op.execute(
+        f"""
+        CREATE FUNCTION content.create_carts_archive_partitions(till timestamp)
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            month_start timestamp;
+        BEGIN
+            SELECT date_trunc('month', min(created_at))
+            INTO month_start
+            FROM content.carts
+            WHERE status IN ('COMPLETED', 'DEACTIVATED') AND created_at < till;
+
+            WHILE month_start IS NOT NULL AND month_start < till LOOP
+                IF to_regclass(
+                    format(
+                        'content.%I',
+                        'carts_archive_' || to_char(month_start, 'YYYY_MM')
+                    )
+                ) IS NULL THEN
+                    PERFORM pg_advisory_xact_lock(
+                        hashtext('content.create_carts_archive_partitions')
+                    );
+{_CREATE_PARTITION}
+                END IF;
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END;
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION content.create_carts_archive_partitions(timestamp)")
+    op.execute(
+        f"""
+        CREATE FUNCTION content.create_carts_archive_partitions(till timestamptz)
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            month_start timestamp;
+        BEGIN
+            SELECT date_trunc('month', min(created_at))
+            INTO month_start
+            FROM content.carts
+            WHERE status IN ('COMPLETED', 'DEACTIVATED') AND created_at < till;
+
+            WHILE month_start IS NOT NULL AND month_start < till LOOP
+{_CREATE_PARTITION}
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END;
+        $$
+        """
+    )
@@ -1,7 +1,6 @@
 import asyncio
 from contextlib import asynccontextmanager
 from functools import wraps
-from logging.config import dictConfig
 from typing import Any, AsyncContextManager, Callable
 from uuid import UUID
 
@@ -12,7 +11,7 @@ from app.api.cli.items import run_add_item_command
 from app.app_layer.use_cases.cart_items.dto import AddItemToCartInputDTO
 from app.config import Config
 from app.containers import Container
-from app.logging import ctx, get_logging_config
+from app.logging import ctx, setup_logging
 
 app = typer.Typer()
 
@@ -28,12 +27,7 @@ def coro(func: Callable[..., Any]) -> Callable[..., Any]:
 @asynccontextmanager
 async def container() -> AsyncContextManager[Container]:  # pragma: no cover
     config = Config()
-    dictConfig(
-        config=get_logging_config(
-            transaction_ctx=ctx,
-            config=config.LOGGING,
-        ),
-    )
+    setup_logging(transaction_ctx=ctx, config=config.LOGGING)
 
     async with Container.lifespan(wireable_packages=[cli]) as cont:
         yield cont
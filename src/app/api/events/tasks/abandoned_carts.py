@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
@@ -8,25 +9,45 @@ from app.app_layer.interfaces.clients.notifications.exceptions import (
     NotificationsClientError,
 )
 from app.app_layer.use_cases.abandoned_carts_service import AbandonedCartsService
+from app.app_layer.use_cases.notifications_batcher import NotificationsBatcher
 from app.containers import Container
 
 
 @inject
 async def send_abandoned_cart_notification(
-    ctx: [str, Any],
+    ctx: dict[str, Any],
     user_id: int,
     cart_id: UUID,
+    cycle: int = 1,
     service: AbandonedCartsService = Provide[Container.abandoned_carts_service],
+    batcher: NotificationsBatcher = Provide[Container.notifications_batcher],
 ) -> None:
     try:
-        await service.send_notification(user_id=user_id, cart_id=cart_id)
+        await batcher.send_notification(user_id=user_id, cart_id=cart_id, cycle=cycle)
     except NotificationsClientError:
         raise Retry(defer=service.config.retry_delay_sec * ctx["job_try"])
 
 
 @inject
 async def process_abandoned_carts(
-    _ctx: [str, Any],
+    _ctx: dict[str, Any],
     service: AbandonedCartsService = Provide[Container.abandoned_carts_service],
 ) -> None:
     await service.process_abandoned_carts()
+
+
+@inject
+async def process_abandoned_carts_shard(
+    _ctx: dict[str, Any],
+    shard: int,
+    shards_qty: int,
+    updated_after: datetime | None = None,
+    updated_before: datetime | None = None,
+    service: AbandonedCartsService = Provide[Container.abandoned_carts_service],
+) -> None:
+    await service.process_abandoned_carts_shard(
+        shard=shard,
+        shards_qty=shards_qty,
+        updated_after=updated_after,
+        updated_before=updated_before,
+    )
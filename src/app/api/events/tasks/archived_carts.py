@@ -0,0 +1,14 @@
+from typing import Any
+
+from dependency_injector.wiring import Provide, inject
+
+from app.app_layer.use_cases.carts.cart_archive import ArchiveCartsUseCase
+from app.containers import Container
+
+
+@inject
+async def archive_carts(
+    _ctx: dict[str, Any],
+    use_case: ArchiveCartsUseCase = Provide[Container.archive_carts_use_case],
+) -> None:
+    await use_case.execute()
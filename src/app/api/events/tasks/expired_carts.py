@@ -0,0 +1,18 @@
+from typing import Any
+
+from dependency_injector.wiring import Provide, inject
+
+from app.app_layer.use_cases.carts.cart_deactivate_expired import (
+    DeactivateExpiredCartsUseCase,
+)
+from app.containers import Container
+
+
+@inject
+async def deactivate_expired_carts(
+    _ctx: dict[str, Any],
+    use_case: DeactivateExpiredCartsUseCase = Provide[
+        Container.deactivate_expired_carts_use_case
+    ],
+) -> None:
+    await use_case.execute()
@@ -40,6 +40,7 @@ class CartViewModel(BaseModel):
     id: UUID
     user_id: int
     status: CartStatusEnum
+    config_version: int | None = None
     items: list[ItemViewModel]
     items_qty: float
     cost: float
@@ -81,3 +82,4 @@ class CartConfigModelView(BaseModel):
     hours_since_update_until_abandoned: int
     max_abandoned_notifications_qty: int
     abandoned_cart_text: str
+    version: int | None = None
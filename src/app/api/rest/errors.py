@@ -88,3 +88,12 @@ CART_CANT_BE_COMPLETED_HTTP_ERROR = HTTPException(
     status_code=status.HTTP_400_BAD_REQUEST,
     detail={"code": 5003, "message": "The cart can't be completed."},
 )
+CART_BATCH_PROCESSING_HTTP_ERROR = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail={"code": 5004, "message": "The cart couldn't be processed."},
+)
+
+TASK_QUEUES_UNAVAILABLE_HTTP_ERROR = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail={"code": 6000, "message": "Task queues are unavailable."},
+)
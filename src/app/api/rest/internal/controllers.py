@@ -5,3 +5,6 @@ from app.api.rest import internal
 internal_api = APIRouter()
 
 internal_api.include_router(internal.v1.carts.controllers.router, prefix="/v1/carts")
+internal_api.include_router(
+    internal.v1.task_queues.controllers.router, prefix="/v1/task-queues"
+)
@@ -1 +1 @@
-from app.api.rest.internal.v1 import carts  # noqa: F401
+from app.api.rest.internal.v1 import carts, task_queues  # noqa: F401
@@ -1,26 +1,122 @@
+from collections.abc import Mapping
+from typing import Annotated
 from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Body, Depends, HTTPException
 
 from app.api.rest.errors import (
+    CART_BATCH_PROCESSING_HTTP_ERROR,
     CART_CANT_BE_COMPLETED_HTTP_ERROR,
     CART_CANT_BE_LOCKED_HTTP_ERROR,
     CART_CANT_BE_UNLOCKED_HTTP_ERROR,
     CART_IN_PROCESS_HTTP_ERROR,
     RETRIEVE_CART_HTTP_ERROR,
 )
-from app.api.rest.internal.v1.view_models import CartViewModel
+from app.api.rest.internal.v1.view_models import (
+    CartBatchResultViewModel,
+    CartViewModel,
+    ErrorViewModel,
+)
 from app.app_layer.interfaces.distributed_lock_system.exceptions import AlreadyLockedError
+from app.app_layer.use_cases.carts.cart_batch import (
+    BatchCompleteCartUseCase,
+    BatchLockCartUseCase,
+    BatchUnlockCartUseCase,
+)
 from app.app_layer.use_cases.carts.cart_complete import CompleteCartUseCase
 from app.app_layer.use_cases.carts.cart_lock import LockCartUseCase
 from app.app_layer.use_cases.carts.cart_unlock import UnlockCartUseCase
+from app.app_layer.use_cases.carts.dto import CartBatchResultOutputDTO
 from app.containers import Container
 from app.domain.carts.exceptions import CantBeLockedError, ChangeStatusError
 from app.domain.interfaces.repositories.carts.exceptions import CartNotFoundError
 
 router = APIRouter()
 
+MAX_BATCH_SIZE = 100
+
+_LOCK_HTTP_ERRORS = {
+    AlreadyLockedError: CART_IN_PROCESS_HTTP_ERROR,
+    CartNotFoundError: RETRIEVE_CART_HTTP_ERROR,
+    CantBeLockedError: CART_CANT_BE_LOCKED_HTTP_ERROR,
+    ChangeStatusError: CART_CANT_BE_LOCKED_HTTP_ERROR,
+}
+_UNLOCK_HTTP_ERRORS = {
+    AlreadyLockedError: CART_IN_PROCESS_HTTP_ERROR,
+    CartNotFoundError: RETRIEVE_CART_HTTP_ERROR,
+    ChangeStatusError: CART_CANT_BE_UNLOCKED_HTTP_ERROR,
+}
+_COMPLETE_HTTP_ERRORS = {
+    AlreadyLockedError: CART_IN_PROCESS_HTTP_ERROR,
+    CartNotFoundError: RETRIEVE_CART_HTTP_ERROR,
+    ChangeStatusError: CART_CANT_BE_COMPLETED_HTTP_ERROR,
+}
+
+CartIds = Annotated[
+    list[UUID],
+    Body(embed=True, min_length=1, max_length=MAX_BATCH_SIZE),
+]
+
+
+def _get_batch_view_models(
+    results: list[CartBatchResultOutputDTO],
+    http_errors: Mapping[type[Exception], HTTPException],
+) -> list[CartBatchResultViewModel]:
+    return [
+        CartBatchResultViewModel(
+            cart_id=result.cart_id,
+            cart=CartViewModel.model_validate(result.cart) if result.cart else None,
+            error=(
+                ErrorViewModel.model_validate(
+                    http_errors.get(
+                        type(result.error), CART_BATCH_PROCESSING_HTTP_ERROR
+                    ).detail,
+                )
+                if result.error
+                else None
+            ),
+        )
+        for result in results
+    ]
+
+
+@router.post("/batch/lock")
+@inject
+async def batch_lock(
+    cart_ids: CartIds,
+    use_case: BatchLockCartUseCase = Depends(Provide[Container.batch_lock_cart_use_case]),
+) -> list[CartBatchResultViewModel]:
+    results = await use_case.execute(cart_ids=cart_ids)
+
+    return _get_batch_view_models(results=results, http_errors=_LOCK_HTTP_ERRORS)
+
+
+@router.post("/batch/unlock")
+@inject
+async def batch_unlock(
+    cart_ids: CartIds,
+    use_case: BatchUnlockCartUseCase = Depends(
+        Provide[Container.batch_unlock_cart_use_case]
+    ),
+) -> list[CartBatchResultViewModel]:
+    results = await use_case.execute(cart_ids=cart_ids)
+
+    return _get_batch_view_models(results=results, http_errors=_UNLOCK_HTTP_ERRORS)
+
+
+@router.post("/batch/complete")
+@inject
+async def batch_complete(
+    cart_ids: CartIds,
+    use_case: BatchCompleteCartUseCase = Depends(
+        Provide[Container.batch_complete_cart_use_case]
+    ),
+) -> list[CartBatchResultViewModel]:
+    results = await use_case.execute(cart_ids=cart_ids)
+
+    return _get_batch_view_models(results=results, http_errors=_COMPLETE_HTTP_ERRORS)
+
 
 @router.post("/{cart_id}/lock")
 @inject
@@ -0,0 +1 @@
+from app.api.rest.internal.v1.task_queues import controllers  # noqa: F401
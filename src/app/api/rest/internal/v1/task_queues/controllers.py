@@ -0,0 +1,25 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+
+from app.api.rest.errors import TASK_QUEUES_UNAVAILABLE_HTTP_ERROR
+from app.api.rest.internal.v1.view_models import QueueStatsViewModel
+from app.app_layer.interfaces.tasks.exceptions import TaskQueuesMonitorError
+from app.app_layer.use_cases.task_queues.stats import TaskQueuesStatsUseCase
+from app.containers import Container
+
+router = APIRouter()
+
+
+@router.get("")
+@inject
+async def stats(
+    use_case: TaskQueuesStatsUseCase = Depends(
+        Provide[Container.task_queues_stats_use_case]
+    ),
+) -> list[QueueStatsViewModel]:
+    try:
+        result = await use_case.execute()
+    except TaskQueuesMonitorError:
+        raise TASK_QUEUES_UNAVAILABLE_HTTP_ERROR
+
+    return [QueueStatsViewModel.model_validate(queue) for queue in result]
@@ -37,8 +37,30 @@ class CartViewModel(BaseModel):
     id: UUID
     user_id: int
     status: CartStatusEnum
+    config_version: int | None = None
     items: list[ItemViewModel]
     items_qty: float
     cost: float
     checkout_enabled: bool
     coupon: CartCouponViewModel | None = None
+
+
+class ErrorViewModel(BaseModel):
+    code: int
+    message: str
+
+
+class QueueStatsViewModel(BaseModel):
+    class Config:
+        from_attributes = True
+
+    name: str
+    depth: int
+    ready_qty: int
+    lag_sec: float
+
+
+class CartBatchResultViewModel(BaseModel):
+    cart_id: UUID
+    cart: CartViewModel | None = None
+    error: ErrorViewModel | None = None
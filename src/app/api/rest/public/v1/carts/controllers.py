@@ -47,11 +47,15 @@ router = APIRouter()
 @router.post("")
 @inject
 async def create(
+    get_or_create: bool = False,
     auth_data: str = Header(..., alias="Authorization"),
     use_case: CreateCartUseCase = Depends(Provide[Container.create_cart_use_case]),
 ) -> CartViewModel:
     try:
-        result = await use_case.create_by_auth_data(auth_data=auth_data)
+        result = await use_case.create_by_auth_data(
+            auth_data=auth_data,
+            get_or_create=get_or_create,
+        )
     except InvalidAuthDataError:
         raise AUTHORIZATION_HTTP_ERROR
     except ActiveCartAlreadyExistsError:
@@ -60,6 +64,22 @@ async def create(
     return CartViewModel.model_validate(result)
 
 
+@router.get("/me")
+@inject
+async def retrieve_active(
+    auth_data: str = Header(..., alias="Authorization"),
+    use_case: CartRetrieveUseCase = Depends(Provide[Container.cart_retrieve_use_case]),
+) -> CartViewModel:
+    try:
+        result = await use_case.execute_active(auth_data=auth_data)
+    except InvalidAuthDataError:
+        raise AUTHORIZATION_HTTP_ERROR
+    except CartNotFoundError:
+        raise RETRIEVE_CART_HTTP_ERROR
+
+    return CartViewModel.model_validate(result)
+
+
 @router.get("/{cart_id}")
 @inject
 async def retrieve(
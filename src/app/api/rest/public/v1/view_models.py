@@ -37,6 +37,7 @@ class CartViewModel(BaseModel):
     id: UUID
     user_id: int
     status: CartStatusEnum
+    config_version: int | None = None
     items: list[ItemViewModel]
     items_qty: float = Field(alias="items_quantity")
     cost: float
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+
+from app.app_layer.interfaces.active_carts_cache.dto import ActiveCartDTO
+
+
+class IActiveCartsCache(ABC):
+    """
+    A mapping of users to their active carts, each entry is the cart ID with the version
+    of the config the cart was built with. Entries may be stale, so the cart has to be
+    checked after it is retrieved by the cached ID.
+    """
+
+    @abstractmethod
+    async def get(self, user_id: int) -> ActiveCartDTO | None:
+        ...
+
+    @abstractmethod
+    async def set(self, user_id: int, data: ActiveCartDTO) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, user_id: int) -> None:
+        ...
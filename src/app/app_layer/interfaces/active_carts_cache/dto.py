@@ -0,0 +1,8 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ActiveCartDTO(BaseModel):
+    cart_id: UUID
+    config_version: int | None = None
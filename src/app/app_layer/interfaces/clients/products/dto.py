@@ -1,6 +1,8 @@
 from decimal import Decimal
 
-from pydantic import AnyHttpUrl, BaseModel
+from pydantic import AnyHttpUrl, BaseModel, Field
+
+from app.domain.cart_items.value_objects import ITEM_PRICE_SCALE
 
 
 class RatingOutputDTO(BaseModel):
@@ -11,7 +13,7 @@ class RatingOutputDTO(BaseModel):
 class ProductOutputDTO(BaseModel):
     id: int
     title: str
-    price: Decimal
+    price: Decimal = Field(decimal_places=ITEM_PRICE_SCALE)
     description: str
     category: str
     image: AnyHttpUrl
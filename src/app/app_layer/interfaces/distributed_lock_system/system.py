@@ -1,16 +1,48 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
 
 
-class IDistributedLockSystem(ABC):
-    def __call__(self, name: str, *args, **kwargs) -> "IDistributedLockSystem":
+class IDistributedLockHandle(ABC):
+    """
+    A single lock entry. Every handle owns the lock it acquires, so handles can be used
+    concurrently.
+    """
+
+    def __init__(self, name: str) -> None:
         self._name = name
+
+    async def __aenter__(self) -> "IDistributedLockHandle":
+        await self.acquire()
         return self
 
-    async def __aenter__(self) -> "IDistributedLockSystem":
+    async def __aexit__(self, *args: Any, **kwargs: Any) -> None:
+        await self.release()
+
+    @abstractmethod
+    async def acquire(self) -> None:
+        ...
+
+    @abstractmethod
+    async def release(self) -> None:
+        ...
+
+
+class IDistributedBatchLockHandle(ABC):
+    """
+    A single entry into many locks at once. Locks are acquired in one attempt without
+    waiting, the locks that are held by someone else are left out of `acquired`.
+    """
+
+    def __init__(self, names: Sequence[str]) -> None:
+        self._names = tuple(dict.fromkeys(names))
+        self.acquired: frozenset[str] = frozenset()
+
+    async def __aenter__(self) -> "IDistributedBatchLockHandle":
         await self.acquire()
         return self
 
-    async def __aexit__(self, *args, **kwargs) -> None:
+    async def __aexit__(self, *args: Any, **kwargs: Any) -> None:
         await self.release()
 
     @abstractmethod
@@ -20,3 +52,17 @@ class IDistributedLockSystem(ABC):
     @abstractmethod
     async def release(self) -> None:
         ...
+
+
+class IDistributedLockSystem(ABC):
+    @abstractmethod
+    def __call__(self, name: str, *args: Any, **kwargs: Any) -> IDistributedLockHandle:
+        ...
+
+    @abstractmethod
+    def batch(self, names: Sequence[str]) -> IDistributedBatchLockHandle:
+        ...
+
+    @abstractmethod
+    async def lease(self, name: str, ttl_sec: float) -> bool:
+        ...
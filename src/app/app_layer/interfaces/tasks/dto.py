@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class QueueStatsOutputDTO(BaseModel):
+    name: str
+    depth: int
+    ready_qty: int
+    lag_sec: float
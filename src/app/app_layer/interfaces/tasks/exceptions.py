@@ -12,3 +12,7 @@ class TaskProducingError(TaskProducerError):
 
 class TaskIsNotQueuedError(TaskProducerError):
     pass
+
+
+class TaskQueuesMonitorError(Exception):
+    pass
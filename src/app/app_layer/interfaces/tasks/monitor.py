@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+from app.app_layer.interfaces.tasks.dto import QueueStatsOutputDTO
+
+
+class ITaskQueuesMonitor(ABC):
+    @abstractmethod
+    async def get_stats(self) -> list[QueueStatsOutputDTO]:
+        ...
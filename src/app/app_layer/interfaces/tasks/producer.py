@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
 
@@ -12,5 +13,16 @@ class ITaskProducer(ABC):
         self,
         user_id: int,
         cart_id: UUID,
+        cycle: int,
+    ) -> None:
+        ...
+
+    @abstractmethod
+    async def enqueue_abandoned_carts_shard_task(
+        self,
+        shard: int,
+        shards_qty: int,
+        updated_after: datetime | None = None,
+        updated_before: datetime | None = None,
     ) -> None:
         ...
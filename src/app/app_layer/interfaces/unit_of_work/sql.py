@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any
 
 from app.domain.interfaces.repositories.cart_coupons.repo import ICartCouponsRepository
 from app.domain.interfaces.repositories.cart_notifications import (
@@ -6,24 +7,29 @@ from app.domain.interfaces.repositories.cart_notifications import (
 )
 from app.domain.interfaces.repositories.carts.repo import ICartsRepository
 from app.domain.interfaces.repositories.items.repo import IItemsRepository
+from app.domain.interfaces.repositories.watermarks import IWatermarksRepository
 
 
-class IUnitOfWork(ABC):
+class IUnitOfWorkHandle(ABC):
+    """
+    A single entry into the unit of work. Every handle owns its transaction and
+    repositories, so handles can be used concurrently.
+    """
+
     items: IItemsRepository
     carts: ICartsRepository
     cart_coupons: ICartCouponsRepository
     carts_notifications: ICartNotificationsRepository
+    watermarks: IWatermarksRepository
 
-    def __call__(self, autocommit: bool, *args, **kwargs) -> "IUnitOfWork":
+    def __init__(self, autocommit: bool) -> None:
         self._autocommit = autocommit
 
-        return self
-
-    async def __aenter__(self) -> "IUnitOfWork":
+    async def __aenter__(self) -> "IUnitOfWorkHandle":
         return self  # pragma: no cover
 
     async def __aexit__(
-        self, exc_type: type[BaseException] | None, *args, **kwargs
+        self, exc_type: type[BaseException] | None, *args: Any, **kwargs: Any
     ) -> None:
         if exc_type is not None:
             await self.rollback()
@@ -44,3 +50,9 @@ class IUnitOfWork(ABC):
     @abstractmethod
     async def shutdown(self) -> None:
         ...
+
+
+class IUnitOfWork(ABC):
+    @abstractmethod
+    def __call__(self, autocommit: bool, *args: Any, **kwargs: Any) -> IUnitOfWorkHandle:
+        ...
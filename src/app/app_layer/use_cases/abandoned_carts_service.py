@@ -1,36 +1,57 @@
+import asyncio
+from collections.abc import Sequence
+from datetime import datetime
 from logging import getLogger
 from uuid import UUID
 
 from app.app_layer.interfaces.clients.notifications.client import INotificationsClient
 from app.app_layer.interfaces.clients.notifications.dto import SendNotificationInputDTO
+from app.app_layer.interfaces.clients.notifications.exceptions import (
+    NotificationsClientError,
+)
+from app.app_layer.interfaces.distributed_lock_system.system import IDistributedLockSystem
 from app.app_layer.interfaces.tasks.exceptions import TaskProducingError
 from app.app_layer.interfaces.tasks.producer import ITaskProducer
 from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork
-from app.config import TaskConfig
+from app.config import PeriodicConfig, TaskConfig
 from app.domain.cart_notifications.entities import CartNotification
 from app.logging import update_context
 
 logger = getLogger(__name__)
 
+FAN_OUT_LEASE_NAME = "abandoned-carts-fan-out-lease"
+WATERMARK_NAME = "abandoned-carts"
+
 
 class AbandonedCartsService:
     """
     Responsible for processing abandoned carts and sending notifications to the users.
     It uses a unit of work pattern to manage the database transactions and interacts
     with other components such as the task producer and notification client.
+
+    The scan is split into shards that are processed by separate tasks, only the
+    instance that takes the fan-out lease enqueues them on a periodic tick. In the
+    incremental mode every tick scans only the carts that became abandoned since the
+    durable watermark of the previous tick.
     """
 
-    def __init__(
+    def __init__(  # noqa: CFQ002
         self,
         uow: IUnitOfWork,
         task_producer: ITaskProducer,
         notification_client: INotificationsClient,
+        distributed_lock_system: IDistributedLockSystem,
         config: TaskConfig,
+        periodic_config: PeriodicConfig,
+        reservation_timeout_sec: int,
     ) -> None:
         self._uow = uow
         self._task_producer = task_producer
         self._notification_client = notification_client
+        self._distributed_lock_system = distributed_lock_system
         self._config = config
+        self._periodic_config = periodic_config
+        self._reservation_timeout_sec = reservation_timeout_sec
 
     @property
     def config(self) -> TaskConfig:
@@ -38,51 +59,197 @@ class AbandonedCartsService:
 
     async def process_abandoned_carts(self) -> None:
         """
-        Processes abandoned carts by retrieving the list of abandoned cart IDs and
+        Processes abandoned carts by enqueuing a scan task for every shard, if the fan-out
+        lease for the current tick is taken by this instance. In the incremental mode
+        the watermark is moved forward only when the tasks of all shards are enqueued.
+        """
+
+        if not await self._distributed_lock_system.lease(
+            name=FAN_OUT_LEASE_NAME,
+            ttl_sec=self._periodic_config.lease_ttl_sec,
+        ):
+            logger.debug("Abandoned carts are fanned out by another instance.")
+            return
+
+        if not self._periodic_config.incremental:
+            await self._enqueue_shards()
+            return
+
+        async with self._uow(autocommit=True) as uow:
+            updated_after = await uow.watermarks.get(name=WATERMARK_NAME)
+            updated_before = await uow.carts.get_abandonment_threshold()
+
+        if updated_after is not None and updated_after >= updated_before:
+            return
+
+        if not await self._enqueue_shards(
+            updated_after=updated_after,
+            updated_before=updated_before,
+        ):
+            # the same window will be processed next time
+            return
+
+        async with self._uow(autocommit=True) as uow:
+            await uow.watermarks.save(name=WATERMARK_NAME, value=updated_before)
+
+        logger.debug(
+            "Abandoned carts watermark moved from %s to %s.",
+            updated_after,
+            updated_before,
+        )
+
+    async def process_abandoned_carts_shard(
+        self,
+        shard: int,
+        shards_qty: int,
+        updated_after: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> None:
+        """
+        Processes a single shard of abandoned carts by retrieving the list of its
+        abandoned cart IDs, last updated within the provided bounds if any, and
         enqueuing abandoned cart notification tasks.
         """
 
-        async with self._uow(autocommit=True):
-            carts_data = await self._uow.carts.find_abandoned_cart_id_by_user_id()
+        async with self._uow(autocommit=True) as uow:
+            carts_data = await uow.carts.find_abandoned_cart_id_by_user_id(
+                shard=shard,
+                shards_qty=shards_qty,
+                updated_after=updated_after,
+                updated_before=updated_before,
+            )
 
         logger.debug(
-            "Got %s abandoned carts. Ready to send notifications tasks.",
+            "Got %s abandoned carts in shard %s of %s. Ready to send notifications tasks.",
             len(carts_data),
+            shard,
+            shards_qty,
         )
 
-        for user_id, cart_id in carts_data:
+        for user_id, cart_id, cycle in carts_data:
             await update_context(cart_id=cart_id)
 
             try:
                 await self._task_producer.enqueue_abandoned_cart_notification_task(
                     cart_id=cart_id,
                     user_id=user_id,
+                    cycle=cycle,
                 )
             except TaskProducingError:
                 # will be processed next time
                 continue
 
-    async def send_notification(self, user_id: int, cart_id: UUID) -> None:
-        """Sends a notification to the user for the specified abandoned cart."""
+    async def send_notification(
+        self, user_id: int, cart_id: UUID, cycle: int = 1
+    ) -> None:
+        """
+        Sends a notification of the specified cycle to the user for the specified
+        abandoned cart, unless it is already sent or being sent.
+        """
 
         await update_context(cart_id=cart_id)
 
-        async with self._uow(autocommit=True):
-            config = await self._uow.carts.get_config()
+        (error,) = await self.send_notifications(recipients=[(user_id, cart_id, cycle)])
 
-        notification = CartNotification.create_abandoned_cart_notification(
-            cart_id=cart_id,
-            text=config.abandoned_cart_text,
-        )
+        if error is not None:
+            raise error
 
-        await self._notification_client.send_notification(
-            data=SendNotificationInputDTO(
-                user_id=user_id,
-                text=notification.text,
+    async def send_notifications(
+        self,
+        recipients: Sequence[tuple[int, UUID, int]],
+    ) -> list[BaseException | None]:
+        """
+        Sends notifications for the specified user IDs, abandoned cart IDs and cycles
+        concurrently, using a single cart config snapshot. Every notification is
+        reserved before it is sent and confirmed after, so a notification already
+        sent or being sent by another task is skipped, unless its reservation is older
+        than the reservation timeout, e.g. the task died before releasing it. A
+        notification that failed to be sent is released to be retried. Returns the
+        error of every recipient in the same order, `None` for the sent and skipped
+        ones.
+        """
+
+        async with self._uow(autocommit=True) as uow:
+            config = await uow.carts.get_config()
+            notifications = [
+                CartNotification.create_abandoned_cart_notification(
+                    cart_id=cart_id,
+                    text=config.abandoned_cart_text,
+                    cycle=cycle,
+                )
+                for _, cart_id, cycle in recipients
+            ]
+            reserved = await uow.carts_notifications.reserve(
+                notifications=notifications,
+                reservation_timeout_sec=self._reservation_timeout_sec,
             )
+
+        user_ids = {
+            notification.id: user_id
+            for (user_id, _, _), notification in zip(recipients, notifications)
+        }
+        results = await asyncio.gather(
+            *(
+                self._notification_client.send_notification(
+                    data=SendNotificationInputDTO(
+                        user_id=user_ids[notification.id],
+                        text=notification.text,
+                    )
+                )
+                for notification in reserved
+            ),
+            return_exceptions=True,
+        )
+        errors = {
+            notification.id: result if isinstance(result, BaseException) else None
+            for notification, result in zip(reserved, results)
+        }
+        sent = [
+            notification for notification in reserved if errors[notification.id] is None
+        ]
+        failed = [
+            notification
+            for notification in reserved
+            if isinstance(errors[notification.id], NotificationsClientError)
+        ]
+
+        for notification in sent:
+            notification.mark_sent()
+
+        if sent or failed:
+            async with self._uow(autocommit=True) as uow:
+                if sent:
+                    await uow.carts_notifications.confirm(notifications=sent)
+                if failed:
+                    await uow.carts_notifications.release(notifications=failed)
+
+        logger.info(
+            "Abandoned cart notifications sent: %s, skipped: %s, failed: %s.",
+            len(sent),
+            len(notifications) - len(reserved),
+            len(reserved) - len(sent),
         )
 
-        async with self._uow(autocommit=True):
-            await self._uow.carts_notifications.create(cart_notification=notification)
+        return [errors.get(notification.id) for notification in notifications]
+
+    async def _enqueue_shards(
+        self,
+        updated_after: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> bool:
+        shards_qty = self._periodic_config.shards_qty
+        enqueued = True
+
+        for shard in range(shards_qty):
+            try:
+                await self._task_producer.enqueue_abandoned_carts_shard_task(
+                    shard=shard,
+                    shards_qty=shards_qty,
+                    updated_after=updated_after,
+                    updated_before=updated_before,
+                )
+            except TaskProducingError:
+                # will be processed next time
+                enqueued = False
 
-        logger.info("Cart %s. Abandoned cart notification successfully sent!", cart_id)
+        return enqueued
@@ -13,6 +13,7 @@ class CartConfigOutputDTO(BaseModel):
     hours_since_update_until_abandoned: int
     max_abandoned_notifications_qty: int
     abandoned_cart_text: str
+    version: int | None = None
 
 
 class CartConfigInputDTO(BaseModel):
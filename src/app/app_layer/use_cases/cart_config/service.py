@@ -6,6 +6,7 @@ from app.app_layer.use_cases.cart_config.dto import (
     CartConfigInputDTO,
     CartConfigOutputDTO,
 )
+from app.app_layer.use_cases.cart_items.limits import CartItemLimits
 from app.domain.cart_config.dto import CartConfigDTO
 from app.domain.cart_config.entities import CartConfig
 
@@ -19,9 +20,15 @@ class CartConfigService:
     authentication.
     """
 
-    def __init__(self, uow: IUnitOfWork, auth_system: IAuthSystem) -> None:
+    def __init__(
+        self,
+        uow: IUnitOfWork,
+        auth_system: IAuthSystem,
+        item_limits: CartItemLimits,
+    ) -> None:
         self._uow = uow
         self._auth_system = auth_system
+        self._item_limits = item_limits
 
     async def retrieve(self, auth_data: str) -> CartConfigOutputDTO:
         """
@@ -31,16 +38,16 @@ class CartConfigService:
 
         await self._auth_system.check_for_admin(auth_data=auth_data)
 
-        async with self._uow(autocommit=True):
-            result = await self._uow.carts.get_config()
+        async with self._uow(autocommit=True) as uow:
+            result = await uow.carts.get_config(with_items_limits=True)
 
         return CartConfigOutputDTO.model_validate(result)
 
     async def update(self, data: CartConfigInputDTO) -> CartConfigOutputDTO:
         """
         Updates the cart configuration by validating the authentication data, creating
-        a CartConfig instance with the input data, and calling the update_config method
-        of the carts repository.
+        a CartConfig instance with the input data, calling the update_config method
+        of the carts repository, and resetting the cached item limits.
         """
 
         await self._auth_system.check_for_admin(auth_data=data.auth_data)
@@ -56,9 +63,10 @@ class CartConfigService:
             )
         )
 
-        async with self._uow(autocommit=True):
-            result = await self._uow.carts.update_config(cart_config=cart_config)
+        async with self._uow(autocommit=True) as uow:
+            result = await uow.carts.update_config(cart_config=cart_config)
 
+        self._item_limits.invalidate()
         logger.info("Cart config successfully updated!")
 
         return CartConfigOutputDTO.model_validate(result)
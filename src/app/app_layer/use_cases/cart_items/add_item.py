@@ -7,11 +7,11 @@ from app.app_layer.interfaces.clients.products.client import IProductsClient
 from app.app_layer.interfaces.distributed_lock_system.system import IDistributedLockSystem
 from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork
 from app.app_layer.use_cases.cart_items.dto import AddItemToCartInputDTO
+from app.app_layer.use_cases.cart_items.limits import CartItemLimits
 from app.app_layer.use_cases.carts.dto import CartOutputDTO
 from app.domain.cart_items.dto import ItemDTO
 from app.domain.cart_items.entities import CartItem
 from app.domain.carts.entities import Cart
-from app.domain.carts.exceptions import CartItemDoesNotExistError
 from app.logging import update_context
 
 logger = getLogger(__name__)
@@ -30,11 +30,13 @@ class AddCartItemUseCase:
         products_client: IProductsClient,
         auth_system: IAuthSystem,
         distributed_lock_system: IDistributedLockSystem,
+        item_limits: CartItemLimits,
     ) -> None:
         self._uow = uow
         self._products_client = products_client
         self._auth_system = auth_system
         self._distributed_lock_system = distributed_lock_system
+        self._item_limits = item_limits
 
     async def execute(self, data: AddItemToCartInputDTO) -> CartOutputDTO:
         """
@@ -50,15 +52,48 @@ class AddCartItemUseCase:
 
     async def _add_item_to_cart(self, data: AddItemToCartInputDTO) -> CartOutputDTO:
         user = await self._auth_system.get_user_data(auth_data=data.auth_data)
+        cart = await self._try_to_increase_stored_item_qty(data=data, user=user)
 
-        async with self._uow(autocommit=True):
-            cart = await self._uow.carts.retrieve(cart_id=data.cart_id)
+        if cart is None:
+            async with self._uow(autocommit=True) as uow:
+                cart = await uow.carts.retrieve(cart_id=data.cart_id)
 
-        self._check_user_ownership(cart=cart, user=user)
-        cart = await self._update_cart(cart=cart, data=data)
+            self._check_user_ownership(cart=cart, user=user)
+            await self._item_limits.load(cart=cart, item_ids=[data.id])
+            cart = await self._update_cart(cart=cart, data=data)
 
         return CartOutputDTO.model_validate(cart)
 
+    async def _try_to_increase_stored_item_qty(
+        self,
+        data: AddItemToCartInputDTO,
+        user: UserDataOutputDTO,
+    ) -> Cart | None:
+        # the qty of an item already in the cart is increased by a single statement
+        # checking the limits, the cart is retrieved afterwards only for the response.
+        # A new item and a rejected increase take the path reporting the reason
+        async with self._uow(autocommit=True) as uow:
+            item_qty = await uow.items.increase_item_qty(
+                cart_id=data.cart_id,
+                item_id=data.id,
+                qty=data.qty,
+                user_id=None if user.is_admin else user.id,
+            )
+
+            if item_qty is None:
+                return None
+
+            cart = await uow.carts.retrieve(cart_id=data.cart_id)
+
+        logger.info(
+            "Cart %s. Item %s qty successfully increased. Current item qty %s",
+            cart.id,
+            data.id,
+            item_qty,
+        )
+
+        return cart
+
     def _check_user_ownership(self, cart: Cart, user: UserDataOutputDTO) -> None:
         if user.is_admin:
             return
@@ -66,12 +101,10 @@ class AddCartItemUseCase:
         cart.check_user_ownership(user_id=user.id)
 
     async def _update_cart(self, cart: Cart, data: AddItemToCartInputDTO) -> Cart:
-        try:
-            await self._increase_item_qty(cart=cart, item_id=data.id, qty=data.qty)
-        except CartItemDoesNotExistError:
-            cart = await self._try_to_add_new_item_to_cart(cart=cart, data=data)
+        if cart.items.get(data.id) is None:
+            return await self._try_to_add_new_item_to_cart(cart=cart, data=data)
 
-        return cart
+        return await self._increase_item_qty(cart=cart, item_id=data.id, qty=data.qty)
 
     async def _try_to_add_new_item_to_cart(
         self,
@@ -81,8 +114,7 @@ class AddCartItemUseCase:
         item = await self._try_to_create_item(cart=cart, data=data)
         cart.add_new_item(item)
 
-        async with self._uow(autocommit=True):
-            await self._uow.items.add_item(item=item)
+        await self._save_item(cart=cart, item=item, qty=data.qty)
 
         logger.info(
             "Item %s successfully added to cart %s with qty %s",
@@ -114,14 +146,26 @@ class AddCartItemUseCase:
     async def _increase_item_qty(self, cart: Cart, item_id: int, qty: Decimal) -> Cart:
         item = cart.increase_item_qty(item_id=item_id, qty=qty)
 
-        async with self._uow(autocommit=True):
-            await self._uow.items.update_item(item=item)
+        await self._save_item(cart=cart, item=item, qty=qty)
 
         logger.info(
             "Cart %s. Item %s qty successfully increased. Current item qty %s",
             cart.id,
             item_id,
-            qty,
+            item.qty,
         )
 
         return cart
+
+    async def _save_item(self, cart: Cart, item: CartItem, qty: Decimal) -> None:
+        async with self._uow(autocommit=True) as uow:
+            stored_qty = await uow.items.upsert_item(
+                item=item,
+                qty=qty,
+                config_version=cart.config_version,
+            )
+
+            if stored_qty != item.qty:
+                # the item was changed after the cart was retrieved, so the limits are
+                # checked against the stored qty and the changes are rolled back on error
+                cart.update_item_qty(item_id=item.id, qty=stored_qty)
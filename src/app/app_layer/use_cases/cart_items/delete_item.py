@@ -3,7 +3,7 @@ from logging import getLogger
 from app.app_layer.interfaces.auth_system.dto import UserDataOutputDTO
 from app.app_layer.interfaces.auth_system.system import IAuthSystem
 from app.app_layer.interfaces.distributed_lock_system.system import IDistributedLockSystem
-from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork
+from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork, IUnitOfWorkHandle
 from app.app_layer.use_cases.cart_items.dto import DeleteCartItemInputDTO
 from app.app_layer.use_cases.carts.dto import CartOutputDTO
 from app.domain.carts.entities import Cart
@@ -47,10 +47,12 @@ class DeleteCartItemUseCase:
     async def _delete_cart_item(self, data: DeleteCartItemInputDTO) -> CartOutputDTO:
         user = await self._auth_system.get_user_data(auth_data=data.auth_data)
 
-        async with self._uow(autocommit=True):
-            cart = await self._uow.carts.retrieve(cart_id=data.cart_id)
+        async with self._uow(autocommit=True) as uow:
+            cart = await uow.carts.retrieve(cart_id=data.cart_id)
             self._check_user_ownership(cart=cart, user=user)
-            cart = await self._delete_item_from_cart(cart=cart, item_id=data.item_id)
+            cart = await self._delete_item_from_cart(
+                uow=uow, cart=cart, item_id=data.item_id
+            )
 
         return CartOutputDTO.model_validate(cart)
 
@@ -60,13 +62,15 @@ class DeleteCartItemUseCase:
 
         cart.check_user_ownership(user_id=user.id)
 
-    async def _delete_item_from_cart(self, cart: Cart, item_id: int) -> Cart:
+    async def _delete_item_from_cart(
+        self, uow: IUnitOfWorkHandle, cart: Cart, item_id: int
+    ) -> Cart:
         try:
             cart.delete_item(item_id=item_id)
         except CartItemDoesNotExistError:
             return cart
 
-        await self._uow.items.delete_item(item_id=item_id, cart=cart)
+        await uow.items.delete_item(item_id=item_id, cart=cart)
 
         logger.info("Item %s successfully deleted from cart %s", item_id, cart.id)
 
@@ -0,0 +1,87 @@
+import time
+from collections.abc import Collection
+from decimal import Decimal
+
+from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork
+from app.config import ItemLimitsCacheConfig
+from app.domain.carts.entities import Cart
+
+
+class CartItemLimits:
+    """
+    Responsible for loading the qty limits of the specific items into the cart
+    configuration before the items are changed, since the configuration is retrieved
+    without them. The limits are taken from the config version the cart is validated
+    against, so they always match the rest of the config.
+
+    The limits are cached in the process by the config version for the configured
+    time, including the absence of a limit, so only the items missed by the cache are
+    retrieved, all at once. The cache is reset when the limits are updated by this
+    process and when it grows over the configured size.
+    """
+
+    def __init__(self, uow: IUnitOfWork, config: ItemLimitsCacheConfig) -> None:
+        self._uow = uow
+        self._config = config
+        self._cache: dict[tuple[int | None, int], tuple[Decimal | None, float]] = {}
+
+    async def load(self, cart: Cart, item_ids: Collection[int]) -> None:
+        """Sets the qty limits of the specified items to the configuration of the cart."""
+
+        now = time.monotonic()
+        config_version = cart.config.version
+        limits: dict[int, Decimal | None] = {}
+        missed_item_ids = []
+
+        for item_id in item_ids:
+            cached = self._cache.get((config_version, item_id))
+
+            if cached is not None and cached[1] > now:
+                limits[item_id] = cached[0]
+            else:
+                missed_item_ids.append(item_id)
+
+        if missed_item_ids:
+            limits.update(
+                await self._retrieve(
+                    config_version=config_version,
+                    item_ids=missed_item_ids,
+                    now=now,
+                ),
+            )
+
+        cart.config.limit_items_by_id = {
+            item_id: limit for item_id, limit in limits.items() if limit is not None
+        }
+
+    def invalidate(self) -> None:
+        """Resets the cached limits, so the next loads retrieve the actual ones."""
+
+        self._cache.clear()
+
+    async def _retrieve(
+        self,
+        config_version: int | None,
+        item_ids: Collection[int],
+        now: float,
+    ) -> dict[int, Decimal | None]:
+        async with self._uow(autocommit=True) as uow:
+            stored_limits = await uow.carts.get_items_limits(
+                config_version=config_version,
+                item_ids=item_ids,
+            )
+
+        limits = {item_id: stored_limits.get(item_id) for item_id in item_ids}
+
+        if len(self._cache) + len(limits) > self._config.max_size:
+            self._cache.clear()
+
+        expires_at = now + self._config.ttl_sec
+        self._cache.update(
+            {
+                (config_version, item_id): (limit, expires_at)
+                for item_id, limit in limits.items()
+            }
+        )
+
+        return limits
@@ -3,8 +3,9 @@ from logging import getLogger
 from app.app_layer.interfaces.auth_system.dto import UserDataOutputDTO
 from app.app_layer.interfaces.auth_system.system import IAuthSystem
 from app.app_layer.interfaces.distributed_lock_system.system import IDistributedLockSystem
-from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork
+from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork, IUnitOfWorkHandle
 from app.app_layer.use_cases.cart_items.dto import UpdateCartItemInputDTO
+from app.app_layer.use_cases.cart_items.limits import CartItemLimits
 from app.app_layer.use_cases.carts.dto import CartOutputDTO
 from app.domain.carts.entities import Cart
 from app.logging import update_context
@@ -25,10 +26,12 @@ class UpdateCartItemUseCase:
         uow: IUnitOfWork,
         auth_system: IAuthSystem,
         distributed_lock_system: IDistributedLockSystem,
+        item_limits: CartItemLimits,
     ) -> None:
         self._uow = uow
         self._auth_system = auth_system
         self._distributed_lock_system = distributed_lock_system
+        self._item_limits = item_limits
 
     async def execute(self, data: UpdateCartItemInputDTO) -> CartOutputDTO:
         """
@@ -45,10 +48,11 @@ class UpdateCartItemUseCase:
     async def _update_cart_item(self, data: UpdateCartItemInputDTO) -> CartOutputDTO:
         user = await self._auth_system.get_user_data(auth_data=data.auth_data)
 
-        async with self._uow(autocommit=True):
-            cart = await self._uow.carts.retrieve(cart_id=data.cart_id)
+        async with self._uow(autocommit=True) as uow:
+            cart = await uow.carts.retrieve(cart_id=data.cart_id)
             self._check_user_ownership(cart=cart, user=user)
-            cart = await self._update_item_qty(cart=cart, data=data)
+            await self._item_limits.load(cart=cart, item_ids=[data.item_id])
+            cart = await self._update_item_qty(uow=uow, cart=cart, data=data)
 
         return CartOutputDTO.model_validate(cart)
 
@@ -60,11 +64,13 @@ class UpdateCartItemUseCase:
 
     async def _update_item_qty(
         self,
+        uow: IUnitOfWorkHandle,
         cart: Cart,
         data: UpdateCartItemInputDTO,
     ) -> Cart:
         item = cart.update_item_qty(item_id=data.item_id, qty=data.qty)
-        await self._uow.items.update_item(item=item)
+        await uow.items.update_item(item=item)
+        await uow.carts.pin_config_version(cart=cart)
 
         logger.info(
             "Cart %s. Item %s successfully updated with qty %s",
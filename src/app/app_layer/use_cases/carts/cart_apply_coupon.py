@@ -50,16 +50,16 @@ class CartApplyCouponUseCase:
     async def _apply_coupon(self, data: CartApplyCouponInputDTO) -> CartOutputDTO:
         user = await self._auth_system.get_user_data(auth_data=data.auth_data)
 
-        async with self._uow(autocommit=True):
-            cart = await self._uow.carts.retrieve(cart_id=data.cart_id)
+        async with self._uow(autocommit=True) as uow:
+            cart = await uow.carts.retrieve(cart_id=data.cart_id)
 
         self._check_can_coupon_be_applied(user=user, cart=cart)
 
         coupon_data = await self._coupons_client.get_coupon(coupon_name=data.coupon_name)
         self._apply_coupon_to_cart(cart=cart, data=data, coupon_data=coupon_data)
 
-        async with self._uow(autocommit=True):
-            await self._uow.cart_coupons.create(cart_coupon=cart.coupon)
+        async with self._uow(autocommit=True) as uow:
+            await uow.cart_coupons.create(cart_coupon=cart.coupon)
 
         logger.info(
             "Coupon %s successfully applied to cart %s", data.coupon_name, cart.id
@@ -0,0 +1,58 @@
+import time
+from logging import getLogger
+
+from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork
+from app.app_layer.use_cases.carts.dto import ArchiveCartsOutputDTO
+from app.config import CartArchiveConfig
+
+logger = getLogger(__name__)
+
+
+class ArchiveCartsUseCase:
+    """
+    Responsible for moving completed and deactivated carts older than the configured
+    retention out of the live tables into the partitioned archive. Carts are moved in
+    bounded batches, every batch is a separate transaction.
+    """
+
+    def __init__(self, uow: IUnitOfWork, config: CartArchiveConfig) -> None:
+        self._uow = uow
+        self._config = config
+
+    async def execute(self) -> ArchiveCartsOutputDTO:
+        """
+        Executes the use case by archiving batches of terminal carts until a batch comes
+        out incomplete or the configured number of batches is reached.
+        """
+
+        started_at = time.perf_counter()
+        archived_qty = batches_qty = 0
+
+        while batches_qty < self._config.max_batches:
+            async with self._uow(autocommit=True) as uow:
+                batch_qty = await uow.carts.archive_terminal(
+                    older_than_days=self._config.older_than_days,
+                    limit=self._config.batch_size,
+                )
+
+            batches_qty += 1
+            archived_qty += batch_qty
+
+            if batch_qty < self._config.batch_size:
+                break
+
+        result = ArchiveCartsOutputDTO(
+            archived_qty=archived_qty,
+            batches_qty=batches_qty,
+            elapsed_sec=time.perf_counter() - started_at,
+        )
+
+        logger.info(
+            "Archived %s carts in %s batches in %.3f sec (%.1f carts/sec)",
+            result.archived_qty,
+            result.batches_qty,
+            result.elapsed_sec,
+            result.archived_qty / result.elapsed_sec if result.elapsed_sec else 0,
+        )
+
+        return result
@@ -0,0 +1,133 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from logging import getLogger
+from uuid import UUID
+
+from app.app_layer.interfaces.distributed_lock_system.exceptions import AlreadyLockedError
+from app.app_layer.interfaces.distributed_lock_system.system import IDistributedLockSystem
+from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork
+from app.app_layer.use_cases.carts.dto import CartBatchResultOutputDTO, CartOutputDTO
+from app.domain.carts.entities import Cart
+from app.domain.carts.exceptions import BaseCartDomainError
+from app.domain.interfaces.repositories.carts.exceptions import CartNotFoundError
+
+logger = getLogger(__name__)
+
+
+class BaseBatchChangeCartStatusUseCase(ABC):
+    """
+    Responsible for changing the statuses of many carts at once. The locks of all carts
+    are acquired in one call, the carts are loaded with one query, status transitions
+    are validated in memory and the changed carts are written with one statement.
+    Every cart gets its own result, a failure of one cart doesn't affect the others.
+    """
+
+    action: str
+
+    def __init__(
+        self,
+        uow: IUnitOfWork,
+        distributed_lock_system: IDistributedLockSystem,
+    ) -> None:
+        self._uow = uow
+        self._distributed_lock_system = distributed_lock_system
+
+    async def execute(self, cart_ids: Sequence[UUID]) -> list[CartBatchResultOutputDTO]:
+        """
+        Executes the use case and returns the results in the order of the provided
+        cart IDs, duplicates are processed once.
+        """
+
+        cart_ids = list(dict.fromkeys(cart_ids))
+        lock_names = {cart_id: f"cart-lock-{cart_id}" for cart_id in cart_ids}
+
+        async with self._distributed_lock_system.batch(
+            names=list(lock_names.values())
+        ) as locks:
+            results = {
+                cart_id: CartBatchResultOutputDTO(
+                    cart_id=cart_id,
+                    error=AlreadyLockedError(),
+                )
+                for cart_id, name in lock_names.items()
+                if name not in locks.acquired
+            }
+            locked_cart_ids = [cart_id for cart_id in cart_ids if cart_id not in results]
+            results.update(await self._change_statuses(cart_ids=locked_cart_ids))
+
+        logger.info(
+            "Carts batch %s: %s of %s carts succeeded",
+            self.action,
+            sum(result.error is None for result in results.values()),
+            len(cart_ids),
+        )
+
+        return [results[cart_id] for cart_id in cart_ids]
+
+    @abstractmethod
+    def _change_status(self, cart: Cart) -> None:
+        ...
+
+    async def _change_statuses(
+        self, cart_ids: list[UUID]
+    ) -> dict[UUID, CartBatchResultOutputDTO]:
+        results = {}
+        changed_carts = []
+
+        async with self._uow(autocommit=True) as uow:
+            carts = {cart.id: cart for cart in await uow.carts.retrieve_many(cart_ids)}
+
+            for cart_id in cart_ids:
+                results[cart_id] = self._try_to_change_status(
+                    cart_id=cart_id, cart=carts.get(cart_id)
+                )
+
+                if results[cart_id].error is None:
+                    changed_carts.append(carts[cart_id])
+
+            await uow.carts.update_many(carts=changed_carts)
+
+        return results
+
+    def _try_to_change_status(
+        self, cart_id: UUID, cart: Cart | None
+    ) -> CartBatchResultOutputDTO:
+        if cart is None:
+            return CartBatchResultOutputDTO(cart_id=cart_id, error=CartNotFoundError())
+
+        try:
+            self._change_status(cart=cart)
+        except BaseCartDomainError as err:
+            return CartBatchResultOutputDTO(cart_id=cart_id, error=err)
+
+        return CartBatchResultOutputDTO(
+            cart_id=cart_id,
+            cart=CartOutputDTO.model_validate(cart),
+        )
+
+
+class BatchLockCartUseCase(BaseBatchChangeCartStatusUseCase):
+    """Responsible for locking many carts at once."""
+
+    action = "lock"
+
+    def _change_status(self, cart: Cart) -> None:
+        cart.lock()
+
+
+class BatchUnlockCartUseCase(BaseBatchChangeCartStatusUseCase):
+    """Responsible for unlocking many carts at once."""
+
+    action = "unlock"
+
+    def _change_status(self, cart: Cart) -> None:
+        cart.unlock()
+
+
+class BatchCompleteCartUseCase(BaseBatchChangeCartStatusUseCase):
+    """Responsible for completing many carts at once."""
+
+    action = "complete"
+
+    def _change_status(self, cart: Cart) -> None:
+        cart.complete()
@@ -1,6 +1,7 @@
 from logging import getLogger
 from uuid import UUID
 
+from app.app_layer.interfaces.active_carts_cache.cache import IActiveCartsCache
 from app.app_layer.interfaces.distributed_lock_system.system import IDistributedLockSystem
 from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork
 from app.app_layer.use_cases.carts.dto import CartOutputDTO
@@ -13,16 +14,19 @@ class CompleteCartUseCase:
     """
     Responsible for completing a cart by updating its status to "completed" in the
     database. It uses a distributed lock system to ensure that only one process can
-    change the cart at a time.
+    change the cart at a time. The completed cart is dropped from the active carts
+    cache.
     """
 
     def __init__(
         self,
         uow: IUnitOfWork,
         distributed_lock_system: IDistributedLockSystem,
+        active_carts_cache: IActiveCartsCache,
     ) -> None:
         self._uow = uow
         self._distributed_lock_system = distributed_lock_system
+        self._active_carts_cache = active_carts_cache
 
     async def execute(self, cart_id: UUID) -> CartOutputDTO:
         """
@@ -37,10 +41,12 @@ class CompleteCartUseCase:
             return await self._complete_cart(cart_id=cart_id)
 
     async def _complete_cart(self, cart_id: UUID) -> CartOutputDTO:
-        async with self._uow(autocommit=True):
-            cart = await self._uow.carts.retrieve(cart_id=cart_id)
+        async with self._uow(autocommit=True) as uow:
+            cart = await uow.carts.retrieve(cart_id=cart_id)
             cart.complete()
-            await self._uow.carts.update(cart=cart)
+            await uow.carts.update(cart=cart)
+
+        await self._active_carts_cache.delete(user_id=cart.user_id)
 
         logger.info("Cart %s successfully completed", cart.id)
 
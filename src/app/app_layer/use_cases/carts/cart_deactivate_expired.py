@@ -0,0 +1,58 @@
+import time
+from logging import getLogger
+
+from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork
+from app.app_layer.use_cases.carts.dto import DeactivateExpiredCartsOutputDTO
+from app.config import CartExpiryConfig
+
+logger = getLogger(__name__)
+
+
+class DeactivateExpiredCartsUseCase:
+    """
+    Responsible for deactivating opened carts that have been idle for longer than the
+    configured horizon. Carts are deactivated in bounded batches, every batch is a
+    separate transaction, so row locks are held only for the duration of a batch.
+    """
+
+    def __init__(self, uow: IUnitOfWork, config: CartExpiryConfig) -> None:
+        self._uow = uow
+        self._config = config
+
+    async def execute(self) -> DeactivateExpiredCartsOutputDTO:
+        """
+        Executes the use case by deactivating batches of expired carts until a batch
+        comes out incomplete or the configured number of batches is reached.
+        """
+
+        started_at = time.perf_counter()
+        deactivated_qty = batches_qty = 0
+
+        while batches_qty < self._config.max_batches:
+            async with self._uow(autocommit=True) as uow:
+                batch_qty = await uow.carts.deactivate_expired(
+                    idle_hours=self._config.idle_hours,
+                    limit=self._config.batch_size,
+                )
+
+            batches_qty += 1
+            deactivated_qty += batch_qty
+
+            if batch_qty < self._config.batch_size:
+                break
+
+        result = DeactivateExpiredCartsOutputDTO(
+            deactivated_qty=deactivated_qty,
+            batches_qty=batches_qty,
+            elapsed_sec=time.perf_counter() - started_at,
+        )
+
+        logger.info(
+            "Deactivated %s expired carts in %s batches in %.3f sec (%.1f carts/sec)",
+            result.deactivated_qty,
+            result.batches_qty,
+            result.elapsed_sec,
+            result.deactivated_qty / result.elapsed_sec if result.elapsed_sec else 0,
+        )
+
+        return result
@@ -1,5 +1,6 @@
 from logging import getLogger
 
+from app.app_layer.interfaces.active_carts_cache.cache import IActiveCartsCache
 from app.app_layer.interfaces.auth_system.dto import UserDataOutputDTO
 from app.app_layer.interfaces.auth_system.system import IAuthSystem
 from app.app_layer.interfaces.distributed_lock_system.system import IDistributedLockSystem
@@ -17,7 +18,7 @@ class CartDeleteUseCase:
     instance of IUnitOfWork to interact with the data storage, an instance of
     IAuthSystem to validate the user's authentication data, and an instance of
     IDistributedLockSystem to acquire and release locks for concurrent access to the
-    cart.
+    cart. The deactivated cart is dropped from the active carts cache.
     """
 
     def __init__(
@@ -25,10 +26,12 @@ class CartDeleteUseCase:
         uow: IUnitOfWork,
         auth_system: IAuthSystem,
         distributed_lock_system: IDistributedLockSystem,
+        active_carts_cache: IActiveCartsCache,
     ) -> None:
         self._uow = uow
         self._auth_system = auth_system
         self._distributed_lock_system = distributed_lock_system
+        self._active_carts_cache = active_carts_cache
 
     async def execute(self, data: CartDeleteInputDTO) -> CartOutputDTO:
         """
@@ -44,11 +47,13 @@ class CartDeleteUseCase:
     async def _delete_cart(self, data: CartDeleteInputDTO) -> CartOutputDTO:
         user = await self._auth_system.get_user_data(auth_data=data.auth_data)
 
-        async with self._uow(autocommit=True):
-            cart = await self._uow.carts.retrieve(cart_id=data.cart_id)
+        async with self._uow(autocommit=True) as uow:
+            cart = await uow.carts.retrieve(cart_id=data.cart_id)
             self._check_user_ownership(cart=cart, user=user)
             cart.deactivate()
-            await self._uow.carts.update(cart=cart)
+            await uow.carts.update(cart=cart)
+
+        await self._active_carts_cache.delete(user_id=cart.user_id)
 
         logger.info("Cart %s successfully deactivated", cart.id)
 
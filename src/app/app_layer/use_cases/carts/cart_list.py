@@ -26,8 +26,8 @@ class CartListUseCase:
         await self._auth_system.check_for_admin(auth_data=data.auth_data)
         created_at = data.created_at or datetime.now()
 
-        async with self._uow(autocommit=True):
-            carts = await self._uow.carts.get_list(
+        async with self._uow(autocommit=True) as uow:
+            carts = await uow.carts.get_list(
                 page_size=data.page_size,
                 created_at=created_at,
             )
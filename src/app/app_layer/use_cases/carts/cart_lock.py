@@ -35,10 +35,10 @@ class LockCartUseCase:
             return await self._lock_cart(cart_id=cart_id)
 
     async def _lock_cart(self, cart_id: UUID) -> CartOutputDTO:
-        async with self._uow(autocommit=True):
-            cart = await self._uow.carts.retrieve(cart_id=cart_id)
+        async with self._uow(autocommit=True) as uow:
+            cart = await uow.carts.retrieve(cart_id=cart_id)
             cart.lock()
-            await self._uow.carts.update(cart=cart)
+            await uow.carts.update(cart=cart)
 
         logger.info("Cart %s successfully locked", cart.id)
 
@@ -3,7 +3,7 @@ from logging import getLogger
 from app.app_layer.interfaces.auth_system.dto import UserDataOutputDTO
 from app.app_layer.interfaces.auth_system.system import IAuthSystem
 from app.app_layer.interfaces.distributed_lock_system.system import IDistributedLockSystem
-from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork
+from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork, IUnitOfWorkHandle
 from app.app_layer.use_cases.carts.dto import CartOutputDTO, CartRemoveCouponInputDTO
 from app.domain.carts.entities import Cart
 from app.domain.carts.exceptions import CouponDoesNotExistError
@@ -43,10 +43,10 @@ class CartRemoveCouponUseCase:
     async def _remove_coupon(self, data: CartRemoveCouponInputDTO) -> CartOutputDTO:
         user = await self._auth_system.get_user_data(auth_data=data.auth_data)
 
-        async with self._uow(autocommit=True):
-            cart = await self._uow.carts.retrieve(cart_id=data.cart_id)
+        async with self._uow(autocommit=True) as uow:
+            cart = await uow.carts.retrieve(cart_id=data.cart_id)
             self._check_user_ownership(cart=cart, user=user)
-            cart = await self._update_cart(cart=cart)
+            cart = await self._update_cart(uow=uow, cart=cart)
 
         logger.info("Coupon successfully deleted from cart %s", cart.id)
 
@@ -58,12 +58,12 @@ class CartRemoveCouponUseCase:
 
         cart.check_user_ownership(user_id=user.id)
 
-    async def _update_cart(self, cart: Cart) -> Cart:
+    async def _update_cart(self, uow: IUnitOfWorkHandle, cart: Cart) -> Cart:
         try:
             cart.remove_coupon()
         except CouponDoesNotExistError:
             return cart
 
-        await self._uow.cart_coupons.delete(cart_id=cart.id)
+        await uow.cart_coupons.delete(cart_id=cart.id)
 
         return cart
@@ -1,19 +1,37 @@
+from app.app_layer.interfaces.active_carts_cache.cache import IActiveCartsCache
+from app.app_layer.interfaces.active_carts_cache.dto import ActiveCartDTO
 from app.app_layer.interfaces.auth_system.dto import UserDataOutputDTO
 from app.app_layer.interfaces.auth_system.system import IAuthSystem
 from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork
 from app.app_layer.use_cases.carts.dto import CartOutputDTO, CartRetrieveInputDTO
 from app.domain.carts.entities import Cart
+from app.domain.carts.value_objects import CartStatusEnum
+from app.domain.interfaces.repositories.carts.exceptions import (
+    CartConfigNotFoundError,
+    CartNotFoundError,
+)
 from app.logging import update_context
 
 
 class CartRetrieveUseCase:
     """
     Responsible for retrieving a cart and validating the user's ownership of the cart.
+
+    The active cart of the user can be retrieved without its ID. The ID and the config
+    version are taken from the active carts cache when they're there, so the cart is
+    read by its ID without looking the latest config up. Otherwise the cart is looked
+    up by the user ID and the cache is filled.
     """
 
-    def __init__(self, uow: IUnitOfWork, auth_system: IAuthSystem) -> None:
+    def __init__(
+        self,
+        uow: IUnitOfWork,
+        auth_system: IAuthSystem,
+        active_carts_cache: IActiveCartsCache,
+    ) -> None:
         self._uow = uow
         self._auth_system = auth_system
+        self._active_carts_cache = active_carts_cache
 
     async def execute(self, data: CartRetrieveInputDTO) -> CartOutputDTO:
         """
@@ -25,13 +43,62 @@ class CartRetrieveUseCase:
 
         user = await self._auth_system.get_user_data(auth_data=data.auth_data)
 
-        async with self._uow(autocommit=True):
-            cart = await self._uow.carts.retrieve(cart_id=data.cart_id)
+        async with self._uow(autocommit=True) as uow:
+            cart = await uow.carts.retrieve(cart_id=data.cart_id)
 
         self._check_user_ownership(cart=cart, user=user)
 
         return CartOutputDTO.model_validate(cart)
 
+    async def execute_active(self, auth_data: str) -> CartOutputDTO:
+        """
+        Executes the use case by retrieving the active cart of the user based on their
+        authentication data. Returns the retrieved cart as a CartOutputDTO object.
+        """
+
+        user = await self._auth_system.get_user_data(auth_data=auth_data)
+        cart = await self._get_cached_active_cart(user_id=user.id)
+
+        if cart is None:
+            async with self._uow(autocommit=True) as uow:
+                cart = await uow.carts.retrieve_active(user_id=user.id)
+
+            await self._active_carts_cache.set(
+                user_id=user.id,
+                data=ActiveCartDTO(cart_id=cart.id, config_version=cart.config.version),
+            )
+
+        await update_context(cart_id=cart.id)
+
+        return CartOutputDTO.model_validate(cart)
+
+    async def _get_cached_active_cart(self, user_id: int) -> Cart | None:
+        cached = await self._active_carts_cache.get(user_id=user_id)
+
+        if cached is None:
+            return None
+
+        try:
+            async with self._uow(autocommit=True) as uow:
+                cart = await uow.carts.retrieve(
+                    cart_id=cached.cart_id,
+                    config_version=cached.config_version,
+                )
+        except (CartNotFoundError, CartConfigNotFoundError):
+            cart = None
+
+        if (
+            cart is not None
+            and cart.user_id == user_id
+            and cart.status in (CartStatusEnum.OPENED, CartStatusEnum.LOCKED)
+        ):
+            return cart
+
+        # the cart was deactivated or completed by a path that doesn't maintain the cache
+        await self._active_carts_cache.delete(user_id=user_id)
+
+        return None
+
     def _check_user_ownership(self, cart: Cart, user: UserDataOutputDTO) -> None:
         if user.is_admin:
             return
@@ -39,10 +39,10 @@ class UnlockCartUseCase:
             return await self._unlock_cart(cart_id=cart_id)
 
     async def _unlock_cart(self, cart_id: UUID) -> CartOutputDTO:
-        async with self._uow(autocommit=True):
-            cart = await self._uow.carts.retrieve(cart_id=cart_id)
+        async with self._uow(autocommit=True) as uow:
+            cart = await uow.carts.retrieve(cart_id=cart_id)
             cart.unlock()
-            await self._uow.carts.update(cart=cart)
+            await uow.carts.update(cart=cart)
 
         logger.info("Cart %s successfully unlocked", cart.id)
 
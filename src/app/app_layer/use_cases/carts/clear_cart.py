@@ -46,11 +46,11 @@ class ClearCartUseCase:
     async def _clear_cart(self, data: ClearCartInputDTO) -> CartOutputDTO:
         user = await self._auth_system.get_user_data(auth_data=data.auth_data)
 
-        async with self._uow(autocommit=True):
-            cart = await self._uow.carts.retrieve(cart_id=data.cart_id)
+        async with self._uow(autocommit=True) as uow:
+            cart = await uow.carts.retrieve(cart_id=data.cart_id)
             self._check_user_ownership(cart=cart, user=user)
             cart.clear()
-            await self._uow.carts.clear(cart_id=cart.id)
+            await uow.carts.clear(cart_id=cart.id)
 
         logger.info("Cart %s successfully cleared", cart.id)
 
@@ -1,5 +1,7 @@
 from logging import getLogger
 
+from app.app_layer.interfaces.active_carts_cache.cache import IActiveCartsCache
+from app.app_layer.interfaces.active_carts_cache.dto import ActiveCartDTO
 from app.app_layer.interfaces.auth_system.exceptions import OperationForbiddenError
 from app.app_layer.interfaces.auth_system.system import IAuthSystem
 from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork
@@ -17,25 +19,35 @@ class CreateCartUseCase:
     based on the user ID. The class uses an instance of the IUnitOfWork interface to
     interact with the data storage and an instance of the IAuthSystem interface to
     authenticate the user.
+
+    In the get-or-create mode the active cart of the user is returned if it exists,
+    instead of failing with ActiveCartAlreadyExistsError. In both modes the active cart
+    is put into the active carts cache.
     """
 
     def __init__(
         self,
         uow: IUnitOfWork,
         auth_system: IAuthSystem,
+        active_carts_cache: IActiveCartsCache,
     ) -> None:
         self._uow = uow
         self._auth_system = auth_system
+        self._active_carts_cache = active_carts_cache
 
-    async def create_by_auth_data(self, auth_data: str) -> CartOutputDTO:
+    async def create_by_auth_data(
+        self,
+        auth_data: str,
+        get_or_create: bool = False,
+    ) -> CartOutputDTO:
         """
         Creates a cart for the user based on their authentication data. It retrieves
         the user data using the get_user_data method of the IAuthSystem interface and
-        then creates the cart.
+        then creates the cart, or gets the active one in the get-or-create mode.
         """
 
         user = await self._auth_system.get_user_data(auth_data=auth_data)
-        return await self._create(user_id=user.id)
+        return await self._create(user_id=user.id, get_or_create=get_or_create)
 
     async def create_by_user_id(self, data: CartCreateByUserIdInputDTO) -> CartOutputDTO:
         """
@@ -55,12 +67,21 @@ class CreateCartUseCase:
 
         return await self._create(user_id=data.user_id)
 
-    async def _create(self, user_id: int) -> CartOutputDTO:
-        async with self._uow(autocommit=True):
-            cart_config = await self._uow.carts.get_config()
+    async def _create(self, user_id: int, get_or_create: bool = False) -> CartOutputDTO:
+        async with self._uow(autocommit=True) as uow:
+            cart_config = await uow.carts.get_config()
             cart = Cart.create(user_id=user_id, config=cart_config)
-            await self._uow.carts.create(cart=cart)
 
-        logger.debug("Cart %s successfully created for user %s.", cart.id, cart.user_id)
+            if get_or_create:
+                cart = await uow.carts.get_or_create(cart=cart)
+            else:
+                await uow.carts.create(cart=cart)
+
+        await self._active_carts_cache.set(
+            user_id=cart.user_id,
+            data=ActiveCartDTO(cart_id=cart.id, config_version=cart.config.version),
+        )
+
+        logger.debug("Cart %s is active for user %s.", cart.id, cart.user_id)
 
         return CartOutputDTO.model_validate(cart)
@@ -2,7 +2,7 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 from app.domain.carts.value_objects import CartStatusEnum
 
@@ -38,6 +38,7 @@ class CartOutputDTO(BaseModel):
     id: UUID
     user_id: int
     status: CartStatusEnum
+    config_version: int | None = None
     items: list[ItemOutputDTO]
     items_qty: Decimal
     cost: Decimal
@@ -78,3 +79,23 @@ class CartListInputDTO(BaseModel):
 
 
 CartListOutputDTO = TypeAdapter(list[CartOutputDTO])
+
+
+class CartBatchResultOutputDTO(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    cart_id: UUID
+    cart: CartOutputDTO | None = None
+    error: Exception | None = None
+
+
+class DeactivateExpiredCartsOutputDTO(BaseModel):
+    deactivated_qty: int
+    batches_qty: int
+    elapsed_sec: float
+
+
+class ArchiveCartsOutputDTO(BaseModel):
+    archived_qty: int
+    batches_qty: int
+    elapsed_sec: float
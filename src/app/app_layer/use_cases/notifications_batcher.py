@@ -0,0 +1,95 @@
+import asyncio
+from logging import getLogger
+from uuid import UUID
+
+from app.app_layer.use_cases.abandoned_carts_service import AbandonedCartsService
+from app.config import NotificationsBatchConfig
+
+logger = getLogger(__name__)
+
+
+class NotificationsBatcher:
+    """
+    Responsible for combining abandoned cart notifications requested by concurrently
+    running tasks into batches, which are sent by the abandoned carts service at once.
+
+    A batch is sent when it reaches the configured size or when the configured time has
+    passed since its first notification was requested. Every caller waits for and gets
+    the result of its own notification only, so the tasks are still acknowledged and
+    retried individually. When batching is disabled, notifications are sent one by one.
+    """
+
+    def __init__(
+        self,
+        service: AbandonedCartsService,
+        config: NotificationsBatchConfig,
+    ) -> None:
+        self._service = service
+        self._config = config
+        self._pending: list[tuple[int, UUID, int, asyncio.Future[None]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task[None]] = set()
+
+    async def send_notification(
+        self, user_id: int, cart_id: UUID, cycle: int = 1
+    ) -> None:
+        """
+        Sends a notification of the specified cycle to the user for the specified
+        abandoned cart as a part of the current batch and waits until it is sent.
+        """
+
+        if not self._config.enabled:
+            await self._service.send_notification(
+                user_id=user_id,
+                cart_id=cart_id,
+                cycle=cycle,
+            )
+            return
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        self._pending.append((user_id, cart_id, cycle, future))
+
+        if len(self._pending) >= self._config.max_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._config.max_wait_sec, self._flush)
+
+        await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+
+        batch = asyncio.create_task(self._send(pending))
+        self._batches.add(batch)
+        batch.add_done_callback(self._batches.discard)
+
+    async def _send(
+        self,
+        pending: list[tuple[int, UUID, int, asyncio.Future[None]]],
+    ) -> None:
+        errors: list[BaseException | None]
+
+        try:
+            errors = await self._service.send_notifications(
+                recipients=[
+                    (user_id, cart_id, cycle) for user_id, cart_id, cycle, _ in pending
+                ],
+            )
+        except Exception as exc:
+            logger.exception("Failed to send a batch of %s notifications.", len(pending))
+            errors = [exc] * len(pending)
+
+        for (*_, future), error in zip(pending, errors):
+            # the task may have been cancelled by the job timeout
+            if future.done():
+                continue
+
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
@@ -0,0 +1,17 @@
+from app.app_layer.interfaces.tasks.dto import QueueStatsOutputDTO
+from app.app_layer.interfaces.tasks.monitor import ITaskQueuesMonitor
+
+
+class TaskQueuesStatsUseCase:
+    """
+    Responsible for reporting the depth and the lag of the task queues, so the workers
+    of every queue can be scaled independently.
+    """
+
+    def __init__(self, monitor: ITaskQueuesMonitor) -> None:
+        self._monitor = monitor
+
+    async def execute(self) -> list[QueueStatsOutputDTO]:
+        """Executes the use case by reading the current stats of every task queue."""
+
+        return await self._monitor.get_stats()
@@ -1,12 +1,19 @@
+from enum import StrEnum
 from typing import Any
 
-from pydantic import AnyHttpUrl, BaseModel, PostgresDsn
+from pydantic import AnyHttpUrl, BaseModel, Field, PostgresDsn, model_validator
 from pydantic_settings import BaseSettings
 
 from app.logging import LoggingConfig
 
 
+class DBBackendEnum(StrEnum):
+    SQLA = "sqla"
+    ASYNCPG = "asyncpg"
+
+
 class DBConfig(BaseModel):
+    backend: DBBackendEnum = DBBackendEnum.SQLA
     app_name: str
     dsn: PostgresDsn
     schema_name: str
@@ -19,6 +26,7 @@ class DBConfig(BaseModel):
     server_settings: dict[str, Any] = {}
     connect_args: dict[str, Any] = {}
     debug: bool = False
+    aggregated_cart_fetch: bool = False
 
 
 class ProductsClientConfig(BaseModel):
@@ -53,8 +61,54 @@ class TaskConfig(BaseModel):
     no_keep_result_value: int = 0
 
 
+class QueueConfig(BaseModel):
+    max_jobs: int = Field(default=10, gt=0)
+    job_timeout_sec: int = 300
+
+
+class QueuesConfig(BaseModel):
+    example: QueueConfig = QueueConfig()
+    periodic: QueueConfig = QueueConfig()
+    abandoned_carts: QueueConfig = QueueConfig(max_jobs=4)
+    notifications: QueueConfig = QueueConfig(max_jobs=50, job_timeout_sec=60)
+
+
+class NotificationsBatchConfig(BaseModel):
+    enabled: bool = False
+    max_size: int = Field(default=50, gt=0)
+    max_wait_sec: float = Field(default=0.05, ge=0)
+
+
 class PeriodicConfig(BaseModel):
     schedule: dict[str, Any] = {"hour": [0, 12]}
+    shards_qty: int = Field(default=1, gt=0)
+    lease_ttl_sec: float = 5.0
+    incremental: bool = False
+
+
+class CartExpiryConfig(BaseModel):
+    idle_hours: int = 720
+    batch_size: int = 1000
+    max_batches: int = 100
+    schedule: dict[str, Any] = {"minute": [0]}
+
+
+class CartArchiveConfig(BaseModel):
+    older_than_days: int = 90
+    batch_size: int = 500
+    max_batches: int = 100
+    schedule: dict[str, Any] = {"hour": [3], "minute": [0]}
+
+
+class ActiveCartsCacheConfig(BaseModel):
+    # a cached cart keeps its config version for the ttl after the config is updated,
+    # like the item limits cache
+    ttl_sec: int = Field(default=60, gt=0)
+
+
+class ItemLimitsCacheConfig(BaseModel):
+    ttl_sec: float = Field(default=60, gt=0)
+    max_size: int = Field(default=100_000, gt=0)
 
 
 class RedisLockConfig(BaseModel):
@@ -68,6 +122,34 @@ class RedisLockConfig(BaseModel):
     time_to_wait_sec: float = 5.0
 
 
+class AuthBackendEnum(StrEnum):
+    FAKE = "fake"
+    JWT = "jwt"
+
+
+class AuthConfig(BaseModel):
+    backend: AuthBackendEnum = AuthBackendEnum.FAKE
+    name: str = "auth"
+    retries_enabled: bool = True
+    jwks_url: AnyHttpUrl | None = None
+    jwks_min_refresh_interval_sec: float = 30.0
+    algorithms: list[str] = ["RS256"]
+    audience: str | None = None
+    issuer: str | None = None
+    leeway_sec: int = 0
+    user_id_claim: str = "sub"
+    roles_claim: str = "roles"
+    admin_role: str = "admin"
+    users_cache_size: int = 10_000
+
+    @model_validator(mode="after")
+    def check_jwks_url(self) -> "AuthConfig":
+        if self.backend == AuthBackendEnum.JWT and self.jwks_url is None:
+            raise ValueError("jwks_url is required for the jwt backend")
+
+        return self
+
+
 class Config(BaseSettings):
     class Config:
         env_file = ".env"
@@ -78,7 +160,14 @@ class Config(BaseSettings):
     NOTIFICATIONS_CLIENT: NotificationsClientConfig
     ARQ_REDIS: ArqRedisConfig
     TASK: TaskConfig
+    QUEUES: QueuesConfig = QueuesConfig()
+    NOTIFICATIONS_BATCH: NotificationsBatchConfig = NotificationsBatchConfig()
     PERIODIC: PeriodicConfig
+    CART_EXPIRY: CartExpiryConfig = CartExpiryConfig()
+    CART_ARCHIVE: CartArchiveConfig = CartArchiveConfig()
     DB: DBConfig
     LOGGING: LoggingConfig
     REDIS_LOCK: RedisLockConfig
+    ACTIVE_CARTS_CACHE: ActiveCartsCacheConfig = ActiveCartsCacheConfig()
+    ITEM_LIMITS_CACHE: ItemLimitsCacheConfig = ItemLimitsCacheConfig()
+    AUTH: AuthConfig = AuthConfig()
@@ -1,6 +1,6 @@
 from contextlib import asynccontextmanager
 from types import ModuleType
-from typing import AsyncContextManager
+from typing import AsyncIterator
 
 from dependency_injector import containers, providers
 
@@ -8,9 +8,19 @@ from app.app_layer.use_cases.abandoned_carts_service import AbandonedCartsServic
 from app.app_layer.use_cases.cart_config.service import CartConfigService
 from app.app_layer.use_cases.cart_items.add_item import AddCartItemUseCase
 from app.app_layer.use_cases.cart_items.delete_item import DeleteCartItemUseCase
+from app.app_layer.use_cases.cart_items.limits import CartItemLimits
 from app.app_layer.use_cases.cart_items.update_item import UpdateCartItemUseCase
 from app.app_layer.use_cases.carts.cart_apply_coupon import CartApplyCouponUseCase
+from app.app_layer.use_cases.carts.cart_archive import ArchiveCartsUseCase
+from app.app_layer.use_cases.carts.cart_batch import (
+    BatchCompleteCartUseCase,
+    BatchLockCartUseCase,
+    BatchUnlockCartUseCase,
+)
 from app.app_layer.use_cases.carts.cart_complete import CompleteCartUseCase
+from app.app_layer.use_cases.carts.cart_deactivate_expired import (
+    DeactivateExpiredCartsUseCase,
+)
 from app.app_layer.use_cases.carts.cart_delete import CartDeleteUseCase
 from app.app_layer.use_cases.carts.cart_list import CartListUseCase
 from app.app_layer.use_cases.carts.cart_lock import LockCartUseCase
@@ -19,8 +29,11 @@ from app.app_layer.use_cases.carts.cart_retrieve import CartRetrieveUseCase
 from app.app_layer.use_cases.carts.cart_unlock import UnlockCartUseCase
 from app.app_layer.use_cases.carts.clear_cart import ClearCartUseCase
 from app.app_layer.use_cases.carts.create_cart import CreateCartUseCase
+from app.app_layer.use_cases.notifications_batcher import NotificationsBatcher
+from app.app_layer.use_cases.task_queues.stats import TaskQueuesStatsUseCase
 from app.config import Config
-from app.infra.auth_system import FakeJWTAuthSystem
+from app.infra.auth_system import FakeJWTAuthSystem, JWTAuthSystem
+from app.infra.events.arq.monitor import ArqTaskQueuesMonitor
 from app.infra.events.arq.producers import ArqTaskProducer, init_arq_task_broker
 from app.infra.http.clients.coupons import CouponsHttpClient
 from app.infra.http.clients.notifications import NotificationsHttpClient
@@ -28,44 +41,57 @@ from app.infra.http.clients.products import ProductsHttpClient
 from app.infra.http.retry_systems.backoff import BackoffConfig, BackoffRetrySystem
 from app.infra.http.transports.aiohttp import AioHttpTransport, init_aiohttp_session_pool
 from app.infra.http.transports.base import HttpTransportConfig, RetryableHttpTransport
+from app.infra.redis_active_carts_cache import RedisActiveCartsCache
 from app.infra.redis_lock_system import RedisLockSystem, init_redis
+from app.infra.repositories.asyncpg.db import init_asyncpg_pool
 from app.infra.repositories.sqla.db import Database
+from app.infra.unit_of_work.asyncpg import AsyncpgUow
 from app.infra.unit_of_work.sqla import Uow
 
 
 class EventsContainer(containers.DeclarativeContainer):
     config = providers.Dependency(instance_of=Config)
     broker = providers.Resource(init_arq_task_broker, config=config.provided.ARQ_REDIS)
-    task_producer = providers.Factory(ArqTaskProducer, broker=broker)
+    task_producer = providers.Singleton(ArqTaskProducer, broker=broker)
+    queues_monitor = providers.Singleton(ArqTaskQueuesMonitor, broker=broker)
 
 
 class DBContainer(containers.DeclarativeContainer):
     config = providers.Dependency(instance_of=Config)
     db = providers.Singleton(Database, config=config.provided.DB)
-    uow = providers.Factory(Uow, session_factory=db.provided.session_factory)
+    pool = providers.Resource(init_asyncpg_pool, config=config.provided.DB)
+    uow = providers.Selector(
+        config.provided.DB.backend,
+        sqla=providers.Singleton(
+            Uow,
+            session_factory=db.provided.session_factory,
+            aggregated_cart_fetch=config.provided.DB.aggregated_cart_fetch,
+        ),
+        asyncpg=providers.Singleton(AsyncpgUow, pool=pool),
+    )
 
 
 class ProductsClientContainer(containers.DeclarativeContainer):
     config = providers.Dependency(instance_of=Config)
-    transport = providers.Factory(
+    transport = providers.Singleton(
         RetryableHttpTransport,
-        transport=providers.Factory(
+        transport=providers.Singleton(
             AioHttpTransport,
             session=providers.Resource(init_aiohttp_session_pool),
-            config=providers.Factory(
+            config=providers.Singleton(
                 HttpTransportConfig,
                 integration_name=config.provided.PRODUCTS_CLIENT.name,
             ),
         ),
-        retry_system=providers.Factory(
+        retry_system=providers.Singleton(
             BackoffRetrySystem,
-            config=providers.Factory(
+            config=providers.Singleton(
                 BackoffConfig,
                 enabled=config.provided.PRODUCTS_CLIENT.retries_enabled,
             ),
         ),
     )
-    client = providers.Factory(
+    client = providers.Singleton(
         ProductsHttpClient,
         base_url=config.provided.PRODUCTS_CLIENT.base_url,
         transport=transport,
@@ -74,25 +100,25 @@ class ProductsClientContainer(containers.DeclarativeContainer):
 
 class CouponsClientContainer(containers.DeclarativeContainer):
     config = providers.Dependency(instance_of=Config)
-    transport = providers.Factory(
+    transport = providers.Singleton(
         RetryableHttpTransport,
-        transport=providers.Factory(
+        transport=providers.Singleton(
             AioHttpTransport,
             session=providers.Resource(init_aiohttp_session_pool),
-            config=providers.Factory(
+            config=providers.Singleton(
                 HttpTransportConfig,
                 integration_name=config.provided.COUPONS_CLIENT.name,
             ),
         ),
-        retry_system=providers.Factory(
+        retry_system=providers.Singleton(
             BackoffRetrySystem,
-            config=providers.Factory(
+            config=providers.Singleton(
                 BackoffConfig,
                 enabled=config.provided.COUPONS_CLIENT.retries_enabled,
             ),
         ),
     )
-    client = providers.Factory(
+    client = providers.Singleton(
         CouponsHttpClient,
         base_url=config.provided.COUPONS_CLIENT.base_url,
         transport=transport,
@@ -101,38 +127,69 @@ class CouponsClientContainer(containers.DeclarativeContainer):
 
 class NotificationsClientContainer(containers.DeclarativeContainer):
     config = providers.Dependency(instance_of=Config)
-    transport = providers.Factory(
+    transport = providers.Singleton(
         RetryableHttpTransport,
-        transport=providers.Factory(
+        transport=providers.Singleton(
             AioHttpTransport,
             session=providers.Resource(init_aiohttp_session_pool),
-            config=providers.Factory(
+            config=providers.Singleton(
                 HttpTransportConfig,
                 integration_name=config.provided.NOTIFICATIONS_CLIENT.name,
             ),
         ),
-        retry_system=providers.Factory(
+        retry_system=providers.Singleton(
             BackoffRetrySystem,
-            config=providers.Factory(
+            config=providers.Singleton(
                 BackoffConfig,
                 enabled=config.provided.NOTIFICATIONS_CLIENT.retries_enabled,
             ),
         ),
     )
-    client = providers.Factory(
+    client = providers.Singleton(
         NotificationsHttpClient,
         base_url=config.provided.NOTIFICATIONS_CLIENT.base_url,
         transport=transport,
     )
 
 
+class AuthSystemContainer(containers.DeclarativeContainer):
+    config = providers.Dependency(instance_of=Config)
+    transport = providers.Singleton(
+        RetryableHttpTransport,
+        transport=providers.Singleton(
+            AioHttpTransport,
+            session=providers.Resource(init_aiohttp_session_pool),
+            config=providers.Singleton(
+                HttpTransportConfig,
+                integration_name=config.provided.AUTH.name,
+            ),
+        ),
+        retry_system=providers.Singleton(
+            BackoffRetrySystem,
+            config=providers.Singleton(
+                BackoffConfig,
+                enabled=config.provided.AUTH.retries_enabled,
+            ),
+        ),
+    )
+    system = providers.Selector(
+        config.provided.AUTH.backend,
+        fake=providers.Singleton(FakeJWTAuthSystem),
+        jwt=providers.Singleton(
+            JWTAuthSystem,
+            config=config.provided.AUTH,
+            transport=transport,
+        ),
+    )
+
+
 class DistributedLockSystemContainer(containers.DeclarativeContainer):
     config = providers.Dependency(instance_of=Config)
     redis = providers.Resource(
         init_redis,
         config=config.provided.REDIS_LOCK,
     )
-    system = providers.Factory(
+    system = providers.Singleton(
         RedisLockSystem,
         redis=redis,
         config=config.provided.REDIS_LOCK,
@@ -149,105 +206,162 @@ class Container(containers.DeclarativeContainer):
     notifications_client = providers.Container(
         NotificationsClientContainer, config=config
     )
-    auth_system = providers.Factory(FakeJWTAuthSystem)
+    auth = providers.Container(AuthSystemContainer, config=config)
+    auth_system = auth.container.system
     distributed_lock_system = providers.Container(
         DistributedLockSystemContainer,
         config=config,
     )
+    active_carts_cache = providers.Singleton(
+        RedisActiveCartsCache,
+        redis=distributed_lock_system.container.redis,
+        config=config.ACTIVE_CARTS_CACHE,
+    )
+    cart_item_limits = providers.Singleton(
+        CartItemLimits,
+        uow=db.container.uow,
+        config=config.ITEM_LIMITS_CACHE,
+    )
 
-    create_cart_use_case = providers.Factory(
-        CreateCartUseCase, uow=db.container.uow, auth_system=auth_system
+    create_cart_use_case = providers.Singleton(
+        CreateCartUseCase,
+        uow=db.container.uow,
+        auth_system=auth_system,
+        active_carts_cache=active_carts_cache,
     )
-    cart_retrieve_use_case = providers.Factory(
+    cart_retrieve_use_case = providers.Singleton(
         CartRetrieveUseCase,
         uow=db.container.uow,
         auth_system=auth_system,
+        active_carts_cache=active_carts_cache,
     )
-    cart_delete_use_case = providers.Factory(
+    cart_delete_use_case = providers.Singleton(
         CartDeleteUseCase,
         uow=db.container.uow,
         auth_system=auth_system,
         distributed_lock_system=distributed_lock_system.container.system,
+        active_carts_cache=active_carts_cache,
     )
 
-    add_cart_item_use_case = providers.Factory(
+    add_cart_item_use_case = providers.Singleton(
         AddCartItemUseCase,
         uow=db.container.uow,
         products_client=products_client.container.client,
         auth_system=auth_system,
         distributed_lock_system=distributed_lock_system.container.system,
+        item_limits=cart_item_limits,
     )
-    update_cart_item_use_case = providers.Factory(
+    update_cart_item_use_case = providers.Singleton(
         UpdateCartItemUseCase,
         uow=db.container.uow,
         auth_system=auth_system,
         distributed_lock_system=distributed_lock_system.container.system,
+        item_limits=cart_item_limits,
     )
-    delete_cart_item_use_case = providers.Factory(
+    delete_cart_item_use_case = providers.Singleton(
         DeleteCartItemUseCase,
         uow=db.container.uow,
         auth_system=auth_system,
         distributed_lock_system=distributed_lock_system.container.system,
     )
-    clear_cart_use_case = providers.Factory(
+    clear_cart_use_case = providers.Singleton(
         ClearCartUseCase,
         uow=db.container.uow,
         auth_system=auth_system,
         distributed_lock_system=distributed_lock_system.container.system,
     )
 
-    cart_apply_coupon_use_case = providers.Factory(
+    cart_apply_coupon_use_case = providers.Singleton(
         CartApplyCouponUseCase,
         uow=db.container.uow,
         coupons_client=coupons_client.container.client,
         auth_system=auth_system,
         distributed_lock_system=distributed_lock_system.container.system,
     )
-    cart_remove_coupon_use_case = providers.Factory(
+    cart_remove_coupon_use_case = providers.Singleton(
         CartRemoveCouponUseCase,
         uow=db.container.uow,
         auth_system=auth_system,
         distributed_lock_system=distributed_lock_system.container.system,
     )
 
-    lock_cart_use_case = providers.Factory(
+    lock_cart_use_case = providers.Singleton(
         LockCartUseCase,
         uow=db.container.uow,
         distributed_lock_system=distributed_lock_system.container.system,
     )
-    unlock_cart_use_case = providers.Factory(
+    unlock_cart_use_case = providers.Singleton(
         UnlockCartUseCase,
         uow=db.container.uow,
         distributed_lock_system=distributed_lock_system.container.system,
     )
-    complete_cart_use_case = providers.Factory(
+    complete_cart_use_case = providers.Singleton(
         CompleteCartUseCase,
         uow=db.container.uow,
         distributed_lock_system=distributed_lock_system.container.system,
+        active_carts_cache=active_carts_cache,
+    )
+    batch_lock_cart_use_case = providers.Singleton(
+        BatchLockCartUseCase,
+        uow=db.container.uow,
+        distributed_lock_system=distributed_lock_system.container.system,
     )
-    cart_list_use_case = providers.Factory(
+    batch_unlock_cart_use_case = providers.Singleton(
+        BatchUnlockCartUseCase,
+        uow=db.container.uow,
+        distributed_lock_system=distributed_lock_system.container.system,
+    )
+    batch_complete_cart_use_case = providers.Singleton(
+        BatchCompleteCartUseCase,
+        uow=db.container.uow,
+        distributed_lock_system=distributed_lock_system.container.system,
+    )
+    cart_list_use_case = providers.Singleton(
         CartListUseCase,
         uow=db.container.uow,
         auth_system=auth_system,
     )
-    cart_config_service = providers.Factory(
+    cart_config_service = providers.Singleton(
         CartConfigService,
         uow=db.container.uow,
         auth_system=auth_system,
+        item_limits=cart_item_limits,
     )
-    abandoned_carts_service = providers.Factory(
+    archive_carts_use_case = providers.Singleton(
+        ArchiveCartsUseCase,
+        uow=db.container.uow,
+        config=config.CART_ARCHIVE,
+    )
+    deactivate_expired_carts_use_case = providers.Singleton(
+        DeactivateExpiredCartsUseCase,
+        uow=db.container.uow,
+        config=config.CART_EXPIRY,
+    )
+    task_queues_stats_use_case = providers.Singleton(
+        TaskQueuesStatsUseCase,
+        monitor=events.container.queues_monitor,
+    )
+    abandoned_carts_service = providers.Singleton(
         AbandonedCartsService,
         uow=db.container.uow,
         task_producer=events.container.task_producer,
         notification_client=notifications_client.container.client,
+        distributed_lock_system=distributed_lock_system.container.system,
         config=config.TASK,
+        periodic_config=config.PERIODIC,
+        reservation_timeout_sec=config.QUEUES.notifications.job_timeout_sec,
+    )
+    notifications_batcher = providers.Singleton(
+        NotificationsBatcher,
+        service=abandoned_carts_service,
+        config=config.NOTIFICATIONS_BATCH,
     )
 
     @classmethod
     @asynccontextmanager
     async def lifespan(
         cls, wireable_packages: list[ModuleType]
-    ) -> AsyncContextManager["Container"]:
+    ) -> AsyncIterator["Container"]:
         container = cls()
         container.wire(packages=wireable_packages)
 
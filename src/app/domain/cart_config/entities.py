@@ -9,3 +9,4 @@ class CartConfig:
         self.hours_since_update_until_abandoned = data.hours_since_update_until_abandoned
         self.max_abandoned_notifications_qty = data.max_abandoned_notifications_qty
         self.abandoned_cart_text = data.abandoned_cart_text
+        self.version = data.version
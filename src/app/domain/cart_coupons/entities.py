@@ -2,6 +2,8 @@ import typing
 from decimal import Decimal
 
 from app.domain.cart_coupons.dto import CartCouponDTO
+from app.domain.cart_items.value_objects import ITEM_COST_SCALE
+from app.domain.fixed_point import to_minor_ceil
 
 if typing.TYPE_CHECKING:  # pragma: no cover
     from app.domain.carts.entities import Cart
@@ -19,10 +21,14 @@ class CartCoupon:
         self.discount_abs = data.discount_abs
         self.cart = cart
 
+        # in the minor units of the item costs, so it's compared to the cart cost with
+        # integer arithmetic
+        self._min_cart_cost_minor = to_minor_ceil(self.min_cart_cost, ITEM_COST_SCALE)
+
     @property
     def cart_cost(self) -> Decimal:
         return self.cart.cost - self.discount_abs
 
     @property
     def applied(self) -> bool:
-        return self.cart.cost >= self.min_cart_cost
+        return self.cart.cost_minor >= self._min_cart_cost_minor
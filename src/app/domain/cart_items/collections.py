@@ -0,0 +1,76 @@
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from typing import overload
+
+from app.domain.cart_items.entities import CartItem
+
+
+class CartItems(Sequence[CartItem]):
+    """
+    Represents the items of a shopping cart indexed by item id. Lookup, insertion and
+    deletion by id take constant time, iteration follows the insertion order.
+    """
+
+    def __init__(self, items: Iterable[CartItem] = ()) -> None:
+        self._items_by_id = {item.id: item for item in items}
+
+    def __len__(self) -> int:
+        return len(self._items_by_id)
+
+    def __iter__(self) -> Iterator[CartItem]:
+        return iter(self._items_by_id.values())
+
+    def __contains__(self, item: object) -> bool:
+        return isinstance(item, CartItem) and self._items_by_id.get(item.id) is item
+
+    @overload
+    def __getitem__(self, index: int) -> CartItem:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[CartItem]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> CartItem | list[CartItem]:
+        items = self._items_by_id.values()
+
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(items))
+            if step < 0:
+                return list(items)[index]
+
+            return list(islice(items, start, stop, step))
+
+        if not -len(items) <= index < len(items):
+            raise IndexError(f"{self.__class__.__name__} index out of range")
+
+        if index < 0:
+            return next(islice(reversed(items), -index - 1, None))
+
+        return next(islice(items, index, None))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CartItems | list):
+            return NotImplemented
+
+        return len(self) == len(other) and all(
+            item == other_item for item, other_item in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def get(self, item_id: int) -> CartItem | None:
+        """Returns the item with the provided id or None if the cart doesn't have it."""
+
+        return self._items_by_id.get(item_id)
+
+    def append(self, item: CartItem) -> None:
+        """Adds the item to the end of the collection, replacing one with the same id."""
+
+        self._items_by_id[item.id] = item
+
+    def pop(self, item_id: int) -> CartItem:
+        """Removes the item with the provided id from the collection and returns it."""
+
+        return self._items_by_id.pop(item_id)
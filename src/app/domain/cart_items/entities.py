@@ -1,12 +1,22 @@
 from decimal import Decimal
 
 from app.domain.cart_items.dto import ItemDTO
+from app.domain.cart_items.value_objects import (
+    ITEM_COST_SCALE,
+    ITEM_PRICE_SCALE,
+    QTY_SCALE,
+)
+from app.domain.fixed_point import from_minor, get_scale, to_minor
 
 
 class CartItem:
     """
     Represents an item that can be a part of a shopping cart. It also calculates the
     cost of the item based on its quantity and price.
+
+    The price and the quantity are kept as integer minor units too, so costs are
+    computed with integer arithmetic. The cost is given back with the decimal places of
+    price * qty, the way the decimal multiplication gives it.
     """
 
     def __init__(self, data: ItemDTO) -> None:
@@ -17,6 +27,46 @@ class CartItem:
         self.is_weight = data.is_weight
         self.cart_id = data.cart_id
 
+    @property
+    def qty(self) -> Decimal:
+        return self._qty
+
+    @qty.setter
+    def qty(self, value: Decimal) -> None:  # noqa: CCE001
+        self._qty = value
+        self._qty_minor = to_minor(value, QTY_SCALE)
+        self._qty_scale = get_scale(value)
+
+    @property
+    def qty_minor(self) -> int:
+        return self._qty_minor
+
+    @property
+    def qty_scale(self) -> int:
+        return self._qty_scale
+
+    @property
+    def price(self) -> Decimal:
+        return self._price
+
+    @price.setter
+    def price(self, value: Decimal) -> None:  # noqa: CCE001
+        self._price = value
+        self._price_minor = to_minor(value, ITEM_PRICE_SCALE)
+        self._price_scale = get_scale(value)
+
+    @property
+    def price_minor(self) -> int:
+        return self._price_minor
+
+    @property
+    def cost_minor(self) -> int:
+        return self._price_minor * self._qty_minor
+
+    @property
+    def cost_scale(self) -> int:
+        return self._price_scale + self.qty_scale
+
     @property
     def cost(self) -> Decimal:
-        return self.price * self.qty
+        return from_minor(self.cost_minor, ITEM_COST_SCALE, display_scale=self.cost_scale)
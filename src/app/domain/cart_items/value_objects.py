@@ -3,6 +3,7 @@ from logging import getLogger
 
 from annotated_types import Gt
 from pydantic import (
+    Field,
     ValidationError,
     ValidationInfo,
     ValidatorFunctionWrapHandler,
@@ -14,6 +15,13 @@ from app.domain.cart_items.exceptions import MinQtyLimitExceededError
 
 logger = getLogger(__name__)
 
+ITEM_PRICE_PRECISION = 10
+ITEM_PRICE_SCALE = 2
+QTY_PRECISION = 10
+# the finest qty the carts accept, the scale of the item qty limits
+QTY_SCALE = 3
+ITEM_COST_SCALE = ITEM_PRICE_SCALE + QTY_SCALE
+
 
 def qty_validator(
     value: Decimal,
@@ -24,14 +32,18 @@ def qty_validator(
         return handler(value)
     except ValidationError:
         logger.info(
-            "Invalid item %s qty detected! Required >= 0, got %s.",
+            "Invalid item %s qty detected! Required > 0 with at most %s decimal places, "
+            "got %s.",
             info.data.get("item_id") if info.data else None,
+            QTY_SCALE,
             value,
         )
         raise MinQtyLimitExceededError
 
 
-Qty = Annotated[Decimal, Gt(Decimal(0)), WrapValidator(qty_validator)]
-
-ITEM_PRICE_PRECISION = 10
-ITEM_PRICE_SCALE = 2
+Qty = Annotated[
+    Decimal,
+    Gt(Decimal(0)),
+    Field(decimal_places=QTY_SCALE),
+    WrapValidator(qty_validator),
+]
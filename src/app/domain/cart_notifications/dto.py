@@ -10,5 +10,6 @@ class CartNotificationDTO(BaseModel):
     id: UUID
     cart_id: UUID
     type: CartNotificationTypeEnum
+    cycle: int = 1
     text: str
-    sent_at: datetime
+    sent_at: datetime | None = None
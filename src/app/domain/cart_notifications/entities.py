@@ -1,20 +1,26 @@
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from app.domain.cart_notifications.dto import CartNotificationDTO
 from app.domain.cart_notifications.value_objects import CartNotificationTypeEnum
+from app.domain.ids import uuid7
 
 
 class CartNotification:
     """
     Represents a notification of a cart. It also provides methods for creating
     different types of cart notifications.
+
+    A notification is identified by its cart, type and cycle, the ordinal number of the
+    notification of that type for the cart. A created notification is pending until it
+    is marked as sent.
     """
 
     def __init__(self, data: CartNotificationDTO) -> None:
         self.id = data.id
         self.cart_id = data.cart_id
         self.type = data.type
+        self.cycle = data.cycle
         self.text = data.text
         self.sent_at = data.sent_at
 
@@ -24,32 +30,40 @@ class CartNotification:
         cart_id: UUID,
         notification_type: CartNotificationTypeEnum,
         text: str,
+        cycle: int = 1,
     ) -> "CartNotification":
         """
-        Creates a cart notification with the given cart ID, notification type, and
-        text.
+        Creates a pending cart notification with the given cart ID, notification type,
+        text and cycle.
         """
 
         return cls(
             data=CartNotificationDTO(
-                id=uuid4(),
+                id=uuid7(),
                 cart_id=cart_id,
                 type=notification_type,
+                cycle=cycle,
                 text=text,
-                sent_at=datetime.now(),
             ),
         )
 
     @classmethod
     def create_abandoned_cart_notification(
-        cls, cart_id: UUID, text: str
+        cls, cart_id: UUID, text: str, cycle: int = 1
     ) -> "CartNotification":
         """
-        Creates an abandoned cart notification with the given cart ID and text.
+        Creates a pending abandoned cart notification with the given cart ID, text and
+        cycle.
         """
 
         return cls.create(
             cart_id=cart_id,
             notification_type=CartNotificationTypeEnum.ABANDONED_CART,
             text=text,
+            cycle=cycle,
         )
+
+    def mark_sent(self) -> None:
+        """Marks the notification as sent at the current time."""
+
+        self.sent_at = datetime.now()
@@ -14,3 +14,4 @@ class CartDTO(BaseModel):
     id: UUID
     user_id: int
     status: CartStatusEnum
+    config_version: int | None = None
@@ -1,11 +1,13 @@
-import uuid
+from collections.abc import Iterable
 from datetime import datetime
 from decimal import Decimal
 from logging import getLogger
 
 from app.domain.cart_config.entities import CartConfig
 from app.domain.cart_coupons.entities import CartCoupon
+from app.domain.cart_items.collections import CartItems
 from app.domain.cart_items.entities import CartItem
+from app.domain.cart_items.value_objects import ITEM_COST_SCALE, QTY_SCALE
 from app.domain.carts.dto import CartDTO
 from app.domain.carts.exceptions import (
     CantBeLockedError,
@@ -20,6 +22,8 @@ from app.domain.carts.exceptions import (
     SpecificItemQtyLimitExceeded,
 )
 from app.domain.carts.value_objects import CartStatusEnum
+from app.domain.fixed_point import from_minor, to_minor, to_minor_ceil
+from app.domain.ids import uuid7
 
 logger = getLogger(__name__)
 
@@ -31,6 +35,7 @@ class Cart:
     """
 
     WEIGHT_ITEM_QTY: Decimal = Decimal(1)
+    WEIGHT_ITEM_QTY_MINOR: int = to_minor(WEIGHT_ITEM_QTY, QTY_SCALE)
     STATUS_TRANSITION_RULESET: dict[CartStatusEnum, set[CartStatusEnum]] = {
         CartStatusEnum.OPENED: {CartStatusEnum.DEACTIVATED, CartStatusEnum.LOCKED},
         CartStatusEnum.DEACTIVATED: {},
@@ -41,7 +46,7 @@ class Cart:
     def __init__(
         self,
         data: CartDTO,
-        items: list[CartItem],
+        items: Iterable[CartItem],
         config: CartConfig,
         coupon: CartCoupon | None = None,
     ) -> None:
@@ -49,24 +54,54 @@ class Cart:
         self.id = data.id
         self.user_id = data.user_id
         self.status = data.status
-        self.items = items
+        self.config_version = data.config_version
+        self.items = CartItems(items)
         self.coupon = coupon
 
         self._config = config
 
     @property
-    def items_qty(self) -> Decimal:
+    def items_qty_minor(self) -> int:
         return sum(
-            [self.WEIGHT_ITEM_QTY if item.is_weight else item.qty for item in self.items]
+            [
+                self.WEIGHT_ITEM_QTY_MINOR if item.is_weight else item.qty_minor
+                for item in self.items
+            ]
         )
 
+    @property
+    def items_qty(self) -> Decimal:
+        return from_minor(
+            self.items_qty_minor,
+            QTY_SCALE,
+            display_scale=max(
+                [0 if item.is_weight else item.qty_scale for item in self.items],
+                default=0,
+            ),
+        )
+
+    @property
+    def cost_minor(self) -> int:
+        return sum([item.cost_minor for item in self.items])
+
+    @property
+    def cost_scale(self) -> int:
+        return max([item.cost_scale for item in self.items], default=0)
+
     @property
     def cost(self) -> Decimal:
-        return sum([item.cost for item in self.items])
+        return from_minor(self.cost_minor, ITEM_COST_SCALE, display_scale=self.cost_scale)
 
     @property
     def checkout_enabled(self) -> bool:
-        return self.cost >= self._config.min_cost_for_checkout
+        return self.cost_minor >= to_minor_ceil(
+            self._config.min_cost_for_checkout,
+            ITEM_COST_SCALE,
+        )
+
+    @property
+    def config(self) -> CartConfig:
+        return self._config
 
     @classmethod
     def create(cls, user_id: int, config: CartConfig) -> "Cart":
@@ -75,9 +110,10 @@ class Cart:
         return cls(
             data=CartDTO(
                 created_at=datetime.now(),
-                id=uuid.uuid4(),
+                id=uuid7(),
                 user_id=user_id,
                 status=CartStatusEnum.OPENED,
+                config_version=config.version,
             ),
             items=[],
             config=config,
@@ -93,9 +129,9 @@ class Cart:
 
         self._check_can_be_modified(action="increase item qty")
 
-        items_by_id = {item.id: item for item in self.items}
+        item = self.items.get(item_id)
 
-        if item_id not in items_by_id:
+        if item is None:
             logger.info(
                 "Cart %s. Failed to increase item %s qty! Item doesn't exist in cart.",
                 self.id,
@@ -103,12 +139,13 @@ class Cart:
             )
             raise CartItemDoesNotExistError
 
-        items_by_id[item_id].qty += qty
+        item.qty += qty
 
-        self._check_specific_item_qty_limit(item=items_by_id[item_id])
+        self._check_specific_item_qty_limit(item=item)
         self._validate_items_qty_limit()
+        self._pin_config_version()
 
-        return items_by_id[item_id]
+        return item
 
     def add_new_item(self, item: CartItem) -> None:
         """
@@ -120,9 +157,7 @@ class Cart:
 
         self._check_can_be_modified(action="add new item")
 
-        items_by_id = {item.id: item for item in self.items}
-
-        if item.id in items_by_id:
+        if self.items.get(item.id) is not None:
             logger.info(
                 "Cart %s. Failed to add new item %s! Item already exists in cart.",
                 self.id,
@@ -133,6 +168,7 @@ class Cart:
         self._check_specific_item_qty_limit(item=item)
         self.items.append(item)
         self._validate_items_qty_limit()
+        self._pin_config_version()
 
     def deactivate(self) -> None:
         """Used to change the status of a shopping cart to "DEACTIVATED"."""
@@ -150,9 +186,9 @@ class Cart:
 
         self._check_can_be_modified(action="update item qty")
 
-        items_by_id = {item.id: item for item in self.items}
+        item = self.items.get(item_id)
 
-        if item_id not in items_by_id:
+        if item is None:
             logger.info(
                 "Cart %s. Failed to update item %s! Item doesn't exist in cart.",
                 self.id,
@@ -160,12 +196,13 @@ class Cart:
             )
             raise CartItemDoesNotExistError
 
-        items_by_id[item_id].qty = qty
+        item.qty = qty
 
-        self._check_specific_item_qty_limit(item=items_by_id[item_id])
+        self._check_specific_item_qty_limit(item=item)
         self._validate_items_qty_limit()
+        self._pin_config_version()
 
-        return items_by_id[item_id]
+        return item
 
     def delete_item(self, item_id: int) -> None:
         """
@@ -176,9 +213,7 @@ class Cart:
 
         self._check_can_be_modified(action="delete item")
 
-        items_by_id = {item.id: item for item in self.items}
-
-        if item_id not in items_by_id:
+        if self.items.get(item_id) is None:
             logger.info(
                 "Cart %s. Failed to delete item %s! Item doesn't exist in cart.",
                 self.id,
@@ -186,14 +221,13 @@ class Cart:
             )
             raise CartItemDoesNotExistError
 
-        items_by_id.pop(item_id)
-        self.items = list(items_by_id.values())
+        self.items.pop(item_id)
 
     def clear(self) -> None:
         """Used to remove all items from the shopping cart."""
 
         self._check_can_be_modified(action="clear cart")
-        self.items = []
+        self.items = CartItems()
 
     def check_user_ownership(self, user_id: int) -> None:
         """
@@ -263,6 +297,7 @@ class Cart:
             raise CantBeLockedError
 
         self.status = CartStatusEnum.LOCKED
+        self._pin_config_version()
 
     def unlock(self) -> None:
         """
@@ -300,7 +335,7 @@ class Cart:
             )
 
     def _validate_items_qty_limit(self) -> None:
-        if self.items_qty > self._config.max_items_qty:
+        if self.items_qty_minor > self._config.max_items_qty * 10**QTY_SCALE:
             logger.info(
                 "Cart %s. Max items qty limit exceeded! Limit: %s, got: %s",
                 self.id,
@@ -319,6 +354,10 @@ class Cart:
             )
             raise ChangeStatusError
 
+    def _pin_config_version(self) -> None:
+        # the cart has just been validated against the current config
+        self.config_version = self._config.version
+
     def _check_can_be_modified(self, action: str) -> None:
         if self.status != CartStatusEnum.OPENED:
             logger.info(
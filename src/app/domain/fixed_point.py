@@ -0,0 +1,51 @@
+import math
+from decimal import Decimal
+from functools import cache
+
+
+@cache
+def _get_exponent(scale: int) -> Decimal:
+    return Decimal(1).scaleb(-scale)
+
+
+def get_scale(value: Decimal) -> int:
+    """Returns the number of decimal places of the value, e.g. 2 for 19.98."""
+
+    return max(-int(value.as_tuple().exponent), 0)
+
+
+def to_minor(value: Decimal, scale: int) -> int:
+    """
+    Converts the value to an integer number of minor units of the provided scale, e.g.
+    cents for the scale of 2. Raises ValueError for values with more decimal places than
+    the scale, so nothing is rounded away.
+    """
+
+    minor = value.scaleb(scale)
+    if minor != minor.to_integral_value():
+        raise ValueError(f"{value} has more than {scale} decimal places")
+
+    return int(minor)
+
+
+def from_minor(value: int, scale: int, display_scale: int | None = None) -> Decimal:
+    """
+    Converts the integer number of minor units of the provided scale to a decimal with
+    the display scale number of decimal places, the provided scale by default.
+    """
+
+    result = Decimal(value).scaleb(-scale)
+    if display_scale is None:
+        return result
+
+    return result.quantize(_get_exponent(display_scale))
+
+
+def to_minor_ceil(value: Decimal, scale: int) -> int:
+    """
+    Returns the least integer number of minor units of the provided scale that is not
+    less than the value, so a minor units sum is compared to a value of any scale
+    exactly.
+    """
+
+    return math.ceil(value.scaleb(scale))
@@ -7,3 +7,19 @@ class ICartNotificationsRepository(ABC):
     @abstractmethod
     async def create(self, cart_notification: CartNotification) -> CartNotification:
         ...
+
+    @abstractmethod
+    async def reserve(
+        self,
+        notifications: list[CartNotification],
+        reservation_timeout_sec: int,
+    ) -> list[CartNotification]:
+        ...
+
+    @abstractmethod
+    async def confirm(self, notifications: list[CartNotification]) -> None:
+        ...
+
+    @abstractmethod
+    async def release(self, notifications: list[CartNotification]) -> None:
+        ...
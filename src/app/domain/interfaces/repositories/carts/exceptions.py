@@ -8,3 +8,7 @@ class CartNotFoundError(BaseCartsRepoError):
 
 class ActiveCartAlreadyExistsError(BaseCartsRepoError):
     pass
+
+
+class CartConfigNotFoundError(BaseCartsRepoError):
+    pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
+from collections.abc import Collection, Sequence
 from datetime import datetime
+from decimal import Decimal
 from uuid import UUID
 
 from app.domain.cart_config.entities import CartConfig
@@ -13,13 +14,37 @@ class ICartsRepository(ABC):
         ...
 
     @abstractmethod
-    async def retrieve(self, cart_id: UUID) -> Cart:
+    async def get_or_create(self, cart: Cart) -> Cart:
+        ...
+
+    @abstractmethod
+    async def retrieve(self, cart_id: UUID, config_version: int | None = None) -> Cart:
+        ...
+
+    @abstractmethod
+    async def retrieve_active(self, user_id: int) -> Cart:
+        ...
+
+    @abstractmethod
+    async def retrieve_many(self, cart_ids: Collection[UUID]) -> list[Cart]:
         ...
 
     @abstractmethod
     async def update(self, cart: Cart) -> Cart:
         ...
 
+    @abstractmethod
+    async def update_many(self, carts: Sequence[Cart]) -> None:
+        ...
+
+    @abstractmethod
+    async def deactivate_expired(self, idle_hours: int, limit: int) -> int:
+        ...
+
+    @abstractmethod
+    async def archive_terminal(self, older_than_days: int, limit: int) -> int:
+        ...
+
     @abstractmethod
     async def clear(self, cart_id: UUID) -> None:
         ...
@@ -29,7 +54,7 @@ class ICartsRepository(ABC):
         ...
 
     @abstractmethod
-    async def get_config(self) -> CartConfig:
+    async def get_config(self, with_items_limits: bool = False) -> CartConfig:
         ...
 
     @abstractmethod
@@ -37,5 +62,27 @@ class ICartsRepository(ABC):
         ...
 
     @abstractmethod
-    async def find_abandoned_cart_id_by_user_id(self) -> Mapping[UUID, int]:
+    async def get_items_limits(
+        self,
+        config_version: int | None,
+        item_ids: Collection[int],
+    ) -> dict[int, Decimal]:
+        ...
+
+    @abstractmethod
+    async def pin_config_version(self, cart: Cart) -> None:
+        ...
+
+    @abstractmethod
+    async def get_abandonment_threshold(self) -> datetime:
+        ...
+
+    @abstractmethod
+    async def find_abandoned_cart_id_by_user_id(
+        self,
+        shard: int = 0,
+        shards_qty: int = 1,
+        updated_after: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> list[tuple[int, UUID, int]]:
         ...
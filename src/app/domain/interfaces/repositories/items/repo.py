@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from decimal import Decimal
+from uuid import UUID
 
 from app.domain.cart_items.entities import CartItem
 from app.domain.carts.entities import Cart
@@ -9,6 +11,25 @@ class IItemsRepository(ABC):
     async def add_item(self, item: CartItem) -> None:
         ...
 
+    @abstractmethod
+    async def upsert_item(
+        self,
+        item: CartItem,
+        qty: Decimal,
+        config_version: int | None,
+    ) -> Decimal:
+        ...
+
+    @abstractmethod
+    async def increase_item_qty(
+        self,
+        cart_id: UUID,
+        item_id: int,
+        qty: Decimal,
+        user_id: int | None = None,
+    ) -> Decimal | None:
+        ...
+
     @abstractmethod
     async def update_item(self, item: CartItem) -> CartItem:
         ...
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class IWatermarksRepository(ABC):
+    @abstractmethod
+    async def get(self, name: str) -> datetime | None:
+        ...
+
+    @abstractmethod
+    async def save(self, name: str, value: datetime) -> None:
+        ...
@@ -1,5 +1,14 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from hashlib import sha256
+from http import HTTPMethod
 from logging import getLogger
+from types import MappingProxyType
+from typing import Any
 
+import jwt
 from pydantic import ValidationError
 
 from app.app_layer.interfaces.auth_system.dto import UserDataOutputDTO
@@ -8,10 +17,18 @@ from app.app_layer.interfaces.auth_system.exceptions import (
     OperationForbiddenError,
 )
 from app.app_layer.interfaces.auth_system.system import IAuthSystem
+from app.config import AuthConfig
+from app.infra.http.transports.base import (
+    HttpRequestInputDTO,
+    HttpTransportError,
+    IHttpTransport,
+)
 from app.logging import update_context
 
 logger = getLogger(__name__)
 
+_TOKEN_PREFIX = "Bearer "
+
 _USERS_BY_TOKEN = {
     "customer.1": {"id": 1, "roles": ["customer"]},
     "customer.2": {"id": 2, "roles": ["customer"]},
@@ -19,6 +36,14 @@ _USERS_BY_TOKEN = {
 }
 
 
+def _extract_token(auth_data: str) -> str:
+    if not auth_data.startswith(_TOKEN_PREFIX):
+        logger.error("Failed to authenticate user! Error: bad token format.")
+        raise InvalidAuthDataError
+
+    return auth_data.removeprefix(_TOKEN_PREFIX)
+
+
 class FakeJWTAuthSystem(IAuthSystem):
     """
     Provides authentication functionality using a fake JWT token. It validates the
@@ -26,9 +51,6 @@ class FakeJWTAuthSystem(IAuthSystem):
     admin.
     """
 
-    def __init__(self) -> None:
-        self._token: None | str = None
-
     def validate_auth_data(self, auth_data: str) -> None:
         """
         Validates the authentication data by checking if it starts with "Bearer " and
@@ -36,21 +58,7 @@ class FakeJWTAuthSystem(IAuthSystem):
         InvalidAuthDataError exception.
         """
 
-        if not auth_data.startswith("Bearer "):
-            logger.error(
-                "Failed to authenticate user with token %s! Error: bad token format.",
-                auth_data,
-            )
-            raise InvalidAuthDataError
-
-        self._token = auth_data.removeprefix("Bearer ")
-
-        if self._token not in _USERS_BY_TOKEN:
-            logger.error(
-                "Failed to authenticate user with token %s! Error: invalid token.",
-                auth_data,
-            )
-            raise InvalidAuthDataError
+        self._get_token(auth_data)
 
     async def get_user_data(self, auth_data: str) -> UserDataOutputDTO:
         """
@@ -59,9 +67,7 @@ class FakeJWTAuthSystem(IAuthSystem):
         InvalidAuthDataError exception. It also updates the context with the user ID.
         """
 
-        self.validate_auth_data(auth_data)
-
-        user_data = _USERS_BY_TOKEN[self._token]
+        user_data = _USERS_BY_TOKEN[self._get_token(auth_data)]
 
         try:
             user = UserDataOutputDTO(
@@ -92,3 +98,185 @@ class FakeJWTAuthSystem(IAuthSystem):
         if not user.is_admin:
             logger.error("Check for admin failed! Auth data: %s!", auth_data)
             raise OperationForbiddenError
+
+    def _get_token(self, auth_data: str) -> str:
+        token = _extract_token(auth_data)
+
+        if token not in _USERS_BY_TOKEN:
+            logger.error(
+                "Failed to authenticate user with token %s! Error: invalid token.",
+                auth_data,
+            )
+            raise InvalidAuthDataError
+
+        return token
+
+
+class JWTAuthSystem(IAuthSystem):
+    """
+    Provides authentication functionality using JWT tokens signed with the keys
+    published by the identity provider as a JWKS document.
+
+    The system keeps no per-request state, so a single instance is shared by the whole
+    process. Signing keys are fetched once and refetched only when a token refers to an
+    unknown key, and verified users are cached by token hash until the token expires,
+    so repeated requests with the same token skip the signature verification.
+    """
+
+    def __init__(self, config: AuthConfig, transport: IHttpTransport) -> None:
+        self._config = config
+        self._transport = transport
+        self._keys: Mapping[str | None, jwt.PyJWK] = MappingProxyType({})
+        self._keys_lock = asyncio.Lock()
+        self._keys_fetched_at = float("-inf")
+        self._users_cache: OrderedDict[
+            bytes, tuple[float, UserDataOutputDTO]
+        ] = OrderedDict()
+
+    def validate_auth_data(self, auth_data: str) -> None:
+        """
+        Validates the authentication data by checking if it starts with "Bearer " and
+        if the token is a well-formed JWT. The signature and the claims are verified
+        by the get_user_data method. If the validation fails, it raises an
+        InvalidAuthDataError exception.
+        """
+
+        self._get_unverified_header(_extract_token(auth_data))
+
+    async def get_user_data(self, auth_data: str) -> UserDataOutputDTO:
+        """
+        Retrieves user data from the verified token claims. Users are served from the
+        cache while the token is not expired. If the token is invalid, it raises an
+        InvalidAuthDataError exception. It also updates the context with the user ID.
+        """
+
+        token = _extract_token(auth_data)
+        cache_key = sha256(token.encode()).digest()
+
+        user = self._get_cached_user(cache_key)
+
+        if user is None:
+            claims = await self._verify(token)
+            user = self._build_user(claims)
+            self._cache_user(cache_key, claims["exp"], user)
+            logger.debug("Got user data %s", user)
+
+        await update_context(user_id=user.id)
+
+        return user
+
+    async def check_for_admin(self, auth_data: str) -> None:
+        """
+        Checks if the user is an admin by calling the get_user_data method. If the
+        user is not an admin, it raises an OperationForbiddenError exception.
+        """
+
+        user = await self.get_user_data(auth_data=auth_data)
+
+        if not user.is_admin:
+            logger.error("Check for admin failed! User id: %s!", user.id)
+            raise OperationForbiddenError
+
+    @staticmethod
+    def _get_unverified_header(token: str) -> dict[str, Any]:
+        try:
+            return jwt.get_unverified_header(token)
+        except jwt.PyJWTError as err:
+            logger.error("Failed to authenticate user! Error: %s", str(err))
+            raise InvalidAuthDataError
+
+    def _get_cached_user(self, cache_key: bytes) -> UserDataOutputDTO | None:
+        cached = self._users_cache.get(cache_key)
+
+        if cached is None:
+            return None
+
+        expires_at, user = cached
+
+        if expires_at <= time.time():
+            self._users_cache.pop(cache_key, None)
+            return None
+
+        self._users_cache.move_to_end(cache_key)
+
+        return user
+
+    def _cache_user(self, cache_key: bytes, exp: Any, user: UserDataOutputDTO) -> None:
+        self._users_cache[cache_key] = (float(exp), user)
+
+        while len(self._users_cache) > self._config.users_cache_size:
+            self._users_cache.popitem(last=False)
+
+    async def _verify(self, token: str) -> dict[str, Any]:
+        key = await self._get_signing_key(token)
+
+        try:
+            return jwt.decode(
+                token,
+                key=key.key,
+                algorithms=self._config.algorithms,
+                audience=self._config.audience,
+                issuer=self._config.issuer,
+                leeway=self._config.leeway_sec,
+                options={"require": ["exp", self._config.user_id_claim]},
+            )
+        except jwt.PyJWTError as err:
+            logger.error("Failed to authenticate user! Error: %s", str(err))
+            raise InvalidAuthDataError
+
+    def _build_user(self, claims: dict[str, Any]) -> UserDataOutputDTO:
+        roles = claims.get(self._config.roles_claim) or []
+
+        try:
+            return UserDataOutputDTO(
+                id=claims[self._config.user_id_claim],
+                is_admin=self._config.admin_role in roles,
+            )
+        except ValidationError as err:
+            logger.error("Failed to authenticate user! Error: %s", str(err))
+            raise InvalidAuthDataError
+
+    async def _get_signing_key(self, token: str) -> jwt.PyJWK:
+        kid = self._get_unverified_header(token).get("kid")
+
+        if kid not in self._keys:
+            await self._refresh_keys()
+
+        try:
+            return self._keys[kid]
+        except KeyError:
+            logger.error(
+                "Failed to authenticate user! Error: unknown signing key %s.", kid
+            )
+            raise InvalidAuthDataError
+
+    async def _refresh_keys(self) -> None:
+        fetched_at = self._keys_fetched_at
+
+        async with self._keys_lock:
+            # keys were refreshed by another request while this one was waiting
+            if self._keys_fetched_at != fetched_at:
+                return
+
+            if time.monotonic() - fetched_at < self._config.jwks_min_refresh_interval_sec:
+                return
+
+            self._keys_fetched_at = time.monotonic()
+
+            try:
+                response = await self._transport.request(
+                    HttpRequestInputDTO(
+                        method=HTTPMethod.GET,
+                        url=str(self._config.jwks_url),
+                    ),
+                )
+                if not isinstance(response, dict):
+                    raise jwt.PyJWKSetError("JWKS response is not a JSON object")
+
+                jwk_set = jwt.PyJWKSet.from_dict(response)
+            except (HttpTransportError, jwt.PyJWTError) as err:
+                logger.error("Failed to fetch signing keys! Error: %s", str(err))
+                return
+
+            self._keys = MappingProxyType({key.key_id: key for key in jwk_set.keys})
+            logger.info("Fetched %s signing keys.", len(self._keys))
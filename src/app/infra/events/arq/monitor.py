@@ -0,0 +1,57 @@
+import asyncio
+import time
+
+from arq import ArqRedis
+from redis.asyncio import RedisError
+
+from app.app_layer.interfaces.tasks.dto import QueueStatsOutputDTO
+from app.app_layer.interfaces.tasks.exceptions import TaskQueuesMonitorError
+from app.app_layer.interfaces.tasks.monitor import ITaskQueuesMonitor
+from app.infra.events.queues import QueueNameEnum
+
+
+class ArqTaskQueuesMonitor(ITaskQueuesMonitor):
+    """
+    Responsible for reading the state of the Arq queues. Every queue is a sorted set of
+    job IDs scored by the time the job is due, so the stats of all queues are read with
+    a single pipelined round trip.
+    """
+
+    def __init__(self, broker: ArqRedis) -> None:
+        self._broker = broker
+
+    async def get_stats(self) -> list[QueueStatsOutputDTO]:
+        """
+        Returns the total number of queued jobs, the number of jobs that are already due
+        and the time the oldest due job has been waiting for every queue.
+        """
+
+        now_ms = time.time() * 1000
+
+        try:
+            async with self._broker.pipeline(transaction=False) as pipe:
+                for queue in QueueNameEnum:
+                    pipe.zcard(queue.value)
+                    pipe.zcount(queue.value, "-inf", now_ms)
+                    pipe.zrange(queue.value, 0, 0, withscores=True)
+
+                results = await pipe.execute()
+        except (ConnectionError, OSError, RedisError, asyncio.TimeoutError) as err:
+            raise TaskQueuesMonitorError(str(err)) from err
+
+        stats = []
+
+        for idx, queue in enumerate(QueueNameEnum):
+            depth, ready_qty, oldest = results[idx * 3 : idx * 3 + 3]
+            lag_ms = now_ms - oldest[0][1] if ready_qty else 0
+
+            stats.append(
+                QueueStatsOutputDTO(
+                    name=queue.value,
+                    depth=depth,
+                    ready_qty=ready_qty,
+                    lag_sec=lag_ms / 1000,
+                ),
+            )
+
+        return stats
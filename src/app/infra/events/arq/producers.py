@@ -1,4 +1,5 @@
 import asyncio
+from datetime import datetime
 from logging import getLogger
 from typing import Generator
 from uuid import UUID
@@ -47,11 +48,12 @@ class ArqTaskProducer(ITaskProducer):
         self,
         user_id: int,
         cart_id: UUID,
+        cycle: int,
     ) -> None:
         """
         Responsible for enqueueing an abandoned cart notification task using the
-        Arq library. It takes in the user ID and cart ID as inputs and enqueues
-        the task with the appropriate parameters.
+        Arq library. It takes in the user ID, cart ID and notification cycle as inputs
+        and enqueues the task with the appropriate parameters.
         """
 
         # TODO(me): # circular import :(
@@ -62,8 +64,9 @@ class ArqTaskProducer(ITaskProducer):
                 function=send_abandoned_cart_notification.__name__,
                 user_id=user_id,
                 cart_id=cart_id,
+                cycle=cycle,
                 _job_id=str(cart_id),
-                _queue_name=QueueNameEnum.EXAMPLE_QUEUE.value,
+                _queue_name=QueueNameEnum.NOTIFICATIONS_QUEUE.value,
             )
         except TaskIsNotQueuedError:
             logger.debug(
@@ -82,6 +85,46 @@ class ArqTaskProducer(ITaskProducer):
             "Abandoned cart %s notification task successfully enqueued!", cart_id
         )
 
+    async def enqueue_abandoned_carts_shard_task(
+        self,
+        shard: int,
+        shards_qty: int,
+        updated_after: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> None:
+        """
+        Responsible for enqueueing the scan of a single shard of abandoned carts. The
+        job ID is derived from the shard and the start of the scanned window, so a
+        shard that is still queued or being scanned is not enqueued twice.
+        """
+
+        # TODO(me): # circular import :(
+        from app.api.events.tasks.abandoned_carts import process_abandoned_carts_shard
+
+        try:
+            await self._enqueue_job(
+                function=process_abandoned_carts_shard.__name__,
+                shard=shard,
+                shards_qty=shards_qty,
+                updated_after=updated_after,
+                updated_before=updated_before,
+                _job_id=(
+                    f"{process_abandoned_carts_shard.__name__}:{shard}:{shards_qty}"
+                    + (f":{updated_after.isoformat()}" if updated_after else "")
+                ),
+                _queue_name=QueueNameEnum.ABANDONED_CARTS_QUEUE.value,
+            )
+        except TaskIsNotQueuedError:
+            logger.debug("Abandoned carts shard %s is already queued!", shard)
+            return
+        except TaskProducingError as err:
+            logger.error(
+                "Failed to enqueue abandoned carts shard %s task! Error: %s", shard, err
+            )
+            raise
+
+        logger.debug("Abandoned carts shard %s task successfully enqueued!", shard)
+
     async def _enqueue_job(self, *args, **kwargs) -> Job:
         try:
             job = await self._broker.enqueue_job(*args, **kwargs)
@@ -1,20 +1,27 @@
-from logging.config import dictConfig
-from typing import Any
+import time
+from logging import getLogger
+from typing import Any, cast
 
 from arq import cron, func
 from arq.connections import RedisSettings
+from arq.typing import WorkerCoroutine
 
 from app.api import events
 from app.api.events.tasks.abandoned_carts import (
     process_abandoned_carts,
+    process_abandoned_carts_shard,
     send_abandoned_cart_notification,
 )
+from app.api.events.tasks.archived_carts import archive_carts
 from app.api.events.tasks.example import example_task
+from app.api.events.tasks.expired_carts import deactivate_expired_carts
 from app.config import Config
 from app.containers import Container
 from app.infra.events.queues import QueueNameEnum
 from app.logging import ctx as transaction_ctx
-from app.logging import get_logging_config
+from app.logging import setup_logging
+
+logger = getLogger(__name__)
 
 config = Config()
 
@@ -23,12 +30,7 @@ async def startup(ctx: dict[str, Any]) -> None:
     container = Container()
     container.wire(packages=[events.tasks])
 
-    dictConfig(
-        config=get_logging_config(
-            transaction_ctx=transaction_ctx,
-            config=config.LOGGING,
-        ),
-    )
+    setup_logging(transaction_ctx=transaction_ctx, config=config.LOGGING)
 
     await container.init_resources()
 
@@ -39,23 +41,83 @@ async def shutdown(ctx: dict[str, Any]) -> None:
     await ctx["container"].shutdown_resources()
 
 
+async def job_start(ctx: dict[str, Any]) -> None:
+    logger.debug(
+        "Job %s started %.3f sec after it was due, try %s.",
+        ctx["job_id"],
+        max(time.time() - ctx["score"] / 1000, 0),
+        ctx["job_try"],
+    )
+
+
+# Every queue has its own worker entry point, so the pools are scaled and sized
+# independently and a flood of one task type doesn't delay the others.
+
+
 class ConsumerSettings:
     redis_settings: RedisSettings = RedisSettings(**config.ARQ_REDIS.model_dump())
     functions = [
-        func(coroutine=example_task, max_tries=config.TASK.max_tries),
-        func(coroutine=send_abandoned_cart_notification, max_tries=config.TASK.max_tries),
+        func(
+            coroutine=cast(WorkerCoroutine, example_task),
+            max_tries=config.TASK.max_tries,
+        ),
     ]
     queue_name = QueueNameEnum.EXAMPLE_QUEUE.value
+    max_jobs = config.QUEUES.example.max_jobs
+    job_timeout = config.QUEUES.example.job_timeout_sec
+    on_startup = startup
+    on_shutdown = shutdown
+    on_job_start = job_start
+    keep_result = config.TASK.no_keep_result_value
+
+
+class AbandonedCartsConsumerSettings:
+    redis_settings: RedisSettings = RedisSettings(**config.ARQ_REDIS.model_dump())
+    functions = [
+        func(
+            coroutine=cast(WorkerCoroutine, process_abandoned_carts_shard),
+            max_tries=config.TASK.max_tries,
+        ),
+    ]
+    queue_name = QueueNameEnum.ABANDONED_CARTS_QUEUE.value
+    max_jobs = config.QUEUES.abandoned_carts.max_jobs
+    job_timeout = config.QUEUES.abandoned_carts.job_timeout_sec
+    on_startup = startup
+    on_shutdown = shutdown
+    on_job_start = job_start
+    keep_result = config.TASK.no_keep_result_value
+
+
+class NotificationsConsumerSettings:
+    redis_settings: RedisSettings = RedisSettings(**config.ARQ_REDIS.model_dump())
+    functions = [
+        func(
+            coroutine=cast(WorkerCoroutine, send_abandoned_cart_notification),
+            max_tries=config.TASK.max_tries,
+        ),
+    ]
+    queue_name = QueueNameEnum.NOTIFICATIONS_QUEUE.value
+    max_jobs = config.QUEUES.notifications.max_jobs
+    job_timeout = config.QUEUES.notifications.job_timeout_sec
     on_startup = startup
     on_shutdown = shutdown
+    on_job_start = job_start
     keep_result = config.TASK.no_keep_result_value
 
 
 class PeriodicSettings:
     redis_settings: RedisSettings = RedisSettings(**config.ARQ_REDIS.model_dump())
     cron_jobs = [
-        cron(process_abandoned_carts, **config.PERIODIC.schedule),
+        cron(cast(WorkerCoroutine, process_abandoned_carts), **config.PERIODIC.schedule),
+        cron(
+            cast(WorkerCoroutine, deactivate_expired_carts),
+            **config.CART_EXPIRY.schedule,
+        ),
+        cron(cast(WorkerCoroutine, archive_carts), **config.CART_ARCHIVE.schedule),
     ]
     queue_name = QueueNameEnum.PERIODIC_QUEUE.value
+    max_jobs = config.QUEUES.periodic.max_jobs
+    job_timeout = config.QUEUES.periodic.job_timeout_sec
     on_startup = startup
     on_shutdown = shutdown
+    on_job_start = job_start
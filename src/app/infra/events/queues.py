@@ -4,3 +4,5 @@ from enum import Enum
 class QueueNameEnum(str, Enum):
     EXAMPLE_QUEUE = "example_queue"
     PERIODIC_QUEUE = "periodic_queue"
+    ABANDONED_CARTS_QUEUE = "abandoned_carts_queue"
+    NOTIFICATIONS_QUEUE = "notifications_queue"
@@ -1,5 +1,5 @@
 import asyncio
-from logging import DEBUG, getLogger
+from logging import getLogger
 from types import SimpleNamespace
 from typing import Any, Generator
 
@@ -10,7 +10,6 @@ from aiohttp import (
     ClientResponseError,
     ClientSession,
     TraceConfig,
-    TraceRequestEndParams,
     TraceRequestExceptionParams,
     TraceRequestStartParams,
 )
@@ -21,6 +20,7 @@ from app.infra.http.transports.base import (
     HttpTransportError,
     IHttpTransport,
 )
+from app.logging import debug_snapshots
 
 logger = getLogger(__name__)
 
@@ -68,14 +68,21 @@ class AioHttpTransport(IHttpTransport):
             json=data.body if isinstance(data.body, (dict, list)) else None,
             trace_request_ctx=trace_ctx,
         ) as response:
-            data = await _get_response_data(response)
+            response_data = await _get_response_data(response)
+            debug_snapshots.log(
+                logger,
+                "Server got response: %s - %s. %s",
+                lambda: response.status,
+                lambda: response_data,
+                lambda: vars(trace_ctx),
+            )
 
             try:
                 response.raise_for_status()
             except ClientResponseError as err:
-                raise HttpTransportError(message=data, code=err.status)
+                raise HttpTransportError(message=str(response_data), code=err.status)
 
-            return data
+            return response_data
 
 
 async def _get_response_data(response: ClientResponse) -> dict[str, Any] | str:
@@ -90,23 +97,10 @@ async def _on_request_start(
     trace_ctx: SimpleNamespace,
     __: TraceRequestStartParams,
 ) -> None:
-    if logger.getEffectiveLevel() > DEBUG:  # pragma: no cover[coverage err]
-        return
-
-    logger.debug("Server make request: %s", vars(trace_ctx.trace_request_ctx))
-
-
-async def _on_request_end(
-    _: ClientSession,
-    trace_ctx: SimpleNamespace,
-    params: TraceRequestEndParams,
-) -> None:
-    if logger.getEffectiveLevel() > DEBUG:  # pragma: no cover[coverage err]
-        return
-
-    response = await _get_response_data(params.response)
-    logger.debug(
-        "Server got response: %s. %s", response, vars(trace_ctx.trace_request_ctx)
+    debug_snapshots.log(
+        logger,
+        "Server make request: %s",
+        lambda: vars(trace_ctx.trace_request_ctx),
     )
 
 
@@ -132,7 +126,6 @@ async def init_aiohttp_session_pool() -> Generator[None, None, ClientSession]:
     trace_config = TraceConfig()
     trace_config.on_request_start.append(_on_request_start)
     trace_config.on_request_exception.append(_on_request_exception)
-    trace_config.on_request_end.append(_on_request_end)
 
     session = ClientSession(trace_configs=[trace_config])
     yield session
@@ -0,0 +1,68 @@
+from logging import getLogger
+
+from pydantic import ValidationError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.app_layer.interfaces.active_carts_cache.cache import IActiveCartsCache
+from app.app_layer.interfaces.active_carts_cache.dto import ActiveCartDTO
+from app.config import ActiveCartsCacheConfig
+
+logger = getLogger(__name__)
+
+
+class RedisActiveCartsCache(IActiveCartsCache):
+    """
+    Provides the mapping of users to their active carts stored in Redis. Entries expire
+    after the configured ttl. Redis errors are logged and never raised, a failed read is
+    a cache miss, so the carts are looked up in the database while Redis is unavailable.
+    """
+
+    def __init__(self, redis: Redis, config: ActiveCartsCacheConfig) -> None:
+        self._redis = redis
+        self._config = config
+
+    async def get(self, user_id: int) -> ActiveCartDTO | None:
+        """
+        Returns the cached ID of the active cart of the user with its config version, if
+        any. An entry that can't be parsed is a cache miss.
+        """
+
+        try:
+            value = await self._redis.get(self._get_key(user_id=user_id))
+        except RedisError:
+            logger.warning("Failed to get the active cart of user %s.", user_id)
+            return None
+
+        if value is None:
+            return None
+
+        try:
+            return ActiveCartDTO.model_validate_json(value)
+        except ValidationError:
+            logger.warning("Invalid cached active cart of user %s.", user_id)
+            return None
+
+    async def set(self, user_id: int, data: ActiveCartDTO) -> None:
+        """Caches the ID of the active cart of the user with its config version."""
+
+        try:
+            await self._redis.set(
+                self._get_key(user_id=user_id),
+                data.model_dump_json(),
+                ex=self._config.ttl_sec,
+            )
+        except RedisError:
+            logger.warning("Failed to cache the active cart of user %s.", user_id)
+
+    async def delete(self, user_id: int) -> None:
+        """Drops the cached ID of the active cart of the user."""
+
+        try:
+            await self._redis.delete(self._get_key(user_id=user_id))
+        except RedisError:
+            logger.warning("Failed to drop the active cart of user %s.", user_id)
+
+    @staticmethod
+    def _get_key(user_id: int) -> str:
+        return f"active-cart-{user_id}"
@@ -1,28 +1,51 @@
-from collections.abc import Generator
+from collections.abc import Generator, Sequence
 from logging import getLogger
+from typing import Any
+from uuid import uuid4
 
 from redis.asyncio import ConnectionPool, Redis
 from redis.asyncio.lock import Lock
+from redis.commands.core import AsyncScript
 from redis.exceptions import LockError
 
 from app.app_layer.interfaces.distributed_lock_system.exceptions import AlreadyLockedError
-from app.app_layer.interfaces.distributed_lock_system.system import IDistributedLockSystem
+from app.app_layer.interfaces.distributed_lock_system.system import (
+    IDistributedBatchLockHandle,
+    IDistributedLockHandle,
+    IDistributedLockSystem,
+)
 from app.config import RedisLockConfig
 
 logger = getLogger(__name__)
 
+# deletes only the keys that still hold the token of the batch, like Lock.release does
+_RELEASE_MANY_SCRIPT = """
+local released = 0
+for _, key in ipairs(KEYS) do
+    if redis.call("get", key) == ARGV[1] then
+        redis.call("del", key)
+        released = released + 1
+    end
+end
+return released
+"""
 
-class RedisLockSystem(IDistributedLockSystem):
+
+class RedisLockHandle(IDistributedLockHandle):
     """
-    Provides a distributed lock system using Redis as the backend. It allows
-    acquiring and releasing locks using the Redis Lock class.
+    Provides a single distributed lock using the Redis Lock class.
     """
 
-    def __init__(self, redis: Redis, config: RedisLockConfig) -> None:
-        self._redis = redis
-        self._config = config
-
-        self._lock: Lock | None = None
+    def __init__(self, name: str, redis: Redis, config: RedisLockConfig) -> None:
+        super().__init__(name=name)
+        self._lock = Lock(
+            redis=redis,
+            name=name,
+            timeout=config.ttl_sec,
+            sleep=config.acquire_tries_interval_sec,
+            blocking=config.wait_mode,
+            blocking_timeout=config.time_to_wait_sec,
+        )
 
     async def acquire(self) -> None:
         """
@@ -31,15 +54,6 @@ class RedisLockSystem(IDistributedLockSystem):
         based on the configuration.
         """
 
-        self._lock = Lock(
-            redis=self._redis,
-            name=self._name,
-            timeout=self._config.ttl_sec,
-            sleep=self._config.acquire_tries_interval_sec,
-            blocking=self._config.wait_mode,
-            blocking_timeout=self._config.time_to_wait_sec,
-        )
-
         acquired = await self._lock.acquire()
 
         if not acquired:
@@ -63,6 +77,111 @@ class RedisLockSystem(IDistributedLockSystem):
         logger.debug("Redis lock: %s was successfully released!", self._name)
 
 
+class RedisBatchLockHandle(IDistributedBatchLockHandle):
+    """
+    Provides many distributed locks at once. The locks are compatible with the ones of
+    RedisLockHandle, all of them are acquired with a single pipelined round trip and
+    released with a single script call.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        redis: Redis,
+        release_script: AsyncScript,
+        config: RedisLockConfig,
+    ) -> None:
+        super().__init__(names=names)
+        self._redis = redis
+        self._release_script = release_script
+        self._config = config
+        self._token = uuid4().hex.encode()
+
+    async def acquire(self) -> None:
+        """
+        Tries to acquire every lock once without waiting and stores the names of the
+        acquired ones.
+        """
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for name in self._names:
+                pipe.set(name, self._token, nx=True, px=int(self._config.ttl_sec * 1000))
+
+            results = await pipe.execute()
+
+        self.acquired = frozenset(
+            name for name, acquired in zip(self._names, results) if acquired
+        )
+
+        logger.debug(
+            "Redis locks: %s of %s were successfully acquired!",
+            len(self.acquired),
+            len(self._names),
+        )
+
+    async def release(self) -> None:
+        """Releases the acquired locks that are still held by this handle."""
+
+        if not self.acquired:
+            return
+
+        released = await self._release_script(
+            keys=list(self.acquired), args=[self._token]
+        )
+
+        if released != len(self.acquired):
+            logger.info(
+                "Failed to release %s locks because their ttl has expired!",
+                len(self.acquired) - released,
+            )
+
+        logger.debug("Redis locks: %s were successfully released!", released)
+
+
+class RedisLockSystem(IDistributedLockSystem):
+    """
+    Provides a distributed lock system using Redis as the backend. Every call creates
+    a new lock handle, so a single instance is shared by all requests.
+    """
+
+    def __init__(self, redis: Redis, config: RedisLockConfig) -> None:
+        self._redis = redis
+        self._config = config
+        self._release_many_script = redis.register_script(_RELEASE_MANY_SCRIPT)
+
+    def __call__(self, name: str, *args: Any, **kwargs: Any) -> RedisLockHandle:
+        return RedisLockHandle(name=name, redis=self._redis, config=self._config)
+
+    def batch(self, names: Sequence[str]) -> RedisBatchLockHandle:
+        """
+        Creates a handle that acquires the locks with the provided names at once.
+        """
+
+        return RedisBatchLockHandle(
+            names=names,
+            redis=self._redis,
+            release_script=self._release_many_script,
+            config=self._config,
+        )
+
+    async def lease(self, name: str, ttl_sec: float) -> bool:
+        """
+        Tries to take the lease with the provided name without waiting. The lease is
+        never released, it expires after the provided ttl, so only one caller can take
+        it during that period. Returns whether the lease was taken.
+        """
+
+        taken = await self._redis.set(name, uuid4().hex, nx=True, px=int(ttl_sec * 1000))
+
+        if not taken:
+            logger.debug("Redis lease: %s is already taken!", name)
+            return False
+
+        logger.debug("Redis lease: %s was successfully taken for %ss!", name, ttl_sec)
+
+        return True
+
+
 async def init_redis(config: RedisLockConfig) -> Generator[Redis, None, None]:
     """
     Initializes a Redis connection and returns a generator object that yields the
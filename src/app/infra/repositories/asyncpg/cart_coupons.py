@@ -0,0 +1,40 @@
+from uuid import UUID
+
+from asyncpg import Connection
+
+from app.domain.cart_coupons.entities import CartCoupon
+from app.domain.interfaces.repositories.cart_coupons.repo import ICartCouponsRepository
+
+_INSERT_COUPON = """
+INSERT INTO carts_coupons (cart_id, coupon_id, min_cart_cost, discount_abs)
+VALUES ($1, $2, $3, $4)
+"""
+_DELETE_COUPON = "DELETE FROM carts_coupons WHERE cart_id = $1"
+
+
+class CartCouponsRepository(ICartCouponsRepository):
+    """
+    Responsible for interacting with the database to create and delete cart coupons
+    through a raw asyncpg connection with prepared statements.
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection = connection
+
+    async def create(self, cart_coupon: CartCoupon) -> CartCoupon:
+        """Creates a new cart coupon in the database."""
+
+        await self._connection.execute(
+            _INSERT_COUPON,
+            cart_coupon.cart.id,
+            cart_coupon.coupon_id,
+            cart_coupon.min_cart_cost,
+            cart_coupon.discount_abs,
+        )
+
+        return cart_coupon
+
+    async def delete(self, cart_id: UUID) -> None:
+        """Deletes a cart coupon from the database based on the cart ID."""
+
+        await self._connection.execute(_DELETE_COUPON, cart_id)
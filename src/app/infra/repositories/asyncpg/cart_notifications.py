@@ -0,0 +1,128 @@
+from uuid import UUID
+
+from asyncpg import Connection
+
+from app.domain.cart_notifications.entities import CartNotification
+from app.domain.cart_notifications.value_objects import CartNotificationTypeEnum
+from app.domain.interfaces.repositories.cart_notifications import (
+    ICartNotificationsRepository,
+)
+
+_INSERT_NOTIFICATION = """
+INSERT INTO cart_notifications (id, cart_id, type, cycle, text, sent_at)
+VALUES ($1, $2, $3, $4, $5, $6)
+"""
+_RESERVE_NOTIFICATIONS = """
+INSERT INTO cart_notifications (id, cart_id, type, cycle, text, sent_at)
+SELECT id, cart_id, type::cart_notification_type_enum, cycle, text, sent_at
+FROM unnest(
+    $1::uuid[], $2::uuid[], $3::text[], $4::int[], $5::text[], $6::timestamp[]
+) AS pending(id, cart_id, type, cycle, text, sent_at)
+ON CONFLICT (cart_id, type, cycle) DO UPDATE
+SET id = excluded.id,
+    text = excluded.text,
+    reserved_at = LOCALTIMESTAMP,
+    updated_at = LOCALTIMESTAMP
+WHERE cart_notifications.sent_at IS NULL
+    AND cart_notifications.reserved_at < LOCALTIMESTAMP - make_interval(secs => $7)
+RETURNING id
+"""
+_CONFIRM_NOTIFICATIONS = """
+UPDATE cart_notifications AS n
+SET sent_at = sent.sent_at, updated_at = LOCALTIMESTAMP
+FROM unnest($1::uuid[], $2::uuid[], $3::timestamp[]) AS sent(id, cart_id, sent_at)
+WHERE n.id = sent.id AND n.cart_id = sent.cart_id
+"""
+_RELEASE_NOTIFICATIONS = """
+DELETE FROM cart_notifications WHERE id = ANY($1::uuid[]) AND sent_at IS NULL
+"""
+
+
+class CartsNotificationsRepository(ICartNotificationsRepository):
+    """
+    Provides methods to create, reserve, confirm and release cart notifications in the
+    database through a raw asyncpg connection. Batches are passed as arrays, so every
+    statement is prepared once regardless of the batch size.
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection = connection
+
+    async def create(self, cart_notification: CartNotification) -> CartNotification:
+        """Saves the given cart notification to the database."""
+
+        await self._connection.execute(
+            _INSERT_NOTIFICATION,
+            cart_notification.id,
+            cart_notification.cart_id,
+            cart_notification.type,
+            cart_notification.cycle,
+            cart_notification.text,
+            cart_notification.sent_at,
+        )
+
+        return cart_notification
+
+    async def reserve(
+        self,
+        notifications: list[CartNotification],
+        reservation_timeout_sec: int,
+    ) -> list[CartNotification]:
+        """
+        Saves the given pending cart notifications to the database in a single
+        statement, skipping the ones whose cart, type and cycle are already taken.
+        A taken notification that is still not sent is taken over if it was reserved
+        more than `reservation_timeout_sec` seconds ago. Returns the saved notifications
+        only.
+        """
+
+        if not notifications:
+            return []
+
+        # a statement can't take over a row it has inserted itself
+        pending: dict[tuple[UUID, CartNotificationTypeEnum, int], CartNotification] = {}
+
+        for notification in notifications:
+            pending.setdefault(
+                (notification.cart_id, notification.type, notification.cycle),
+                notification,
+            )
+
+        rows = await self._connection.fetch(
+            _RESERVE_NOTIFICATIONS,
+            [notification.id for notification in pending.values()],
+            [notification.cart_id for notification in pending.values()],
+            [notification.type for notification in pending.values()],
+            [notification.cycle for notification in pending.values()],
+            [notification.text for notification in pending.values()],
+            [notification.sent_at for notification in pending.values()],
+            reservation_timeout_sec,
+        )
+        reserved_ids = {reserved_id for reserved_id, in rows}
+
+        return [
+            notification
+            for notification in notifications
+            if notification.id in reserved_ids
+        ]
+
+    async def confirm(self, notifications: list[CartNotification]) -> None:
+        """Saves the sending time of the given reserved cart notifications."""
+
+        await self._connection.execute(
+            _CONFIRM_NOTIFICATIONS,
+            [notification.id for notification in notifications],
+            [notification.cart_id for notification in notifications],
+            [notification.sent_at for notification in notifications],
+        )
+
+    async def release(self, notifications: list[CartNotification]) -> None:
+        """
+        Deletes the given reserved cart notifications that are still not sent, so
+        their cart, type and cycle can be reserved again.
+        """
+
+        await self._connection.execute(
+            _RELEASE_NOTIFICATIONS,
+            [notification.id for notification in notifications],
+        )
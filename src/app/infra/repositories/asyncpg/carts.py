@@ -0,0 +1,610 @@
+from collections.abc import Collection, Sequence
+from datetime import datetime
+from decimal import Decimal
+from logging import getLogger
+from typing import Any, ClassVar
+from uuid import UUID
+
+import orjson
+from asyncpg import Connection, IntegrityConstraintViolationError
+
+from app.domain.cart_config.dto import CartConfigDTO
+from app.domain.cart_config.entities import CartConfig
+from app.domain.cart_coupons.dto import CartCouponDTO
+from app.domain.cart_coupons.entities import CartCoupon
+from app.domain.cart_items.dto import ItemDTO
+from app.domain.cart_items.entities import CartItem
+from app.domain.carts.dto import CartDTO
+from app.domain.carts.entities import Cart
+from app.domain.interfaces.repositories.carts.exceptions import (
+    ActiveCartAlreadyExistsError,
+    CartConfigNotFoundError,
+    CartNotFoundError,
+)
+from app.domain.interfaces.repositories.carts.repo import ICartsRepository
+from app.infra.repositories.sqla.db import json_dumps
+from app.logging import debug_snapshots, update_context
+
+logger = getLogger(__name__)
+
+# a whole cart as a single JSON document, numerics are rendered as strings, so
+# decimals don't pass through floats
+_SELECT_CARTS = """
+SELECT jsonb_build_object(
+    'created_at', c.created_at,
+    'id', c.id,
+    'user_id', c.user_id,
+    'status', c.status,
+    'config_version', c.config_version,
+    'items', coalesce(
+        (
+            SELECT jsonb_agg(
+                jsonb_build_object(
+                    'id', i.id,
+                    'name', i.name,
+                    'qty', i.qty,
+                    'price', i.price::text,
+                    'is_weight', i.is_weight,
+                    'cart_id', i.cart_id
+                )
+            )
+            FROM cart_items AS i
+            WHERE i.cart_id = c.id
+        ),
+        '[]'::jsonb
+    ),
+    'coupon', (
+        SELECT jsonb_build_object(
+            'coupon_id', cc.coupon_id,
+            'min_cart_cost', cc.min_cart_cost::text,
+            'discount_abs', cc.discount_abs::text
+        )
+        FROM carts_coupons AS cc
+        WHERE cc.cart_id = c.id
+    )
+)::text
+FROM carts AS c
+"""
+_SELECT_CART_BY_ID = f"{_SELECT_CARTS} WHERE c.id = $1 AND c.status != 'DEACTIVATED'"
+_SELECT_CARTS_BY_IDS = (
+    f"{_SELECT_CARTS} WHERE c.id = ANY($1::uuid[]) AND c.status != 'DEACTIVATED'"
+)
+_SELECT_ACTIVE_CART = (
+    f"{_SELECT_CARTS} WHERE c.user_id = $1 AND c.status IN ('OPENED', 'LOCKED') LIMIT 1"
+)
+_SELECT_CARTS_PAGE = (
+    f"{_SELECT_CARTS} WHERE c.created_at < $1 ORDER BY c.created_at DESC LIMIT $2"
+)
+_INSERT_CART = """
+INSERT INTO carts (created_at, id, user_id, status, config_version)
+VALUES ($1, $2, $3, $4, $5)
+"""
+# the active cart is selected only if nothing is inserted, NULL stands for the inserted
+# cart. No row means the conflicting cart stopped being active before the statement
+# started, so another attempt is made.
+_GET_OR_CREATE_CART = f"""
+WITH inserted AS ({_INSERT_CART} ON CONFLICT DO NOTHING RETURNING id)
+SELECT NULL::text FROM inserted
+UNION ALL
+(
+    {_SELECT_CARTS}
+    WHERE c.user_id = $3
+        AND c.status IN ('OPENED', 'LOCKED')
+        AND NOT EXISTS (SELECT FROM inserted)
+    LIMIT 1
+)
+"""
+_GET_OR_CREATE_CART_ATTEMPTS = 3
+_UPDATE_CART = """
+UPDATE carts SET status = $2, config_version = $3, updated_at = LOCALTIMESTAMP
+WHERE id = $1
+"""
+_UPDATE_CARTS = """
+UPDATE carts AS c
+SET
+    status = new_statuses.status::cart_status_enum,
+    config_version = new_statuses.config_version,
+    updated_at = LOCALTIMESTAMP
+FROM unnest($1::uuid[], $2::text[], $3::integer[])
+    AS new_statuses(id, status, config_version)
+WHERE c.id = new_statuses.id
+"""
+# the update time is kept, the config version isn't a change made by the user
+_PIN_CONFIG_VERSION = """
+UPDATE carts SET config_version = $2
+WHERE id = $1 AND config_version IS DISTINCT FROM $2
+"""
+_DEACTIVATE_EXPIRED_CARTS = """
+UPDATE carts
+SET status = 'DEACTIVATED', updated_at = LOCALTIMESTAMP
+WHERE ctid IN (
+    SELECT c.ctid
+    FROM carts AS c
+    WHERE c.status = 'OPENED'
+        AND c.updated_at < LOCALTIMESTAMP - make_interval(hours => $1)
+        AND NOT EXISTS (
+            SELECT
+            FROM cart_items AS i
+            WHERE i.cart_id = c.id
+                AND i.updated_at >= LOCALTIMESTAMP - make_interval(hours => $1)
+        )
+    LIMIT $2
+    FOR UPDATE SKIP LOCKED
+)
+"""
+_CREATE_ARCHIVE_PARTITIONS = """
+SELECT create_carts_archive_partitions(LOCALTIMESTAMP - make_interval(days => $1))
+"""
+# all the statements see the same snapshot, so the rows removed by the cascade are
+# still visible to the subqueries below
+_ARCHIVE_TERMINAL_CARTS = """
+WITH batch AS (
+    SELECT id
+    FROM carts
+    WHERE status IN ('COMPLETED', 'DEACTIVATED')
+        AND created_at < LOCALTIMESTAMP - make_interval(days => $1)
+    LIMIT $2
+    FOR UPDATE SKIP LOCKED
+), moved AS (
+    DELETE FROM carts
+    WHERE id IN (SELECT id FROM batch)
+    RETURNING id, created_at, updated_at, user_id, status
+)
+INSERT INTO carts_archive (id, created_at, updated_at, user_id, status, data)
+SELECT
+    moved.id,
+    moved.created_at,
+    moved.updated_at,
+    moved.user_id,
+    moved.status,
+    jsonb_build_object(
+        'items', coalesce(
+            (
+                SELECT jsonb_agg(to_jsonb(cart_items))
+                FROM cart_items
+                WHERE cart_items.cart_id = moved.id
+            ),
+            '[]'::jsonb
+        ),
+        'coupon', (
+            SELECT to_jsonb(carts_coupons)
+            FROM carts_coupons
+            WHERE carts_coupons.cart_id = moved.id
+        ),
+        'notifications', coalesce(
+            (
+                SELECT jsonb_agg(to_jsonb(cart_notifications))
+                FROM cart_notifications
+                WHERE cart_notifications.cart_id = moved.id
+            ),
+            '[]'::jsonb
+        )
+    )
+FROM moved
+"""
+_CLEAR_CART = "DELETE FROM cart_items WHERE cart_id = $1"
+_SELECT_CONFIG_VERSION = "SELECT max(id) FROM cart_config"
+_SELECT_CONFIG = "SELECT data::text FROM cart_config WHERE id = $1"
+_INSERT_CONFIG = "INSERT INTO cart_config (data) VALUES ($1::jsonb) RETURNING id"
+_SELECT_ITEMS_LIMITS = (
+    "SELECT item_id, qty_limit FROM cart_item_limits WHERE config_version = $1"
+)
+_SELECT_ITEMS_LIMITS_BY_IDS = """
+SELECT item_id, qty_limit FROM cart_item_limits
+WHERE config_version = $1 AND item_id = ANY($2::integer[])
+"""
+_INSERT_ITEMS_LIMITS = """
+INSERT INTO cart_item_limits (config_version, item_id, qty_limit)
+SELECT $1, * FROM unnest($2::integer[], $3::numeric[])
+"""
+_SELECT_ABANDONMENT_THRESHOLD = "SELECT LOCALTIMESTAMP - make_interval(hours => $1)"
+
+
+class CartsRepository(ICartsRepository):
+    """
+    Responsible for interacting with the database to perform CRUD operations on the
+    Cart objects through a raw asyncpg connection. The statements are static, so
+    asyncpg prepares every one of them once per connection and reuses it. Carts are
+    always fetched as single JSON documents built by Postgres.
+    """
+
+    # the config versions are immutable, so they are parsed once per process
+    _configs_by_version: ClassVar[dict[int, CartConfigDTO]] = {}
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection = connection
+
+    async def create(self, cart: Cart) -> Cart:
+        """
+        Creates a new cart in the database and returns the created cart object.
+        """
+
+        try:
+            await self._connection.execute(
+                _INSERT_CART,
+                cart.created_at,
+                cart.id,
+                cart.user_id,
+                cart.status,
+                cart.config_version,
+            )
+        except IntegrityConstraintViolationError:
+            raise ActiveCartAlreadyExistsError
+
+        await update_context(cart_id=cart.id)
+
+        return cart
+
+    async def get_or_create(self, cart: Cart) -> Cart:
+        """
+        Creates the given cart in the database unless its user already has an active
+        cart, which is returned instead. The insert and the lookup of the active cart
+        are done with a single statement.
+        """
+
+        for _ in range(_GET_OR_CREATE_CART_ATTEMPTS):
+            row = await self._connection.fetchrow(
+                _GET_OR_CREATE_CART,
+                cart.created_at,
+                cart.id,
+                cart.user_id,
+                cart.status,
+                cart.config_version,
+            )
+
+            if row is not None:
+                break
+        else:
+            logger.info("User %s. Active cart can't be got or created!", cart.user_id)
+            raise ActiveCartAlreadyExistsError
+
+        if row[0] is not None:
+            cart = self._get_cart(data=row[0], config=cart.config)
+            logger.debug("Cart %s. Active cart already exists.", cart.id)
+
+        await update_context(cart_id=cart.id)
+
+        return cart
+
+    async def retrieve(self, cart_id: UUID, config_version: int | None = None) -> Cart:
+        """
+        Retrieves an existing cart from the database based on the provided cart ID
+        and returns the retrieved cart object. With the config version the cart gets
+        that config instead of the latest one, which isn't looked up then.
+        """
+
+        data = await self._connection.fetchval(_SELECT_CART_BY_ID, cart_id)
+
+        if data is None:
+            raise CartNotFoundError
+
+        config = await self._get_config(version=config_version)
+        cart = self._get_cart(data=data, config=config)
+
+        debug_snapshots.log(logger, "Got cart: %s", lambda: vars(cart))
+
+        return cart
+
+    async def retrieve_active(self, user_id: int) -> Cart:
+        """
+        Retrieves the active cart of the user with the provided ID from the database,
+        the lookup is served by the unique index of the active carts of users.
+        """
+
+        data = await self._connection.fetchval(_SELECT_ACTIVE_CART, user_id)
+
+        if data is None:
+            raise CartNotFoundError
+
+        config = await self._get_config()
+        cart = self._get_cart(data=data, config=config)
+
+        await update_context(cart_id=cart.id)
+
+        return cart
+
+    async def retrieve_many(self, cart_ids: Collection[UUID]) -> list[Cart]:
+        """
+        Retrieves existing carts from the database based on the provided cart IDs with
+        a single query. Carts that don't exist are missing from the returned list.
+        """
+
+        if not cart_ids:
+            return []
+
+        rows = await self._connection.fetch(_SELECT_CARTS_BY_IDS, list(cart_ids))
+        config = await self._get_config()
+
+        return [self._get_cart(data=data, config=config) for data, in rows]
+
+    async def update(self, cart: Cart) -> Cart:
+        """
+        Updates the status and the config version of a cart in the database based on
+        the provided cart object and returns the updated cart object.
+        """
+
+        await self._connection.execute(
+            _UPDATE_CART,
+            cart.id,
+            cart.status,
+            cart.config_version,
+        )
+
+        return cart
+
+    async def update_many(self, carts: Sequence[Cart]) -> None:
+        """
+        Updates the statuses and the config versions of the provided carts in the
+        database with a single UPDATE ... FROM unnest(...) statement.
+        """
+
+        if not carts:
+            return
+
+        await self._connection.execute(
+            _UPDATE_CARTS,
+            [cart.id for cart in carts],
+            [cart.status for cart in carts],
+            [cart.config_version for cart in carts],
+        )
+
+    async def deactivate_expired(self, idle_hours: int, limit: int) -> int:
+        """
+        Deactivates at most `limit` opened carts that, together with their items, were
+        not updated for the provided number of hours and returns the number of
+        deactivated carts. Rows locked by concurrent transactions are skipped.
+        """
+
+        status = await self._connection.execute(
+            _DEACTIVATE_EXPIRED_CARTS,
+            idle_hours,
+            limit,
+        )
+
+        return self._get_rowcount(status=status)
+
+    async def archive_terminal(self, older_than_days: int, limit: int) -> int:
+        """
+        Moves at most `limit` completed or deactivated carts created more than the
+        provided number of days ago, together with their items, coupon and notifications,
+        into the partitioned archive and returns the number of moved carts. Missing
+        archive partitions are created beforehand under an advisory lock, so
+        overlapping runs don't race to create them.
+        """
+
+        await self._connection.execute(_CREATE_ARCHIVE_PARTITIONS, older_than_days)
+        status = await self._connection.execute(
+            _ARCHIVE_TERMINAL_CARTS,
+            older_than_days,
+            limit,
+        )
+
+        return self._get_rowcount(status=status)
+
+    async def clear(self, cart_id: UUID) -> None:
+        """
+        Clears the items of a cart in the database based on the provided cart ID.
+        """
+
+        await self._connection.execute(_CLEAR_CART, cart_id)
+
+    async def get_list(self, page_size: int, created_at: datetime) -> list[Cart]:
+        """
+        Retrieves a list of carts from the database based on the specified page
+        size and creation date and returns a list of cart objects.
+        """
+
+        rows = await self._connection.fetch(_SELECT_CARTS_PAGE, created_at, page_size)
+        config = await self._get_config()
+
+        return [self._get_cart(data=data, config=config) for data, in rows]
+
+    async def get_config(self, with_items_limits: bool = False) -> CartConfig:
+        """
+        Retrieves the cart configuration from the database and returns the cart
+        configuration object. The per-item limits are loaded only on request, since
+        the whole table of them is read.
+        """
+
+        config = await self._get_config()
+
+        if not with_items_limits:
+            return config
+
+        rows = await self._connection.fetch(_SELECT_ITEMS_LIMITS, config.version)
+        config.limit_items_by_id = dict(rows)
+
+        return config
+
+    async def update_config(self, cart_config: CartConfig) -> CartConfig:
+        """
+        Stores the provided cart configuration as a new version in the database and
+        returns it with the version set. The stored versions are never changed. The
+        per-item limits are stored in their own table under the new version.
+        """
+
+        data = vars(cart_config).copy()
+        limit_items_by_id = data.pop("limit_items_by_id")
+        data.pop("version")
+
+        cart_config.version = await self._connection.fetchval(
+            _INSERT_CONFIG,
+            json_dumps(data),
+        )
+
+        if limit_items_by_id:
+            await self._connection.execute(
+                _INSERT_ITEMS_LIMITS,
+                cart_config.version,
+                list(limit_items_by_id.keys()),
+                list(limit_items_by_id.values()),
+            )
+
+        return cart_config
+
+    async def get_items_limits(
+        self,
+        config_version: int | None,
+        item_ids: Collection[int],
+    ) -> dict[int, Decimal]:
+        """
+        Retrieves the qty limits of the provided items in the specified config version
+        with a single query. Items without a limit are missing from the result.
+        """
+
+        if not item_ids:
+            return {}
+
+        rows = await self._connection.fetch(
+            _SELECT_ITEMS_LIMITS_BY_IDS,
+            config_version,
+            list(item_ids),
+        )
+
+        return dict(rows)
+
+    async def pin_config_version(self, cart: Cart) -> None:
+        """
+        Records the config version the cart was last validated against, unless it is
+        already recorded. The update time of the cart is kept as is.
+        """
+
+        await self._connection.execute(
+            _PIN_CONFIG_VERSION,
+            cart.id,
+            cart.config_version,
+        )
+
+    async def get_abandonment_threshold(self) -> datetime:
+        """
+        Returns the database time before which not updated opened carts are considered
+        abandoned.
+        """
+
+        config = await self._get_config()
+
+        return await self._connection.fetchval(
+            _SELECT_ABANDONMENT_THRESHOLD,
+            config.hours_since_update_until_abandoned,
+        )
+
+    async def find_abandoned_cart_id_by_user_id(
+        self,
+        shard: int = 0,
+        shards_qty: int = 1,
+        updated_after: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> list[tuple[int, UUID, int]]:
+        """
+        Finds abandoned carts in the database based on certain criteria and returns
+        a list of tuples containing the user ID and cart ID of the abandoned carts and
+        the cycle of their next abandoned cart notification.
+        Only the sent notifications are counted, so the cycle of a reservation that
+        was never sent is taken over once the reservation expires.
+        Only the carts of the provided shard out of `shards_qty` ones are returned,
+        carts are spread over the shards by the hash of their ID. If the bounds are
+        provided, only the carts last updated within them are returned.
+        """
+
+        config = await self._get_config()
+        args: list[Any] = [config.max_abandoned_notifications_qty]
+
+        # every combination of the optional criteria is a statement of its own, so
+        # each of them gets a plan that fits it
+        if updated_before is not None:
+            args.append(updated_before)
+            window = f"c.updated_at <= ${len(args)}"
+        else:
+            args.append(config.hours_since_update_until_abandoned)
+            window = (
+                f"c.updated_at <= LOCALTIMESTAMP - make_interval(hours => ${len(args)})"
+            )
+
+        if updated_after is not None:
+            args.append(updated_after)
+            window += f" AND c.updated_at > ${len(args)}"
+
+        if shards_qty > 1:
+            # every shard takes an equal range of the signed 32-bit hash, so it reads
+            # only its own entries of the index on the hash
+            shard_size = 2**32 // shards_qty
+            lower_hash = -(2**31) + shard * shard_size
+            upper_hash = (
+                lower_hash + shard_size - 1 if shard < shards_qty - 1 else 2**31 - 1
+            )
+            args.extend([lower_hash, upper_hash])
+            window += (
+                f" AND hashtext(c.id::text) BETWEEN ${len(args) - 1} AND ${len(args)}"
+            )
+
+        rows = await self._connection.fetch(
+            f"""
+            WITH notifications AS (
+                SELECT n.cart_id, count(*) AS notifications_count
+                FROM cart_notifications AS n
+                JOIN carts AS c ON n.cart_id = c.id
+                WHERE {window}
+                    AND c.status = 'OPENED'
+                    AND n.type = 'ABANDONED_CART'
+                    AND n.sent_at IS NOT NULL
+                GROUP BY n.cart_id
+            )
+            SELECT c.user_id, c.id, coalesce(n.notifications_count, 0) + 1
+            FROM carts AS c
+            LEFT JOIN notifications AS n ON c.id = n.cart_id
+            WHERE {window}
+                AND c.status = 'OPENED'
+                AND (n.notifications_count IS NULL OR n.notifications_count < $1)
+            """,
+            *args,
+        )
+
+        return [(user_id, cart_id, cycle) for user_id, cart_id, cycle in rows]
+
+    @staticmethod
+    def _get_rowcount(status: str) -> int:
+        # the command tag of a statement, e.g. "UPDATE 10" or "INSERT 0 10"
+        return int(status.rsplit(" ", 1)[-1])
+
+    @staticmethod
+    def _get_cart(data: str, config: CartConfig) -> Cart:
+        aggregate = orjson.loads(data)
+        cart = Cart(
+            data=CartDTO.model_validate(aggregate),
+            items=[
+                CartItem(data=ItemDTO.model_validate(item)) for item in aggregate["items"]
+            ],
+            config=config,
+        )
+
+        if aggregate["coupon"] is None:
+            return cart
+
+        cart.coupon = CartCoupon(
+            data=CartCouponDTO.model_validate(aggregate["coupon"]),
+            cart=cart,
+        )
+
+        return cart
+
+    async def _get_config(self, version: int | None = None) -> CartConfig:
+        if version is None:
+            version = await self._connection.fetchval(_SELECT_CONFIG_VERSION)
+
+        if version is None:
+            raise CartConfigNotFoundError
+
+        data = self._configs_by_version.get(version)
+
+        if data is None:
+            row_data = await self._connection.fetchval(_SELECT_CONFIG, version)
+
+            if row_data is None:
+                raise CartConfigNotFoundError
+
+            data = CartConfigDTO.model_validate(
+                {**orjson.loads(row_data), "version": version},
+            )
+            self._configs_by_version[version] = data
+
+        return CartConfig(data=data)
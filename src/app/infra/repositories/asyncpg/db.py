@@ -0,0 +1,43 @@
+from collections.abc import AsyncIterator
+
+from asyncpg import Pool, create_pool
+
+from app.config import DBBackendEnum, DBConfig
+
+
+def get_pool(config: DBConfig) -> Pool:
+    """
+    Creates a not yet initialized pool of raw asyncpg connections with the session
+    settings of the SQLAlchemy engine. Unqualified names resolve to the configured
+    schema.
+    """
+
+    return create_pool(
+        dsn=str(config.dsn).replace("postgresql+asyncpg://", "postgresql://", 1),
+        min_size=config.pool_size,
+        max_size=config.pool_size + config.max_overflow,
+        timeout=config.connection_timeout,
+        command_timeout=config.command_timeout,
+        **config.connect_args,
+        server_settings={
+            "jit": "off",
+            **config.server_settings,
+            "application_name": config.app_name,
+            "timezone": config.timezone,
+            "search_path": config.schema_name,
+        },
+    )
+
+
+async def init_asyncpg_pool(config: DBConfig) -> AsyncIterator[Pool | None]:
+    """
+    Initializes and returns a pool of raw asyncpg connections when the asyncpg backend
+    is selected, so no extra connections are opened for the SQLAlchemy one.
+    """
+
+    if config.backend != DBBackendEnum.ASYNCPG:
+        yield None
+        return
+
+    async with get_pool(config=config) as pool:
+        yield pool
@@ -0,0 +1,169 @@
+from decimal import Decimal
+from logging import getLogger
+from uuid import UUID
+
+from asyncpg import Connection, IntegrityConstraintViolationError
+
+from app.domain.cart_items.entities import CartItem
+from app.domain.carts.entities import Cart
+from app.domain.interfaces.repositories.items.exceptions import ItemAlreadyExists
+from app.domain.interfaces.repositories.items.repo import IItemsRepository
+
+logger = getLogger(__name__)
+
+_INSERT_ITEM = """
+INSERT INTO cart_items (id, name, qty, price, is_weight, cart_id)
+VALUES ($1, $2, $3::numeric, $4, $5, $6)
+"""
+_UPSERT_ITEM = f"""
+WITH upserted AS (
+    {_INSERT_ITEM}
+    ON CONFLICT (cart_id, id) DO UPDATE
+    SET qty = cart_items.qty + excluded.qty, updated_at = LOCALTIMESTAMP
+    RETURNING qty
+),
+pinned AS (
+    UPDATE carts SET config_version = $7
+    WHERE id = $6 AND config_version IS DISTINCT FROM $7
+)
+SELECT qty::numeric FROM upserted
+"""
+# the qty is increased only if the cart is opened, owned by the user, if any, and the
+# specific item and the overall items qty limits of the current config are kept,
+# the cart is pinned to the config in the same statement
+_INCREASE_ITEM_QTY = f"""
+WITH config AS (
+    SELECT id AS version, (data ->> 'max_items_qty')::numeric AS max_items_qty
+    FROM cart_config
+    ORDER BY id DESC
+    LIMIT 1
+),
+increased AS (
+    UPDATE cart_items AS i
+    SET qty = i.qty + $3::numeric, updated_at = LOCALTIMESTAMP
+    FROM carts AS c, config
+    WHERE i.cart_id = $1
+      AND i.id = $2
+      AND c.id = i.cart_id
+      AND c.status = 'OPENED'
+      AND ($4::integer IS NULL OR c.user_id = $4)
+      AND NOT EXISTS (
+          SELECT FROM cart_item_limits AS l
+          WHERE l.config_version = config.version
+            AND l.item_id = i.id
+            AND l.qty_limit < i.qty + $3::numeric
+      )
+      AND (
+          SELECT sum(CASE WHEN is_weight THEN {Cart.WEIGHT_ITEM_QTY} ELSE qty END)
+          FROM cart_items
+          WHERE cart_id = $1
+      ) + CASE WHEN i.is_weight THEN 0 ELSE $3::numeric END <= config.max_items_qty
+    RETURNING i.qty, config.version
+),
+pinned AS (
+    UPDATE carts AS c SET config_version = increased.version
+    FROM increased
+    WHERE c.id = $1 AND c.config_version IS DISTINCT FROM increased.version
+)
+SELECT qty::numeric FROM increased
+"""
+_UPDATE_ITEM = """
+UPDATE cart_items
+SET name = $3, qty = $4::numeric, price = $5, is_weight = $6, updated_at = LOCALTIMESTAMP
+WHERE id = $1 AND cart_id = $2
+"""
+_DELETE_ITEM = "DELETE FROM cart_items WHERE id = $1 AND cart_id = $2"
+
+
+class ItemsRepository(IItemsRepository):
+    """
+    Responsible for interacting with the database to perform CRUD operations on
+    CartItem objects through a raw asyncpg connection with prepared statements.
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection = connection
+
+    async def add_item(self, item: CartItem) -> None:
+        """Inserts a new CartItem object into the database."""
+
+        try:
+            await self._connection.execute(
+                _INSERT_ITEM,
+                item.id,
+                item.name,
+                item.qty,
+                item.price,
+                item.is_weight,
+                item.cart_id,
+            )
+        except IntegrityConstraintViolationError as err:
+            raise ItemAlreadyExists(str(err)) from err
+
+    async def upsert_item(
+        self,
+        item: CartItem,
+        qty: Decimal,
+        config_version: int | None,
+    ) -> Decimal:
+        """
+        Inserts the given CartItem object into the database with the given qty, or adds
+        the qty to the stored one if the item is already in the cart, and pins the cart
+        to the given config version in a single statement. Returns the stored qty of
+        the item.
+        """
+
+        return await self._connection.fetchval(
+            _UPSERT_ITEM,
+            item.id,
+            item.name,
+            qty,
+            item.price,
+            item.is_weight,
+            item.cart_id,
+            config_version,
+        )
+
+    async def increase_item_qty(
+        self,
+        cart_id: UUID,
+        item_id: int,
+        qty: Decimal,
+        user_id: int | None = None,
+    ) -> Decimal | None:
+        """
+        Adds the qty to the stored one of an item already in the cart and pins the cart
+        to the current config in a single statement, if the cart can be modified by
+        the user, if any, and the qty limits of the config are kept. Returns the stored
+        qty of the item, or None if it isn't increased.
+        """
+
+        return await self._connection.fetchval(
+            _INCREASE_ITEM_QTY,
+            cart_id,
+            item_id,
+            qty,
+            user_id,
+        )
+
+    async def update_item(self, item: CartItem) -> CartItem:
+        """Updates an existing CartItem object in the database."""
+
+        await self._connection.execute(
+            _UPDATE_ITEM,
+            item.id,
+            item.cart_id,
+            item.name,
+            item.qty,
+            item.price,
+            item.is_weight,
+        )
+
+        return item
+
+    async def delete_item(self, cart: Cart, item_id: int) -> None:
+        """
+        Deletes an item from the database based on the provided cart and item_id.
+        """
+
+        await self._connection.execute(_DELETE_ITEM, item_id, cart.id)
@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from asyncpg import Connection
+
+from app.domain.interfaces.repositories.watermarks import IWatermarksRepository
+
+_SELECT_WATERMARK = "SELECT value FROM watermarks WHERE name = $1"
+_SAVE_WATERMARK = """
+INSERT INTO watermarks (name, value) VALUES ($1, $2)
+ON CONFLICT (name) DO UPDATE SET value = excluded.value, updated_at = LOCALTIMESTAMP
+"""
+
+
+class WatermarksRepository(IWatermarksRepository):
+    """
+    Provides methods to read and move the durable watermarks of incremental periodic
+    jobs through a raw asyncpg connection.
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection = connection
+
+    async def get(self, name: str) -> datetime | None:
+        """
+        Retrieves the value of the watermark with the provided name, returns None if
+        the watermark was never saved.
+        """
+
+        return await self._connection.fetchval(_SELECT_WATERMARK, name)
+
+    async def save(self, name: str, value: datetime) -> None:
+        """Creates or moves the watermark with the provided name to the provided value."""
+
+        await self._connection.execute(_SAVE_WATERMARK, name, value)
@@ -1,7 +1,12 @@
+from datetime import timedelta
+from uuid import UUID
+
+from sqlalchemy import delete, func, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.cart_notifications.entities import CartNotification
+from app.domain.cart_notifications.value_objects import CartNotificationTypeEnum
 from app.domain.interfaces.repositories.cart_notifications import (
     ICartNotificationsRepository,
 )
@@ -10,8 +15,9 @@ from app.infra.repositories.sqla import models
 
 class CartsNotificationsRepository(ICartNotificationsRepository):
     """
-    Provides a method to create a cart notification and save it to the database
-    using SQLAlchemy.
+    Provides methods to create, reserve, confirm and release cart notifications in the
+    database using SQLAlchemy. Reservations rely on the unique index over the cart ID,
+    type and cycle of a notification.
     """
 
     def __init__(self, session: AsyncSession) -> None:
@@ -24,9 +30,98 @@ class CartsNotificationsRepository(ICartNotificationsRepository):
             id=cart_notification.id,
             cart_id=cart_notification.cart_id,
             type=cart_notification.type,
+            cycle=cart_notification.cycle,
             text=cart_notification.text,
             sent_at=cart_notification.sent_at,
         )
         await self._session.execute(stmt)
 
         return cart_notification
+
+    async def reserve(
+        self,
+        notifications: list[CartNotification],
+        reservation_timeout_sec: int,
+    ) -> list[CartNotification]:
+        """
+        Saves the given pending cart notifications to the database in a single
+        statement, skipping the ones whose cart, type and cycle are already taken.
+        A taken notification that is still not sent is taken over if it was reserved
+        more than `reservation_timeout_sec` seconds ago. Returns the saved notifications
+        only.
+        """
+
+        # a statement can't take over a row it has inserted itself
+        pending: dict[tuple[UUID, CartNotificationTypeEnum, int], CartNotification] = {}
+
+        for notification in notifications:
+            pending.setdefault(
+                (notification.cart_id, notification.type, notification.cycle),
+                notification,
+            )
+
+        insert_stmt = insert(models.CartNotification).values(
+            [
+                {
+                    "id": notification.id,
+                    "cart_id": notification.cart_id,
+                    "type": notification.type,
+                    "cycle": notification.cycle,
+                    "text": notification.text,
+                    "sent_at": notification.sent_at,
+                }
+                for notification in pending.values()
+            ]
+        )
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["cart_id", "type", "cycle"],
+            set_={
+                "id": insert_stmt.excluded.id,
+                "text": insert_stmt.excluded.text,
+                "reserved_at": func.localtimestamp(),
+                "updated_at": func.localtimestamp(),
+            },
+            where=(
+                models.CartNotification.sent_at.is_(None)
+                & (
+                    models.CartNotification.reserved_at
+                    < func.localtimestamp() - timedelta(seconds=reservation_timeout_sec)
+                )
+            ),
+        ).returning(models.CartNotification.id)
+        reserved_ids = set(await self._session.scalars(stmt))
+
+        return [
+            notification
+            for notification in notifications
+            if notification.id in reserved_ids
+        ]
+
+    async def confirm(self, notifications: list[CartNotification]) -> None:
+        """Saves the sending time of the given reserved cart notifications."""
+
+        await self._session.execute(
+            update(models.CartNotification),
+            [
+                {
+                    "id": notification.id,
+                    "cart_id": notification.cart_id,
+                    "sent_at": notification.sent_at,
+                }
+                for notification in notifications
+            ],
+        )
+
+    async def release(self, notifications: list[CartNotification]) -> None:
+        """
+        Deletes the given reserved cart notifications that are still not sent, so
+        their cart, type and cycle can be reserved again.
+        """
+
+        stmt = delete(models.CartNotification).where(
+            models.CartNotification.id.in_(
+                [notification.id for notification in notifications]
+            ),
+            models.CartNotification.sent_at.is_(None),
+        )
+        await self._session.execute(stmt)
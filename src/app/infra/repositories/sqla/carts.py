@@ -1,8 +1,28 @@
-from datetime import datetime
+from collections.abc import Collection, Sequence
+from datetime import datetime, timedelta
+from decimal import Decimal
+from itertools import chain
 from logging import getLogger
+from typing import Any, ClassVar
 from uuid import UUID
 
-from sqlalchemy import Row, delete, func, select, text, update
+import orjson
+from sqlalchemy import (
+    CTE,
+    ColumnElement,
+    ScalarSelect,
+    Text,
+    cast,
+    column,
+    delete,
+    exists,
+    func,
+    literal_column,
+    select,
+    text,
+    update,
+    values,
+)
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,14 +40,17 @@ from app.domain.carts.entities import Cart
 from app.domain.carts.value_objects import CartStatusEnum
 from app.domain.interfaces.repositories.carts.exceptions import (
     ActiveCartAlreadyExistsError,
+    CartConfigNotFoundError,
     CartNotFoundError,
 )
 from app.domain.interfaces.repositories.carts.repo import ICartsRepository
 from app.infra.repositories.sqla import models
-from app.logging import update_context
+from app.logging import debug_snapshots, update_context
 
 logger = getLogger(__name__)
 
+_GET_OR_CREATE_CART_ATTEMPTS = 3
+
 
 class CartsRepository(ICartsRepository):
     """
@@ -36,10 +59,17 @@ class CartsRepository(ICartsRepository):
     cart, update a cart's status, clear a cart's items, get a list of carts, get the
     cart configuration, update the cart configuration, and find abandoned carts based
     on certain criteria.
+
+    With the aggregated fetch a cart is retrieved as a single JSON document built by
+    Postgres, instead of a row per item loaded through the ORM.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    # the config versions are immutable, so they are parsed once per process
+    _configs_by_version: ClassVar[dict[int, CartConfigDTO]] = {}
+
+    def __init__(self, session: AsyncSession, aggregated_fetch: bool = False) -> None:
         self._session = session
+        self._aggregated_fetch = aggregated_fetch
 
     async def create(self, cart: Cart) -> Cart:
         """
@@ -51,6 +81,7 @@ class CartsRepository(ICartsRepository):
             id=cart.id,
             user_id=cart.user_id,
             status=cart.status,
+            config_version=cart.config_version,
         )
 
         try:
@@ -62,49 +93,262 @@ class CartsRepository(ICartsRepository):
 
         return cart
 
-    async def retrieve(self, cart_id: UUID) -> Cart:
+    async def get_or_create(self, cart: Cart) -> Cart:
+        """
+        Creates the given cart in the database unless its user already has an active
+        cart, which is returned instead. The insert and the lookup of the active cart
+        are done with a single statement.
+        """
+
+        for _ in range(_GET_OR_CREATE_CART_ATTEMPTS):
+            inserted = (
+                insert(models.Cart)
+                .values(
+                    created_at=cart.created_at,
+                    id=cart.id,
+                    user_id=cart.user_id,
+                    status=cart.status,
+                    config_version=cart.config_version,
+                )
+                .on_conflict_do_nothing()
+                .returning(models.Cart.id)
+                .cte("inserted")
+            )
+            obj = await self._get_active_cart(user_id=cart.user_id, inserted=inserted)
+
+            if obj is None:
+                # the statement sees neither the inserted cart nor an active cart
+                # committed concurrently after it has started
+                obj = await self._get_active_cart(user_id=cart.user_id)
+
+            if obj is not None:
+                break
+            # the conflicting cart has stopped being active, so the insert is retried
+        else:
+            logger.info("User %s. Active cart can't be got or created!", cart.user_id)
+            raise ActiveCartAlreadyExistsError
+
+        if obj.id != cart.id:
+            cart = self._get_cart(obj=obj, config=cart.config)
+            logger.debug("Cart %s. Active cart already exists.", cart.id)
+
+        await update_context(cart_id=cart.id)
+
+        return cart
+
+    async def retrieve(self, cart_id: UUID, config_version: int | None = None) -> Cart:
         """
         Retrieves an existing cart from the database based on the provided cart ID
-        and returns the retrieved cart object.
+        and returns the retrieved cart object. With the config version the cart gets
+        that config instead of the latest one, which isn't looked up then.
+        """
+
+        if self._aggregated_fetch:
+            cart = await self._retrieve_aggregated(
+                cart_id=cart_id,
+                config_version=config_version,
+            )
+        else:
+            cart = await self._retrieve_joined(
+                cart_id=cart_id,
+                config_version=config_version,
+            )
+
+        debug_snapshots.log(logger, "Got cart: %s", lambda: vars(cart))
+
+        return cart
+
+    async def retrieve_active(self, user_id: int) -> Cart:
+        """
+        Retrieves the active cart of the user with the provided ID from the database,
+        the lookup is served by the unique index of the active carts of users.
+        """
+
+        obj = await self._get_active_cart(user_id=user_id)
+
+        if not obj:
+            raise CartNotFoundError
+
+        config = await self._get_config()
+        cart = self._get_cart(obj=obj, config=config)
+
+        await update_context(cart_id=cart.id)
+
+        return cart
+
+    async def retrieve_many(self, cart_ids: Collection[UUID]) -> list[Cart]:
+        """
+        Retrieves existing carts from the database based on the provided cart IDs with
+        a single query. Carts that don't exist are missing from the returned list.
         """
 
+        if not cart_ids:
+            return []
+
         stmt = (
             select(models.Cart)
             .options(joinedload(models.Cart.items))
             .options(joinedload(models.Cart.coupon))
             .where(
-                models.Cart.id == cart_id,
+                models.Cart.id.in_(cart_ids),
                 models.Cart.status != CartStatusEnum.DEACTIVATED,
             )
         )
         result = await self._session.scalars(stmt)
-        obj = result.first()
-
-        if not obj:
-            raise CartNotFoundError
+        objects = result.unique().all()
 
         config = await self._get_config()
-        cart = self._get_cart(obj=obj, config=config)
-
-        logger.debug("Got cart: %s", vars(cart))
 
-        return cart
+        return [self._get_cart(obj=obj, config=config) for obj in objects]
 
     async def update(self, cart: Cart) -> Cart:
         """
-        Updates the status of a cart in the database based on the provided cart
-        object and returns the updated cart object.
+        Updates the status and the config version of a cart in the database based on
+        the provided cart object and returns the updated cart object.
         """
 
         stmt = (
             update(models.Cart)
             .where(models.Cart.id == cart.id)
-            .values(status=cart.status)
+            .values(status=cart.status, config_version=cart.config_version)
         )
         await self._session.execute(stmt)
 
         return cart
 
+    async def update_many(self, carts: Sequence[Cart]) -> None:
+        """
+        Updates the statuses and the config versions of the provided carts in the
+        database with a single UPDATE ... FROM (VALUES ...) statement.
+        """
+
+        if not carts:
+            return
+
+        new_statuses = values(
+            column("id", models.Cart.id.type),
+            column("status", models.Cart.status.type),
+            column("config_version", models.Cart.config_version.type),
+            name="new_statuses",
+        ).data([(cart.id, cart.status, cart.config_version) for cart in carts])
+
+        stmt = (
+            update(models.Cart)
+            .where(models.Cart.id == new_statuses.c.id)
+            .values(
+                status=new_statuses.c.status,
+                config_version=new_statuses.c.config_version,
+            )
+        )
+        await self._session.execute(stmt)
+
+    async def deactivate_expired(self, idle_hours: int, limit: int) -> int:
+        """
+        Deactivates at most `limit` opened carts that, together with their items, were
+        not updated for the provided number of hours and returns the number of
+        deactivated carts. Rows locked by concurrent transactions are skipped.
+        """
+
+        threshold = func.localtimestamp() - timedelta(hours=idle_hours)
+        ctid: ColumnElement[Any] = literal_column("ctid")
+
+        expired = (
+            select(ctid)
+            .select_from(models.Cart)
+            .where(
+                models.Cart.status == CartStatusEnum.OPENED,
+                models.Cart.updated_at < threshold,
+                ~exists().where(
+                    models.CartItem.cart_id == models.Cart.id,
+                    models.CartItem.updated_at >= threshold,
+                ),
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(models.Cart)
+            .where(ctid.in_(expired))
+            .values(status=CartStatusEnum.DEACTIVATED)
+        )
+        result = await self._session.execute(stmt)
+
+        return result.rowcount
+
+    async def archive_terminal(self, older_than_days: int, limit: int) -> int:
+        """
+        Moves at most `limit` completed or deactivated carts created more than the
+        provided number of days ago, together with their items, coupon and notifications,
+        into the partitioned archive and returns the number of moved carts. Missing
+        archive partitions are created beforehand under an advisory lock, so
+        overlapping runs don't race to create them.
+        """
+
+        threshold = func.localtimestamp() - timedelta(days=older_than_days)
+        schema = models.CartArchive.__table__.schema
+        schema_func = getattr(func, schema) if schema else func
+        await self._session.execute(
+            select(schema_func.create_carts_archive_partitions(threshold)),
+        )
+
+        batch = (
+            select(models.Cart.id)
+            .where(
+                models.Cart.status.in_(
+                    [CartStatusEnum.COMPLETED, CartStatusEnum.DEACTIVATED],
+                ),
+                models.Cart.created_at < threshold,
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("batch")
+        )
+        moved = (
+            delete(models.Cart)
+            .where(models.Cart.id.in_(select(batch.c.id)))
+            .returning(
+                models.Cart.id,
+                models.Cart.created_at,
+                models.Cart.updated_at,
+                models.Cart.user_id,
+                models.Cart.status,
+            )
+            .cte("moved")
+        )
+        # All the statements see the same snapshot, so the rows removed by the cascade
+        # are still visible to the subqueries below.
+        data = func.jsonb_build_object(
+            literal_column("'items'"),
+            self._get_archived_rows(
+                table_name=models.CartItem.__tablename__,
+                criteria=models.CartItem.cart_id == moved.c.id,
+            ),
+            literal_column("'coupon'"),
+            select(func.to_jsonb(literal_column(models.CartCoupon.__tablename__)))
+            .where(models.CartCoupon.cart_id == moved.c.id)
+            .scalar_subquery(),
+            literal_column("'notifications'"),
+            self._get_archived_rows(
+                table_name=models.CartNotification.__tablename__,
+                criteria=models.CartNotification.cart_id == moved.c.id,
+            ),
+        )
+
+        stmt = insert(models.CartArchive).from_select(
+            ["id", "created_at", "updated_at", "user_id", "status", "data"],
+            select(
+                moved.c.id,
+                moved.c.created_at,
+                moved.c.updated_at,
+                moved.c.user_id,
+                moved.c.status,
+                data,
+            ),
+        )
+        result = await self._session.execute(stmt)
+
+        return result.rowcount
+
     async def clear(self, cart_id: UUID) -> None:
         """
         Clears the items of a cart in the database based on the provided cart ID.
@@ -134,35 +378,151 @@ class CartsRepository(ICartsRepository):
 
         return [self._get_cart(obj=obj, config=config) for obj in objects]
 
-    async def get_config(self) -> CartConfig:
+    async def get_config(self, with_items_limits: bool = False) -> CartConfig:
         """
         Retrieves the cart configuration from the database and returns the cart
-        configuration object.
+        configuration object. The per-item limits are loaded only on request, since
+        the whole table of them is read.
         """
 
-        return await self._get_config()
+        config = await self._get_config()
+
+        if not with_items_limits:
+            return config
+
+        stmt = select(models.CartItemLimit.item_id, models.CartItemLimit.qty_limit).where(
+            models.CartItemLimit.config_version == config.version
+        )
+        result = await self._session.execute(stmt)
+        config.limit_items_by_id = dict(result.tuples().all())
+
+        return config
 
     async def update_config(self, cart_config: CartConfig) -> CartConfig:
         """
-        Updates the cart configuration in the database based on the provided cart
-        configuration object and returns the updated cart configuration object.
+        Stores the provided cart configuration as a new version in the database and
+        returns it with the version set. The stored versions are never changed. The
+        per-item limits are stored in their own table under the new version.
         """
 
-        stmt = update(models.CartConfig).values(data=vars(cart_config))
-        await self._session.execute(stmt)
+        data = vars(cart_config).copy()
+        limit_items_by_id = data.pop("limit_items_by_id")
+        data.pop("version")
+
+        stmt = insert(models.CartConfig).values(data=data).returning(models.CartConfig.id)
+        cart_config.version = await self._session.scalar(stmt)
+
+        if limit_items_by_id:
+            await self._session.execute(
+                insert(models.CartItemLimit),
+                [
+                    {
+                        "config_version": cart_config.version,
+                        "item_id": item_id,
+                        "qty_limit": qty_limit,
+                    }
+                    for item_id, qty_limit in limit_items_by_id.items()
+                ],
+            )
 
         return cart_config
 
-    async def find_abandoned_cart_id_by_user_id(self) -> list[tuple[int, UUID]]:
+    async def get_items_limits(
+        self,
+        config_version: int | None,
+        item_ids: Collection[int],
+    ) -> dict[int, Decimal]:
+        """
+        Retrieves the qty limits of the provided items in the specified config version
+        with a single query. Items without a limit are missing from the result.
+        """
+
+        if not item_ids:
+            return {}
+
+        stmt = select(models.CartItemLimit.item_id, models.CartItemLimit.qty_limit).where(
+            models.CartItemLimit.config_version == config_version,
+            models.CartItemLimit.item_id.in_(item_ids),
+        )
+        result = await self._session.execute(stmt)
+
+        return dict(result.tuples().all())
+
+    async def pin_config_version(self, cart: Cart) -> None:
+        """
+        Records the config version the cart was last validated against, unless it is
+        already recorded. The update time of the cart is kept as is.
+        """
+
+        stmt = (
+            update(models.Cart)
+            .where(
+                models.Cart.id == cart.id,
+                models.Cart.config_version.is_distinct_from(cart.config_version),
+            )
+            .values(
+                config_version=cart.config_version,
+                updated_at=models.Cart.updated_at,
+            )
+        )
+        await self._session.execute(stmt)
+
+    async def get_abandonment_threshold(self) -> datetime:
+        """
+        Returns the database time before which not updated opened carts are considered
+        abandoned.
+        """
+
+        config = await self._get_config()
+        stmt = select(
+            func.localtimestamp()
+            - text(f"INTERVAL '{config.hours_since_update_until_abandoned} hours'"),
+        )
+        result = await self._session.execute(stmt)
+
+        return result.scalar_one()
+
+    async def find_abandoned_cart_id_by_user_id(
+        self,
+        shard: int = 0,
+        shards_qty: int = 1,
+        updated_after: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> list[tuple[int, UUID, int]]:
         """
         Finds abandoned carts in the database based on certain criteria and returns
-        a list of tuples containing the user ID and cart ID of the abandoned carts.
+        a list of tuples containing the user ID and cart ID of the abandoned carts and
+        the cycle of their next abandoned cart notification.
+        Only the sent notifications are counted, so the cycle of a reservation that
+        was never sent is taken over once the reservation expires.
+        Only the carts of the provided shard out of `shards_qty` ones are returned,
+        carts are spread over the shards by the hash of their ID. If the bounds are
+        provided, only the carts last updated within them are returned.
         """
 
         config = await self._get_config()
-        abandonment_threshold_time = func.now() - text(
-            f"INTERVAL '{config.hours_since_update_until_abandoned} hours'"
+        abandonment_threshold_time = (
+            updated_before
+            if updated_before is not None
+            else func.localtimestamp()
+            - text(f"INTERVAL '{config.hours_since_update_until_abandoned} hours'")
         )
+        window = [models.Cart.updated_at <= abandonment_threshold_time]
+
+        if updated_after is not None:
+            window.append(models.Cart.updated_at > updated_after)
+
+        if shards_qty > 1:
+            # every shard takes an equal range of the signed 32-bit hash, so it reads
+            # only its own entries of the index on the hash
+            shard_size = 2**32 // shards_qty
+            lower_hash = -(2**31) + shard * shard_size
+            upper_hash = (
+                lower_hash + shard_size - 1 if shard < shards_qty - 1 else 2**31 - 1
+            )
+            window.append(
+                func.hashtext(cast(models.Cart.id, Text)).between(lower_hash, upper_hash),
+            )
 
         subquery = (
             select(
@@ -171,18 +531,23 @@ class CartsRepository(ICartsRepository):
             )
             .join(models.Cart, models.CartNotification.cart_id == models.Cart.id)
             .where(
-                models.Cart.updated_at <= abandonment_threshold_time,
+                *window,
                 models.Cart.status == CartStatusEnum.OPENED,
                 models.CartNotification.type == CartNotificationTypeEnum.ABANDONED_CART,
+                models.CartNotification.sent_at.is_not(None),
             )
             .group_by(models.CartNotification.cart_id)
         ).subquery()
 
         stmt = (
-            select(models.Cart.user_id, models.Cart.id)
+            select(
+                models.Cart.user_id,
+                models.Cart.id,
+                func.coalesce(subquery.c.notifications_count, 0) + 1,
+            )
             .outerjoin(subquery, models.Cart.id == subquery.c.cart_id)
             .where(
-                models.Cart.updated_at <= abandonment_threshold_time,
+                *window,
                 models.Cart.status == CartStatusEnum.OPENED,
                 (subquery.c.notifications_count.is_(None))
                 | (
@@ -194,15 +559,180 @@ class CartsRepository(ICartsRepository):
 
         result = await self._session.execute(stmt)
 
-        return [(user_id, cart_id) for user_id, cart_id in result.all()]
+        return [(user_id, cart_id, cycle) for user_id, cart_id, cycle in result.all()]
+
+    @staticmethod
+    def _get_archived_rows(
+        table_name: str,
+        criteria: ColumnElement[bool],
+    ) -> ScalarSelect[Any]:
+        return (
+            select(
+                func.coalesce(
+                    func.jsonb_agg(func.to_jsonb(literal_column(table_name))),
+                    literal_column("'[]'::jsonb"),
+                ),
+            )
+            .where(criteria)
+            .scalar_subquery()
+        )
+
+    @staticmethod
+    def _build_json_object(**fields: Any) -> ColumnElement[Any]:
+        return func.jsonb_build_object(
+            *chain.from_iterable(
+                (literal_column(f"'{name}'"), value) for name, value in fields.items()
+            ),
+        )
+
+    @staticmethod
+    def _get_cart_from_json(data: str, config: CartConfig) -> Cart:
+        # numerics come as strings, so decimals don't pass through floats
+        aggregate = orjson.loads(data)
+        cart = Cart(
+            data=CartDTO.model_validate(aggregate),
+            items=[
+                CartItem(data=ItemDTO.model_validate(item)) for item in aggregate["items"]
+            ],
+            config=config,
+        )
+
+        if aggregate["coupon"] is None:
+            return cart
+
+        cart.coupon = CartCoupon(
+            data=CartCouponDTO.model_validate(aggregate["coupon"]),
+            cart=cart,
+        )
+
+        return cart
+
+    async def _retrieve_joined(self, cart_id: UUID, config_version: int | None) -> Cart:
+        stmt = (
+            select(models.Cart)
+            .options(joinedload(models.Cart.items))
+            .options(joinedload(models.Cart.coupon))
+            .where(
+                models.Cart.id == cart_id,
+                models.Cart.status != CartStatusEnum.DEACTIVATED,
+            )
+        )
+        result = await self._session.scalars(stmt)
+        obj = result.first()
+
+        if not obj:
+            raise CartNotFoundError
+
+        config = await self._get_config(version=config_version)
+
+        return self._get_cart(obj=obj, config=config)
+
+    async def _retrieve_aggregated(
+        self,
+        cart_id: UUID,
+        config_version: int | None,
+    ) -> Cart:
+        items = (
+            select(
+                func.coalesce(
+                    func.jsonb_agg(
+                        self._build_json_object(
+                            id=models.CartItem.id,
+                            name=models.CartItem.name,
+                            qty=models.CartItem.qty,
+                            price=cast(models.CartItem.price, Text),
+                            is_weight=models.CartItem.is_weight,
+                            cart_id=models.CartItem.cart_id,
+                        ),
+                    ),
+                    literal_column("'[]'::jsonb"),
+                ),
+            )
+            .where(models.CartItem.cart_id == models.Cart.id)
+            .scalar_subquery()
+        )
+        coupon = (
+            select(
+                self._build_json_object(
+                    coupon_id=models.CartCoupon.coupon_id,
+                    min_cart_cost=cast(models.CartCoupon.min_cart_cost, Text),
+                    discount_abs=cast(models.CartCoupon.discount_abs, Text),
+                ),
+            )
+            .where(models.CartCoupon.cart_id == models.Cart.id)
+            .scalar_subquery()
+        )
+        stmt = select(
+            cast(
+                self._build_json_object(
+                    created_at=models.Cart.created_at,
+                    id=models.Cart.id,
+                    user_id=models.Cart.user_id,
+                    status=models.Cart.status,
+                    config_version=models.Cart.config_version,
+                    items=items,
+                    coupon=coupon,
+                ),
+                Text,
+            ),
+        ).where(
+            models.Cart.id == cart_id,
+            models.Cart.status != CartStatusEnum.DEACTIVATED,
+        )
+        data = await self._session.scalar(stmt)
+
+        if data is None:
+            raise CartNotFoundError
+
+        config = await self._get_config(version=config_version)
+
+        return self._get_cart_from_json(data=data, config=config)
+
+    async def _get_active_cart(
+        self,
+        user_id: int,
+        inserted: CTE | None = None,
+    ) -> models.Cart | None:
+        stmt = (
+            select(models.Cart)
+            .options(joinedload(models.Cart.items))
+            .options(joinedload(models.Cart.coupon))
+            .where(
+                models.Cart.user_id == user_id,
+                models.Cart.status.in_([CartStatusEnum.OPENED, CartStatusEnum.LOCKED]),
+            )
+        )
+
+        if inserted is not None:
+            stmt = stmt.add_cte(inserted)
+
+        result = await self._session.scalars(stmt)
+
+        return result.unique().first()
+
+    async def _get_config(self, version: int | None = None) -> CartConfig:
+        if version is None:
+            version = await self._session.scalar(select(func.max(models.CartConfig.id)))
+
+        if version is None:
+            raise CartConfigNotFoundError
+
+        data = self._configs_by_version.get(version)
+
+        if data is None:
+            stmt = select(models.CartConfig.data).where(models.CartConfig.id == version)
+            result = await self._session.execute(stmt)
+            row_data = result.scalar_one_or_none()
+
+            if row_data is None:
+                raise CartConfigNotFoundError
 
-    async def _get_config(self) -> CartConfig:
-        stmt = select(models.CartConfig)
-        row = await self._session.scalar(stmt)
+            data = CartConfigDTO.model_validate({**row_data, "version": version})
+            self._configs_by_version[version] = data
 
-        return CartConfig(data=CartConfigDTO.model_validate(row.data))
+        return CartConfig(data=data)
 
-    def _get_cart(self, obj: Row, config: CartConfig) -> Cart:
+    def _get_cart(self, obj: models.Cart, config: CartConfig) -> Cart:
         cart = Cart(
             data=CartDTO.model_validate(obj),
             items=[CartItem(data=ItemDTO.model_validate(item)) for item in obj.items],
@@ -1,12 +1,16 @@
+from decimal import Decimal
 from logging import getLogger
+from uuid import UUID
 
-from sqlalchemy import delete, update
+from sqlalchemy import Numeric, case, delete, exists, func, literal, select, true, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.domain.cart_items.entities import CartItem
 from app.domain.carts.entities import Cart
+from app.domain.carts.value_objects import CartStatusEnum
 from app.domain.interfaces.repositories.items.exceptions import ItemAlreadyExists
 from app.domain.interfaces.repositories.items.repo import IItemsRepository
 from app.infra.repositories.sqla import models
@@ -40,6 +44,119 @@ class ItemsRepository(IItemsRepository):
         except IntegrityError as err:
             raise ItemAlreadyExists(str(err)) from err
 
+    async def upsert_item(
+        self,
+        item: CartItem,
+        qty: Decimal,
+        config_version: int | None,
+    ) -> Decimal:
+        """
+        Inserts the given CartItem object into the database with the given qty, or adds
+        the qty to the stored one if the item is already in the cart, and pins the cart
+        to the given config version in a single statement. Returns the stored qty of
+        the item.
+        """
+
+        insert_stmt = insert(models.CartItem).values(
+            id=item.id,
+            name=item.name,
+            qty=qty,
+            price=item.price,
+            is_weight=item.is_weight,
+            cart_id=item.cart_id,
+        )
+        upserted = (
+            insert_stmt.on_conflict_do_update(
+                index_elements=[models.CartItem.cart_id, models.CartItem.id],
+                set_={"qty": models.CartItem.qty + insert_stmt.excluded.qty},
+            )
+            .returning(models.CartItem.qty)
+            .cte("upserted")
+        )
+        pinned = (
+            update(models.Cart)
+            .where(
+                models.Cart.id == item.cart_id,
+                models.Cart.config_version.is_distinct_from(config_version),
+            )
+            .values(config_version=config_version, updated_at=models.Cart.updated_at)
+            .cte("pinned")
+        )
+        stmt = select(upserted.c.qty).add_cte(pinned)
+        result = await self._session.execute(stmt)
+
+        return result.scalar_one()
+
+    async def increase_item_qty(
+        self,
+        cart_id: UUID,
+        item_id: int,
+        qty: Decimal,
+        user_id: int | None = None,
+    ) -> Decimal | None:
+        """
+        Adds the qty to the stored one of an item already in the cart and pins the cart
+        to the current config in a single statement, if the cart can be modified by
+        the user, if any, and the qty limits of the config are kept. Returns the stored
+        qty of the item, or None if it isn't increased.
+        """
+
+        qty_added = literal(qty, Numeric())
+        config = (
+            select(
+                models.CartConfig.id.label("version"),
+                models.CartConfig.data["max_items_qty"]
+                .astext.cast(Numeric())
+                .label("max_items_qty"),
+            )
+            .order_by(models.CartConfig.id.desc())
+            .limit(1)
+            .cte("config")
+        )
+        stored = aliased(models.CartItem)
+        items_qty = (
+            select(
+                func.sum(case((stored.is_weight, Cart.WEIGHT_ITEM_QTY), else_=stored.qty))
+            )
+            .where(stored.cart_id == cart_id)
+            .scalar_subquery()
+        )
+        increased = (
+            update(models.CartItem)
+            .where(
+                models.CartItem.cart_id == cart_id,
+                models.CartItem.id == item_id,
+                models.Cart.id == models.CartItem.cart_id,
+                models.Cart.status == CartStatusEnum.OPENED,
+                models.Cart.user_id == user_id if user_id is not None else true(),
+                ~exists().where(
+                    models.CartItemLimit.config_version == config.c.version,
+                    models.CartItemLimit.item_id == models.CartItem.id,
+                    models.CartItemLimit.qty_limit < models.CartItem.qty + qty_added,
+                ),
+                items_qty + case((models.CartItem.is_weight, 0), else_=qty_added)
+                <= config.c.max_items_qty,
+            )
+            .values(qty=models.CartItem.qty + qty_added)
+            .returning(models.CartItem.qty, config.c.version)
+            .cte("increased")
+        )
+        pinned = (
+            update(models.Cart)
+            .where(
+                models.Cart.id == cart_id,
+                models.Cart.config_version.is_distinct_from(increased.c.version),
+            )
+            .values(
+                config_version=increased.c.version,
+                updated_at=models.Cart.updated_at,
+            )
+            .cte("pinned")
+        )
+        stmt = select(increased.c.qty).add_cte(pinned)
+
+        return await self._session.scalar(stmt)
+
     async def update_item(self, item: CartItem) -> CartItem:
         """Updates an existing CartItem object in the database."""
 
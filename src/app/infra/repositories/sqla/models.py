@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Annotated
-from uuid import UUID, uuid4
+from typing import Annotated, Any
+from uuid import UUID
 
 import sqlalchemy as sa
 from sqlalchemy import Index, func
@@ -16,9 +16,15 @@ from app.domain.cart_coupons.value_objects import (
     CartCost,
     Discount,
 )
-from app.domain.cart_items.value_objects import ITEM_PRICE_PRECISION, ITEM_PRICE_SCALE
+from app.domain.cart_items.value_objects import (
+    ITEM_PRICE_PRECISION,
+    ITEM_PRICE_SCALE,
+    QTY_PRECISION,
+    QTY_SCALE,
+)
 from app.domain.cart_notifications.value_objects import CartNotificationTypeEnum
 from app.domain.carts.value_objects import CartStatusEnum
+from app.domain.ids import uuid7
 from app.infra.repositories.sqla.base import Base
 
 
@@ -61,18 +67,21 @@ class CartItem(TimestampMixin, Base):
         "Cart", lazy="noload", back_populates="items", uselist=False
     )
 
+    __table_args__ = (sa.PrimaryKeyConstraint("cart_id", "id"),)
+
 
 class Cart(TimestampMixin, Base):
     __tablename__ = "carts"
 
     id: Mapped[UUID] = mapped_column(
-        sa.UUID(as_uuid=True), primary_key=True, default=uuid4
+        sa.UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     user_id: Mapped[int] = mapped_column(sa.Integer, nullable=False)
     status: Mapped[CartStatusEnum] = mapped_column(
         default=CartStatusEnum.OPENED,
         server_default=CartStatusEnum.OPENED,
     )
+    config_version: Mapped[int | None] = mapped_column(sa.Integer, nullable=True)
 
     items: Mapped[list[CartItem]] = relationship(
         "CartItem", lazy="noload", back_populates="cart"
@@ -91,6 +100,18 @@ class Cart(TimestampMixin, Base):
                 status.in_([CartStatusEnum.OPENED.value, CartStatusEnum.LOCKED.value])
             ),
         ),
+        Index("idx_carts_status_created_at", "status", "created_at"),
+        Index(
+            "idx_carts_opened_updated_at",
+            "updated_at",
+            postgresql_where=(status == CartStatusEnum.OPENED.value),
+        ),
+        Index(
+            "idx_carts_opened_id_hash_updated_at",
+            func.hashtext(sa.cast(id, sa.Text)),
+            "updated_at",
+            postgresql_where=(status == CartStatusEnum.OPENED.value),
+        ),
     )
 
 
@@ -121,11 +142,31 @@ class CartConfig(TimestampMixin, Base):
     data: Mapped[dict] = mapped_column(JSONB, nullable=False)
 
 
+class CartItemLimit(TimestampMixin, Base):
+    __tablename__ = "cart_item_limits"
+
+    config_version: Mapped[int] = mapped_column(
+        sa.ForeignKey(
+            column="cart_config.id",
+            name="cart_item_limits_config_version_fkey",
+            ondelete="CASCADE",
+        ),
+        primary_key=True,
+    )
+    item_id: Mapped[int] = mapped_column(sa.Integer, primary_key=True)
+    qty_limit: Mapped[Decimal] = mapped_column(
+        sa.Numeric(precision=QTY_PRECISION, scale=QTY_SCALE),
+        nullable=False,
+    )
+
+    __table_args__ = (sa.PrimaryKeyConstraint("config_version", "item_id"),)
+
+
 class CartNotification(TimestampMixin, Base):
     __tablename__ = "cart_notifications"
 
     id: Mapped[UUID] = mapped_column(
-        sa.UUID(as_uuid=True), primary_key=True, default=uuid4
+        sa.UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     cart_id: Mapped[UUID] = mapped_column(
         sa.ForeignKey(
@@ -136,5 +177,47 @@ class CartNotification(TimestampMixin, Base):
         primary_key=True,
     )
     type: Mapped[CartNotificationTypeEnum] = mapped_column(nullable=False)
+    cycle: Mapped[int] = mapped_column(nullable=False, server_default="1")
     text: Mapped[str] = mapped_column(sa.Text, nullable=False)
-    sent_at: Mapped[datetime] = mapped_column(nullable=False)
+    sent_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    reserved_at: Mapped[datetime] = mapped_column(
+        nullable=False,
+        server_default=func.CURRENT_TIMESTAMP(),
+    )
+
+    __table_args__ = (
+        Index(
+            "idx_cart_notifications_idempotency_key",
+            "cart_id",
+            "type",
+            "cycle",
+            unique=True,
+        ),
+    )
+
+
+class CartArchive(Base):
+    __tablename__ = "carts_archive"
+
+    id: Mapped[UUID] = mapped_column(sa.UUID(as_uuid=True), primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(primary_key=True)
+    updated_at: Mapped[datetime] = mapped_column(nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        nullable=False,
+        server_default=func.CURRENT_TIMESTAMP(),
+    )
+    user_id: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    status: Mapped[CartStatusEnum] = mapped_column(nullable=False)
+    data: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+
+    __table_args__ = (
+        Index("idx_carts_archive_user_id", "user_id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+
+class Watermark(TimestampMixin, Base):
+    __tablename__ = "watermarks"
+
+    name: Mapped[str] = mapped_column(sa.Text, primary_key=True)
+    value: Mapped[datetime] = mapped_column(nullable=False)
@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.interfaces.repositories.watermarks import IWatermarksRepository
+from app.infra.repositories.sqla import models
+
+
+class WatermarksRepository(IWatermarksRepository):
+    """
+    Provides methods to read and move the durable watermarks of incremental periodic
+    jobs using SQLAlchemy.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get(self, name: str) -> datetime | None:
+        """
+        Retrieves the value of the watermark with the provided name, returns None if
+        the watermark was never saved.
+        """
+
+        stmt = select(models.Watermark.value).where(models.Watermark.name == name)
+
+        return await self._session.scalar(stmt)
+
+    async def save(self, name: str, value: datetime) -> None:
+        """Creates or moves the watermark with the provided name to the provided value."""
+
+        stmt = insert(models.Watermark).values(name=name, value=value)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[models.Watermark.name],
+            set_={"value": stmt.excluded.value, "updated_at": func.localtimestamp()},
+        )
+        await self._session.execute(stmt)
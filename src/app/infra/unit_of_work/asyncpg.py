@@ -0,0 +1,74 @@
+from typing import Any
+
+from asyncpg import Connection, Pool
+from asyncpg.transaction import Transaction
+
+from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork, IUnitOfWorkHandle
+from app.infra.repositories.asyncpg.cart_coupons import CartCouponsRepository
+from app.infra.repositories.asyncpg.cart_notifications import CartsNotificationsRepository
+from app.infra.repositories.asyncpg.carts import CartsRepository
+from app.infra.repositories.asyncpg.items import ItemsRepository
+from app.infra.repositories.asyncpg.watermarks import WatermarksRepository
+
+
+class AsyncpgUowHandle(IUnitOfWorkHandle):
+    """
+    Provides a transaction and repositories bound to its own raw asyncpg connection
+    acquired from the pool.
+    """
+
+    def __init__(self, pool: Pool, autocommit: bool) -> None:
+        super().__init__(autocommit=autocommit)
+        self._pool = pool
+        self._transaction: Transaction | None = None
+
+    async def __aenter__(self) -> IUnitOfWorkHandle:
+        self._connection: Connection = await self._pool.acquire()
+        self._transaction = self._connection.transaction()
+        await self._transaction.start()
+
+        self.items = ItemsRepository(connection=self._connection)
+        self.carts = CartsRepository(connection=self._connection)
+        self.cart_coupons = CartCouponsRepository(connection=self._connection)
+        self.carts_notifications = CartsNotificationsRepository(
+            connection=self._connection,
+        )
+        self.watermarks = WatermarksRepository(connection=self._connection)
+
+        return await super().__aenter__()
+
+    async def commit(self) -> None:
+        """Commits the transaction of the connection."""
+
+        if self._transaction is not None:
+            transaction, self._transaction = self._transaction, None
+            await transaction.commit()
+
+    async def rollback(self) -> None:
+        """Rolls back the transaction of the connection."""
+
+        if self._transaction is not None:
+            transaction, self._transaction = self._transaction, None
+            await transaction.rollback()
+
+    async def shutdown(self) -> None:
+        """Rolls back the not committed changes and releases the connection."""
+
+        try:
+            await self.rollback()
+        finally:
+            await self._pool.release(self._connection)
+
+
+class AsyncpgUow(IUnitOfWork):
+    """
+    Provides a unit of work pattern for managing transactions and repositories on
+    raw asyncpg connections. Every call creates a new handle, so a single instance is
+    shared by all requests.
+    """
+
+    def __init__(self, pool: Pool) -> None:
+        self._pool = pool
+
+    def __call__(self, autocommit: bool, *args: Any, **kwargs: Any) -> AsyncpgUowHandle:
+        return AsyncpgUowHandle(pool=self._pool, autocommit=autocommit)
@@ -1,28 +1,42 @@
+from typing import Any
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork
+from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork, IUnitOfWorkHandle
 from app.infra.repositories.sqla.cart_coupons import CartCouponsRepository
 from app.infra.repositories.sqla.cart_notifications import CartsNotificationsRepository
 from app.infra.repositories.sqla.carts import CartsRepository
 from app.infra.repositories.sqla.items import ItemsRepository
+from app.infra.repositories.sqla.watermarks import WatermarksRepository
 
 
-class Uow(IUnitOfWork):
+class UowHandle(IUnitOfWorkHandle):
     """
-    Provides a unit of work pattern for managing transactions and repositories in
-    an asynchronous SQLAlchemy session.
+    Provides a transaction and repositories bound to its own asynchronous SQLAlchemy
+    session.
     """
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        autocommit: bool,
+        aggregated_cart_fetch: bool = False,
+    ) -> None:
+        super().__init__(autocommit=autocommit)
         self._session_factory = session_factory
+        self._aggregated_cart_fetch = aggregated_cart_fetch
 
-    async def __aenter__(self) -> IUnitOfWork:
+    async def __aenter__(self) -> IUnitOfWorkHandle:
         self._session = self._session_factory()
 
         self.items = ItemsRepository(session=self._session)
-        self.carts = CartsRepository(session=self._session)
+        self.carts = CartsRepository(
+            session=self._session,
+            aggregated_fetch=self._aggregated_cart_fetch,
+        )
         self.cart_coupons = CartCouponsRepository(session=self._session)
         self.carts_notifications = CartsNotificationsRepository(session=self._session)
+        self.watermarks = WatermarksRepository(session=self._session)
 
         return await super().__aenter__()
 
@@ -40,3 +54,26 @@ class Uow(IUnitOfWork):
         """Closes the session."""
 
         await self._session.close()
+
+
+class Uow(IUnitOfWork):
+    """
+    Provides a unit of work pattern for managing transactions and repositories in
+    an asynchronous SQLAlchemy session. Every call creates a new handle, so a single
+    instance is shared by all requests.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        aggregated_cart_fetch: bool = False,
+    ) -> None:
+        self._session_factory = session_factory
+        self._aggregated_cart_fetch = aggregated_cart_fetch
+
+    def __call__(self, autocommit: bool, *args: Any, **kwargs: Any) -> UowHandle:
+        return UowHandle(
+            session_factory=self._session_factory,
+            autocommit=autocommit,
+            aggregated_cart_fetch=self._aggregated_cart_fetch,
+        )
@@ -1,59 +1,228 @@
+import random
+from collections.abc import Callable, Mapping
 from contextvars import ContextVar
-from logging import LogRecord
-from typing import Any
+from copy import copy
+from logging import Formatter, Logger, LogRecord, StreamHandler, getLevelName
+from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from types import MappingProxyType
+from typing import Any, TextIO
 from uuid import UUID
 
-from pydantic import BaseModel
-from pythonjsonlogger import jsonlogger
+import orjson
+from pydantic import BaseModel, Field
+
+CTX_RECORD_ATTR = "transaction_ctx"
+
+_RECORD_ATTRS = frozenset(
+    {
+        *vars(LogRecord("", 0, "", 0, "", (), None)),
+        "message",
+        "asctime",
+        CTX_RECORD_ATTR,
+    },
+)
+
+
+class DebugSnapshotConfig(BaseModel):
+    enabled: bool = False
+    level: str = "DEBUG"
+    sample_rate: float = Field(default=1.0, ge=0, le=1)
+    max_payload_size: int = Field(default=2048, gt=0)
+    cart_ids: set[UUID] = set()
 
 
 class LoggingConfig(BaseModel):
     level: str
     json_enabled: bool
+    debug_snapshot: DebugSnapshotConfig = DebugSnapshotConfig()
 
 
-class ContextDTO(BaseModel):
-    cart_id: UUID | None = None
-    user_id: int | None = None
+ctx: ContextVar[Mapping[str, Any]] = ContextVar(
+    "current_ctx",
+    default=MappingProxyType({}),
+)
 
 
-ctx: ContextVar[ContextDTO] = ContextVar("current_ctx", default=ContextDTO())
+class CtxJsonFormatter(Formatter):
+    """
+    Responsible for rendering log records as JSON lines.
 
+    Only the well-known record attributes, the `extra` fields and the transaction context
+    are serialized, the context is taken from the record when it was attached by
+    `ContextQueueHandler` and from the context variable otherwise.
+    """
 
-class CtxJsonFormatter(jsonlogger.JsonFormatter):
     def __init__(
         self,
         *args: Any,
-        transaction_ctx: ContextVar[BaseModel],
+        transaction_ctx: ContextVar[Mapping[str, Any]],
         **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
         self._ctx = transaction_ctx
 
-    def add_fields(
+    def format(self, record: LogRecord) -> str:
+        log_record = {
+            "message": record.getMessage(),
+            "name": record.name,
+            "levelname": record.levelname,
+            "created": record.created,
+            "module": record.module,
+            "funcName": record.funcName,
+            "lineno": record.lineno,
+            "process": record.process,
+            "thread": record.thread,
+        }
+
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                log_record[key] = value
+
+        if record.exc_info:
+            log_record["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            log_record["stack_info"] = self.formatStack(record.stack_info)
+
+        log_record.update(getattr(record, CTX_RECORD_ATTR, None) or self._ctx.get())
+
+        return orjson.dumps(log_record, default=str).decode()
+
+
+class ContextQueueHandler(QueueHandler):
+    """
+    Responsible for handing log records over to a background listener thread.
+
+    The message is rendered and the transaction context is attached in the calling thread,
+    the formatting and the write to the stream are done by the listener, so coroutines never
+    block on the output stream.
+    """
+
+    def __init__(
         self,
-        log_record: dict[str, Any],
-        record: LogRecord,
-        message_dict: dict[str, Any],
+        stream: TextIO,
+        transaction_ctx: ContextVar[Mapping[str, Any]],
     ) -> None:
-        super().add_fields(log_record, record, message_dict)
-
-        transaction_ctx = self._ctx.get()
-        log_record.update(
-            {
-                **record.__dict__,
-                **transaction_ctx.model_dump(exclude_none=True),
-            }
+        super().__init__(queue=SimpleQueue())
+        self._ctx = transaction_ctx
+        self._handler = StreamHandler(stream=stream)
+        self._listener = QueueListener(self.queue, self._handler)
+        self._listener.start()
+        self._is_listening = True
+
+    def setFormatter(self, fmt: Formatter | None) -> None:  # noqa: N802
+        self._handler.setFormatter(fmt)
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        record = copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        setattr(record, CTX_RECORD_ATTR, self._ctx.get())
+
+        return record
+
+    def close(self) -> None:
+        if self._is_listening:
+            self._is_listening = False
+            self._listener.stop()
+            self._handler.close()
+
+        super().close()
+
+
+class _LazyPayload:
+    __slots__ = ("_factory", "_max_size")
+
+    def __init__(self, factory: Callable[[], Any], max_size: int) -> None:
+        self._factory = factory
+        self._max_size = max_size
+
+    def __str__(self) -> str:
+        payload = str(self._factory())
+
+        if len(payload) <= self._max_size:
+            return payload
+
+        return f"{payload[:self._max_size]}... ({len(payload)} chars)"
+
+
+class DebugSnapshotLogger:
+    """
+    Responsible for logging expensive debug payloads, such as full cart states or HTTP
+    response bodies.
+
+    Payloads are passed as callables and are built and rendered only when snapshots are
+    enabled, the logger accepts the snapshot level, the cart from the transaction context
+    is in the configured subset and the record passes sampling. Rendered payloads are
+    truncated to the configured size.
+    """
+
+    def __init__(self, config: DebugSnapshotConfig) -> None:
+        self.configure(config)
+
+    def configure(self, config: DebugSnapshotConfig) -> None:
+        """
+        Applies the provided config to all subsequent snapshots.
+        """
+
+        self._config = config
+        self._level = getLevelName(config.level)
+
+    def is_enabled_for(self, logger: Logger) -> bool:
+        """
+        Checks whether a snapshot for the current context should be logged by the provided
+        logger. Sampling is applied on every call.
+        """
+
+        config = self._config
+
+        if not config.enabled or not logger.isEnabledFor(self._level):
+            return False
+
+        if config.cart_ids and ctx.get().get("cart_id") not in config.cart_ids:
+            return False
+
+        return (
+            config.sample_rate >= 1 or random.random() < config.sample_rate  # noqa: S311
+        )
+
+    def log(self, logger: Logger, msg: str, *payloads: Callable[[], Any]) -> None:
+        """
+        Logs the message with the provided payload factories as arguments if a snapshot
+        should be logged for the current context.
+        """
+
+        if not self.is_enabled_for(logger):
+            return
+
+        logger.log(
+            self._level,
+            msg,
+            *(
+                _LazyPayload(payload, self._config.max_payload_size)
+                for payload in payloads
+            ),
+            stacklevel=2,
         )
 
 
-async def update_context(**kwargs) -> None:
-    current_ctx = ctx.get()
-    ctx.set(current_ctx.model_copy(update={**kwargs}))
+debug_snapshots = DebugSnapshotLogger(DebugSnapshotConfig())
+
+
+async def update_context(**kwargs: Any) -> None:
+    updated_ctx = {**ctx.get(), **kwargs}
+    ctx.set(
+        MappingProxyType(
+            {key: value for key, value in updated_ctx.items() if value is not None},
+        ),
+    )
 
 
 def get_logging_config(
-    transaction_ctx: ContextVar[BaseModel], config: LoggingConfig
+    transaction_ctx: ContextVar[Mapping[str, Any]],
+    config: LoggingConfig,
 ) -> dict[str, Any]:
     return {
         "version": 1,
@@ -67,10 +236,11 @@ def get_logging_config(
         },
         "handlers": {
             "console": {
-                "class": "logging.StreamHandler",
+                "()": ContextQueueHandler,
                 "level": config.level,
                 "formatter": "json" if config.json_enabled else "standard",
                 "stream": "ext://sys.stdout",
+                "transaction_ctx": transaction_ctx,
             },
         },
         "loggers": {
@@ -80,3 +250,11 @@ def get_logging_config(
             },
         },
     }
+
+
+def setup_logging(
+    transaction_ctx: ContextVar[Mapping[str, Any]],
+    config: LoggingConfig,
+) -> None:
+    dictConfig(config=get_logging_config(transaction_ctx=transaction_ctx, config=config))
+    debug_snapshots.configure(config.debug_snapshot)
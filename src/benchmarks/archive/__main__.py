@@ -0,0 +1,181 @@
+import asyncio
+import random
+import secrets
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any
+from uuid import uuid4
+
+import typer
+from sqlalchemy import insert
+
+from app.app_layer.use_cases.carts.cart_archive import ArchiveCartsUseCase
+from app.config import CartArchiveConfig
+from app.containers import Container
+from app.domain.carts.value_objects import CartStatusEnum
+from app.infra.repositories.sqla import models
+from app.infra.repositories.sqla.db import Database
+from app.infra.unit_of_work.sqla import Uow
+
+MAX_USER_ID = 2**31 - 1
+SEED_CHUNK_SIZE = 5_000
+
+app = typer.Typer()
+
+
+@app.command()
+def main(  # noqa: CFQ002
+    carts: int = 100_000,
+    items_per_cart: int = 3,
+    days: int = 365,
+    terminal_ratio: float = typer.Option(0.9, min=0, max=1),
+    older_than_days: int = 90,
+    batch_size: int = 5_000,
+    rounds: int = 20,
+) -> None:
+    """
+    Seeds the Postgres from the environment config (with applied migrations) with carts
+    created during the last `days` days and reports the abandoned carts scan and the admin
+    listing latencies before and after archiving the terminal carts.
+    """
+
+    asyncio.run(
+        _run(
+            carts=carts,
+            items_per_cart=items_per_cart,
+            days=days,
+            terminal_ratio=terminal_ratio,
+            archive_config=CartArchiveConfig(
+                older_than_days=older_than_days,
+                batch_size=batch_size,
+                max_batches=carts // batch_size + 1,
+            ),
+            rounds=rounds,
+        ),
+    )
+
+
+async def _run(
+    carts: int,
+    items_per_cart: int,
+    days: int,
+    terminal_ratio: float,
+    archive_config: CartArchiveConfig,
+    rounds: int,
+) -> None:
+    async with Container.lifespan(wireable_packages=[]) as container:
+        db: Database = container.db.container.db()
+        uow: Uow = container.db.container.uow()
+
+        await _seed(
+            db=db,
+            carts=carts,
+            items_per_cart=items_per_cart,
+            days=days,
+            terminal_ratio=terminal_ratio,
+        )
+        before = await _measure(uow=uow, rounds=rounds)
+
+        result = await ArchiveCartsUseCase(uow=uow, config=archive_config).execute()
+        typer.echo(
+            f"Archived {result.archived_qty} carts in {result.elapsed_sec:.2f}s "
+            f"({result.archived_qty / result.elapsed_sec:.0f} carts/sec)",
+        )
+
+        after = await _measure(uow=uow, rounds=rounds)
+
+    typer.echo(f"{'query':<18}{'before ms':>12}{'after ms':>12}{'change':>10}")
+    for query, before_ms in before.items():
+        after_ms = after[query]
+        typer.echo(
+            f"{query:<18}{before_ms:>12.2f}{after_ms:>12.2f}"
+            f"{(after_ms - before_ms) / before_ms * 100:>+9.1f}%",
+        )
+
+
+async def _seed(
+    db: Database,
+    carts: int,
+    items_per_cart: int,
+    days: int,
+    terminal_ratio: float,
+) -> None:
+    # Random offset, so repeated runs don't collide with the active carts left by the
+    # previous ones.
+    first_user_id = secrets.randbelow(MAX_USER_ID - carts) + 1
+    now = datetime.utcnow()
+
+    for offset in range(0, carts, SEED_CHUNK_SIZE):
+        cart_rows: list[dict[str, Any]] = []
+        item_rows: list[dict[str, Any]] = []
+
+        for user_id in range(offset, min(offset + SEED_CHUNK_SIZE, carts)):
+            created_at = now - timedelta(seconds=random.randint(0, days * 86400))
+            status = (
+                random.choice([CartStatusEnum.COMPLETED, CartStatusEnum.DEACTIVATED])
+                if random.random() < terminal_ratio
+                else CartStatusEnum.OPENED
+            )
+            cart_id = uuid4()
+            cart_rows.append(
+                {
+                    "id": cart_id,
+                    "user_id": first_user_id + user_id,
+                    "status": status,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                },
+            )
+            item_rows.extend(
+                {
+                    "id": item_id,
+                    "cart_id": cart_id,
+                    "name": "bench",
+                    "qty": 1,
+                    "price": Decimal("9.99"),
+                    "is_weight": False,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }
+                for item_id in range(1, items_per_cart + 1)
+            )
+
+        async with db.session_factory() as session, session.begin():
+            await session.execute(insert(models.Cart), cart_rows)
+            if item_rows:
+                await session.execute(insert(models.CartItem), item_rows)
+
+        typer.echo(f"Seeded {min(offset + SEED_CHUNK_SIZE, carts)}/{carts} carts")
+
+
+async def _measure(uow: Uow, rounds: int) -> dict[str, float]:
+    async def scan_abandoned() -> None:
+        async with uow(autocommit=False) as uow_handle:
+            await uow_handle.carts.find_abandoned_cart_id_by_user_id()
+
+    async def list_carts() -> None:
+        async with uow(autocommit=False) as uow_handle:
+            await uow_handle.carts.get_list(page_size=50, created_at=datetime.utcnow())
+
+    return {
+        "abandoned scan": await _get_median_ms(scan_abandoned, rounds=rounds),
+        "admin listing": await _get_median_ms(list_carts, rounds=rounds),
+    }
+
+
+async def _get_median_ms(query: Callable[[], Awaitable[None]], rounds: int) -> float:
+    latencies = []
+
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        await query()
+        latencies.append((time.perf_counter() - started_at) * 1000)
+
+    return statistics.median(latencies)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,147 @@
+import asyncio
+import secrets
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import typer
+from sqlalchemy import insert
+
+from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork, IUnitOfWorkHandle
+from app.containers import Container
+from app.domain.cart_items.dto import ItemDTO
+from app.domain.cart_items.entities import CartItem
+from app.domain.carts.value_objects import CartStatusEnum
+from app.infra.repositories.asyncpg.db import get_pool
+from app.infra.repositories.sqla import models
+from app.infra.repositories.sqla.db import Database
+from app.infra.unit_of_work.asyncpg import AsyncpgUow
+from app.infra.unit_of_work.sqla import Uow
+
+MAX_USER_ID = 2**31 - 1
+
+app = typer.Typer()
+
+
+@app.command()
+def main(items_qty: int = 10, rounds: int = 500) -> None:
+    """
+    Seeds the Postgres from the environment config (with applied migrations) with a cart
+    of the provided items quantity and reports the median latencies of the SQLAlchemy and
+    the raw asyncpg backends for the hot cart statements.
+    """
+
+    asyncio.run(_run(items_qty=items_qty, rounds=rounds))
+
+
+async def _run(items_qty: int, rounds: int) -> None:
+    async with Container.lifespan(wireable_packages=[]) as container:
+        db: Database = container.db.container.db()
+        cart_id, user_id = await _seed(db=db, items_qty=items_qty)
+
+        async with get_pool(config=container.config.DB) as pool:
+            backends: dict[str, IUnitOfWork] = {
+                "sqla": Uow(session_factory=db.session_factory),
+                "asyncpg": AsyncpgUow(pool=pool),
+            }
+            operations: dict[str, Callable[[IUnitOfWorkHandle], Awaitable[object]]] = {
+                "retrieve": lambda handle: handle.carts.retrieve(cart_id=cart_id),
+                "retrieve_active": lambda handle: handle.carts.retrieve_active(
+                    user_id=user_id,
+                ),
+                "upsert_item": lambda handle: handle.items.upsert_item(
+                    item=_get_item(cart_id=cart_id),
+                    qty=Decimal(1),
+                    config_version=None,
+                ),
+            }
+
+            typer.echo(
+                f"{'operation':<18}{'sqla ms':>10}{'asyncpg ms':>13}{'change':>10}"
+            )
+            for name, operation in operations.items():
+                sqla_ms, asyncpg_ms = [
+                    await _get_median_ms(uow=uow, operation=operation, rounds=rounds)
+                    for uow in backends.values()
+                ]
+                typer.echo(
+                    f"{name:<18}{sqla_ms:>10.2f}{asyncpg_ms:>13.2f}"
+                    f"{(asyncpg_ms - sqla_ms) / sqla_ms * 100:>+9.1f}%",
+                )
+
+
+async def _seed(db: Database, items_qty: int) -> tuple[UUID, int]:
+    # Random user, so repeated runs don't collide with the active carts left by the
+    # previous ones.
+    user_id = secrets.randbelow(MAX_USER_ID) + 1
+    cart_id = uuid4()
+    now = datetime.utcnow()
+
+    async with db.session_factory() as session, session.begin():
+        await session.execute(
+            insert(models.Cart),
+            [
+                {
+                    "id": cart_id,
+                    "user_id": user_id,
+                    "status": CartStatusEnum.OPENED,
+                    "created_at": now,
+                    "updated_at": now,
+                },
+            ],
+        )
+        await session.execute(
+            insert(models.CartItem),
+            [
+                {
+                    "id": item_id,
+                    "cart_id": cart_id,
+                    "name": "bench",
+                    "qty": 1,
+                    "price": Decimal("9.99"),
+                    "is_weight": False,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for item_id in range(1, items_qty + 1)
+            ],
+        )
+
+    return cart_id, user_id
+
+
+def _get_item(cart_id: UUID) -> CartItem:
+    return CartItem(
+        data=ItemDTO(
+            id=1,
+            name="bench",
+            qty=Decimal(1),
+            price=Decimal("9.99"),
+            is_weight=False,
+            cart_id=cart_id,
+        ),
+    )
+
+
+async def _get_median_ms(
+    uow: IUnitOfWork,
+    operation: Callable[[IUnitOfWorkHandle], Awaitable[object]],
+    rounds: int,
+) -> float:
+    latencies = []
+
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        # not committed, so every round sees the seeded cart
+        async with uow(autocommit=False) as uow_handle:
+            await operation(uow_handle)
+        latencies.append((time.perf_counter() - started_at) * 1000)
+
+    return statistics.median(latencies)
+
+
+if __name__ == "__main__":
+    app()
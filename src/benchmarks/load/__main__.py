@@ -0,0 +1,85 @@
+import asyncio
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from benchmarks.load.runner import (
+    BackendEnum,
+    LoadConfig,
+    LoadReportDTO,
+    compare_reports,
+    run_load,
+)
+
+app = typer.Typer()
+
+
+@app.command()
+def main(  # noqa: CFQ002
+    backend: BackendEnum = typer.Option(BackendEnum.MEMORY.value),
+    concurrency: int = 10,
+    carts: int = 100,
+    items_per_cart: int = 3,
+    clients_latency_sec: float = 0,
+    save: Optional[Path] = typer.Option(
+        None, help="Path to store the report as a baseline."
+    ),
+    compare: Optional[Path] = typer.Option(
+        None, help="Path to a baseline to diff against."
+    ),
+    threshold: float = typer.Option(10, help="Allowed p95 growth in percent."),
+) -> None:
+    """
+    Runs the public cart API load test in process, against in-memory fakes or against
+    the Postgres and Redis from the environment config (with applied migrations).
+    """
+
+    report = asyncio.run(
+        run_load(
+            LoadConfig(
+                backend=backend,
+                concurrency=concurrency,
+                carts=carts,
+                items_per_cart=items_per_cart,
+                clients_latency_sec=clients_latency_sec,
+            ),
+        ),
+    )
+
+    typer.echo(f"Duration: {report.duration_sec:.2f}s")
+    typer.echo(
+        f"{'endpoint':<14}{'requests':>10}{'errors':>8}{'rps':>10}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    )
+    for endpoint, stats in report.endpoints.items():
+        typer.echo(
+            f"{endpoint.value:<14}{stats.requests:>10}{stats.errors:>8}"
+            f"{stats.throughput_rps:>10.1f}{stats.p50_ms:>10.2f}"
+            f"{stats.p95_ms:>10.2f}{stats.p99_ms:>10.2f}",
+        )
+
+    if save is not None:
+        save.write_text(report.model_dump_json(indent=2))
+
+    if compare is None:
+        return
+
+    baseline = LoadReportDTO.model_validate_json(compare.read_text())
+    regressions = []
+
+    for endpoint, diff in compare_reports(baseline=baseline, current=report).items():
+        typer.echo(
+            f"{endpoint.value:<14}"
+            + "".join(f"{metric}: {change:+.1f}%  " for metric, change in diff.items()),
+        )
+        if diff["p95_ms"] > threshold:
+            regressions.append(endpoint)
+
+    if regressions:
+        typer.echo(f"p95 regressions over {threshold}%: {', '.join(regressions)}")
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
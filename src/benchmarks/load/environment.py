@@ -0,0 +1,533 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import Collection, Sequence
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from pydantic_core import Url
+
+from app.app_layer.interfaces.active_carts_cache.cache import IActiveCartsCache
+from app.app_layer.interfaces.active_carts_cache.dto import ActiveCartDTO
+from app.app_layer.interfaces.auth_system.dto import UserDataOutputDTO
+from app.app_layer.interfaces.auth_system.exceptions import InvalidAuthDataError
+from app.app_layer.interfaces.auth_system.system import IAuthSystem
+from app.app_layer.interfaces.clients.coupons.client import ICouponsClient
+from app.app_layer.interfaces.clients.coupons.dto import CouponOutputDTO
+from app.app_layer.interfaces.clients.products.client import IProductsClient
+from app.app_layer.interfaces.clients.products.dto import (
+    ProductOutputDTO,
+    RatingOutputDTO,
+)
+from app.app_layer.interfaces.distributed_lock_system.exceptions import AlreadyLockedError
+from app.app_layer.interfaces.distributed_lock_system.system import (
+    IDistributedBatchLockHandle,
+    IDistributedLockHandle,
+    IDistributedLockSystem,
+)
+from app.app_layer.interfaces.unit_of_work.sql import IUnitOfWork, IUnitOfWorkHandle
+from app.domain.cart_config.dto import CartConfigDTO
+from app.domain.cart_config.entities import CartConfig
+from app.domain.cart_coupons.dto import CartCouponDTO
+from app.domain.cart_coupons.entities import CartCoupon
+from app.domain.cart_items.dto import ItemDTO
+from app.domain.cart_items.entities import CartItem
+from app.domain.cart_notifications.entities import CartNotification
+from app.domain.carts.dto import CartDTO
+from app.domain.carts.entities import Cart
+from app.domain.carts.value_objects import CartStatusEnum
+from app.domain.interfaces.repositories.cart_coupons.repo import ICartCouponsRepository
+from app.domain.interfaces.repositories.cart_notifications import (
+    ICartNotificationsRepository,
+)
+from app.domain.interfaces.repositories.carts.exceptions import (
+    ActiveCartAlreadyExistsError,
+    CartNotFoundError,
+)
+from app.domain.interfaces.repositories.carts.repo import ICartsRepository
+from app.domain.interfaces.repositories.items.exceptions import ItemAlreadyExists
+from app.domain.interfaces.repositories.items.repo import IItemsRepository
+from app.domain.interfaces.repositories.watermarks import IWatermarksRepository
+
+BENCH_TOKEN_PREFIX = "bench."
+ACTIVE_STATUSES = frozenset({CartStatusEnum.OPENED, CartStatusEnum.LOCKED})
+PRODUCT_IMAGE_URL = Url("https://example.com/image.png")
+
+
+class InMemoryStorage:
+    """
+    Stores the state of the in-memory backend. Rows are kept as DTOs and entities are
+    rebuilt on every read, the same way the SQL repositories do it.
+    """
+
+    def __init__(self, config: CartConfigDTO) -> None:
+        self.config = config
+        self.items_limits: dict[int | None, dict[int, Decimal]] = defaultdict(dict)
+        self.carts: dict[UUID, CartDTO] = {}
+        self.items: dict[UUID, dict[int, ItemDTO]] = defaultdict(dict)
+        self.coupons: dict[UUID, CartCouponDTO] = {}
+        self.notifications: list[CartNotification] = []
+        self.watermarks: dict[str, datetime] = {}
+
+
+class InMemoryCartsRepository(ICartsRepository):
+    def __init__(self, storage: InMemoryStorage) -> None:
+        self._storage = storage
+
+    async def create(self, cart: Cart) -> Cart:
+        for row in self._storage.carts.values():
+            if row.user_id == cart.user_id and row.status in ACTIVE_STATUSES:
+                raise ActiveCartAlreadyExistsError
+
+        self._storage.carts[cart.id] = CartDTO.model_validate(cart)
+
+        return cart
+
+    async def get_or_create(self, cart: Cart) -> Cart:
+        for row in self._storage.carts.values():
+            if row.user_id == cart.user_id and row.status in ACTIVE_STATUSES:
+                return self._get_cart(row=row, config=cart.config)
+
+        self._storage.carts[cart.id] = CartDTO.model_validate(cart)
+
+        return cart
+
+    async def retrieve(self, cart_id: UUID, config_version: int | None = None) -> Cart:
+        # only the latest config is stored
+        row = self._storage.carts.get(cart_id)
+
+        if row is None or row.status == CartStatusEnum.DEACTIVATED:
+            raise CartNotFoundError
+
+        return self._get_cart(row=row, config=await self._get_config())
+
+    async def retrieve_active(self, user_id: int) -> Cart:
+        for row in self._storage.carts.values():
+            if row.user_id == user_id and row.status in ACTIVE_STATUSES:
+                return self._get_cart(row=row, config=await self._get_config())
+
+        raise CartNotFoundError
+
+    async def retrieve_many(self, cart_ids: Collection[UUID]) -> list[Cart]:
+        config = await self._get_config()
+
+        return [
+            self._get_cart(row=row, config=config)
+            for cart_id in cart_ids
+            if (row := self._storage.carts.get(cart_id)) is not None
+            and row.status != CartStatusEnum.DEACTIVATED
+        ]
+
+    async def update(self, cart: Cart) -> Cart:
+        row = self._storage.carts[cart.id]
+        self._storage.carts[cart.id] = row.model_copy(
+            update={"status": cart.status, "config_version": cart.config_version},
+        )
+
+        return cart
+
+    async def update_many(self, carts: Sequence[Cart]) -> None:
+        for cart in carts:
+            await self.update(cart=cart)
+
+    async def deactivate_expired(self, idle_hours: int, limit: int) -> int:
+        return 0
+
+    async def archive_terminal(self, older_than_days: int, limit: int) -> int:
+        return 0
+
+    async def clear(self, cart_id: UUID) -> None:
+        self._storage.items.pop(cart_id, None)
+
+    async def get_list(self, page_size: int, created_at: datetime) -> list[Cart]:
+        config = await self._get_config()
+        rows = sorted(
+            (row for row in self._storage.carts.values() if row.created_at < created_at),
+            key=lambda row: row.created_at,
+            reverse=True,
+        )
+
+        return [self._get_cart(row=row, config=config) for row in rows[:page_size]]
+
+    async def get_config(self, with_items_limits: bool = False) -> CartConfig:
+        config = await self._get_config()
+
+        if not with_items_limits:
+            return config
+
+        config.limit_items_by_id = dict(self._storage.items_limits[config.version])
+
+        return config
+
+    async def update_config(self, cart_config: CartConfig) -> CartConfig:
+        data = vars(cart_config).copy()
+        limit_items_by_id = data.pop("limit_items_by_id")
+        cart_config.version = data["version"] = (self._storage.config.version or 0) + 1
+        self._storage.items_limits[cart_config.version] = dict(limit_items_by_id)
+        self._storage.config = CartConfigDTO.model_validate(data)
+
+        return cart_config
+
+    async def get_items_limits(
+        self,
+        config_version: int | None,
+        item_ids: Collection[int],
+    ) -> dict[int, Decimal]:
+        items_limits = self._storage.items_limits[config_version]
+
+        return {
+            item_id: items_limits[item_id]
+            for item_id in item_ids
+            if item_id in items_limits
+        }
+
+    async def pin_config_version(self, cart: Cart) -> None:
+        row = self._storage.carts[cart.id]
+        self._storage.carts[cart.id] = row.model_copy(
+            update={"config_version": cart.config_version},
+        )
+
+    async def get_abandonment_threshold(self) -> datetime:
+        return datetime.now() - timedelta(
+            hours=self._storage.config.hours_since_update_until_abandoned,
+        )
+
+    async def find_abandoned_cart_id_by_user_id(
+        self,
+        shard: int = 0,
+        shards_qty: int = 1,
+        updated_after: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> list[tuple[int, UUID, int]]:
+        return []
+
+    async def _get_config(self) -> CartConfig:
+        return CartConfig(data=self._storage.config)
+
+    def _get_cart(self, row: CartDTO, config: CartConfig) -> Cart:
+        cart = Cart(
+            data=row,
+            items=[CartItem(data=item) for item in self._storage.items[row.id].values()],
+            config=config,
+        )
+
+        if (coupon := self._storage.coupons.get(row.id)) is not None:
+            cart.coupon = CartCoupon(data=coupon, cart=cart)
+
+        return cart
+
+
+class InMemoryItemsRepository(IItemsRepository):
+    def __init__(self, storage: InMemoryStorage) -> None:
+        self._storage = storage
+
+    async def add_item(self, item: CartItem) -> None:
+        items = self._storage.items[item.cart_id]
+
+        if item.id in items:
+            raise ItemAlreadyExists
+
+        items[item.id] = ItemDTO.model_validate(item)
+
+    async def upsert_item(
+        self,
+        item: CartItem,
+        qty: Decimal,
+        config_version: int | None,
+    ) -> Decimal:
+        items = self._storage.items[item.cart_id]
+
+        if (stored := items.get(item.id)) is not None:
+            stored.qty += qty
+        else:
+            stored = items[item.id] = ItemDTO.model_validate(item)
+            stored.qty = qty
+
+        self._pin_config_version(cart_id=item.cart_id, config_version=config_version)
+
+        return stored.qty
+
+    async def increase_item_qty(
+        self,
+        cart_id: UUID,
+        item_id: int,
+        qty: Decimal,
+        user_id: int | None = None,
+    ) -> Decimal | None:
+        row = self._storage.carts.get(cart_id)
+        items = self._storage.items[cart_id]
+        stored = items.get(item_id)
+        config = self._storage.config
+
+        if (
+            row is None
+            or stored is None
+            or row.status != CartStatusEnum.OPENED
+            or (user_id is not None and row.user_id != user_id)
+        ):
+            return None
+
+        limit = self._storage.items_limits[config.version].get(item_id)
+        items_qty = sum(
+            (
+                Cart.WEIGHT_ITEM_QTY if item.is_weight else item.qty
+                for item in items.values()
+            ),
+            Decimal(0),
+        )
+
+        if limit is not None and stored.qty + qty > limit:
+            return None
+
+        if items_qty + (0 if stored.is_weight else qty) > config.max_items_qty:
+            return None
+
+        stored.qty += qty
+        self._pin_config_version(cart_id=cart_id, config_version=config.version)
+
+        return stored.qty
+
+    async def update_item(self, item: CartItem) -> CartItem:
+        self._storage.items[item.cart_id][item.id] = ItemDTO.model_validate(item)
+
+        return item
+
+    async def delete_item(self, cart: Cart, item_id: int) -> None:
+        self._storage.items[cart.id].pop(item_id, None)
+
+    def _pin_config_version(self, cart_id: UUID, config_version: int | None) -> None:
+        row = self._storage.carts[cart_id]
+        self._storage.carts[cart_id] = row.model_copy(
+            update={"config_version": config_version},
+        )
+
+
+class InMemoryCartCouponsRepository(ICartCouponsRepository):
+    def __init__(self, storage: InMemoryStorage) -> None:
+        self._storage = storage
+
+    async def create(self, cart_coupon: CartCoupon) -> CartCoupon:
+        self._storage.coupons[cart_coupon.cart.id] = CartCouponDTO.model_validate(
+            cart_coupon,
+        )
+
+        return cart_coupon
+
+    async def delete(self, cart_id: UUID) -> None:
+        self._storage.coupons.pop(cart_id, None)
+
+
+class InMemoryCartNotificationsRepository(ICartNotificationsRepository):
+    def __init__(self, storage: InMemoryStorage) -> None:
+        self._storage = storage
+
+    async def create(self, cart_notification: CartNotification) -> CartNotification:
+        self._storage.notifications.append(cart_notification)
+
+        return cart_notification
+
+    async def reserve(
+        self,
+        notifications: list[CartNotification],
+        reservation_timeout_sec: int,
+    ) -> list[CartNotification]:
+        taken = {
+            (notification.cart_id, notification.type, notification.cycle)
+            for notification in self._storage.notifications
+        }
+        reserved = []
+
+        for notification in notifications:
+            key = (notification.cart_id, notification.type, notification.cycle)
+
+            if key not in taken:
+                taken.add(key)
+                reserved.append(notification)
+
+        self._storage.notifications.extend(reserved)
+
+        return reserved
+
+    async def confirm(self, notifications: list[CartNotification]) -> None:
+        pass
+
+    async def release(self, notifications: list[CartNotification]) -> None:
+        released_ids = {
+            notification.id
+            for notification in notifications
+            if notification.sent_at is None
+        }
+        self._storage.notifications = [
+            notification
+            for notification in self._storage.notifications
+            if notification.id not in released_ids
+        ]
+
+
+class InMemoryWatermarksRepository(IWatermarksRepository):
+    def __init__(self, storage: InMemoryStorage) -> None:
+        self._storage = storage
+
+    async def get(self, name: str) -> datetime | None:
+        return self._storage.watermarks.get(name)
+
+    async def save(self, name: str, value: datetime) -> None:
+        self._storage.watermarks[name] = value
+
+
+class InMemoryUowHandle(IUnitOfWorkHandle):
+    """
+    Unit of work entry over the in-memory storage. Writes are applied immediately, so
+    there is nothing to commit or roll back.
+    """
+
+    def __init__(self, storage: InMemoryStorage, autocommit: bool) -> None:
+        super().__init__(autocommit=autocommit)
+        self.items = InMemoryItemsRepository(storage=storage)
+        self.carts = InMemoryCartsRepository(storage=storage)
+        self.cart_coupons = InMemoryCartCouponsRepository(storage=storage)
+        self.carts_notifications = InMemoryCartNotificationsRepository(storage=storage)
+        self.watermarks = InMemoryWatermarksRepository(storage=storage)
+
+    async def __aenter__(self) -> "InMemoryUowHandle":
+        return self
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+
+class InMemoryUow(IUnitOfWork):
+    """Unit of work over the in-memory storage."""
+
+    def __init__(self, storage: InMemoryStorage) -> None:
+        self._storage = storage
+
+    def __call__(self, autocommit: bool, *args: Any, **kwargs: Any) -> InMemoryUowHandle:
+        return InMemoryUowHandle(storage=self._storage, autocommit=autocommit)
+
+
+class InMemoryLockHandle(IDistributedLockHandle):
+    """Process-local lock that mirrors the non-waiting mode of RedisLockHandle."""
+
+    def __init__(self, name: str, locks: set[str]) -> None:
+        super().__init__(name=name)
+        self._locks = locks
+
+    async def acquire(self) -> None:
+        if self._name in self._locks:
+            raise AlreadyLockedError
+
+        self._locks.add(self._name)
+
+    async def release(self) -> None:
+        self._locks.discard(self._name)
+
+
+class InMemoryBatchLockHandle(IDistributedBatchLockHandle):
+    """Process-local batch lock that mirrors RedisBatchLockHandle."""
+
+    def __init__(self, names: Sequence[str], locks: set[str]) -> None:
+        super().__init__(names=names)
+        self._locks = locks
+
+    async def acquire(self) -> None:
+        self.acquired = frozenset(name for name in self._names if name not in self._locks)
+        self._locks.update(self.acquired)
+
+    async def release(self) -> None:
+        self._locks.difference_update(self.acquired)
+
+
+class InMemoryLockSystem(IDistributedLockSystem):
+    """Process-local lock system that mirrors the non-waiting mode of RedisLockSystem."""
+
+    def __init__(self, locks: set[str]) -> None:
+        self._locks = locks
+
+    def __call__(self, name: str, *args: Any, **kwargs: Any) -> InMemoryLockHandle:
+        return InMemoryLockHandle(name=name, locks=self._locks)
+
+    def batch(self, names: Sequence[str]) -> InMemoryBatchLockHandle:
+        return InMemoryBatchLockHandle(names=names, locks=self._locks)
+
+    async def lease(self, name: str, ttl_sec: float) -> bool:
+        if name in self._locks:
+            return False
+
+        self._locks.add(name)
+        asyncio.get_running_loop().call_later(ttl_sec, self._locks.discard, name)
+
+        return True
+
+
+class InMemoryActiveCartsCache(IActiveCartsCache):
+    """Process-local counterpart of RedisActiveCartsCache without expiration."""
+
+    def __init__(self) -> None:
+        self._carts: dict[int, ActiveCartDTO] = {}
+
+    async def get(self, user_id: int) -> ActiveCartDTO | None:
+        return self._carts.get(user_id)
+
+    async def set(self, user_id: int, data: ActiveCartDTO) -> None:
+        self._carts[user_id] = data
+
+    async def delete(self, user_id: int) -> None:
+        self._carts.pop(user_id, None)
+
+
+class BenchAuthSystem(IAuthSystem):
+    """
+    Accepts `Bearer bench.<user_id>` tokens, so every virtual user of a benchmark run can
+    own its own cart.
+    """
+
+    def validate_auth_data(self, auth_data: str) -> None:
+        scheme, _, token = auth_data.partition(" ")
+
+        if scheme != "Bearer" or not token.startswith(BENCH_TOKEN_PREFIX):
+            raise InvalidAuthDataError
+
+    async def get_user_data(self, auth_data: str) -> UserDataOutputDTO:
+        self.validate_auth_data(auth_data=auth_data)
+        user_id = auth_data.removeprefix(f"Bearer {BENCH_TOKEN_PREFIX}")
+
+        return UserDataOutputDTO(id=int(user_id), is_admin=False)
+
+    async def check_for_admin(self, auth_data: str) -> None:
+        self.validate_auth_data(auth_data=auth_data)
+
+
+class BenchProductsClient(IProductsClient):
+    def __init__(self, latency_sec: float = 0) -> None:
+        self._latency_sec = latency_sec
+
+    async def get_product(self, item_id: int) -> ProductOutputDTO:
+        await asyncio.sleep(self._latency_sec)
+
+        return ProductOutputDTO(
+            id=item_id,
+            title=f"Product {item_id}",
+            price=Decimal("10.00"),
+            description="",
+            category="bench",
+            image=PRODUCT_IMAGE_URL,
+            rating=RatingOutputDTO(rate=5, count=1),
+        )
+
+
+class BenchCouponsClient(ICouponsClient):
+    def __init__(self, latency_sec: float = 0) -> None:
+        self._latency_sec = latency_sec
+
+    async def get_coupon(self, coupon_name: str) -> CouponOutputDTO:
+        await asyncio.sleep(self._latency_sec)
+
+        return CouponOutputDTO(min_cart_cost=Decimal(1), discount_abs=Decimal(1))
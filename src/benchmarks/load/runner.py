@@ -0,0 +1,280 @@
+import asyncio
+import secrets
+import statistics
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from enum import StrEnum
+from typing import Any
+
+from dependency_injector import providers
+from fastapi import FastAPI
+from httpx import AsyncClient, Response
+from pydantic import BaseModel
+
+from app.api import rest
+from app.api.rest.main import app
+from app.containers import Container
+from app.domain.cart_config.dto import CartConfigDTO
+from benchmarks.load.environment import (
+    BENCH_TOKEN_PREFIX,
+    BenchAuthSystem,
+    BenchCouponsClient,
+    BenchProductsClient,
+    InMemoryActiveCartsCache,
+    InMemoryLockSystem,
+    InMemoryStorage,
+    InMemoryUow,
+)
+
+MAX_USER_ID = 2**31 - 1
+
+
+class BackendEnum(StrEnum):
+    MEMORY = "memory"
+    LOCAL = "local"
+
+
+class EndpointEnum(StrEnum):
+    CREATE = "create"
+    ADD_ITEM = "add-item"
+    UPDATE_ITEM = "update-item"
+    APPLY_COUPON = "apply-coupon"
+    RETRIEVE = "retrieve"
+
+
+class LoadConfig(BaseModel):
+    backend: BackendEnum = BackendEnum.MEMORY
+    concurrency: int = 10
+    carts: int = 100
+    items_per_cart: int = 3
+    clients_latency_sec: float = 0
+
+
+class EndpointStatsDTO(BaseModel):
+    requests: int
+    errors: int
+    throughput_rps: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+class LoadReportDTO(BaseModel):
+    config: LoadConfig
+    duration_sec: float
+    endpoints: dict[EndpointEnum, EndpointStatsDTO]
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.latencies: dict[EndpointEnum, list[float]] = defaultdict(list)
+        self.errors: dict[EndpointEnum, int] = defaultdict(int)
+
+    async def call(
+        self, endpoint: EndpointEnum, request: Awaitable[Response]
+    ) -> Response:
+        started_at = time.perf_counter()
+        response = await request
+        self.latencies[endpoint].append(time.perf_counter() - started_at)
+
+        if response.is_error:
+            self.errors[endpoint] += 1
+
+        return response
+
+    def get_stats(self, duration_sec: float) -> dict[EndpointEnum, EndpointStatsDTO]:
+        return {
+            endpoint: _get_endpoint_stats(
+                latencies=latencies,
+                errors=self.errors[endpoint],
+                duration_sec=duration_sec,
+            )
+            for endpoint, latencies in self.latencies.items()
+        }
+
+
+async def run_load(config: LoadConfig) -> LoadReportDTO:
+    """
+    Drives the create, add-item, update-item, apply-coupon and retrieve flow for
+    `config.carts` virtual users with `config.concurrency` of them in flight at a time,
+    and reports throughput and latency percentiles per endpoint.
+    """
+
+    recorder = _Recorder()
+    user_ids = iter(range(_get_first_user_id(config.carts), MAX_USER_ID))
+    carts_left = iter(range(config.carts))
+
+    async def worker(client: AsyncClient) -> None:
+        for _ in carts_left:
+            await _run_cart_flow(
+                client=client,
+                recorder=recorder,
+                user_id=next(user_ids),
+                items_qty=config.items_per_cart,
+            )
+
+    async with _application(config) as application, AsyncClient(
+        app=application,
+        base_url="http://bench",
+    ) as client:
+        started_at = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(config.concurrency)))
+        duration_sec = time.perf_counter() - started_at
+
+    return LoadReportDTO(
+        config=config,
+        duration_sec=duration_sec,
+        endpoints=recorder.get_stats(duration_sec=duration_sec),
+    )
+
+
+def compare_reports(
+    baseline: LoadReportDTO,
+    current: LoadReportDTO,
+) -> dict[EndpointEnum, dict[str, float]]:
+    """
+    Returns the relative change in percent of every metric of every endpoint present in
+    both reports. Positive values mean the metric grew.
+    """
+
+    diff = {}
+
+    for endpoint, stats in current.endpoints.items():
+        if (baseline_stats := baseline.endpoints.get(endpoint)) is None:
+            continue
+
+        diff[endpoint] = {
+            metric: _get_change(baseline_value, getattr(stats, metric))
+            for metric, baseline_value in baseline_stats.model_dump().items()
+            if metric not in {"requests", "errors"}
+        }
+
+    return diff
+
+
+async def _run_cart_flow(
+    client: AsyncClient,
+    recorder: _Recorder,
+    user_id: int,
+    items_qty: int,
+) -> None:
+    headers = {"Authorization": f"Bearer {BENCH_TOKEN_PREFIX}{user_id}"}
+
+    response = await recorder.call(
+        EndpointEnum.CREATE,
+        client.post("/api/v1/carts", headers=headers),
+    )
+    if response.is_error:
+        return
+
+    url = f"/api/v1/carts/{response.json()['id']}"
+
+    for item_id in range(1, items_qty + 1):
+        await recorder.call(
+            EndpointEnum.ADD_ITEM,
+            client.post(
+                f"{url}/items", headers=headers, json={"item_id": item_id, "qty": 1}
+            ),
+        )
+
+    for item_id in range(1, items_qty + 1):
+        await recorder.call(
+            EndpointEnum.UPDATE_ITEM,
+            client.patch(f"{url}/items/{item_id}", headers=headers, json=2),
+        )
+
+    await recorder.call(
+        EndpointEnum.APPLY_COUPON,
+        client.post(f"{url}/apply-coupon", headers=headers, json="bench"),
+    )
+    await recorder.call(EndpointEnum.RETRIEVE, client.get(url, headers=headers))
+
+
+@asynccontextmanager
+async def _application(config: LoadConfig) -> AsyncIterator[FastAPI]:
+    if config.backend == BackendEnum.LOCAL:
+        async with Container.lifespan(wireable_packages=[rest]) as container:
+            _override_clients(container=container, config=config)
+            yield app
+
+        return
+
+    container = Container()
+    container.wire(packages=[rest])
+    _override_clients(container=container, config=config)
+    _override_storage(container=container)
+
+    try:
+        yield app
+    finally:
+        container.unwire()
+
+
+def _override_clients(container: Container, config: LoadConfig) -> None:
+    container.auth_system.override(providers.Singleton(BenchAuthSystem))
+    container.products_client.container.client.override(
+        providers.Singleton(BenchProductsClient, latency_sec=config.clients_latency_sec),
+    )
+    container.coupons_client.container.client.override(
+        providers.Singleton(BenchCouponsClient, latency_sec=config.clients_latency_sec),
+    )
+
+
+def _override_storage(container: Container) -> None:
+    storage = InMemoryStorage(
+        config=CartConfigDTO(
+            max_items_qty=10**6,
+            min_cost_for_checkout=Decimal(1),
+            limit_items_by_id={},
+            hours_since_update_until_abandoned=1,
+            max_abandoned_notifications_qty=1,
+            abandoned_cart_text="bench",
+        ),
+    )
+    locks: set[str] = set()
+
+    container.db.container.uow.override(providers.Singleton(InMemoryUow, storage=storage))
+    container.distributed_lock_system.container.system.override(
+        providers.Singleton(InMemoryLockSystem, locks=locks),
+    )
+    container.active_carts_cache.override(providers.Singleton(InMemoryActiveCartsCache))
+
+
+def _get_first_user_id(carts: int) -> int:
+    # Random offset, so repeated runs against a local database don't collide with the
+    # active carts left by the previous ones.
+    return secrets.randbelow(MAX_USER_ID - carts) + 1
+
+
+def _get_endpoint_stats(
+    latencies: list[float],
+    errors: int,
+    duration_sec: float,
+) -> EndpointStatsDTO:
+    latencies_ms = [latency * 1000 for latency in latencies]
+    percentiles = (
+        statistics.quantiles(latencies_ms, n=100, method="inclusive")
+        if len(latencies_ms) > 1
+        else latencies_ms * 99
+    )
+
+    return EndpointStatsDTO(
+        requests=len(latencies_ms),
+        errors=errors,
+        throughput_rps=len(latencies_ms) / duration_sec,
+        mean_ms=statistics.fmean(latencies_ms),
+        p50_ms=percentiles[49],
+        p95_ms=percentiles[94],
+        p99_ms=percentiles[98],
+    )
+
+
+def _get_change(baseline: Any, current: Any) -> float:
+    if not baseline:
+        return 0.0
+
+    return (current - baseline) / baseline * 100
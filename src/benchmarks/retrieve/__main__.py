@@ -0,0 +1,115 @@
+import asyncio
+import secrets
+import statistics
+import time
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import typer
+from sqlalchemy import insert
+
+from app.containers import Container
+from app.domain.carts.value_objects import CartStatusEnum
+from app.infra.repositories.sqla import models
+from app.infra.repositories.sqla.db import Database
+from app.infra.unit_of_work.sqla import Uow
+
+MAX_USER_ID = 2**31 - 1
+
+app = typer.Typer()
+
+
+@app.command()
+def main(
+    items_qty: list[int] = typer.Option([1, 10, 100, 1_000]),
+    rounds: int = 200,
+) -> None:
+    """
+    Seeds the Postgres from the environment config (with applied migrations) with a cart
+    per provided items quantity and reports the cart retrieval latencies of the joined
+    ORM fetch and the aggregated JSON fetch.
+    """
+
+    asyncio.run(_run(items_qty=items_qty, rounds=rounds))
+
+
+async def _run(items_qty: list[int], rounds: int) -> None:
+    async with Container.lifespan(wireable_packages=[]) as container:
+        db: Database = container.db.container.db()
+        cart_ids = await _seed(db=db, items_qty=items_qty)
+
+        joined = Uow(session_factory=db.session_factory)
+        aggregated = Uow(session_factory=db.session_factory, aggregated_cart_fetch=True)
+
+        typer.echo(f"{'items':<10}{'joined ms':>12}{'aggregated ms':>16}{'change':>10}")
+        for qty, cart_id in zip(items_qty, cart_ids):
+            joined_ms = await _get_median_ms(uow=joined, cart_id=cart_id, rounds=rounds)
+            aggregated_ms = await _get_median_ms(
+                uow=aggregated,
+                cart_id=cart_id,
+                rounds=rounds,
+            )
+            typer.echo(
+                f"{qty:<10}{joined_ms:>12.2f}{aggregated_ms:>16.2f}"
+                f"{(aggregated_ms - joined_ms) / joined_ms * 100:>+9.1f}%",
+            )
+
+
+async def _seed(db: Database, items_qty: list[int]) -> list[UUID]:
+    # Random offset, so repeated runs don't collide with the active carts left by the
+    # previous ones.
+    first_user_id = secrets.randbelow(MAX_USER_ID - len(items_qty)) + 1
+    now = datetime.utcnow()
+    cart_ids = []
+
+    async with db.session_factory() as session, session.begin():
+        for user_id, qty in enumerate(items_qty, start=first_user_id):
+            cart_id = uuid4()
+            await session.execute(
+                insert(models.Cart),
+                [
+                    {
+                        "id": cart_id,
+                        "user_id": user_id,
+                        "status": CartStatusEnum.OPENED,
+                        "created_at": now,
+                        "updated_at": now,
+                    },
+                ],
+            )
+            await session.execute(
+                insert(models.CartItem),
+                [
+                    {
+                        "id": item_id,
+                        "cart_id": cart_id,
+                        "name": "bench",
+                        "qty": 1,
+                        "price": Decimal("9.99"),
+                        "is_weight": False,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for item_id in range(1, qty + 1)
+                ],
+            )
+            cart_ids.append(cart_id)
+
+    return cart_ids
+
+
+async def _get_median_ms(uow: Uow, cart_id: UUID, rounds: int) -> float:
+    latencies = []
+
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        async with uow(autocommit=False) as uow_handle:
+            await uow_handle.carts.retrieve(cart_id=cart_id)
+        latencies.append((time.perf_counter() - started_at) * 1000)
+
+    return statistics.median(latencies)
+
+
+if __name__ == "__main__":
+    app()
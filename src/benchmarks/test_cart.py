@@ -0,0 +1,104 @@
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from _pytest.fixtures import SubRequest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from app.app_layer.use_cases.carts.dto import CartOutputDTO
+from app.domain.cart_config.dto import CartConfigDTO
+from app.domain.cart_config.entities import CartConfig
+from app.domain.cart_items.dto import ItemDTO
+from app.domain.cart_items.entities import CartItem
+from app.domain.carts.entities import Cart
+from tests.utils import fake
+
+ITEMS_QTY = [10, 100, 1_000, 10_000]
+ROUNDS = 200
+
+
+def _create_item(cart: Cart, item_id: int) -> CartItem:
+    return CartItem(
+        data=ItemDTO(
+            id=item_id,
+            name=fake.text.word(),
+            qty=Decimal(1),
+            price=Decimal("9.99"),
+            is_weight=False,
+            cart_id=cart.id,
+        ),
+    )
+
+
+@pytest.fixture(params=ITEMS_QTY, ids=[f"{qty} items" for qty in ITEMS_QTY])
+def cart(request: SubRequest) -> Cart:
+    cart = Cart.create(
+        user_id=fake.numeric.integer_number(start=1),
+        config=CartConfig(
+            data=CartConfigDTO(
+                max_items_qty=10**9,
+                min_cost_for_checkout=Decimal(1),
+                limit_items_by_id={},
+                hours_since_update_until_abandoned=1,
+                max_abandoned_notifications_qty=1,
+                abandoned_cart_text=fake.text.word(),
+            ),
+        ),
+    )
+
+    for item_id in range(1, request.param + 1):
+        cart.items.append(_create_item(cart=cart, item_id=item_id))
+
+    return cart
+
+
+def test_add_new_item(benchmark: BenchmarkFixture, cart: Cart) -> None:
+    item = _create_item(cart=cart, item_id=0)
+
+    def setup() -> tuple[tuple[CartItem], dict[str, Any]]:
+        if cart.items.get(item.id) is not None:
+            cart.items.pop(item.id)
+
+        return (item,), {}
+
+    benchmark.pedantic(cart.add_new_item, setup=setup, rounds=ROUNDS)
+
+
+def test_increase_item_qty(benchmark: BenchmarkFixture, cart: Cart) -> None:
+    item_id = len(cart.items) // 2
+
+    benchmark(cart.increase_item_qty, item_id=item_id, qty=Decimal(1))
+
+
+def test_update_item_qty(benchmark: BenchmarkFixture, cart: Cart) -> None:
+    item_id = len(cart.items) // 2
+
+    benchmark(cart.update_item_qty, item_id=item_id, qty=Decimal(2))
+
+
+def test_delete_item(benchmark: BenchmarkFixture, cart: Cart) -> None:
+    item = cart.items[len(cart.items) // 2]
+
+    def setup() -> tuple[tuple[int], dict[str, Any]]:
+        if cart.items.get(item.id) is None:
+            cart.items.append(item)
+
+        return (item.id,), {}
+
+    benchmark.pedantic(cart.delete_item, setup=setup, rounds=ROUNDS)
+
+
+def test_cart_output_dto(benchmark: BenchmarkFixture, cart: Cart) -> None:
+    benchmark(CartOutputDTO.model_validate, cart)
+
+
+def test_cart_cost(benchmark: BenchmarkFixture, cart: Cart) -> None:
+    benchmark(lambda: cart.cost)
+
+
+def test_cart_items_qty(benchmark: BenchmarkFixture, cart: Cart) -> None:
+    benchmark(lambda: cart.items_qty)
+
+
+def test_cart_checkout_enabled(benchmark: BenchmarkFixture, cart: Cart) -> None:
+    benchmark(lambda: cart.checkout_enabled)
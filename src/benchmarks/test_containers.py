@@ -0,0 +1,90 @@
+import pytest
+from dependency_injector import containers, providers
+from pytest_benchmark.fixture import BenchmarkFixture
+from redis.asyncio import Redis
+
+from app.app_layer.use_cases.cart_items.add_item import AddCartItemUseCase
+from app.app_layer.use_cases.cart_items.limits import CartItemLimits
+from app.containers import Container
+from app.infra.auth_system import FakeJWTAuthSystem
+from app.infra.http.clients.products import ProductsHttpClient
+from app.infra.http.retry_systems.backoff import BackoffConfig, BackoffRetrySystem
+from app.infra.http.transports.aiohttp import AioHttpTransport
+from app.infra.http.transports.base import HttpTransportConfig, RetryableHttpTransport
+from app.infra.redis_lock_system import RedisLockSystem
+from app.infra.unit_of_work.sqla import Uow
+
+
+class _FactoryContainer(containers.DeclarativeContainer):
+    """The per-request wiring of AddCartItemUseCase before providers became singletons."""
+
+    config = providers.Object(Container.config)
+    session: providers.Object[None] = providers.Object(None)
+    redis = providers.Object(Redis())
+    session_factory: providers.Object[None] = providers.Object(None)
+
+    uow = providers.Factory(Uow, session_factory=session_factory)
+    products_client = providers.Factory(
+        ProductsHttpClient,
+        base_url=config.provided.PRODUCTS_CLIENT.base_url,
+        transport=providers.Factory(
+            RetryableHttpTransport,
+            transport=providers.Factory(
+                AioHttpTransport,
+                session=session,
+                config=providers.Factory(
+                    HttpTransportConfig,
+                    integration_name=config.provided.PRODUCTS_CLIENT.name,
+                ),
+            ),
+            retry_system=providers.Factory(
+                BackoffRetrySystem,
+                config=providers.Factory(
+                    BackoffConfig,
+                    enabled=config.provided.PRODUCTS_CLIENT.retries_enabled,
+                ),
+            ),
+        ),
+    )
+    distributed_lock_system = providers.Factory(
+        RedisLockSystem,
+        redis=redis,
+        config=config.provided.REDIS_LOCK,
+    )
+    add_cart_item_use_case = providers.Factory(
+        AddCartItemUseCase,
+        uow=uow,
+        products_client=products_client,
+        auth_system=providers.Factory(FakeJWTAuthSystem),
+        distributed_lock_system=distributed_lock_system,
+        item_limits=providers.Factory(
+            CartItemLimits,
+            uow=uow,
+            config=config.provided.ITEM_LIMITS_CACHE,
+        ),
+    )
+
+
+@pytest.fixture()
+def container() -> Container:
+    container = Container()
+    container.products_client.container.client.override(_FactoryContainer.products_client)
+    container.distributed_lock_system.container.redis.override(_FactoryContainer.redis)
+
+    # the first call builds the singletons
+    container.add_cart_item_use_case()
+
+    return container
+
+
+def test_resolve_use_case_factory(benchmark: BenchmarkFixture) -> None:
+    container = _FactoryContainer()
+
+    benchmark(container.add_cart_item_use_case)
+
+
+def test_resolve_use_case_singleton(
+    benchmark: BenchmarkFixture,
+    container: Container,
+) -> None:
+    benchmark(container.add_cart_item_use_case)
@@ -0,0 +1,9 @@
+from benchmarks.load.runner import EndpointEnum, LoadConfig, run_load
+
+
+async def test_public_api_load_in_memory() -> None:
+    report = await run_load(LoadConfig(concurrency=2, carts=4, items_per_cart=2))
+
+    assert set(report.endpoints) == set(EndpointEnum)
+    assert all(stats.errors == 0 for stats in report.endpoints.values())
+    assert report.endpoints[EndpointEnum.ADD_ITEM].requests == 8
@@ -0,0 +1,181 @@
+import logging
+import os
+from collections.abc import Coroutine, Iterator, Mapping
+from contextlib import suppress
+from contextvars import ContextVar
+from logging import Logger, LogRecord, StreamHandler
+from types import MappingProxyType
+from typing import Any, TextIO
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel
+from pytest_benchmark.fixture import BenchmarkFixture
+from pythonjsonlogger import jsonlogger
+
+from app.logging import ContextQueueHandler, CtxJsonFormatter, ctx, update_context
+from tests.utils import fake
+
+
+class _LegacyContextDTO(BaseModel):
+    cart_id: UUID | None = None
+    user_id: int | None = None
+
+
+class _LegacyCtxJsonFormatter(jsonlogger.JsonFormatter):
+    """The formatter the service used before the switch to orjson and mapping contexts."""
+
+    def __init__(
+        self,
+        *args: Any,
+        transaction_ctx: ContextVar[_LegacyContextDTO],
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore [no-untyped-call]
+        self._ctx = transaction_ctx
+
+    def add_fields(
+        self,
+        log_record: dict[str, Any],
+        record: LogRecord,
+        message_dict: dict[str, Any],
+    ) -> None:
+        super().add_fields(log_record, record, message_dict)
+        log_record.update(
+            {
+                **record.__dict__,
+                **self._ctx.get().model_dump(exclude_none=True),
+            },
+        )
+
+
+legacy_ctx: ContextVar[_LegacyContextDTO] = ContextVar(
+    "legacy_ctx",
+    default=_LegacyContextDTO(),
+)
+mapping_ctx: ContextVar[Mapping[str, Any]] = ContextVar(
+    "mapping_ctx",
+    default=MappingProxyType({}),
+)
+
+
+@pytest.fixture()
+def cart_id() -> UUID:
+    return fake.cryptographic.uuid_object()
+
+
+@pytest.fixture()
+def user_id() -> int:
+    return fake.numeric.integer_number(start=1)
+
+
+@pytest.fixture()
+def record() -> LogRecord:
+    return LogRecord(
+        name=__name__,
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg="Cart %s was updated",
+        args=(fake.cryptographic.uuid(),),
+        exc_info=None,
+    )
+
+
+@pytest.fixture()
+def devnull_logger() -> Iterator[tuple[Logger, TextIO]]:
+    logger = logging.getLogger(f"{__name__}.devnull")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    with open(os.devnull, "w") as stream:  # noqa: PTH123
+        yield logger, stream
+
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+async def _legacy_update_context(**kwargs: Any) -> None:
+    legacy_ctx.set(legacy_ctx.get().model_copy(update={**kwargs}))
+
+
+def _run(coro: Coroutine[Any, Any, None]) -> None:
+    """Drives a coroutine that never suspends without the event loop overhead."""
+
+    with suppress(StopIteration):
+        coro.send(None)
+
+
+def test_legacy_update_context(
+    benchmark: BenchmarkFixture,
+    cart_id: UUID,
+    user_id: int,
+) -> None:
+    legacy_ctx.set(_LegacyContextDTO(user_id=user_id))
+
+    benchmark(lambda: _run(_legacy_update_context(cart_id=cart_id)))
+
+
+def test_mapping_update_context(
+    benchmark: BenchmarkFixture,
+    cart_id: UUID,
+    user_id: int,
+) -> None:
+    ctx.set(MappingProxyType({"user_id": user_id}))
+
+    benchmark(lambda: _run(update_context(cart_id=cart_id)))
+
+
+def test_legacy_json_formatter(
+    benchmark: BenchmarkFixture,
+    record: LogRecord,
+    cart_id: UUID,
+    user_id: int,
+) -> None:
+    legacy_ctx.set(_LegacyContextDTO(cart_id=cart_id, user_id=user_id))
+    formatter = _LegacyCtxJsonFormatter(transaction_ctx=legacy_ctx)
+
+    benchmark(formatter.format, record)
+
+
+def test_orjson_formatter(
+    benchmark: BenchmarkFixture,
+    record: LogRecord,
+    cart_id: UUID,
+    user_id: int,
+) -> None:
+    mapping_ctx.set(MappingProxyType({"cart_id": cart_id, "user_id": user_id}))
+    formatter = CtxJsonFormatter(transaction_ctx=mapping_ctx)
+
+    benchmark(formatter.format, record)
+
+
+def test_legacy_stream_handler_log_line(
+    benchmark: BenchmarkFixture,
+    devnull_logger: tuple[Logger, TextIO],
+    cart_id: UUID,
+) -> None:
+    logger, stream = devnull_logger
+    legacy_ctx.set(_LegacyContextDTO(cart_id=cart_id))
+    handler = StreamHandler(stream=stream)
+    handler.setFormatter(_LegacyCtxJsonFormatter(transaction_ctx=legacy_ctx))
+    logger.addHandler(handler)
+
+    benchmark(logger.info, "Cart %s was updated", cart_id)
+
+
+def test_queue_handler_log_line(
+    benchmark: BenchmarkFixture,
+    devnull_logger: tuple[Logger, TextIO],
+    cart_id: UUID,
+) -> None:
+    """Measures the cost paid by the calling coroutine, the write happens in the listener."""
+
+    logger, stream = devnull_logger
+    mapping_ctx.set(MappingProxyType({"cart_id": cart_id}))
+    handler = ContextQueueHandler(stream=stream, transaction_ctx=mapping_ctx)
+    handler.setFormatter(CtxJsonFormatter(transaction_ctx=mapping_ctx))
+    logger.addHandler(handler)
+
+    benchmark(logger.info, "Cart %s was updated", cart_id)
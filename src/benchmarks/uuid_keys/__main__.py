@@ -0,0 +1,79 @@
+import asyncio
+import time
+from collections.abc import Callable
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import typer
+from asyncpg import Connection
+
+from app.config import Config
+from app.domain.ids import uuid7
+from app.infra.repositories.asyncpg.db import get_pool
+
+app = typer.Typer()
+
+
+@app.command()
+def main(rows: int = 10_000_000, batch_size: int = 10_000) -> None:
+    """
+    Inserts the provided number of rows into a scratch table keyed by uuid4 and into one
+    keyed by uuid7 in the Postgres from the environment config and reports the insert
+    throughput and the primary key index size of both. The tables are dropped afterward.
+    """
+
+    asyncio.run(_run(rows=rows, batch_size=batch_size))
+
+
+async def _run(rows: int, batch_size: int) -> None:
+    generators: dict[str, Callable[[], UUID]] = {"uuid4": uuid4, "uuid7": uuid7}
+
+    async with get_pool(config=Config().DB) as pool, pool.acquire() as connection:
+        typer.echo(f"{'ids':<8}{'rows/s':>12}{'index MB':>12}")
+        for name, generator in generators.items():
+            table = f"bench_{name}_keys"
+            await connection.execute(
+                f"CREATE TABLE {table} (id uuid PRIMARY KEY, created_at timestamp)",
+            )
+
+            try:
+                rows_per_sec = await _insert(
+                    connection=connection,
+                    table=table,
+                    generator=generator,
+                    rows=rows,
+                    batch_size=batch_size,
+                )
+                index_size = await connection.fetchval(
+                    "SELECT pg_relation_size($1::regclass)",
+                    f"{table}_pkey",
+                )
+            finally:
+                await connection.execute(f"DROP TABLE {table}")
+
+            typer.echo(f"{name:<8}{rows_per_sec:>12.0f}{index_size / 2**20:>12.1f}")
+
+
+async def _insert(
+    connection: Connection,
+    table: str,
+    generator: Callable[[], UUID],
+    rows: int,
+    batch_size: int,
+) -> float:
+    elapsed = 0.0
+
+    for offset in range(0, rows, batch_size):
+        now = datetime.utcnow()
+        # ids are generated ahead, so only the database work is measured
+        records = [(generator(), now) for _ in range(min(batch_size, rows - offset))]
+
+        started_at = time.perf_counter()
+        await connection.copy_records_to_table(table, records=records)
+        elapsed += time.perf_counter() - started_at
+
+    return rows / elapsed
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,101 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from asyncpg import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.cart_coupons.entities import CartCoupon
+from app.domain.cart_items.entities import CartItem
+from app.domain.cart_notifications.entities import CartNotification
+from app.domain.carts.entities import Cart
+from app.infra.repositories.asyncpg.cart_coupons import CartCouponsRepository
+from app.infra.repositories.asyncpg.cart_notifications import CartsNotificationsRepository
+from app.infra.repositories.asyncpg.carts import CartsRepository
+from app.infra.repositories.asyncpg.items import ItemsRepository
+from app.infra.repositories.sqla import models
+from tests.environment.repositories.cart_coupons import TestCartCouponsRepository
+from tests.environment.repositories.carts import TestCartsRepository
+from tests.environment.repositories.carts_notifications import (
+    TestCartsNotificationsRepository,
+)
+from tests.environment.repositories.items import TestItemsRepository
+
+
+class TestAsyncpgItemsRepository(ItemsRepository):
+    """
+    Test repository for interactions with cart_items operations through a raw asyncpg
+    connection, the test helpers use a session on the same connection.
+    """
+
+    __test__ = False
+
+    def __init__(self, connection: Connection, session: AsyncSession) -> None:
+        super().__init__(connection=connection)
+        self._helper = TestItemsRepository(session)
+
+    async def create_item(self, item: CartItem) -> None:
+        await self._helper.create_item(item=item)
+
+
+class TestAsyncpgCartsRepository(CartsRepository):
+    """
+    Test repository for interactions with carts operations through a raw asyncpg
+    connection, the test helpers use a session on the same connection.
+    """
+
+    __test__ = False
+
+    def __init__(self, connection: Connection, session: AsyncSession) -> None:
+        super().__init__(connection=connection)
+        self._helper = TestCartsRepository(session)
+
+    async def get_by_id(self, cart_id: UUID) -> Cart:
+        return await self._helper.get_by_id(cart_id=cart_id)
+
+    async def get_archived(self, cart_id: UUID) -> models.CartArchive | None:
+        return await self._helper.get_archived(cart_id=cart_id)
+
+    async def bulk_create(self, carts: list[Cart], **kwargs: Any) -> list[Cart]:
+        return await self._helper.bulk_create(carts, **kwargs)
+
+
+class TestAsyncpgCartCouponsRepository(CartCouponsRepository):
+    """
+    Test repository for interactions with cart_coupons operations through a raw asyncpg
+    connection, the test helpers use a session on the same connection.
+    """
+
+    __test__ = False
+
+    def __init__(self, connection: Connection, session: AsyncSession) -> None:
+        super().__init__(connection=connection)
+        self._helper = TestCartCouponsRepository(session)
+
+    async def retrieve(self, cart: Cart) -> CartCoupon | None:
+        return await self._helper.retrieve(cart=cart)
+
+
+class TestAsyncpgCartsNotificationsRepository(CartsNotificationsRepository):
+    """
+    Test repository for interactions with carts notifications operations through a raw
+    asyncpg connection, the test helpers use a session on the same connection.
+    """
+
+    __test__ = False
+
+    def __init__(self, connection: Connection, session: AsyncSession) -> None:
+        super().__init__(connection=connection)
+        self._helper = TestCartsNotificationsRepository(session)
+
+    async def bulk_create(
+        self,
+        notifications: list[CartNotification],
+    ) -> list[CartNotification]:
+        return await self._helper.bulk_create(notifications=notifications)
+
+    async def retrieve(self, cart_id: UUID) -> CartNotification | None:
+        return await self._helper.retrieve(cart_id=cart_id)
+
+    async def set_reserved_at(self, cart_id: UUID, reserved_at: datetime) -> None:
+        await self._helper.set_reserved_at(cart_id=cart_id, reserved_at=reserved_at)
@@ -38,6 +38,11 @@ class TestCartsRepository(CartsRepository):
 
         return self._get_cart(obj=obj, config=config)
 
+    async def get_archived(self, cart_id: UUID) -> models.CartArchive | None:
+        stmt = select(models.CartArchive).where(models.CartArchive.id == cart_id)
+
+        return await self._session.scalar(stmt)
+
     async def bulk_create(self, carts: list[Cart], **kwargs) -> list[Cart]:
         stmt = insert(models.Cart).values(
             [
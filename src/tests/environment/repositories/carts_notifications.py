@@ -1,6 +1,7 @@
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 
@@ -30,6 +31,7 @@ class TestCartsNotificationsRepository(CartsNotificationsRepository):
                     "id": notification.id,
                     "cart_id": notification.cart_id,
                     "type": notification.type,
+                    "cycle": notification.cycle,
                     "text": notification.text,
                     "sent_at": notification.sent_at,
                 }
@@ -58,7 +60,16 @@ class TestCartsNotificationsRepository(CartsNotificationsRepository):
                 id=row.id,
                 cart_id=row.cart_id,
                 type=row.type,
+                cycle=row.cycle,
                 text=row.text,
                 sent_at=row.sent_at,
             ),
         )
+
+    async def set_reserved_at(self, cart_id: UUID, reserved_at: datetime) -> None:
+        stmt = (
+            update(models.CartNotification)
+            .where(models.CartNotification.cart_id == cart_id)
+            .values(reserved_at=reserved_at)
+        )
+        await self._session.execute(stmt)
@@ -1,4 +1,18 @@
-from app.infra.unit_of_work.sqla import Uow
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infra.repositories.asyncpg.watermarks import (
+    WatermarksRepository as AsyncpgWatermarksRepository,
+)
+from app.infra.repositories.sqla.watermarks import WatermarksRepository
+from app.infra.unit_of_work.sqla import Uow, UowHandle
+from tests.environment.repositories.asyncpg import (
+    TestAsyncpgCartCouponsRepository,
+    TestAsyncpgCartsNotificationsRepository,
+    TestAsyncpgCartsRepository,
+    TestAsyncpgItemsRepository,
+)
 from tests.environment.repositories.cart_coupons import TestCartCouponsRepository
 from tests.environment.repositories.carts import TestCartsRepository
 from tests.environment.repositories.carts_notifications import (
@@ -7,20 +21,103 @@ from tests.environment.repositories.carts_notifications import (
 from tests.environment.repositories.items import TestItemsRepository
 
 
-class TestUow(Uow):
+class TestUowHandle(UowHandle):
     __test__ = False
 
-    items: TestItemsRepository
-    carts: TestCartsRepository
-    cart_coupons: TestCartCouponsRepository
-    carts_notifications: TestCartsNotificationsRepository
+    items: TestItemsRepository | TestAsyncpgItemsRepository
+    carts: TestCartsRepository | TestAsyncpgCartsRepository
+    cart_coupons: TestCartCouponsRepository | TestAsyncpgCartCouponsRepository
+    carts_notifications: (
+        TestCartsNotificationsRepository | TestAsyncpgCartsNotificationsRepository
+    )
 
-    async def __aenter__(self) -> "TestUow":
+    async def __aenter__(self) -> "TestUowHandle":
         self._session = self._session_factory()
 
         self.items = TestItemsRepository(self._session)
-        self.carts = TestCartsRepository(self._session)
+        self.carts = TestCartsRepository(
+            self._session,
+            aggregated_fetch=self._aggregated_cart_fetch,
+        )
         self.cart_coupons = TestCartCouponsRepository(self._session)
         self.carts_notifications = TestCartsNotificationsRepository(self._session)
+        self.watermarks = WatermarksRepository(self._session)
+
+        return self
+
+
+class TestUow(Uow):
+    __test__ = False
+
+    def __call__(self, autocommit: bool, *args: Any, **kwargs: Any) -> TestUowHandle:
+        return TestUowHandle(
+            session_factory=self._session_factory,
+            autocommit=autocommit,
+            aggregated_cart_fetch=self._aggregated_cart_fetch,
+        )
+
+
+class TestAsyncpgUowHandle(TestUowHandle):
+    """
+    Runs the asyncpg repositories on the raw connection of the test session, so they
+    share its SAVEPOINT with the test helpers and are rolled back after the test.
+    """
+
+    __test__ = False
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        autocommit: bool,
+        schema_name: str,
+    ) -> None:
+        super().__init__(session_factory=session_factory, autocommit=autocommit)
+        self._schema_name = schema_name
+
+    async def __aenter__(self) -> "TestAsyncpgUowHandle":
+        self._session = self._session_factory()
+
+        # the savepoint of the session is started by the first request of a connection
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        assert driver_connection is not None
+        await driver_connection.execute(f"SET LOCAL search_path TO {self._schema_name}")
+
+        self.items = TestAsyncpgItemsRepository(driver_connection, self._session)
+        self.carts = TestAsyncpgCartsRepository(driver_connection, self._session)
+        self.cart_coupons = TestAsyncpgCartCouponsRepository(
+            driver_connection,
+            self._session,
+        )
+        self.carts_notifications = TestAsyncpgCartsNotificationsRepository(
+            driver_connection,
+            self._session,
+        )
+        self.watermarks = AsyncpgWatermarksRepository(driver_connection)
 
         return self
+
+
+class TestAsyncpgUow(TestUow):
+    __test__ = False
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        schema_name: str,
+    ) -> None:
+        super().__init__(session_factory=session_factory)
+        self._schema_name = schema_name
+
+    def __call__(
+        self,
+        autocommit: bool,
+        *args: Any,
+        **kwargs: Any,
+    ) -> TestAsyncpgUowHandle:
+        return TestAsyncpgUowHandle(
+            session_factory=self._session_factory,
+            autocommit=autocommit,
+            schema_name=self._schema_name,
+        )
@@ -1,9 +1,11 @@
 import pytest
+from _pytest.fixtures import SubRequest
 
 from app.app_layer.interfaces.clients.notifications.client import INotificationsClient
+from app.app_layer.interfaces.distributed_lock_system.system import IDistributedLockSystem
 from app.app_layer.interfaces.tasks.producer import ITaskProducer
 from app.app_layer.use_cases.abandoned_carts_service import AbandonedCartsService
-from app.config import TaskConfig
+from app.config import PeriodicConfig, TaskConfig
 from tests.environment.unit_of_work import TestUow
 from tests.utils import fake
 
@@ -16,16 +18,35 @@ def task_config() -> TaskConfig:
     )
 
 
+@pytest.fixture()
+def periodic_config(request: SubRequest) -> PeriodicConfig:
+    return PeriodicConfig(
+        shards_qty=fake.numeric.integer_number(start=2, end=8),
+        **getattr(request, "param", {}),
+    )
+
+
+@pytest.fixture()
+def reservation_timeout_sec() -> int:
+    return fake.numeric.integer_number(start=1, end=3600)
+
+
 @pytest.fixture()
 def service(
     uow: TestUow,
     task_producer: ITaskProducer,
     notifications_client: INotificationsClient,
+    distributed_lock_system: IDistributedLockSystem,
     task_config: TaskConfig,
+    periodic_config: PeriodicConfig,
+    reservation_timeout_sec: int,
 ) -> AbandonedCartsService:
     return AbandonedCartsService(
         uow=uow,
         task_producer=task_producer,
         notification_client=notifications_client,
+        distributed_lock_system=distributed_lock_system,
         config=task_config,
+        periodic_config=periodic_config,
+        reservation_timeout_sec=reservation_timeout_sec,
     )
@@ -1,12 +1,20 @@
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, call
+from uuid import UUID
 
 import pytest
 from _pytest.fixtures import SubRequest
 
-from app.api.events.tasks.abandoned_carts import send_abandoned_cart_notification
-from app.app_layer.use_cases.abandoned_carts_service import AbandonedCartsService
-from app.config import TaskConfig
+from app.api.events.tasks.abandoned_carts import (
+    process_abandoned_carts_shard,
+    send_abandoned_cart_notification,
+)
+from app.app_layer.use_cases.abandoned_carts_service import (
+    FAN_OUT_LEASE_NAME,
+    WATERMARK_NAME,
+    AbandonedCartsService,
+)
+from app.config import PeriodicConfig, TaskConfig
 from app.domain.cart_config.entities import CartConfig
 from app.domain.cart_notifications.entities import CartNotification
 from app.domain.carts.dto import CartDTO
@@ -60,30 +68,36 @@ async def carts(
         for user_id in user_ids
     ]
 
-    async with uow(autocommit=True):
-        await uow.carts.update_config(cart_config=cart_config)
-        await uow.carts.bulk_create(carts=carts, **common_kwargs)
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.carts.update_config(cart_config=cart_config)
+        await uow_handle.carts.bulk_create(carts=carts, **common_kwargs)
 
     return carts
 
 
 @pytest.fixture()
 async def notifications(
+    request: SubRequest,
     carts: list[Cart],
     cart_config: CartConfig,
     uow: TestUow,
 ) -> list[CartNotification]:
+    sent_qty = getattr(request, "param", cart_config.max_abandoned_notifications_qty)
     notifications = [
         CartNotification.create_abandoned_cart_notification(
             cart_id=cart.id,
             text=cart_config.abandoned_cart_text,
+            cycle=cycle,
         )
         for cart in carts
-        for _ in range(cart_config.max_abandoned_notifications_qty)
+        for cycle in range(1, sent_qty + 1)
     ]
 
-    async with uow(autocommit=True):
-        await uow.carts_notifications.bulk_create(notifications=notifications)
+    for notification in notifications:
+        notification.mark_sent()
+
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.carts_notifications.bulk_create(notifications=notifications)
 
     return notifications
 
@@ -91,26 +105,70 @@ async def notifications(
 async def test_ok(
     service: AbandonedCartsService, broker: AsyncMock, carts: list[Cart]
 ) -> None:
-    await service.process_abandoned_carts()
+    await service.process_abandoned_carts_shard(shard=0, shards_qty=1)
 
     expected_calls = [
         call(
             function=send_abandoned_cart_notification.__name__,
             user_id=cart.user_id,
             cart_id=cart.id,
+            cycle=1,
             _job_id=str(cart.id),
-            _queue_name=QueueNameEnum.EXAMPLE_QUEUE.value,
+            _queue_name=QueueNameEnum.NOTIFICATIONS_QUEUE.value,
         )
         for cart in carts
     ]
     broker.enqueue_job.assert_has_awaits(calls=expected_calls)
 
 
+@pytest.mark.parametrize(
+    "cart_config", [{"max_abandoned_notifications_qty": 2}], indirect=True
+)
+@pytest.mark.parametrize("notifications", [1], indirect=True)
+@pytest.mark.usefixtures("notifications")
+async def test_next_cycle(
+    service: AbandonedCartsService, broker: AsyncMock, carts: list[Cart]
+) -> None:
+    await service.process_abandoned_carts_shard(shard=0, shards_qty=1)
+
+    assert broker.enqueue_job.await_count == len(carts)
+    assert all(call.kwargs["cycle"] == 2 for call in broker.enqueue_job.await_args_list)
+
+
+@pytest.mark.parametrize(
+    "cart_config", [{"max_abandoned_notifications_qty": 2}], indirect=True
+)
+@pytest.mark.parametrize("notifications", [1], indirect=True)
+@pytest.mark.usefixtures("notifications")
+async def test_unsent_reservation_cycle_is_retried(
+    service: AbandonedCartsService,
+    broker: AsyncMock,
+    carts: list[Cart],
+    cart_config: CartConfig,
+    uow: TestUow,
+) -> None:
+    reserved = [
+        CartNotification.create_abandoned_cart_notification(
+            cart_id=cart.id,
+            text=cart_config.abandoned_cart_text,
+            cycle=2,
+        )
+        for cart in carts
+    ]
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.carts_notifications.bulk_create(notifications=reserved)
+
+    await service.process_abandoned_carts_shard(shard=0, shards_qty=1)
+
+    assert broker.enqueue_job.await_count == len(carts)
+    assert all(call.kwargs["cycle"] == 2 for call in broker.enqueue_job.await_args_list)
+
+
 @pytest.mark.parametrize("carts", [{"updated_at": datetime.now()}], indirect=True)
 async def test_no_abandoned_carts(
     service: AbandonedCartsService, carts: list[Cart], broker: AsyncMock
 ) -> None:
-    await service.process_abandoned_carts()
+    await service.process_abandoned_carts_shard(shard=0, shards_qty=1)
     broker.enqueue_job.assert_not_awaited()
 
 
@@ -122,10 +180,138 @@ async def test_already_processed(
     service: AbandonedCartsService,
     cart_config: CartConfig,
     broker: AsyncMock,
+) -> None:
+    await service.process_abandoned_carts_shard(shard=0, shards_qty=1)
+    broker.enqueue_job.assert_not_awaited()
+
+
+async def test_shards(
+    service: AbandonedCartsService,
+    periodic_config: PeriodicConfig,
+    broker: AsyncMock,
+    carts: list[Cart],
+) -> None:
+    shard_cart_ids: list[UUID] = []
+
+    for shard in range(periodic_config.shards_qty):
+        broker.enqueue_job.reset_mock()
+        await service.process_abandoned_carts_shard(
+            shard=shard,
+            shards_qty=periodic_config.shards_qty,
+        )
+        shard_cart_ids.extend(
+            call.kwargs["cart_id"] for call in broker.enqueue_job.await_args_list
+        )
+
+    assert sorted(shard_cart_ids) == sorted(cart.id for cart in carts)
+
+
+async def test_fan_out(
+    service: AbandonedCartsService,
+    periodic_config: PeriodicConfig,
+    broker: AsyncMock,
+    redis: AsyncMock,
 ) -> None:
     await service.process_abandoned_carts()
+
+    assert redis.set.await_args.args[0] == FAN_OUT_LEASE_NAME
+    expected_calls = [
+        call(
+            function=process_abandoned_carts_shard.__name__,
+            shard=shard,
+            shards_qty=periodic_config.shards_qty,
+            updated_after=None,
+            updated_before=None,
+            _job_id=(
+                f"{process_abandoned_carts_shard.__name__}:"
+                f"{shard}:{periodic_config.shards_qty}"
+            ),
+            _queue_name=QueueNameEnum.ABANDONED_CARTS_QUEUE.value,
+        )
+        for shard in range(periodic_config.shards_qty)
+    ]
+    broker.enqueue_job.assert_has_awaits(calls=expected_calls)
+    assert broker.enqueue_job.await_count == periodic_config.shards_qty
+
+
+@pytest.mark.parametrize("redis", [{"returns": None}], indirect=True)
+async def test_fan_out_lease_is_taken(
+    service: AbandonedCartsService, broker: AsyncMock
+) -> None:
+    await service.process_abandoned_carts()
+    broker.enqueue_job.assert_not_awaited()
+
+
+@pytest.mark.parametrize("periodic_config", [{"incremental": True}], indirect=True)
+async def test_fan_out_incremental(
+    service: AbandonedCartsService,
+    broker: AsyncMock,
+    uow: TestUow,
+) -> None:
+    await service.process_abandoned_carts()
+
+    first_calls = broker.enqueue_job.await_args_list
+    async with uow(autocommit=True) as uow_handle:
+        watermark = await uow_handle.watermarks.get(name=WATERMARK_NAME)
+
+    assert watermark is not None
+    assert all(call.kwargs["updated_after"] is None for call in first_calls)
+    assert all(call.kwargs["updated_before"] == watermark for call in first_calls)
+
+    previous_watermark = watermark - timedelta(minutes=1)
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.watermarks.save(name=WATERMARK_NAME, value=previous_watermark)
+
+    broker.enqueue_job.reset_mock()
+    await service.process_abandoned_carts()
+
+    assert broker.enqueue_job.await_count == len(first_calls)
+    assert all(
+        call.kwargs["updated_after"] == previous_watermark
+        for call in broker.enqueue_job.await_args_list
+    )
+
+
+@pytest.mark.parametrize("periodic_config", [{"incremental": True}], indirect=True)
+async def test_fan_out_incremental_enqueue_failed(
+    service: AbandonedCartsService,
+    broker: AsyncMock,
+    uow: TestUow,
+) -> None:
+    broker.enqueue_job.side_effect = ConnectionError
+
+    await service.process_abandoned_carts()
+
+    async with uow(autocommit=True) as uow_handle:
+        assert await uow_handle.watermarks.get(name=WATERMARK_NAME) is None
+
+
+async def test_shard_window(
+    service: AbandonedCartsService,
+    broker: AsyncMock,
+    cart_config: CartConfig,
+    carts: list[Cart],
+) -> None:
+    threshold = datetime.now() - timedelta(
+        hours=cart_config.hours_since_update_until_abandoned,
+    )
+
+    await service.process_abandoned_carts_shard(
+        shard=0,
+        shards_qty=1,
+        updated_after=threshold,
+        updated_before=datetime.now(),
+    )
     broker.enqueue_job.assert_not_awaited()
 
+    await service.process_abandoned_carts_shard(
+        shard=0,
+        shards_qty=1,
+        updated_after=threshold - timedelta(minutes=1),
+        updated_before=threshold,
+    )
+    assert broker.enqueue_job.await_count == len(carts)
+
 
 async def test_config_ok(service: AbandonedCartsService) -> None:
     assert isinstance(service.config, TaskConfig)
@@ -31,8 +31,8 @@ async def test_ok(
 ) -> None:
     await service.send_notification(user_id=cart.user_id, cart_id=cart.id)
 
-    async with uow(autocommit=True):
-        notification = await uow.carts_notifications.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        notification = await uow_handle.carts_notifications.retrieve(cart_id=cart.id)
 
     assert notification is not None
 
@@ -74,8 +74,8 @@ async def test_failed(
     with pytest.raises(NotificationsClientError, match="test"):
         await service.send_notification(user_id=cart.user_id, cart_id=cart.id)
 
-    async with uow(autocommit=True):
-        notification = await uow.carts_notifications.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        notification = await uow_handle.carts_notifications.retrieve(cart_id=cart.id)
 
     assert notification is None
 
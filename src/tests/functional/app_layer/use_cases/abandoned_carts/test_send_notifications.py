@@ -0,0 +1,144 @@
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.app_layer.interfaces.clients.notifications.exceptions import (
+    NotificationsClientError,
+)
+from app.app_layer.use_cases.abandoned_carts_service import AbandonedCartsService
+from app.domain.cart_config.entities import CartConfig
+from app.domain.cart_notifications.entities import CartNotification
+from app.domain.carts.entities import Cart
+from app.infra.http.transports.base import HttpTransportError
+from tests.environment.unit_of_work import TestUow
+
+
+@pytest.mark.parametrize("http_response", [{"returns": {}}], indirect=True)
+async def test_ok(
+    service: AbandonedCartsService,
+    cart: Cart,
+    uow: TestUow,
+    http_response: AsyncMock,
+    http_session: MagicMock,
+) -> None:
+    errors = await service.send_notifications(recipients=[(cart.user_id, cart.id, 1)])
+
+    async with uow(autocommit=True) as uow_handle:
+        notification = await uow_handle.carts_notifications.retrieve(cart_id=cart.id)
+
+    assert errors == [None]
+    assert notification is not None
+    assert notification.sent_at is not None
+    http_session.request.assert_called_once()
+
+
+@pytest.mark.parametrize("http_response", [{"returns": {}}], indirect=True)
+async def test_duplicates_skipped(
+    service: AbandonedCartsService,
+    cart: Cart,
+    cart_config: CartConfig,
+    uow: TestUow,
+    http_response: AsyncMock,
+    http_session: MagicMock,
+) -> None:
+    sent = CartNotification.create_abandoned_cart_notification(
+        cart_id=cart.id,
+        text=cart_config.abandoned_cart_text,
+    )
+    sent.mark_sent()
+
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.carts_notifications.create(cart_notification=sent)
+
+    errors = await service.send_notifications(
+        recipients=[(cart.user_id, cart.id, 1), (cart.user_id, cart.id, 2)] * 2,
+    )
+
+    assert errors == [None] * 4
+    http_session.request.assert_called_once()
+
+
+@pytest.mark.parametrize("http_response", [{"returns": {}}], indirect=True)
+async def test_pending_skipped(
+    service: AbandonedCartsService,
+    cart: Cart,
+    cart_config: CartConfig,
+    uow: TestUow,
+    http_response: AsyncMock,
+    http_session: MagicMock,
+) -> None:
+    pending = CartNotification.create_abandoned_cart_notification(
+        cart_id=cart.id,
+        text=cart_config.abandoned_cart_text,
+    )
+
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.carts_notifications.create(cart_notification=pending)
+
+    errors = await service.send_notifications(recipients=[(cart.user_id, cart.id, 1)])
+
+    async with uow(autocommit=True) as uow_handle:
+        notification = await uow_handle.carts_notifications.retrieve(cart_id=cart.id)
+
+    assert errors == [None]
+    assert notification is not None
+    assert notification.id == pending.id
+    assert notification.sent_at is None
+    http_session.request.assert_not_called()
+
+
+@pytest.mark.parametrize("http_response", [{"returns": {}}], indirect=True)
+async def test_stale_reservation_taken_over(
+    service: AbandonedCartsService,
+    cart: Cart,
+    cart_config: CartConfig,
+    uow: TestUow,
+    http_response: AsyncMock,
+    http_session: MagicMock,
+) -> None:
+    stale = CartNotification.create_abandoned_cart_notification(
+        cart_id=cart.id,
+        text=cart_config.abandoned_cart_text,
+    )
+
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.carts_notifications.create(cart_notification=stale)
+        await uow_handle.carts_notifications.set_reserved_at(
+            cart_id=cart.id,
+            reserved_at=datetime.now() - timedelta(days=1),
+        )
+
+    errors = await service.send_notifications(recipients=[(cart.user_id, cart.id, 1)])
+
+    async with uow(autocommit=True) as uow_handle:
+        notification = await uow_handle.carts_notifications.retrieve(cart_id=cart.id)
+
+    assert errors == [None]
+    assert notification is not None
+    assert notification.id != stale.id
+    assert notification.sent_at is not None
+    http_session.request.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "http_response",
+    [{"raises": HttpTransportError(message="test", code=0)}],
+    indirect=True,
+)
+async def test_failed(
+    service: AbandonedCartsService,
+    cart: Cart,
+    uow: TestUow,
+    http_response: AsyncMock,
+    http_session: MagicMock,
+) -> None:
+    errors = await service.send_notifications(recipients=[(cart.user_id, cart.id, 1)])
+
+    async with uow(autocommit=True) as uow_handle:
+        notification = await uow_handle.carts_notifications.retrieve(cart_id=cart.id)
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], NotificationsClientError)
+    assert notification is None
+    http_session.request.assert_called_once()
@@ -5,6 +5,7 @@ from types import SimpleNamespace
 from unittest.mock import ANY, AsyncMock, MagicMock
 
 import pytest
+from pytest_mock import MockerFixture
 
 from app.app_layer.interfaces.auth_system.exceptions import InvalidAuthDataError
 from app.app_layer.interfaces.auth_system.system import IAuthSystem
@@ -14,11 +15,16 @@ from app.app_layer.interfaces.distributed_lock_system.exceptions import AlreadyL
 from app.app_layer.interfaces.distributed_lock_system.system import IDistributedLockSystem
 from app.app_layer.use_cases.cart_items.add_item import AddCartItemUseCase
 from app.app_layer.use_cases.cart_items.dto import AddItemToCartInputDTO
+from app.app_layer.use_cases.cart_items.limits import CartItemLimits
 from app.config import RedisLockConfig
 from app.domain.cart_config.entities import CartConfig
 from app.domain.cart_items.entities import CartItem
 from app.domain.carts.entities import Cart
-from app.domain.carts.exceptions import NotOwnedByUserError
+from app.domain.carts.exceptions import (
+    MaxItemsQtyLimitExceeded,
+    NotOwnedByUserError,
+    SpecificItemQtyLimitExceeded,
+)
 from app.domain.interfaces.repositories.carts.exceptions import CartNotFoundError
 from app.infra.http.transports.base import (
     HttpRequestInputDTO,
@@ -40,27 +46,29 @@ def use_case(
     products_client: IProductsClient,
     auth_system: IAuthSystem,
     distributed_lock_system: IDistributedLockSystem,
+    cart_item_limits: CartItemLimits,
 ) -> AddCartItemUseCase:
     return AddCartItemUseCase(
         uow=uow,
         products_client=products_client,
         auth_system=auth_system,
         distributed_lock_system=distributed_lock_system,
+        item_limits=cart_item_limits,
     )
 
 
 @pytest.fixture()
 async def cart_config(uow: TestUow) -> CartConfig:
-    async with uow(autocommit=True):
-        return await uow.carts.get_config()
+    async with uow(autocommit=True) as uow_handle:
+        return await uow_handle.carts.get_config()
 
 
 @pytest.fixture()
 async def cart(uow: TestUow, cart_config: CartConfig) -> Cart:
     cart = Cart.create(user_id=1, config=cart_config)
 
-    async with uow(autocommit=True):
-        await uow.carts.create(cart=cart)
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.carts.create(cart=cart)
 
     return cart
 
@@ -114,8 +122,8 @@ async def test_new_item_ok(
 ) -> None:
     result = await use_case.execute(data=dto)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert len(result.items) == len(cart.items) == 1
     assert result.items[0].id == cart.items[0].id == dto.id
@@ -180,13 +188,13 @@ async def test_existing_item_ok(
     cart_item: CartItem,
 ) -> None:
     cart.add_new_item(item=cart_item)
-    async with uow(autocommit=True):
-        await uow.items.add_item(item=cart_item)
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.items.add_item(item=cart_item)
 
     result = await use_case.execute(data=dto)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert len(result.items) == len(cart.items) == 1
     assert result.items[0].id == cart.items[0].id == dto.id
@@ -222,8 +230,8 @@ async def test_increase_item_qty_by_admin(
     cart_item: CartItem,
 ) -> None:
     cart.add_new_item(item=cart_item)
-    async with uow(autocommit=True):
-        await uow.items.add_item(item=cart_item)
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.items.add_item(item=cart_item)
 
     dto = AddItemToCartInputDTO(
         id=CART_ITEM_ID,
@@ -234,8 +242,8 @@ async def test_increase_item_qty_by_admin(
 
     result = await use_case.execute(data=dto)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert len(result.items) == len(cart.items) == 1
     assert result.items[0].id == cart.items[0].id == dto.id
@@ -359,6 +367,32 @@ async def test_not_owned_by_current_user(
     http_session.request.assert_not_called()
 
 
+@pytest.mark.parametrize(
+    "cart_item", [{"id": CART_ITEM_ID, "qty": 1, "is_weight": False}], indirect=True
+)
+async def test_existing_item_not_owned_by_current_user(
+    http_session: MagicMock,
+    uow: TestUow,
+    use_case: AddCartItemUseCase,
+    dto: AddItemToCartInputDTO,
+    cart: Cart,
+    cart_item: CartItem,
+) -> None:
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.items.add_item(item=cart_item)
+
+    with pytest.raises(NotOwnedByUserError, match=""):
+        await use_case.execute(
+            data=dto.model_copy(update={"auth_data": "Bearer customer.2"}),
+        )
+
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
+
+    assert cart.items[0].qty == cart_item.qty
+    http_session.request.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "http_response",
     [{"raises": HttpTransportError(message="test", code=123)}],
@@ -402,3 +436,132 @@ async def test_failed_products_client(
             integration_name=http_config.integration_name,
         ),
     )
+
+
+@pytest.mark.parametrize(
+    "cart_item", [{"id": CART_ITEM_ID, "qty": 1, "is_weight": False}], indirect=True
+)
+async def test_item_added_concurrently(
+    mocker: MockerFixture,
+    products_client: IProductsClient,
+    uow: TestUow,
+    use_case: AddCartItemUseCase,
+    dto: AddItemToCartInputDTO,
+    cart: Cart,
+    cart_item: CartItem,
+) -> None:
+    async def add_item_concurrently(item_id: int) -> SimpleNamespace:
+        async with uow(autocommit=True) as uow_handle:
+            await uow_handle.items.add_item(item=cart_item)
+
+        return SimpleNamespace(id=item_id, title=cart_item.name, price=cart_item.price)
+
+    mocker.patch.object(products_client, "get_product", side_effect=add_item_concurrently)
+
+    result = await use_case.execute(data=dto)
+
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
+
+    assert len(result.items) == len(cart.items) == 1
+    assert result.items[0].qty == cart.items[0].qty == cart_item.qty + dto.qty
+
+
+@pytest.mark.parametrize(
+    "cart_item", [{"id": CART_ITEM_ID, "qty": 1, "is_weight": False}], indirect=True
+)
+async def test_item_added_concurrently_limit_exceeded(
+    mocker: MockerFixture,
+    products_client: IProductsClient,
+    uow: TestUow,
+    use_case: AddCartItemUseCase,
+    cart: Cart,
+    cart_config: CartConfig,
+    cart_item: CartItem,
+) -> None:
+    async def add_item_concurrently(item_id: int) -> SimpleNamespace:
+        async with uow(autocommit=True) as uow_handle:
+            await uow_handle.items.add_item(item=cart_item)
+
+        return SimpleNamespace(id=item_id, title=cart_item.name, price=cart_item.price)
+
+    mocker.patch.object(products_client, "get_product", side_effect=add_item_concurrently)
+
+    with pytest.raises(MaxItemsQtyLimitExceeded):
+        await use_case.execute(
+            data=AddItemToCartInputDTO(
+                id=CART_ITEM_ID,
+                qty=Decimal(cart_config.max_items_qty),
+                auth_data="Bearer customer.1",
+                cart_id=cart.id,
+            ),
+        )
+
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
+
+    assert len(cart.items) == 1
+    assert cart.items[0].qty == cart_item.qty
+
+
+@pytest.mark.parametrize(
+    "cart_item", [{"id": CART_ITEM_ID, "qty": 1, "is_weight": False}], indirect=True
+)
+async def test_specific_item_qty_limit_exceeded(
+    redis: AsyncMock,
+    http_session: MagicMock,
+    uow: TestUow,
+    use_case: AddCartItemUseCase,
+    cart: Cart,
+    cart_config: CartConfig,
+    cart_item: CartItem,
+) -> None:
+    cart_config.limit_items_by_id = {CART_ITEM_ID: Decimal(2)}
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.items.add_item(item=cart_item)
+        await uow_handle.carts.update_config(cart_config=cart_config)
+
+    with pytest.raises(SpecificItemQtyLimitExceeded, match=""):
+        await use_case.execute(
+            data=AddItemToCartInputDTO(
+                id=CART_ITEM_ID,
+                qty=Decimal(2),
+                auth_data="Bearer customer.1",
+                cart_id=cart.id,
+            ),
+        )
+
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
+
+    assert cart.config.limit_items_by_id == {}
+    assert cart.items[0].qty == cart_item.qty
+    http_session.request.assert_not_called()
+
+
+@pytest.mark.parametrize("cart_item", [{"id": CART_ITEM_ID, "qty": 1}], indirect=True)
+async def test_config_version_pinned(
+    redis: AsyncMock,
+    uow: TestUow,
+    use_case: AddCartItemUseCase,
+    dto: AddItemToCartInputDTO,
+    cart: Cart,
+    cart_config: CartConfig,
+    cart_item: CartItem,
+) -> None:
+    pinned_version = cart.config_version
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.items.add_item(item=cart_item)
+        await uow_handle.carts.update_config(cart_config=cart_config)
+
+    result = await use_case.execute(data=dto)
+
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
+
+    assert (
+        result.config_version
+        == cart.config_version
+        == cart_config.version
+        != pinned_version
+    )
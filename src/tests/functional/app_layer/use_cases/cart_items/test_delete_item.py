@@ -51,8 +51,8 @@ async def test_ok(
 ) -> None:
     result = await use_case.execute(data=dto)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert len(result.items) == len(cart.items) == 0
     assert result.cost == cart.cost == Decimal(0)
@@ -81,8 +81,8 @@ async def test_delete_by_admin(
         )
     )
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert len(result.items) == len(cart.items) == 0
     assert result.cost == cart.cost == Decimal(0)
@@ -176,8 +176,8 @@ async def test_cart_item_not_found(
         result = await use_case.execute(data=dto)
         assert len(result.items) == 0
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert len(cart.items) == 0
 
@@ -7,6 +7,7 @@ from app.app_layer.interfaces.auth_system.system import IAuthSystem
 from app.app_layer.interfaces.distributed_lock_system.exceptions import AlreadyLockedError
 from app.app_layer.interfaces.distributed_lock_system.system import IDistributedLockSystem
 from app.app_layer.use_cases.cart_items.dto import UpdateCartItemInputDTO
+from app.app_layer.use_cases.cart_items.limits import CartItemLimits
 from app.app_layer.use_cases.cart_items.update_item import UpdateCartItemUseCase
 from app.config import RedisLockConfig
 from app.domain.cart_config.entities import CartConfig
@@ -23,11 +24,13 @@ def use_case(
     uow: TestUow,
     auth_system: IAuthSystem,
     distributed_lock_system: IDistributedLockSystem,
+    cart_item_limits: CartItemLimits,
 ) -> UpdateCartItemUseCase:
     return UpdateCartItemUseCase(
         uow=uow,
         auth_system=auth_system,
         distributed_lock_system=distributed_lock_system,
+        item_limits=cart_item_limits,
     )
 
 
@@ -54,8 +57,8 @@ async def test_ok(
 ) -> None:
     result = await use_case.execute(data=dto)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert len(result.items) == len(cart.items) == 1
     assert result.items[0].qty == cart.items[0].qty == dto.qty
@@ -88,8 +91,8 @@ async def test_update_by_admin(
 
     result = await use_case.execute(data=dto)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert len(result.items) == len(cart.items) == 1
     assert result.items[0].qty == cart.items[0].qty == dto.qty
@@ -185,8 +188,8 @@ async def test_cart_item_not_found(
     dto: UpdateCartItemInputDTO,
     uow: TestUow,
 ) -> None:
-    async with uow(autocommit=True):
-        await uow.items.delete_item(cart=cart, item_id=dto.item_id)
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.items.delete_item(cart=cart, item_id=dto.item_id)
 
     with pytest.raises(CartItemDoesNotExistError, match=""):
         await use_case.execute(data=dto)
@@ -1,8 +1,14 @@
+from unittest.mock import AsyncMock
+
 import pytest
 
+from app.app_layer.interfaces.active_carts_cache.cache import IActiveCartsCache
+from app.app_layer.interfaces.active_carts_cache.dto import ActiveCartDTO
 from app.app_layer.interfaces.auth_system.exceptions import InvalidAuthDataError
 from app.app_layer.interfaces.auth_system.system import IAuthSystem
 from app.app_layer.use_cases.carts.create_cart import CreateCartUseCase
+from app.config import ActiveCartsCacheConfig
+from app.domain.cart_items.entities import CartItem
 from app.domain.carts.entities import Cart
 from app.domain.carts.value_objects import CartStatusEnum
 from app.domain.interfaces.repositories.carts.exceptions import (
@@ -17,19 +23,29 @@ def auth_data() -> str:
 
 
 @pytest.fixture()
-def use_case(uow: TestUow, auth_system: IAuthSystem) -> CreateCartUseCase:
-    return CreateCartUseCase(uow=uow, auth_system=auth_system)
+def use_case(
+    uow: TestUow,
+    auth_system: IAuthSystem,
+    active_carts_cache: IActiveCartsCache,
+) -> CreateCartUseCase:
+    return CreateCartUseCase(
+        uow=uow,
+        auth_system=auth_system,
+        active_carts_cache=active_carts_cache,
+    )
 
 
 async def test_ok(
+    redis: AsyncMock,
+    active_carts_cache_config: ActiveCartsCacheConfig,
     use_case: CreateCartUseCase,
     uow: TestUow,
     auth_data: str,
 ) -> None:
     result = await use_case.create_by_auth_data(auth_data=auth_data)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=result.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=result.id)
 
     assert result.created_at == cart.created_at
     assert result.id == cart.id
@@ -43,6 +59,15 @@ async def test_ok(
     assert result.coupon is None
     assert cart.coupon is None
 
+    redis.set.assert_awaited_once_with(
+        f"active-cart-{cart.user_id}",
+        ActiveCartDTO(
+            cart_id=cart.id,
+            config_version=cart.config.version,
+        ).model_dump_json(),
+        ex=active_carts_cache_config.ttl_sec,
+    )
+
 
 @pytest.mark.parametrize("cart", [{"user_id": 1}], indirect=True)
 async def test_already_exists(
@@ -54,6 +79,46 @@ async def test_already_exists(
         await use_case.create_by_auth_data(auth_data=auth_data)
 
 
+async def test_get_or_create_new(
+    use_case: CreateCartUseCase,
+    uow: TestUow,
+    auth_data: str,
+) -> None:
+    result = await use_case.create_by_auth_data(auth_data=auth_data, get_or_create=True)
+
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=result.id)
+
+    assert result.id == cart.id
+    assert result.user_id == cart.user_id == 1
+    assert result.status == cart.status == CartStatusEnum.OPENED
+
+
+@pytest.mark.parametrize("cart", [{"user_id": 1}], indirect=True)
+async def test_get_or_create_existing(
+    redis: AsyncMock,
+    active_carts_cache_config: ActiveCartsCacheConfig,
+    use_case: CreateCartUseCase,
+    auth_data: str,
+    cart: Cart,
+    cart_item: CartItem,
+) -> None:
+    result = await use_case.create_by_auth_data(auth_data=auth_data, get_or_create=True)
+
+    assert result.id == cart.id
+    assert result.status == cart.status
+    assert [item.id for item in result.items] == [cart_item.id]
+
+    redis.set.assert_awaited_once_with(
+        f"active-cart-{cart.user_id}",
+        ActiveCartDTO(
+            cart_id=cart.id,
+            config_version=cart.config.version,
+        ).model_dump_json(),
+        ex=active_carts_cache_config.ttl_sec,
+    )
+
+
 async def test_invalid_auth_data(use_case: CreateCartUseCase) -> None:
     with pytest.raises(InvalidAuthDataError, match=""):
         await use_case.create_by_auth_data(auth_data="INVALID AUTH DATA")
@@ -1,6 +1,7 @@
 import pytest
 from _pytest.fixtures import SubRequest
 
+from app.app_layer.interfaces.active_carts_cache.cache import IActiveCartsCache
 from app.app_layer.interfaces.auth_system.exceptions import (
     InvalidAuthDataError,
     OperationForbiddenError,
@@ -18,8 +19,16 @@ from tests.utils import fake
 
 
 @pytest.fixture()
-def use_case(uow: TestUow, auth_system: IAuthSystem) -> CreateCartUseCase:
-    return CreateCartUseCase(uow=uow, auth_system=auth_system)
+def use_case(
+    uow: TestUow,
+    auth_system: IAuthSystem,
+    active_carts_cache: IActiveCartsCache,
+) -> CreateCartUseCase:
+    return CreateCartUseCase(
+        uow=uow,
+        auth_system=auth_system,
+        active_carts_cache=active_carts_cache,
+    )
 
 
 @pytest.fixture()
@@ -42,8 +51,8 @@ async def test_ok(
 ) -> None:
     result = await use_case.create_by_user_id(data=dto)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=result.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=result.id)
 
     assert result.created_at == cart.created_at
     assert result.id == cart.id
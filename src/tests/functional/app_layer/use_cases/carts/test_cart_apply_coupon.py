@@ -78,8 +78,8 @@ async def test_ok(
 ) -> None:
     result = await use_case.execute(data=dto)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert cart.coupon.cart == cart
     assert result.coupon.coupon_id == cart.coupon.coupon_id == dto.coupon_name
@@ -161,8 +161,8 @@ async def test_apply_by_admin(
 
     result = await use_case.execute(data=dto)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert cart.coupon.cart == cart
     assert result.coupon.coupon_id == cart.coupon.coupon_id == dto.coupon_name
@@ -226,8 +226,8 @@ async def test_cart_already_locked_for_updates(
     with pytest.raises(AlreadyLockedError, match=""):
         await use_case.execute(data=dto)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert cart.coupon is None
 
@@ -257,8 +257,8 @@ async def test_invalid_auth_data(
             ),
         )
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert cart.coupon is None
 
@@ -314,8 +314,8 @@ async def test_not_owned_by_current_user(
             ),
         )
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert cart.coupon is None
 
@@ -353,8 +353,8 @@ async def test_failed_coupons_client(
     with pytest.raises(CouponsClientError, match="123 - test"):
         await use_case.execute(data=dto)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert cart.coupon is None
 
@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.app_layer.use_cases.carts.cart_archive import ArchiveCartsUseCase
+from app.config import CartArchiveConfig
+from app.domain.cart_config.entities import CartConfig
+from app.domain.cart_items.dto import ItemDTO
+from app.domain.cart_items.entities import CartItem
+from app.domain.carts.dto import CartDTO
+from app.domain.carts.entities import Cart
+from app.domain.carts.value_objects import CartStatusEnum
+from app.domain.interfaces.repositories.carts.exceptions import CartNotFoundError
+from tests.environment.unit_of_work import TestUow
+from tests.utils import fake
+
+
+@pytest.fixture()
+def config() -> CartArchiveConfig:
+    return CartArchiveConfig(older_than_days=30, batch_size=2, max_batches=10)
+
+
+@pytest.fixture()
+def use_case(uow: TestUow, config: CartArchiveConfig) -> ArchiveCartsUseCase:
+    return ArchiveCartsUseCase(uow=uow, config=config)
+
+
+async def _create_cart(
+    uow: TestUow,
+    cart_config: CartConfig,
+    status: CartStatusEnum,
+    created_at: datetime,
+) -> Cart:
+    cart = Cart(
+        data=CartDTO(
+            id=fake.cryptographic.uuid_object(),
+            user_id=fake.numeric.integer_number(start=1),
+            status=status,
+            created_at=created_at,
+        ),
+        items=[],
+        config=cart_config,
+    )
+    item = CartItem(
+        data=ItemDTO(
+            id=fake.numeric.integer_number(start=1),
+            name=fake.text.word(),
+            qty=Decimal(1),
+            price=Decimal("9.99"),
+            is_weight=False,
+            cart_id=cart.id,
+        ),
+    )
+
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.carts.update_config(cart_config=cart_config)
+        await uow_handle.carts.bulk_create(carts=[cart], updated_at=created_at)
+        await uow_handle.items.add_item(item=item)
+
+    return cart
+
+
+async def test_ok(
+    use_case: ArchiveCartsUseCase,
+    config: CartArchiveConfig,
+    cart_config: CartConfig,
+    uow: TestUow,
+) -> None:
+    old = datetime.now() - timedelta(days=config.older_than_days + 1)
+    archived_carts = [
+        await _create_cart(
+            uow=uow, cart_config=cart_config, status=status, created_at=old
+        )
+        for status in (
+            CartStatusEnum.COMPLETED,
+            CartStatusEnum.DEACTIVATED,
+            CartStatusEnum.COMPLETED,
+        )
+    ]
+    kept_carts = [
+        await _create_cart(
+            uow=uow,
+            cart_config=cart_config,
+            status=CartStatusEnum.OPENED,
+            created_at=old,
+        ),
+        await _create_cart(
+            uow=uow,
+            cart_config=cart_config,
+            status=CartStatusEnum.COMPLETED,
+            created_at=datetime.now(),
+        ),
+    ]
+
+    result = await use_case.execute()
+
+    assert result.archived_qty == len(archived_carts)
+    assert result.batches_qty == 2
+
+    async with uow(autocommit=True) as uow_handle:
+        for cart in archived_carts:
+            with pytest.raises(CartNotFoundError):
+                await uow_handle.carts.get_by_id(cart_id=cart.id)
+
+            archived = await uow_handle.carts.get_archived(cart_id=cart.id)
+            assert archived is not None
+            assert archived.status == cart.status
+            assert len(archived.data["items"]) == 1
+            assert archived.data["coupon"] is None
+            assert archived.data["notifications"] == []
+
+        for cart in kept_carts:
+            assert await uow_handle.carts.get_by_id(cart_id=cart.id)
+            assert await uow_handle.carts.get_archived(cart_id=cart.id) is None
+
+
+async def test_nothing_to_archive(use_case: ArchiveCartsUseCase) -> None:
+    result = await use_case.execute()
+
+    assert result.archived_qty == 0
+    assert result.batches_qty == 1
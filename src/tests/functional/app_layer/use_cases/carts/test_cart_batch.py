@@ -0,0 +1,110 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pytest_asyncio.plugin import SubRequest
+from pytest_mock import MockerFixture
+
+from app.app_layer.interfaces.distributed_lock_system.exceptions import AlreadyLockedError
+from app.app_layer.interfaces.distributed_lock_system.system import IDistributedLockSystem
+from app.app_layer.use_cases.carts.cart_batch import (
+    BatchCompleteCartUseCase,
+    BatchLockCartUseCase,
+    BatchUnlockCartUseCase,
+)
+from app.domain.cart_config.entities import CartConfig
+from app.domain.carts.entities import Cart
+from app.domain.carts.exceptions import ChangeStatusError
+from app.domain.carts.value_objects import CartStatusEnum
+from app.domain.interfaces.repositories.carts.exceptions import CartNotFoundError
+from tests.environment.unit_of_work import TestUow
+from tests.utils import fake
+
+
+@pytest.fixture()
+def pipeline(request: SubRequest, mocker: MockerFixture, redis: AsyncMock) -> MagicMock:
+    acquired = getattr(request, "param", True)
+
+    pipe = mocker.MagicMock()
+    pipe.execute = mocker.AsyncMock(
+        side_effect=lambda: [acquired] * len(pipe.set.call_args_list),
+    )
+    redis.pipeline.return_value.__aenter__.return_value = pipe
+
+    return pipe
+
+
+@pytest.mark.parametrize("cart_config", [{"min_cost_for_checkout": 0}], indirect=True)
+async def test_lock_ok(
+    pipeline: MagicMock,
+    uow: TestUow,
+    distributed_lock_system: IDistributedLockSystem,
+    cart: Cart,
+    cart_config: CartConfig,
+) -> None:
+    use_case = BatchLockCartUseCase(
+        uow=uow, distributed_lock_system=distributed_lock_system
+    )
+    missing_cart_id = fake.cryptographic.uuid_object()
+
+    results = await use_case.execute(cart_ids=[cart.id, missing_cart_id, cart.id])
+
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
+
+    assert [result.cart_id for result in results] == [cart.id, missing_cart_id]
+    assert results[0].error is None
+    assert results[0].cart is not None
+    assert results[0].cart.status == cart.status == CartStatusEnum.LOCKED
+    assert isinstance(results[1].error, CartNotFoundError)
+    assert [call.args[0] for call in pipeline.set.call_args_list] == [
+        f"cart-lock-{cart.id}",
+        f"cart-lock-{missing_cart_id}",
+    ]
+
+
+@pytest.mark.parametrize("pipeline", [None], indirect=True)
+async def test_lock_already_locked(
+    pipeline: MagicMock,
+    uow: TestUow,
+    distributed_lock_system: IDistributedLockSystem,
+    cart: Cart,
+) -> None:
+    use_case = BatchLockCartUseCase(
+        uow=uow, distributed_lock_system=distributed_lock_system
+    )
+
+    results = await use_case.execute(cart_ids=[cart.id])
+
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
+
+    assert isinstance(results[0].error, AlreadyLockedError)
+    assert cart.status == CartStatusEnum.OPENED
+
+
+async def test_unlock_and_complete(
+    pipeline: MagicMock,
+    uow: TestUow,
+    distributed_lock_system: IDistributedLockSystem,
+    cart: Cart,
+) -> None:
+    cart.status = CartStatusEnum.LOCKED
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.carts.update(cart=cart)
+
+    complete_use_case = BatchCompleteCartUseCase(
+        uow=uow, distributed_lock_system=distributed_lock_system
+    )
+    unlock_use_case = BatchUnlockCartUseCase(
+        uow=uow, distributed_lock_system=distributed_lock_system
+    )
+
+    completed = await complete_use_case.execute(cart_ids=[cart.id])
+    unlocked = await unlock_use_case.execute(cart_ids=[cart.id])
+
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
+
+    assert completed[0].cart is not None
+    assert completed[0].cart.status == cart.status == CartStatusEnum.COMPLETED
+    assert isinstance(unlocked[0].error, ChangeStatusError)
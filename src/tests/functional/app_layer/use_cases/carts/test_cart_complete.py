@@ -2,6 +2,7 @@ from unittest.mock import ANY, AsyncMock
 
 import pytest
 
+from app.app_layer.interfaces.active_carts_cache.cache import IActiveCartsCache
 from app.app_layer.interfaces.distributed_lock_system.exceptions import AlreadyLockedError
 from app.app_layer.interfaces.distributed_lock_system.system import IDistributedLockSystem
 from app.app_layer.use_cases.carts.cart_complete import CompleteCartUseCase
@@ -18,10 +19,12 @@ from tests.utils import fake
 def use_case(
     uow: TestUow,
     distributed_lock_system: IDistributedLockSystem,
+    active_carts_cache: IActiveCartsCache,
 ) -> CompleteCartUseCase:
     return CompleteCartUseCase(
         uow=uow,
         distributed_lock_system=distributed_lock_system,
+        active_carts_cache=active_carts_cache,
     )
 
 
@@ -35,13 +38,13 @@ async def test_ok(
     uow: TestUow,
 ) -> None:
     cart.lock()
-    async with uow(autocommit=True):
-        cart = await uow.carts.update(cart=cart)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.update(cart=cart)
 
     result = await use_case.execute(cart_id=cart.id)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert result.status == cart.status == CartStatusEnum.COMPLETED
 
@@ -51,6 +54,7 @@ async def test_ok(
         nx=True,
         px=redis_lock_config.ttl_sec * 1000,
     )
+    redis.delete.assert_awaited_once_with(f"active-cart-{cart.user_id}")
 
 
 @pytest.mark.parametrize("redis", [{"returns": False}], indirect=True)
@@ -64,8 +68,8 @@ async def test_cart_already_locked_for_updates(
     with pytest.raises(AlreadyLockedError, match=""):
         await use_case.execute(cart_id=cart.id)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert cart.status != CartStatusEnum.COMPLETED
 
@@ -75,6 +79,7 @@ async def test_cart_already_locked_for_updates(
         nx=True,
         px=redis_lock_config.ttl_sec * 1000,
     )
+    redis.delete.assert_not_awaited()
 
 
 async def test_cart_not_found(
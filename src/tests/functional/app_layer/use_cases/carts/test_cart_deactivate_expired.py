@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.app_layer.use_cases.carts.cart_deactivate_expired import (
+    DeactivateExpiredCartsUseCase,
+)
+from app.config import CartExpiryConfig
+from app.domain.cart_config.entities import CartConfig
+from app.domain.carts.dto import CartDTO
+from app.domain.carts.entities import Cart
+from app.domain.carts.value_objects import CartStatusEnum
+from tests.environment.unit_of_work import TestUow
+from tests.utils import fake
+
+
+@pytest.fixture()
+def config() -> CartExpiryConfig:
+    return CartExpiryConfig(idle_hours=24, batch_size=2, max_batches=10)
+
+
+@pytest.fixture()
+def use_case(uow: TestUow, config: CartExpiryConfig) -> DeactivateExpiredCartsUseCase:
+    return DeactivateExpiredCartsUseCase(uow=uow, config=config)
+
+
+async def _create_carts(
+    uow: TestUow,
+    cart_config: CartConfig,
+    qty: int,
+    updated_at: datetime,
+) -> list[Cart]:
+    carts = [
+        Cart(
+            data=CartDTO(
+                id=fake.cryptographic.uuid_object(),
+                user_id=fake.numeric.integer_number(start=1),
+                status=CartStatusEnum.OPENED,
+                created_at=updated_at,
+            ),
+            items=[],
+            config=cart_config,
+        )
+        for _ in range(qty)
+    ]
+
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.carts.update_config(cart_config=cart_config)
+        await uow_handle.carts.bulk_create(carts=carts, updated_at=updated_at)
+
+    return carts
+
+
+async def test_ok(
+    use_case: DeactivateExpiredCartsUseCase,
+    config: CartExpiryConfig,
+    cart_config: CartConfig,
+    uow: TestUow,
+) -> None:
+    expired_carts = await _create_carts(
+        uow=uow,
+        cart_config=cart_config,
+        qty=3,
+        updated_at=datetime.now() - timedelta(hours=config.idle_hours + 1),
+    )
+    fresh_carts = await _create_carts(
+        uow=uow,
+        cart_config=cart_config,
+        qty=1,
+        updated_at=datetime.now(),
+    )
+
+    result = await use_case.execute()
+
+    async with uow(autocommit=True) as uow_handle:
+        expired_carts = [
+            await uow_handle.carts.get_by_id(cart_id=cart.id) for cart in expired_carts
+        ]
+        fresh_carts = [
+            await uow_handle.carts.get_by_id(cart_id=cart.id) for cart in fresh_carts
+        ]
+
+    assert result.deactivated_qty == len(expired_carts)
+    assert result.batches_qty == 2
+    assert all(cart.status == CartStatusEnum.DEACTIVATED for cart in expired_carts)
+    assert all(cart.status == CartStatusEnum.OPENED for cart in fresh_carts)
+
+
+async def test_nothing_to_deactivate(use_case: DeactivateExpiredCartsUseCase) -> None:
+    result = await use_case.execute()
+
+    assert result.deactivated_qty == 0
+    assert result.batches_qty == 1
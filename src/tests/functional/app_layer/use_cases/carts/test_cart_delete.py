@@ -2,6 +2,7 @@ from unittest.mock import ANY, AsyncMock
 
 import pytest
 
+from app.app_layer.interfaces.active_carts_cache.cache import IActiveCartsCache
 from app.app_layer.interfaces.auth_system.exceptions import InvalidAuthDataError
 from app.app_layer.interfaces.auth_system.system import IAuthSystem
 from app.app_layer.interfaces.distributed_lock_system.exceptions import AlreadyLockedError
@@ -23,11 +24,13 @@ def use_case(
     uow: TestUow,
     auth_system: IAuthSystem,
     distributed_lock_system: IDistributedLockSystem,
+    active_carts_cache: IActiveCartsCache,
 ) -> CartDeleteUseCase:
     return CartDeleteUseCase(
         uow=uow,
         auth_system=auth_system,
         distributed_lock_system=distributed_lock_system,
+        active_carts_cache=active_carts_cache,
     )
 
 
@@ -47,8 +50,8 @@ async def test_ok(
 ) -> None:
     result = await use_case.execute(data=dto)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=cart.id)
 
     assert result.status == cart.status == CartStatusEnum.DEACTIVATED
 
@@ -58,6 +61,7 @@ async def test_ok(
         nx=True,
         px=redis_lock_config.ttl_sec * 1000,
     )
+    redis.delete.assert_awaited_once_with(f"active-cart-{cart.user_id}")
 
 
 async def test_deactivate_by_admin(
@@ -74,8 +78,8 @@ async def test_deactivate_by_admin(
         )
     )
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=cart.id)
 
     assert result.status == cart.status == CartStatusEnum.DEACTIVATED
 
@@ -99,8 +103,8 @@ async def test_cart_already_locked_for_updates(
     with pytest.raises(AlreadyLockedError, match=""):
         await use_case.execute(data=dto)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=cart.id)
 
     assert cart.status != CartStatusEnum.DEACTIVATED
 
@@ -110,6 +114,7 @@ async def test_cart_already_locked_for_updates(
         nx=True,
         px=redis_lock_config.ttl_sec * 1000,
     )
+    redis.delete.assert_not_awaited()
 
 
 async def test_invalid_auth_data(
@@ -127,8 +132,8 @@ async def test_invalid_auth_data(
             ),
         )
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=cart.id)
 
     assert cart.status != CartStatusEnum.DEACTIVATED
 
@@ -178,8 +183,8 @@ async def test_not_owned_by_current_user(
             ),
         )
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=cart.id)
 
     assert cart.status != CartStatusEnum.DEACTIVATED
 
@@ -41,8 +41,8 @@ async def carts(uow: TestUow, cart_config: CartConfig, page_size: int) -> list[C
         for _ in range(carts_qty)
     ]
 
-    async with uow(autocommit=True):
-        await uow.carts.bulk_create(carts=carts)
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.carts.bulk_create(carts=carts)
 
     return carts
 
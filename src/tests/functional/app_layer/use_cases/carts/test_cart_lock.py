@@ -30,8 +30,8 @@ async def test_ok(
 ) -> None:
     result = await use_case.execute(cart_id=cart.id)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert result.status == cart.status == CartStatusEnum.LOCKED
 
@@ -54,8 +54,8 @@ async def test_cart_already_locked_for_updates(
     with pytest.raises(AlreadyLockedError, match=""):
         await use_case.execute(cart_id=cart.id)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert cart.status != CartStatusEnum.LOCKED
 
@@ -21,8 +21,8 @@ from tests.utils import fake
 async def cart(cart: Cart, coupon: CartCoupon, uow: TestUow) -> Cart:
     cart.set_coupon(coupon=coupon)
 
-    async with uow(autocommit=True):
-        await uow.cart_coupons.create(cart_coupon=coupon)
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.cart_coupons.create(cart_coupon=coupon)
 
     return cart
 
@@ -56,9 +56,9 @@ async def test_ok(
 ) -> None:
     result = await use_case.execute(data=dto)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=cart.id)
-        coupon = await uow.cart_coupons.retrieve(cart=cart)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=cart.id)
+        coupon = await uow_handle.cart_coupons.retrieve(cart=cart)
 
     assert coupon is None
     assert result.coupon is None
@@ -85,9 +85,9 @@ async def test_coupon_not_found(
         result = await use_case.execute(data=dto)
         assert result.coupon is None
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=cart.id)
-        coupon = await uow.cart_coupons.retrieve(cart=cart)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=cart.id)
+        coupon = await uow_handle.cart_coupons.retrieve(cart=cart)
 
     assert coupon is None
     assert cart.coupon is None
@@ -114,9 +114,9 @@ async def test_remove_coupon_by_admin(
         )
     )
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=cart.id)
-        coupon = await uow.cart_coupons.retrieve(cart=cart)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=cart.id)
+        coupon = await uow_handle.cart_coupons.retrieve(cart=cart)
 
     assert coupon is None
     assert result.coupon is None
@@ -142,9 +142,9 @@ async def test_cart_already_locked_for_updates(
     with pytest.raises(AlreadyLockedError, match=""):
         await use_case.execute(data=dto)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=cart.id)
-        coupon = await uow.cart_coupons.retrieve(cart=cart)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=cart.id)
+        coupon = await uow_handle.cart_coupons.retrieve(cart=cart)
 
     assert coupon is not None
     assert cart.coupon is not None
@@ -172,9 +172,9 @@ async def test_invalid_auth_data(
             ),
         )
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=cart.id)
-        coupon = await uow.cart_coupons.retrieve(cart=cart)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=cart.id)
+        coupon = await uow_handle.cart_coupons.retrieve(cart=cart)
 
     assert coupon is not None
     assert cart.coupon is not None
@@ -225,9 +225,9 @@ async def test_not_owned_by_current_user(
             ),
         )
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=cart.id)
-        coupon = await uow.cart_coupons.retrieve(cart=cart)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=cart.id)
+        coupon = await uow_handle.cart_coupons.retrieve(cart=cart)
 
     assert coupon is not None
     assert cart.coupon is not None
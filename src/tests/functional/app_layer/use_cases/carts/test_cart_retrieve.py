@@ -1,20 +1,35 @@
+from unittest.mock import AsyncMock
+
 import pytest
 
+from app.app_layer.interfaces.active_carts_cache.cache import IActiveCartsCache
+from app.app_layer.interfaces.active_carts_cache.dto import ActiveCartDTO
 from app.app_layer.interfaces.auth_system.exceptions import InvalidAuthDataError
 from app.app_layer.interfaces.auth_system.system import IAuthSystem
 from app.app_layer.use_cases.carts.cart_retrieve import CartRetrieveUseCase
 from app.app_layer.use_cases.carts.dto import CartRetrieveInputDTO, ItemOutputDTO
+from app.config import ActiveCartsCacheConfig
+from app.domain.cart_coupons.entities import CartCoupon
 from app.domain.cart_items.entities import CartItem
 from app.domain.carts.entities import Cart
 from app.domain.carts.exceptions import NotOwnedByUserError
+from app.domain.carts.value_objects import CartStatusEnum
 from app.domain.interfaces.repositories.carts.exceptions import CartNotFoundError
 from tests.environment.unit_of_work import TestUow
 from tests.utils import fake
 
 
 @pytest.fixture()
-def use_case(uow: TestUow, auth_system: IAuthSystem) -> CartRetrieveUseCase:
-    return CartRetrieveUseCase(uow=uow, auth_system=auth_system)
+def use_case(
+    uow: TestUow,
+    auth_system: IAuthSystem,
+    active_carts_cache: IActiveCartsCache,
+) -> CartRetrieveUseCase:
+    return CartRetrieveUseCase(
+        uow=uow,
+        auth_system=auth_system,
+        active_carts_cache=active_carts_cache,
+    )
 
 
 @pytest.fixture()
@@ -22,6 +37,12 @@ def dto(cart: Cart, cart_item: CartItem, auth_data: str) -> CartRetrieveInputDTO
     return CartRetrieveInputDTO(auth_data=auth_data, cart_id=cart.id)
 
 
+@pytest.mark.parametrize(
+    "uow",
+    [{"aggregated_cart_fetch": False}, {"aggregated_cart_fetch": True}],
+    ids=["joined", "aggregated"],
+    indirect=True,
+)
 @pytest.mark.parametrize("cart", [{"user_id": 1}], indirect=True)
 async def test_ok(
     use_case: CartRetrieveUseCase,
@@ -48,6 +69,26 @@ async def test_ok(
     assert result.coupon == cart.coupon
 
 
+@pytest.mark.parametrize("uow", [{"aggregated_cart_fetch": True}], indirect=True)
+async def test_aggregated_with_coupon(
+    use_case: CartRetrieveUseCase,
+    dto: CartRetrieveInputDTO,
+    cart: Cart,
+    coupon: CartCoupon,
+    uow: TestUow,
+) -> None:
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.cart_coupons.create(cart_coupon=coupon)
+
+    result = await use_case.execute(data=dto)
+
+    assert result.id == cart.id
+    assert result.coupon is not None
+    assert result.coupon.coupon_id == coupon.coupon_id
+    assert result.coupon.min_cart_cost == coupon.min_cart_cost
+    assert result.coupon.discount_abs == coupon.discount_abs
+
+
 async def test_retrieve_by_admin(
     use_case: CartRetrieveUseCase,
     cart: Cart,
@@ -91,6 +132,12 @@ async def test_invalid_auth_data(
         )
 
 
+@pytest.mark.parametrize(
+    "uow",
+    [{"aggregated_cart_fetch": False}, {"aggregated_cart_fetch": True}],
+    ids=["joined", "aggregated"],
+    indirect=True,
+)
 async def test_cart_not_found(use_case: CartRetrieveUseCase) -> None:
     cart_id = fake.cryptographic.uuid_object()
 
@@ -115,3 +162,118 @@ async def test_not_owned_by_current_user(
                 cart_id=cart.id,
             ),
         )
+
+
+@pytest.mark.parametrize("cart", [{"user_id": 1}], indirect=True)
+async def test_active_cache_miss(
+    redis: AsyncMock,
+    active_carts_cache_config: ActiveCartsCacheConfig,
+    use_case: CartRetrieveUseCase,
+    auth_data: str,
+    cart: Cart,
+) -> None:
+    result = await use_case.execute_active(auth_data=auth_data)
+
+    assert result.id == cart.id
+    assert len(result.items) == len(cart.items)
+
+    redis.get.assert_awaited_once_with(f"active-cart-{cart.user_id}")
+    redis.set.assert_awaited_once_with(
+        f"active-cart-{cart.user_id}",
+        ActiveCartDTO(
+            cart_id=cart.id,
+            config_version=cart.config.version,
+        ).model_dump_json(),
+        ex=active_carts_cache_config.ttl_sec,
+    )
+
+
+@pytest.mark.parametrize("cart", [{"user_id": 1}], indirect=True)
+async def test_active_cache_hit(
+    redis: AsyncMock,
+    use_case: CartRetrieveUseCase,
+    auth_data: str,
+    cart: Cart,
+) -> None:
+    redis.get.return_value = (
+        ActiveCartDTO(cart_id=cart.id, config_version=cart.config.version)
+        .model_dump_json()
+        .encode()
+    )
+
+    result = await use_case.execute_active(auth_data=auth_data)
+
+    assert result.id == cart.id
+    assert len(result.items) == len(cart.items)
+
+    redis.set.assert_not_awaited()
+    redis.delete.assert_not_awaited()
+
+
+@pytest.mark.parametrize("cart", [{"user_id": 1}], indirect=True)
+async def test_active_stale_cache_entry(
+    redis: AsyncMock,
+    active_carts_cache_config: ActiveCartsCacheConfig,
+    use_case: CartRetrieveUseCase,
+    auth_data: str,
+    cart: Cart,
+    uow: TestUow,
+) -> None:
+    cart.deactivate()
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.carts.update(cart=cart)
+
+    active_cart = Cart.create(user_id=cart.user_id, config=cart.config)
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.carts.create(cart=active_cart)
+
+    redis.get.return_value = (
+        ActiveCartDTO(cart_id=cart.id, config_version=cart.config.version)
+        .model_dump_json()
+        .encode()
+    )
+
+    result = await use_case.execute_active(auth_data=auth_data)
+
+    assert result.id == active_cart.id
+    assert result.status == CartStatusEnum.OPENED
+
+    redis.delete.assert_awaited_once_with(f"active-cart-{cart.user_id}")
+    redis.set.assert_awaited_once_with(
+        f"active-cart-{cart.user_id}",
+        ActiveCartDTO(
+            cart_id=active_cart.id,
+            config_version=active_cart.config.version,
+        ).model_dump_json(),
+        ex=active_carts_cache_config.ttl_sec,
+    )
+
+
+@pytest.mark.parametrize("cart", [{"user_id": 1}], indirect=True)
+async def test_active_cache_entry_of_unknown_config(
+    redis: AsyncMock,
+    use_case: CartRetrieveUseCase,
+    auth_data: str,
+    cart: Cart,
+) -> None:
+    redis.get.return_value = (
+        ActiveCartDTO(cart_id=cart.id, config_version=2**31 - 1)
+        .model_dump_json()
+        .encode()
+    )
+
+    result = await use_case.execute_active(auth_data=auth_data)
+
+    assert result.id == cart.id
+
+    redis.delete.assert_awaited_once_with(f"active-cart-{cart.user_id}")
+
+
+async def test_active_cart_not_found(
+    redis: AsyncMock,
+    use_case: CartRetrieveUseCase,
+) -> None:
+    with pytest.raises(CartNotFoundError, match=""):
+        await use_case.execute_active(auth_data="Bearer customer.1")
+
+    redis.set.assert_not_awaited()
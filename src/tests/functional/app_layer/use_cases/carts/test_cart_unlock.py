@@ -32,13 +32,13 @@ async def test_ok(
     uow: TestUow,
 ) -> None:
     cart.lock()
-    async with uow(autocommit=True):
-        cart = await uow.carts.update(cart=cart)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.update(cart=cart)
 
     result = await use_case.execute(cart_id=cart.id)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert result.status == cart.status == CartStatusEnum.OPENED
 
@@ -61,8 +61,8 @@ async def test_cart_already_locked_for_updates(
     with pytest.raises(AlreadyLockedError, match=""):
         await use_case.execute(cart_id=cart.id)
 
-    async with uow(autocommit=True):
-        cart_in_db = await uow.carts.retrieve(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart_in_db = await uow_handle.carts.retrieve(cart_id=cart.id)
 
     assert cart.status == cart_in_db.status
 
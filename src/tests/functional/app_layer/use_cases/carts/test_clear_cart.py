@@ -46,8 +46,8 @@ async def test_ok(
 ) -> None:
     result = await use_case.execute(data=dto)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=cart.id)
 
     assert len(result.items) == len(cart.items) == 0
 
@@ -73,8 +73,8 @@ async def test_clear_by_admin(
         )
     )
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=cart.id)
 
     assert len(result.items) == len(cart.items) == 0
 
@@ -98,8 +98,8 @@ async def test_cart_already_locked_for_updates(
     with pytest.raises(AlreadyLockedError, match=""):
         await use_case.execute(data=dto)
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=cart.id)
 
     assert len(cart.items) > 0
 
@@ -126,8 +126,8 @@ async def test_invalid_auth_data(
             ),
         )
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=cart.id)
 
     assert len(cart.items) > 0
 
@@ -177,8 +177,8 @@ async def test_not_owned_by_current_user(
             ),
         )
 
-    async with uow(autocommit=True):
-        cart = await uow.carts.get_by_id(cart_id=cart.id)
+    async with uow(autocommit=True) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=cart.id)
 
     assert len(cart.items) > 0
 
@@ -15,10 +15,10 @@ async def cart(
 ) -> Cart:
     cart.add_new_item(item=cart_item)
 
-    async with uow(autocommit=True):
-        await uow.carts.update_config(cart_config=cart_config)
-        await uow.carts.create(cart=cart)
-        await uow.items.add_item(item=cart_item)
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.carts.update_config(cart_config=cart_config)
+        await uow_handle.carts.create(cart=cart)
+        await uow_handle.items.add_item(item=cart_item)
 
     return cart
 
@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 import pytest
 from _pytest.fixtures import SubRequest
 
@@ -5,22 +7,28 @@ from app.app_layer.interfaces.auth_system.exceptions import OperationForbiddenEr
 from app.app_layer.interfaces.auth_system.system import IAuthSystem
 from app.app_layer.use_cases.cart_config.dto import CartConfigInputDTO
 from app.app_layer.use_cases.cart_config.service import CartConfigService
+from app.app_layer.use_cases.cart_items.limits import CartItemLimits
 from app.domain.cart_config.entities import CartConfig
+from app.domain.carts.entities import Cart
 from tests.environment.unit_of_work import TestUow
 from tests.utils import fake
 
 
 @pytest.fixture()
 async def cart_config(cart_config: CartConfig, uow: TestUow) -> CartConfig:
-    async with uow(autocommit=True):
-        await uow.carts.update_config(cart_config=cart_config)
+    async with uow(autocommit=True) as uow_handle:
+        await uow_handle.carts.update_config(cart_config=cart_config)
 
     return cart_config
 
 
 @pytest.fixture()
-def service(uow: TestUow, auth_system: IAuthSystem) -> CartConfigService:
-    return CartConfigService(uow=uow, auth_system=auth_system)
+def service(
+    uow: TestUow, auth_system: IAuthSystem, cart_item_limits: CartItemLimits
+) -> CartConfigService:
+    return CartConfigService(
+        uow=uow, auth_system=auth_system, item_limits=cart_item_limits
+    )
 
 
 @pytest.fixture()
@@ -63,14 +71,19 @@ async def test_retrieve_forbidden(service: CartConfigService) -> None:
         await service.retrieve(auth_data="Bearer customer.1")
 
 
+@pytest.mark.parametrize(
+    "dto",
+    [{}, {"limit_items_by_id": {1: Decimal(3), 3: Decimal("6.5")}}],
+    indirect=True,
+)
 @pytest.mark.usefixtures("cart_config")
 async def test_update_ok(
     service: CartConfigService, dto: CartConfigInputDTO, uow: TestUow
 ) -> None:
     result = await service.update(data=dto)
 
-    async with uow(autocommit=True):
-        config = await uow.carts.get_config()
+    async with uow(autocommit=True) as uow_handle:
+        config = await uow_handle.carts.get_config(with_items_limits=True)
 
     assert result.max_items_qty == config.max_items_qty == dto.max_items_qty
     assert (
@@ -102,3 +115,61 @@ async def test_update_forbidden(
 ) -> None:
     with pytest.raises(OperationForbiddenError, match=""):
         await service.update(data=dto)
+
+
+@pytest.mark.parametrize(
+    "dto", [{"limit_items_by_id": {1: Decimal(3), 3: Decimal(6)}}], indirect=True
+)
+@pytest.mark.usefixtures("cart_config")
+async def test_update_item_limits_versioned(
+    service: CartConfigService,
+    dto: CartConfigInputDTO,
+    cart_item_limits: CartItemLimits,
+    cart: Cart,
+) -> None:
+    await cart_item_limits.load(cart=cart, item_ids=[1, 2])
+
+    result = await service.update(data=dto)
+    await cart_item_limits.load(cart=cart, item_ids=[1, 2])
+
+    assert cart.config.limit_items_by_id == {}
+
+    cart.config.version = result.version
+    await cart_item_limits.load(cart=cart, item_ids=[1, 2])
+
+    assert cart.config.limit_items_by_id == {1: Decimal(3)}
+
+
+@pytest.mark.usefixtures("cart_config")
+async def test_update_creates_version(
+    service: CartConfigService, dto: CartConfigInputDTO, uow: TestUow
+) -> None:
+    async with uow(autocommit=True) as uow_handle:
+        previous_config = await uow_handle.carts.get_config()
+
+    result = await service.update(data=dto)
+
+    async with uow(autocommit=True) as uow_handle:
+        config = await uow_handle.carts.get_config()
+
+    assert config.version is not None
+    assert previous_config.version is not None
+    assert result.version == config.version > previous_config.version
+    assert result.max_items_qty == config.max_items_qty == dto.max_items_qty
+
+
+@pytest.mark.parametrize(
+    "dto", [{"limit_items_by_id": {1: Decimal(3), 3: Decimal(6)}}], indirect=True
+)
+@pytest.mark.usefixtures("cart_config")
+async def test_items_limits_loaded_on_request(
+    service: CartConfigService, dto: CartConfigInputDTO, uow: TestUow
+) -> None:
+    await service.update(data=dto)
+
+    async with uow(autocommit=True) as uow_handle:
+        config = await uow_handle.carts.get_config()
+        config_with_limits = await uow_handle.carts.get_config(with_items_limits=True)
+
+    assert config.limit_items_by_id == {}
+    assert config_with_limits.limit_items_by_id == dto.limit_items_by_id
@@ -8,12 +8,20 @@ from pytest_mock import MockerFixture
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.app_layer.interfaces.active_carts_cache.cache import IActiveCartsCache
 from app.app_layer.interfaces.auth_system.system import IAuthSystem
 from app.app_layer.interfaces.clients.coupons.client import ICouponsClient
 from app.app_layer.interfaces.clients.notifications.client import INotificationsClient
 from app.app_layer.interfaces.clients.products.client import IProductsClient
 from app.app_layer.interfaces.distributed_lock_system.system import IDistributedLockSystem
-from app.config import RedisLockConfig
+from app.app_layer.use_cases.cart_items.limits import CartItemLimits
+from app.config import (
+    ActiveCartsCacheConfig,
+    DBBackendEnum,
+    DBConfig,
+    ItemLimitsCacheConfig,
+    RedisLockConfig,
+)
 from app.infra.auth_system import FakeJWTAuthSystem
 from app.infra.events.arq.producers import ArqTaskProducer
 from app.infra.http.clients.coupons import CouponsHttpClient
@@ -21,8 +29,9 @@ from app.infra.http.clients.notifications import NotificationsHttpClient
 from app.infra.http.clients.products import ProductsHttpClient
 from app.infra.http.transports.aiohttp import AioHttpTransport
 from app.infra.http.transports.base import HttpTransportConfig, IHttpTransport
+from app.infra.redis_active_carts_cache import RedisActiveCartsCache
 from app.infra.redis_lock_system import RedisLockSystem
-from tests.environment.unit_of_work import TestUow
+from tests.environment.unit_of_work import TestAsyncpgUow, TestUow
 from tests.utils import fake
 
 
@@ -49,6 +58,8 @@ def redis(request: SubRequest, mocker: MockerFixture) -> AsyncMock:
     mock = mocker.AsyncMock(spec=Redis)
     mock.register_script.return_value = mocker.AsyncMock()
     mock.set = mocker.AsyncMock()
+    mock.get = mocker.AsyncMock(return_value=None)
+    mock.delete = mocker.AsyncMock()
 
     if not hasattr(request, "param"):
         return mock
@@ -66,6 +77,18 @@ def distributed_lock_system(
     return RedisLockSystem(redis=redis, config=redis_lock_config)
 
 
+@pytest.fixture()
+def active_carts_cache_config() -> ActiveCartsCacheConfig:
+    return ActiveCartsCacheConfig(ttl_sec=60)
+
+
+@pytest.fixture()
+def active_carts_cache(
+    redis: AsyncMock, active_carts_cache_config: ActiveCartsCacheConfig
+) -> IActiveCartsCache:
+    return RedisActiveCartsCache(redis=redis, config=active_carts_cache_config)
+
+
 @pytest.fixture()
 def broker(mocker: MockerFixture) -> AsyncMock:
     return mocker.AsyncMock(spec=ArqRedis)
@@ -77,8 +100,37 @@ def task_producer(broker: AsyncMock) -> ArqTaskProducer:
 
 
 @pytest.fixture()
-async def uow(session_factory: async_sessionmaker[AsyncSession]) -> TestUow:
-    return TestUow(session_factory=session_factory)
+async def uow(
+    request: SubRequest,
+    session_factory: async_sessionmaker[AsyncSession],
+    db_config: DBConfig,
+) -> TestUow:
+    # the suite runs against the repositories of the configured backend
+    if db_config.backend == DBBackendEnum.ASYNCPG:
+        return TestAsyncpgUow(
+            session_factory=session_factory,
+            schema_name=db_config.schema_name,
+        )
+
+    if not hasattr(request, "param"):
+        return TestUow(session_factory=session_factory)
+
+    return TestUow(
+        session_factory=session_factory,
+        aggregated_cart_fetch=request.param["aggregated_cart_fetch"],
+    )
+
+
+@pytest.fixture()
+def item_limits_cache_config() -> ItemLimitsCacheConfig:
+    return ItemLimitsCacheConfig(ttl_sec=60, max_size=100)
+
+
+@pytest.fixture()
+def cart_item_limits(
+    uow: TestUow, item_limits_cache_config: ItemLimitsCacheConfig
+) -> CartItemLimits:
+    return CartItemLimits(uow=uow, config=item_limits_cache_config)
 
 
 @pytest.fixture()
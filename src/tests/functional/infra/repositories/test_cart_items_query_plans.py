@@ -0,0 +1,148 @@
+from collections.abc import Iterator
+from typing import Any
+from uuid import UUID
+
+import orjson
+import pytest
+from sqlalchemy import Connection, event
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
+
+from app.infra.repositories.sqla import models
+from tests.environment.unit_of_work import TestUow
+
+CARTS_QTY = 1_000
+ITEMS_PER_CART_QTY = 10
+
+
+@pytest.fixture()
+def connection(session_factory: async_sessionmaker[AsyncSession]) -> AsyncConnection:
+    return session_factory.kw["bind"]
+
+
+@pytest.fixture()
+async def cart_id(connection: AsyncConnection) -> UUID:
+    # enough rows for the planner to prefer an index over a sequential scan
+    carts, items = models.Cart.__tablename__, models.CartItem.__tablename__
+    await connection.exec_driver_sql(
+        f"INSERT INTO {carts} (id, user_id, status) "
+        f"SELECT gen_random_uuid(), n, 'COMPLETED' "
+        f"FROM generate_series(1, {CARTS_QTY}) AS n"
+    )
+    await connection.exec_driver_sql(
+        f"INSERT INTO {items} (id, cart_id, name, qty, price, is_weight) "
+        f"SELECT n, c.id, 'item', 1, 1, false "
+        f"FROM {carts} AS c, generate_series(1, {ITEMS_PER_CART_QTY}) AS n"
+    )
+    await connection.exec_driver_sql(f"ANALYZE {carts}, {items}")
+
+    result = await connection.exec_driver_sql(f"SELECT id FROM {carts} LIMIT 1")
+
+    return result.scalar_one()
+
+
+@pytest.fixture()
+def statements(
+    connection: AsyncConnection,
+    cart_id: UUID,
+) -> Iterator[list[tuple[str, Any]]]:
+    """Captures the statements over the cart items issued after the data is seeded."""
+
+    captured: list[tuple[str, Any]] = []
+
+    def capture(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if models.CartItem.__tablename__ in statement:
+            captured.append((statement, parameters))
+
+    event.listen(connection.sync_connection, "before_cursor_execute", capture)
+    yield captured
+    event.remove(connection.sync_connection, "before_cursor_execute", capture)
+
+
+async def _get_plan_nodes(
+    connection: AsyncConnection,
+    statement: str,
+    parameters: Any,
+) -> list[dict[str, Any]]:
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}",
+        tuple(parameters),
+    )
+    plan = result.scalar_one()
+    plan = orjson.loads(plan) if isinstance(plan, str) else plan
+    nodes, pending = [], [plan[0]["Plan"]]
+
+    while pending:
+        node = pending.pop()
+        nodes.append(node)
+        pending.extend(node.get("Plans", []))
+
+    return nodes
+
+
+async def _assert_uses_pkey(
+    connection: AsyncConnection,
+    statements: list[tuple[str, Any]],
+) -> None:
+    assert statements
+
+    for statement, parameters in statements:
+        nodes = await _get_plan_nodes(connection, statement, parameters)
+
+        assert any(node.get("Index Name") == "cart_items_pkey" for node in nodes)
+        assert not any(
+            node["Node Type"] == "Seq Scan"
+            and node.get("Relation Name") == models.CartItem.__tablename__
+            for node in nodes
+        )
+
+
+@pytest.mark.parametrize("aggregated_cart_fetch", [False, True])
+async def test_retrieve(
+    session_factory: async_sessionmaker[AsyncSession],
+    connection: AsyncConnection,
+    cart_id: UUID,
+    statements: list[tuple[str, Any]],
+    aggregated_cart_fetch: bool,
+) -> None:
+    uow = TestUow(
+        session_factory=session_factory,
+        aggregated_cart_fetch=aggregated_cart_fetch,
+    )
+
+    async with uow(autocommit=False) as uow_handle:
+        await uow_handle.carts.retrieve(cart_id=cart_id)
+
+    await _assert_uses_pkey(connection=connection, statements=statements)
+
+
+async def test_clear(
+    session_factory: async_sessionmaker[AsyncSession],
+    connection: AsyncConnection,
+    cart_id: UUID,
+    statements: list[tuple[str, Any]],
+) -> None:
+    async with TestUow(session_factory=session_factory)(autocommit=False) as uow_handle:
+        await uow_handle.carts.clear(cart_id=cart_id)
+
+    await _assert_uses_pkey(connection=connection, statements=statements)
+
+
+async def test_delete_item(
+    session_factory: async_sessionmaker[AsyncSession],
+    connection: AsyncConnection,
+    cart_id: UUID,
+    statements: list[tuple[str, Any]],
+) -> None:
+    async with TestUow(session_factory=session_factory)(autocommit=False) as uow_handle:
+        cart = await uow_handle.carts.get_by_id(cart_id=cart_id)
+        statements.clear()
+        await uow_handle.items.delete_item(cart=cart, item_id=1)
+
+    await _assert_uses_pkey(connection=connection, statements=statements)
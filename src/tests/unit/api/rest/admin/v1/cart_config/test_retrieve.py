@@ -48,6 +48,7 @@ def application(application: FastAPI, use_case: AsyncMock) -> FastAPI:
                 hours_since_update_until_abandoned=fake.numeric.integer_number(start=1),
                 max_abandoned_notifications_qty=fake.numeric.integer_number(start=1),
                 abandoned_cart_text=fake.text.word(),
+                version=fake.numeric.integer_number(start=1),
             ),
         }
     ],
@@ -66,6 +67,7 @@ async def test_ok(http_client: AsyncClient, use_case: AsyncMock, url_path: str)
         "hours_since_update_until_abandoned": use_case.retrieve.return_value.hours_since_update_until_abandoned,
         "max_abandoned_notifications_qty": use_case.retrieve.return_value.max_abandoned_notifications_qty,
         "abandoned_cart_text": use_case.retrieve.return_value.abandoned_cart_text,
+        "version": use_case.retrieve.return_value.version,
     }
 
 
@@ -74,6 +74,7 @@ async def test_ok(http_client: AsyncClient, use_case: AsyncMock, url_path: str)
         "hours_since_update_until_abandoned": use_case.update.return_value.hours_since_update_until_abandoned,
         "max_abandoned_notifications_qty": use_case.update.return_value.max_abandoned_notifications_qty,
         "abandoned_cart_text": use_case.update.return_value.abandoned_cart_text,
+        "version": use_case.update.return_value.version,
     }
 
 
@@ -75,6 +75,7 @@ async def test_ok(http_client: AsyncClient, use_case: AsyncMock, url_path: str)
         "id": str(use_case.create_by_user_id.return_value.id),
         "user_id": use_case.create_by_user_id.return_value.user_id,
         "status": use_case.create_by_user_id.return_value.status.value,
+        "config_version": use_case.create_by_user_id.return_value.config_version,
         "items": use_case.create_by_user_id.return_value.items,
         "items_qty": float(use_case.create_by_user_id.return_value.items_qty),
         "cost": float(use_case.create_by_user_id.return_value.cost),
@@ -80,6 +80,7 @@ async def test_ok(
                 "id": str(use_case.execute.return_value[0].id),
                 "user_id": use_case.execute.return_value[0].user_id,
                 "status": use_case.execute.return_value[0].status.value,
+                "config_version": use_case.execute.return_value[0].config_version,
                 "items": use_case.execute.return_value[0].items,
                 "items_qty": float(use_case.execute.return_value[0].items_qty),
                 "cost": float(use_case.execute.return_value[0].cost),
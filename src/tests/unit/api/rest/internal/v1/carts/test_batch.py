@@ -0,0 +1,140 @@
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+from _pytest.fixtures import SubRequest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+
+from app.api.rest.internal.v1.carts.controllers import MAX_BATCH_SIZE
+from app.app_layer.interfaces.distributed_lock_system.exceptions import AlreadyLockedError
+from app.app_layer.use_cases.carts.cart_batch import BaseBatchChangeCartStatusUseCase
+from app.app_layer.use_cases.carts.dto import CartBatchResultOutputDTO, CartOutputDTO
+from app.domain.carts.exceptions import ChangeStatusError
+from app.domain.carts.value_objects import CartStatusEnum
+from app.domain.interfaces.repositories.carts.exceptions import CartNotFoundError
+from tests.utils import fake
+
+
+@pytest.fixture(
+    params=[
+        ("lock", "batch_lock_cart_use_case", 5001),
+        ("unlock", "batch_unlock_cart_use_case", 5002),
+        ("complete", "batch_complete_cart_use_case", 5003),
+    ],
+    ids=["lock", "unlock", "complete"],
+)
+def endpoint(request: SubRequest) -> tuple[str, str, int]:
+    return request.param
+
+
+@pytest.fixture()
+def url_path(endpoint: tuple[str, str, int]) -> str:
+    return f"api/internal/v1/carts/batch/{endpoint[0]}"
+
+
+@pytest.fixture()
+def cart_ids() -> list[UUID]:
+    return [fake.cryptographic.uuid_object() for _ in range(4)]
+
+
+@pytest.fixture()
+def cart(cart_ids: list[UUID]) -> CartOutputDTO:
+    return CartOutputDTO(
+        created_at=fake.datetime.datetime(),
+        id=cart_ids[0],
+        user_id=fake.numeric.integer_number(start=1),
+        status=CartStatusEnum.LOCKED,
+        items=[],
+        items_qty=0,
+        cost=0,
+        checkout_enabled=False,
+        coupon=None,
+    )
+
+
+@pytest.fixture()
+def use_case(
+    mocker: MockerFixture,
+    cart_ids: list[UUID],
+    cart: CartOutputDTO,
+) -> AsyncMock:
+    mock = mocker.AsyncMock(spec=BaseBatchChangeCartStatusUseCase)
+    mock.execute.return_value = [
+        CartBatchResultOutputDTO(cart_id=cart_ids[0], cart=cart),
+        CartBatchResultOutputDTO(cart_id=cart_ids[1], error=AlreadyLockedError()),
+        CartBatchResultOutputDTO(cart_id=cart_ids[2], error=CartNotFoundError()),
+        CartBatchResultOutputDTO(cart_id=cart_ids[3], error=ChangeStatusError()),
+    ]
+
+    return mock
+
+
+@pytest.fixture()
+def application(
+    application: FastAPI,
+    use_case: AsyncMock,
+    endpoint: tuple[str, str, int],
+) -> FastAPI:
+    with getattr(application.container, endpoint[1]).override(use_case):
+        yield application
+
+
+async def test_ok(
+    http_client: AsyncClient,
+    use_case: AsyncMock,
+    url_path: str,
+    cart_ids: list[UUID],
+    cart: CartOutputDTO,
+    endpoint: tuple[str, str, int],
+) -> None:
+    response = await http_client.post(
+        url=url_path, json={"cart_ids": [str(cart_id) for cart_id in cart_ids]}
+    )
+
+    assert response.status_code == HTTPStatus.OK, response.text
+    use_case.execute.assert_awaited_once_with(cart_ids=cart_ids)
+
+    results = response.json()
+    assert [result["cart_id"] for result in results] == [str(i) for i in cart_ids]
+    assert results[0]["cart"]["id"] == str(cart.id)
+    assert results[0]["error"] is None
+    assert [result["cart"] for result in results[1:]] == [None, None, None]
+    assert [result["error"]["code"] for result in results[1:]] == [
+        5000,
+        2000,
+        endpoint[2],
+    ]
+
+
+async def test_unmapped_error(
+    http_client: AsyncClient,
+    use_case: AsyncMock,
+    url_path: str,
+    cart_ids: list[UUID],
+) -> None:
+    use_case.execute.return_value = [
+        CartBatchResultOutputDTO(cart_id=cart_ids[0], error=Exception()),
+    ]
+
+    response = await http_client.post(url=url_path, json={"cart_ids": [str(cart_ids[0])]})
+
+    assert response.status_code == HTTPStatus.OK, response.text
+    assert response.json()[0]["error"]["code"] == 5004
+
+
+@pytest.mark.parametrize("cart_ids_qty", [0, MAX_BATCH_SIZE + 1])
+async def test_bad_batch_size(
+    http_client: AsyncClient,
+    use_case: AsyncMock,
+    url_path: str,
+    cart_ids_qty: int,
+) -> None:
+    cart_ids = [str(fake.cryptographic.uuid_object()) for _ in range(cart_ids_qty)]
+
+    response = await http_client.post(url=url_path, json={"cart_ids": cart_ids})
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY, response.text
+    use_case.execute.assert_not_awaited()
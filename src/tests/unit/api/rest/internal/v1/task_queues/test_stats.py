@@ -0,0 +1,63 @@
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+
+import pytest
+from _pytest.fixtures import SubRequest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+
+from app.app_layer.interfaces.tasks.dto import QueueStatsOutputDTO
+from app.app_layer.interfaces.tasks.exceptions import TaskQueuesMonitorError
+from app.app_layer.use_cases.task_queues.stats import TaskQueuesStatsUseCase
+
+URL_PATH = "api/internal/v1/task-queues"
+
+
+@pytest.fixture()
+def use_case(request: SubRequest, mocker: MockerFixture) -> AsyncMock:
+    mock = mocker.AsyncMock(spec=TaskQueuesStatsUseCase)
+
+    if "returns" in request.param:
+        mock.execute.return_value = request.param["returns"]
+    elif "raises" in request.param:
+        mock.execute.side_effect = request.param["raises"]
+
+    return mock
+
+
+@pytest.fixture()
+def application(application: FastAPI, use_case: AsyncMock) -> FastAPI:
+    with application.container.task_queues_stats_use_case.override(use_case):
+        yield application
+
+
+@pytest.mark.parametrize(
+    "use_case",
+    [
+        {
+            "returns": [
+                QueueStatsOutputDTO(
+                    name="notifications_queue", depth=3, ready_qty=2, lag_sec=1.5
+                ),
+            ],
+        },
+    ],
+    indirect=True,
+)
+async def test_ok(http_client: AsyncClient, use_case: AsyncMock) -> None:
+    response = await http_client.get(url=URL_PATH)
+
+    assert response.status_code == HTTPStatus.OK, response.text
+    assert response.json() == [
+        {"name": "notifications_queue", "depth": 3, "ready_qty": 2, "lag_sec": 1.5},
+    ]
+    use_case.execute.assert_awaited_once_with()
+
+
+@pytest.mark.parametrize("use_case", [{"raises": TaskQueuesMonitorError}], indirect=True)
+async def test_unavailable(http_client: AsyncClient, use_case: AsyncMock) -> None:
+    response = await http_client.get(url=URL_PATH)
+
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE, response.text
+    assert response.json()["detail"]["code"] == 6000
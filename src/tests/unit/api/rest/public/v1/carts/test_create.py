@@ -68,6 +68,7 @@ async def test_ok(http_client: AsyncClient, use_case: AsyncMock, url_path: str)
         "id": str(use_case.create_by_auth_data.return_value.id),
         "user_id": use_case.create_by_auth_data.return_value.user_id,
         "status": use_case.create_by_auth_data.return_value.status.value,
+        "config_version": use_case.create_by_auth_data.return_value.config_version,
         "items": use_case.create_by_auth_data.return_value.items,
         "items_quantity": float(use_case.create_by_auth_data.return_value.items_qty),
         "cost": float(use_case.create_by_auth_data.return_value.cost),
@@ -76,6 +77,42 @@ async def test_ok(http_client: AsyncClient, use_case: AsyncMock, url_path: str)
     }
 
 
+@pytest.mark.parametrize(
+    "use_case",
+    [
+        {
+            "returns": CartOutputDTO(
+                created_at=fake.datetime.datetime(),
+                id=fake.cryptographic.uuid_object(),
+                user_id=fake.numeric.integer_number(start=1),
+                status=CartStatusEnum.LOCKED,
+                items=[],
+                items_qty=0,
+                cost=0,
+                checkout_enabled=False,
+                coupon=None,
+            ),
+        }
+    ],
+    indirect=True,
+)
+async def test_get_or_create_ok(
+    http_client: AsyncClient, use_case: AsyncMock, url_path: str
+) -> None:
+    response = await http_client.post(
+        url=url_path,
+        params={"get_or_create": True},
+        headers={"Authorization": "Bearer customer.1"},
+    )
+
+    assert response.status_code == HTTPStatus.OK, response.text
+    assert response.json()["id"] == str(use_case.create_by_auth_data.return_value.id)
+    use_case.create_by_auth_data.assert_awaited_once_with(
+        auth_data="Bearer customer.1",
+        get_or_create=True,
+    )
+
+
 @pytest.mark.parametrize(
     ("use_case", "expected_code", "expected_error"),
     [
@@ -69,6 +69,7 @@ async def test_ok(http_client: AsyncClient, use_case: AsyncMock, url_path: str)
         "id": str(use_case.execute.return_value.id),
         "user_id": use_case.execute.return_value.user_id,
         "status": use_case.execute.return_value.status.value,
+        "config_version": use_case.execute.return_value.config_version,
         "items": use_case.execute.return_value.items,
         "items_quantity": float(use_case.execute.return_value.items_qty),
         "cost": float(use_case.execute.return_value.cost),
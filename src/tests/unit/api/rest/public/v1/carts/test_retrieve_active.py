@@ -0,0 +1,99 @@
+from http import HTTPStatus
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from _pytest.fixtures import SubRequest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+
+from app.app_layer.interfaces.auth_system.exceptions import InvalidAuthDataError
+from app.app_layer.use_cases.carts.cart_retrieve import CartRetrieveUseCase
+from app.app_layer.use_cases.carts.dto import CartOutputDTO
+from app.domain.carts.value_objects import CartStatusEnum
+from app.domain.interfaces.repositories.carts.exceptions import CartNotFoundError
+from tests.utils import fake
+
+
+@pytest.fixture()
+def url_path() -> str:
+    return "api/v1/carts/me"
+
+
+@pytest.fixture()
+def use_case(request: SubRequest, mocker: MockerFixture) -> AsyncMock:
+    mock = mocker.AsyncMock(spec=CartRetrieveUseCase)
+
+    if "returns" in request.param:
+        mock.execute_active.return_value = request.param["returns"]
+    elif "raises" in request.param:
+        mock.execute_active.side_effect = request.param["raises"]
+
+    return mock
+
+
+@pytest.fixture()
+def application(application: FastAPI, use_case: AsyncMock) -> FastAPI:
+    with application.container.cart_retrieve_use_case.override(use_case):
+        yield application
+
+
+@pytest.mark.parametrize(
+    "use_case",
+    [
+        {
+            "returns": CartOutputDTO(
+                created_at=fake.datetime.datetime(),
+                id=fake.cryptographic.uuid_object(),
+                user_id=fake.numeric.integer_number(start=1),
+                status=CartStatusEnum.OPENED,
+                items=[],
+                items_qty=0,
+                cost=0,
+                checkout_enabled=False,
+                coupon=None,
+            ),
+        }
+    ],
+    indirect=True,
+)
+async def test_ok(http_client: AsyncClient, use_case: AsyncMock, url_path: str) -> None:
+    response = await http_client.get(url=url_path)
+
+    assert response.status_code == HTTPStatus.OK, response.text
+    assert response.json()["id"] == str(use_case.execute_active.return_value.id)
+
+    use_case.execute_active.assert_awaited_once()
+    use_case.execute.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    ("use_case", "expected_code", "expected_error"),
+    [
+        pytest.param(
+            {"raises": InvalidAuthDataError},
+            HTTPStatus.UNAUTHORIZED,
+            {"detail": {"code": 1000, "message": "Authorization failed."}},
+            id="UNAUTHORIZED",
+        ),
+        pytest.param(
+            {"raises": CartNotFoundError},
+            HTTPStatus.BAD_REQUEST,
+            {"detail": {"code": 2000, "message": "Cart not found."}},
+            id="CART_NOT_FOUND",
+        ),
+    ],
+    indirect=["use_case"],
+)
+async def test_failed(
+    http_client: AsyncClient,
+    use_case: AsyncMock,
+    url_path: str,
+    expected_code: int,
+    expected_error: dict[str, Any],
+) -> None:
+    response = await http_client.get(url=url_path)
+
+    assert response.status_code == expected_code, response.text
+    assert response.json() == expected_error
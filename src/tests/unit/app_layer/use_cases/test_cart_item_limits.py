@@ -0,0 +1,102 @@
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.app_layer.use_cases.cart_items.limits import CartItemLimits
+from app.config import ItemLimitsCacheConfig
+from app.domain.carts.entities import Cart
+
+
+@pytest.fixture()
+def get_items_limits(mocker: MockerFixture) -> AsyncMock:
+    return mocker.AsyncMock(
+        side_effect=lambda config_version, item_ids: {
+            item_id: Decimal(item_id) for item_id in item_ids if item_id % 2
+        },
+    )
+
+
+@pytest.fixture()
+def uow(mocker: MockerFixture, get_items_limits: AsyncMock) -> MagicMock:
+    mock = mocker.MagicMock()
+    uow_handle = mock.return_value.__aenter__.return_value
+    uow_handle.carts.get_items_limits = get_items_limits
+
+    return mock
+
+
+async def test_load(get_items_limits: AsyncMock, uow: MagicMock, cart: Cart) -> None:
+    item_limits = CartItemLimits(uow=uow, config=ItemLimitsCacheConfig())
+
+    await item_limits.load(cart=cart, item_ids=[1, 2, 3])
+
+    assert cart.config.limit_items_by_id == {1: Decimal(1), 3: Decimal(3)}
+    get_items_limits.assert_awaited_once_with(
+        config_version=cart.config.version, item_ids=[1, 2, 3]
+    )
+
+
+async def test_load_cached(
+    get_items_limits: AsyncMock, uow: MagicMock, cart: Cart
+) -> None:
+    item_limits = CartItemLimits(uow=uow, config=ItemLimitsCacheConfig())
+    await item_limits.load(cart=cart, item_ids=[1, 2])
+
+    await item_limits.load(cart=cart, item_ids=[1, 2, 3])
+
+    assert cart.config.limit_items_by_id == {1: Decimal(1), 3: Decimal(3)}
+    assert get_items_limits.await_count == 2
+    get_items_limits.assert_awaited_with(config_version=cart.config.version, item_ids=[3])
+
+
+async def test_load_other_config_version(
+    get_items_limits: AsyncMock, uow: MagicMock, cart: Cart
+) -> None:
+    item_limits = CartItemLimits(uow=uow, config=ItemLimitsCacheConfig())
+    cart.config.version = 1
+    await item_limits.load(cart=cart, item_ids=[1])
+
+    cart.config.version = 2
+    await item_limits.load(cart=cart, item_ids=[1])
+
+    assert get_items_limits.await_count == 2
+    get_items_limits.assert_awaited_with(config_version=2, item_ids=[1])
+
+
+async def test_load_expired(
+    get_items_limits: AsyncMock, uow: MagicMock, cart: Cart
+) -> None:
+    item_limits = CartItemLimits(uow=uow, config=ItemLimitsCacheConfig(ttl_sec=1e-9))
+    await item_limits.load(cart=cart, item_ids=[1])
+
+    await item_limits.load(cart=cart, item_ids=[1])
+
+    assert cart.config.limit_items_by_id == {1: Decimal(1)}
+    assert get_items_limits.await_count == 2
+
+
+async def test_invalidate(
+    get_items_limits: AsyncMock, uow: MagicMock, cart: Cart
+) -> None:
+    item_limits = CartItemLimits(uow=uow, config=ItemLimitsCacheConfig())
+    await item_limits.load(cart=cart, item_ids=[1])
+
+    item_limits.invalidate()
+    await item_limits.load(cart=cart, item_ids=[1])
+
+    assert get_items_limits.await_count == 2
+
+
+async def test_max_size_exceeded(
+    get_items_limits: AsyncMock, uow: MagicMock, cart: Cart
+) -> None:
+    item_limits = CartItemLimits(uow=uow, config=ItemLimitsCacheConfig(max_size=2))
+    await item_limits.load(cart=cart, item_ids=[1, 2])
+    await item_limits.load(cart=cart, item_ids=[3])
+
+    await item_limits.load(cart=cart, item_ids=[1])
+
+    assert get_items_limits.await_count == 3
+    get_items_limits.assert_awaited_with(config_version=cart.config.version, item_ids=[1])
@@ -0,0 +1,123 @@
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.app_layer.interfaces.clients.notifications.exceptions import (
+    NotificationsClientError,
+)
+from app.app_layer.use_cases.abandoned_carts_service import AbandonedCartsService
+from app.app_layer.use_cases.notifications_batcher import NotificationsBatcher
+from app.config import NotificationsBatchConfig
+from tests.utils import fake
+
+
+@pytest.fixture()
+def service(mocker: MockerFixture) -> AsyncMock:
+    mock = mocker.AsyncMock(spec=AbandonedCartsService)
+    mock.send_notifications.side_effect = lambda recipients: [None] * len(recipients)
+
+    return mock
+
+
+def _recipient() -> tuple[int, UUID, int]:
+    return (
+        fake.numeric.integer_number(start=1),
+        fake.cryptographic.uuid_object(),
+        fake.numeric.integer_number(start=1, end=5),
+    )
+
+
+async def test_disabled(service: AsyncMock) -> None:
+    batcher = NotificationsBatcher(
+        service=service, config=NotificationsBatchConfig(enabled=False)
+    )
+    user_id, cart_id, cycle = _recipient()
+
+    await batcher.send_notification(user_id=user_id, cart_id=cart_id, cycle=cycle)
+
+    service.send_notification.assert_awaited_once_with(
+        user_id=user_id,
+        cart_id=cart_id,
+        cycle=cycle,
+    )
+    service.send_notifications.assert_not_awaited()
+
+
+async def test_flushed_by_size(service: AsyncMock) -> None:
+    batcher = NotificationsBatcher(
+        service=service,
+        config=NotificationsBatchConfig(enabled=True, max_size=3, max_wait_sec=60),
+    )
+    recipients = [_recipient() for _ in range(3)]
+
+    await asyncio.wait_for(
+        asyncio.gather(
+            *(
+                batcher.send_notification(user_id=user_id, cart_id=cart_id, cycle=cycle)
+                for user_id, cart_id, cycle in recipients
+            ),
+        ),
+        timeout=1,
+    )
+
+    service.send_notifications.assert_awaited_once_with(recipients=recipients)
+
+
+async def test_flushed_by_time(service: AsyncMock) -> None:
+    batcher = NotificationsBatcher(
+        service=service,
+        config=NotificationsBatchConfig(enabled=True, max_size=10, max_wait_sec=0.01),
+    )
+    recipients = [_recipient() for _ in range(2)]
+
+    await asyncio.gather(
+        *(
+            batcher.send_notification(user_id=user_id, cart_id=cart_id, cycle=cycle)
+            for user_id, cart_id, cycle in recipients
+        ),
+    )
+
+    service.send_notifications.assert_awaited_once_with(recipients=recipients)
+
+
+async def test_failed_individually(service: AsyncMock) -> None:
+    batcher = NotificationsBatcher(
+        service=service,
+        config=NotificationsBatchConfig(enabled=True, max_size=2, max_wait_sec=60),
+    )
+    service.send_notifications.side_effect = None
+    service.send_notifications.return_value = [None, NotificationsClientError("test")]
+    recipients = [_recipient() for _ in range(2)]
+
+    results = await asyncio.gather(
+        *(
+            batcher.send_notification(user_id=user_id, cart_id=cart_id, cycle=cycle)
+            for user_id, cart_id, cycle in recipients
+        ),
+        return_exceptions=True,
+    )
+
+    assert results[0] is None
+    assert isinstance(results[1], NotificationsClientError)
+
+
+async def test_batch_failed(service: AsyncMock) -> None:
+    batcher = NotificationsBatcher(
+        service=service,
+        config=NotificationsBatchConfig(enabled=True, max_size=2, max_wait_sec=60),
+    )
+    service.send_notifications.side_effect = RuntimeError("test")
+    recipients = [_recipient() for _ in range(2)]
+
+    results = await asyncio.gather(
+        *(
+            batcher.send_notification(user_id=user_id, cart_id=cart_id, cycle=cycle)
+            for user_id, cart_id, cycle in recipients
+        ),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
@@ -68,3 +68,30 @@ def test_cart_items_qty_limit_exceeded(
 ) -> None:
     with pytest.raises(MaxItemsQtyLimitExceeded, match=""):
         cart.add_new_item(item=cart_item)
+
+
+@pytest.mark.parametrize(
+    ("cart_config", "cart"), [({"version": 2}, {"config_version": 1})], indirect=True
+)
+def test_config_version_pinned(cart: Cart, cart_item: CartItem) -> None:
+    cart.add_new_item(item=cart_item)
+
+    assert cart.config_version == 2
+
+
+@pytest.mark.parametrize(
+    ("cart_config", "cart", "cart_item"),
+    [
+        (
+            {"version": 2, "limit_items_by_id": {1: Decimal(0)}},
+            {"config_version": 1},
+            {"id": 1, "qty": Decimal(1)},
+        ),
+    ],
+    indirect=True,
+)
+def test_config_version_not_pinned_on_error(cart: Cart, cart_item: CartItem) -> None:
+    with pytest.raises(SpecificItemQtyLimitExceeded, match=""):
+        cart.add_new_item(item=cart_item)
+
+    assert cart.config_version == 1
@@ -25,3 +25,10 @@ def test_ok(cart_config: CartConfig) -> None:
     assert cart.items_qty == Decimal(0)
     assert cart.cost == Decimal(0)
     assert cart.checkout_enabled == (cart.cost >= cart_config.min_cost_for_checkout)
+
+
+@pytest.mark.parametrize("cart_config", [{"version": 2}], indirect=True)
+def test_config_version_pinned(cart_config: CartConfig) -> None:
+    cart = Cart.create(user_id=1, config=cart_config)
+
+    assert cart.config_version == 2
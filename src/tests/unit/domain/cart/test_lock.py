@@ -31,3 +31,14 @@ def test_checkout_disabled(cart: Cart, cart_config: CartConfig) -> None:
         cart.lock()
 
     assert cart.status == CartStatusEnum.OPENED
+
+
+@pytest.mark.parametrize(
+    ("cart_config", "cart"),
+    [({"min_cost_for_checkout": 0, "version": 2}, {"config_version": 1})],
+    indirect=True,
+)
+def test_config_version_pinned(cart: Cart) -> None:
+    cart.lock()
+
+    assert cart.config_version == 2
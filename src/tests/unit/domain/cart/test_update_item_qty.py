@@ -71,3 +71,13 @@ def test_cart_items_qty_limit_exceeded(
 
     with pytest.raises(MaxItemsQtyLimitExceeded, match=""):
         cart.update_item_qty(item_id=1, qty=Decimal(2))
+
+
+@pytest.mark.parametrize(
+    ("cart_config", "cart"), [({"version": 2}, {"config_version": 1})], indirect=True
+)
+def test_config_version_pinned(cart: Cart, cart_item: CartItem) -> None:
+    cart.items.append(cart_item)
+    cart.update_item_qty(item_id=cart_item.id, qty=Decimal(1))
+
+    assert cart.config_version == 2
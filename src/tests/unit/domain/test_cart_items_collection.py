@@ -0,0 +1,79 @@
+from decimal import Decimal
+
+import pytest
+
+from app.domain.cart_items.collections import CartItems
+from app.domain.cart_items.dto import ItemDTO
+from app.domain.cart_items.entities import CartItem
+from tests.utils import fake
+
+
+def _create_item(item_id: int) -> CartItem:
+    return CartItem(
+        data=ItemDTO(
+            id=item_id,
+            name=fake.text.word(),
+            qty=Decimal(1),
+            price=Decimal(1),
+            is_weight=False,
+            cart_id=fake.cryptographic.uuid_object(),
+        ),
+    )
+
+
+def test_keeps_insertion_order() -> None:
+    items = [_create_item(item_id) for item_id in (3, 1, 2)]
+    collection = CartItems(items[:2])
+
+    collection.append(items[2])
+
+    assert list(collection) == collection == items
+    assert collection[0] is items[0]
+    assert collection[-1] is items[2]
+    assert len(collection) == len(items)
+
+
+def test_get() -> None:
+    item = _create_item(1)
+    collection = CartItems([item])
+
+    assert collection.get(item.id) is item
+    assert item in collection
+    assert collection.get(2) is None
+    assert _create_item(1) not in collection
+
+
+def test_pop_keeps_order_of_the_rest() -> None:
+    items = [_create_item(item_id) for item_id in range(1, 5)]
+    collection = CartItems(items)
+
+    assert collection.pop(2) is items[1]
+    assert collection == [items[0], items[2], items[3]]
+
+
+def test_index() -> None:
+    items = [_create_item(item_id) for item_id in range(1, 6)]
+    collection = CartItems(items)
+
+    assert [collection[index] for index in range(-5, 5)] == items * 2
+    assert collection[1:4] == items[1:4]
+    assert collection[::2] == items[::2]
+    assert collection[::-1] == items[::-1]
+    assert collection[4:1] == []
+
+    with pytest.raises(IndexError):
+        collection[5]
+
+    with pytest.raises(IndexError):
+        collection[-6]
+
+
+def test_eq() -> None:
+    items = [_create_item(item_id) for item_id in range(1, 4)]
+    collection = CartItems(items)
+
+    assert collection == CartItems(items)
+    assert collection == items
+    assert collection != items[:2]
+    assert collection != tuple(items)
+    assert CartItems() == []
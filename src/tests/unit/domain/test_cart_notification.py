@@ -20,15 +20,29 @@ def test_create_ok() -> None:
     )
 
     assert isinstance(notification.id, UUID)
-    assert notification.sent_at == FROZEN_TIME
+    assert notification.cycle == 1
+    assert notification.sent_at is None
 
 
 def test_create_abandoned_cart_notification_ok() -> None:
     notification = CartNotification.create_abandoned_cart_notification(
         cart_id=fake.cryptographic.uuid_object(),
         text=fake.text.word(),
+        cycle=2,
     )
 
     assert isinstance(notification.id, UUID)
     assert notification.type == CartNotificationTypeEnum.ABANDONED_CART
+    assert notification.cycle == 2
+    assert notification.sent_at is None
+
+
+def test_mark_sent_ok() -> None:
+    notification = CartNotification.create_abandoned_cart_notification(
+        cart_id=fake.cryptographic.uuid_object(),
+        text=fake.text.word(),
+    )
+
+    notification.mark_sent()
+
     assert notification.sent_at == FROZEN_TIME
@@ -0,0 +1,249 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from app.app_layer.use_cases.carts.dto import CartOutputDTO
+from app.domain.cart_config.entities import CartConfig
+from app.domain.cart_coupons.dto import CartCouponDTO
+from app.domain.cart_coupons.entities import CartCoupon
+from app.domain.cart_items.dto import ItemDTO
+from app.domain.cart_items.entities import CartItem
+from app.domain.cart_items.exceptions import MinQtyLimitExceededError
+from app.domain.carts.dto import CartDTO
+from app.domain.carts.entities import Cart
+from app.domain.carts.value_objects import CartStatusEnum
+from app.domain.fixed_point import from_minor, to_minor, to_minor_ceil
+from tests.utils import fake
+
+SEED = 48
+
+
+def _get_decimal(rnd: random.Random, max_minor: int, scale: int) -> Decimal:
+    return Decimal(rnd.randint(1, max_minor)).scaleb(-scale)
+
+
+@pytest.mark.parametrize(
+    ("value", "scale", "expected"),
+    [
+        (Decimal("9.99"), 2, 999),
+        (Decimal("100"), 2, 10_000),
+        (Decimal("1E+2"), 2, 10_000),
+        (Decimal("0.5"), 3, 500),
+        (Decimal("0.001"), 3, 1),
+        (Decimal("0"), 2, 0),
+        (Decimal("99999999.99"), 2, 9_999_999_999),
+    ],
+)
+def test_to_minor_exact(value: Decimal, scale: int, expected: int) -> None:
+    assert to_minor(value, scale) == expected
+    assert from_minor(expected, scale) == value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [Decimal("0.005"), Decimal("1.115"), Decimal("-0.005"), Decimal("2.9999")],
+)
+def test_to_minor_rejects_sub_scale_value(value: Decimal) -> None:
+    with pytest.raises(ValueError, match="more than 2 decimal places"):
+        to_minor(value, 2)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (Decimal("9.99"), 999),
+        (Decimal("9.991"), 1_000),
+        (Decimal("-9.991"), -999),
+        (Decimal("500"), 50_000),
+    ],
+)
+def test_to_minor_ceil(value: Decimal, expected: int) -> None:
+    assert to_minor_ceil(value, 2) == expected
+
+
+def test_from_minor_display_scale() -> None:
+    assert str(from_minor(1_998_000, 5, display_scale=2)) == "19.98"
+    assert str(from_minor(1_998_000, 5, display_scale=6)) == "19.980000"
+    assert str(from_minor(1_998_000, 5)) == "19.98000"
+
+
+def test_item_cost_exact() -> None:
+    rnd = random.Random(SEED)
+
+    for _ in range(1_000):
+        price = _get_decimal(rnd, max_minor=10**10 - 1, scale=2)
+        qty = _get_decimal(rnd, max_minor=10**6, scale=3)
+        item = CartItem(
+            data=ItemDTO(
+                id=1,
+                name=fake.text.word(),
+                qty=qty,
+                price=price,
+                is_weight=True,
+                cart_id=fake.cryptographic.uuid_object(),
+            ),
+        )
+
+        assert str(item.cost) == str(price * qty)
+
+
+def test_cart_totals_exact(cart_config: CartConfig) -> None:
+    rnd = random.Random(SEED)
+    cart = Cart(
+        data=CartDTO(
+            created_at=fake.datetime.datetime(),
+            id=fake.cryptographic.uuid_object(),
+            user_id=1,
+            status=CartStatusEnum.OPENED,
+        ),
+        items=[
+            CartItem(
+                data=ItemDTO(
+                    id=item_id,
+                    name=fake.text.word(),
+                    qty=_get_decimal(rnd, max_minor=10**5, scale=3),
+                    price=_get_decimal(rnd, max_minor=10**7, scale=2),
+                    is_weight=rnd.choice([True, False]),
+                    cart_id=fake.cryptographic.uuid_object(),
+                ),
+            )
+            for item_id in range(1, 1_001)
+        ],
+        config=cart_config,
+    )
+    coupon = CartCoupon(
+        data=CartCouponDTO(
+            coupon_id=fake.text.word(),
+            min_cart_cost=_get_decimal(rnd, max_minor=10**9, scale=2),
+            discount_abs=_get_decimal(rnd, max_minor=10**5, scale=2),
+        ),
+        cart=cart,
+    )
+    cost = sum(item.price * item.qty for item in cart.items)
+
+    assert str(cart.cost) == str(cost)
+    assert str(cart.items_qty) == str(
+        sum(Cart.WEIGHT_ITEM_QTY if item.is_weight else item.qty for item in cart.items)
+    )
+    assert cart.checkout_enabled is (cost >= cart_config.min_cost_for_checkout)
+    assert str(coupon.cart_cost) == str(cost - coupon.discount_abs)
+    assert coupon.applied is (cost >= coupon.min_cart_cost)
+
+
+@pytest.mark.parametrize("min_cost_for_checkout", [Decimal("10.00"), Decimal("10.01")])
+def test_checkout_enabled_boundary(
+    cart_config: CartConfig,
+    min_cost_for_checkout: Decimal,
+) -> None:
+    cart_config.min_cost_for_checkout = min_cost_for_checkout
+    cart = Cart.create(user_id=1, config=cart_config)
+    cart.items.append(
+        CartItem(
+            data=ItemDTO(
+                id=1,
+                name=fake.text.word(),
+                qty=Decimal("0.5"),
+                price=Decimal("20.00"),
+                is_weight=True,
+                cart_id=cart.id,
+            ),
+        ),
+    )
+
+    assert cart.checkout_enabled is (min_cost_for_checkout == Decimal("10.00"))
+
+
+def test_item_qty_update_keeps_minor_units() -> None:
+    item = CartItem(
+        data=ItemDTO(
+            id=1,
+            name=fake.text.word(),
+            qty=Decimal("1.5"),
+            price=Decimal("3.33"),
+            is_weight=True,
+            cart_id=fake.cryptographic.uuid_object(),
+        ),
+    )
+
+    item.qty += Decimal("0.25")
+
+    assert item.qty_minor == 1_750
+    assert str(item.cost) == str(Decimal("3.33") * Decimal("1.75"))
+
+
+def test_sub_scale_qty_rejected() -> None:
+    with pytest.raises(MinQtyLimitExceededError):
+        ItemDTO(
+            id=1,
+            name=fake.text.word(),
+            qty=Decimal("0.0004"),
+            price=Decimal("9.99"),
+            is_weight=False,
+            cart_id=fake.cryptographic.uuid_object(),
+        )
+
+
+def test_sub_scale_price_rejected() -> None:
+    data = ItemDTO(
+        id=1,
+        name=fake.text.word(),
+        qty=Decimal("1.5"),
+        price=Decimal("9.999"),
+        is_weight=False,
+        cart_id=fake.cryptographic.uuid_object(),
+    )
+
+    with pytest.raises(ValueError, match="more than 2 decimal places"):
+        CartItem(data=data)
+
+
+@pytest.mark.parametrize(
+    ("price", "qty", "is_weight", "expected"),
+    [
+        (
+            "9.99",
+            "2",
+            False,
+            '"qty":"2","price":"9.99","cost":"19.98","is_weight":false}],'
+            '"items_qty":"2","cost":"19.98"',
+        ),
+        (
+            "9.99",
+            "1.5",
+            False,
+            '"qty":"1.5","price":"9.99","cost":"14.985","is_weight":false}],'
+            '"items_qty":"1.5","cost":"14.985"',
+        ),
+        (
+            "10.00",
+            "0.25",
+            True,
+            '"qty":"0.25","price":"10.00","cost":"2.5000","is_weight":true}],'
+            '"items_qty":"1","cost":"2.5000"',
+        ),
+    ],
+)
+def test_serialized_totals_keep_decimal_places(
+    cart_config: CartConfig,
+    price: str,
+    qty: str,
+    is_weight: bool,
+    expected: str,
+) -> None:
+    cart = Cart.create(user_id=1, config=cart_config)
+    cart.items.append(
+        CartItem(
+            data=ItemDTO(
+                id=1,
+                name="item",
+                qty=Decimal(qty),
+                price=Decimal(price),
+                is_weight=is_weight,
+                cart_id=cart.id,
+            ),
+        ),
+    )
+
+    # the JSON strings are compared, the decimal equality ignores the decimal places
+    assert expected in CartOutputDTO.model_validate(cart).model_dump_json()
@@ -0,0 +1,30 @@
+import time
+
+from app.domain.ids import uuid7
+
+
+def test_uuid7_version_and_variant() -> None:
+    uuid = uuid7()
+
+    assert uuid.version == 7
+    assert uuid.variant == "specified in RFC 4122"
+
+
+def test_uuid7_timestamp() -> None:
+    before_ms = time.time_ns() // 1_000_000
+    uuid = uuid7()
+    after_ms = time.time_ns() // 1_000_000
+
+    assert before_ms <= uuid.int >> 80 <= after_ms
+
+
+def test_uuid7_time_ordered() -> None:
+    earlier = uuid7()
+    time.sleep(0.002)
+    later = uuid7()
+
+    assert earlier < later
+
+
+def test_uuid7_unique() -> None:
+    assert len({uuid7() for _ in range(10_000)}) == 10_000
@@ -20,13 +20,19 @@ def user_id() -> int:
 
 
 @pytest.fixture()
-def expected_broker_call(user_id: int, cart_id: UUID) -> dict[str, Any]:
+def cycle() -> int:
+    return fake.numeric.integer_number(start=1, end=5)
+
+
+@pytest.fixture()
+def expected_broker_call(user_id: int, cart_id: UUID, cycle: int) -> dict[str, Any]:
     return {
         "function": send_abandoned_cart_notification.__name__,
         "user_id": user_id,
         "cart_id": cart_id,
+        "cycle": cycle,
         "_job_id": str(cart_id),
-        "_queue_name": QueueNameEnum.EXAMPLE_QUEUE.value,
+        "_queue_name": QueueNameEnum.NOTIFICATIONS_QUEUE.value,
     }
 
 
@@ -43,11 +49,13 @@ async def test_ok(
     broker: AsyncMock,
     user_id: int,
     cart_id: UUID,
+    cycle: int,
     expected_broker_call: dict[str, Any],
 ) -> None:
     await producer.enqueue_abandoned_cart_notification_task(
         user_id=user_id,
         cart_id=cart_id,
+        cycle=cycle,
     )
     broker.enqueue_job.assert_awaited_once_with(**expected_broker_call)
 
@@ -67,12 +75,14 @@ async def test_failed(
     broker: AsyncMock,
     user_id: int,
     cart_id: UUID,
+    cycle: int,
     expected_broker_call: dict[str, Any],
 ) -> None:
     with pytest.raises(TaskProducingError, match="test"):
         await producer.enqueue_abandoned_cart_notification_task(
             user_id=user_id,
             cart_id=cart_id,
+            cycle=cycle,
         )
 
     broker.enqueue_job.assert_awaited_once_with(**expected_broker_call)
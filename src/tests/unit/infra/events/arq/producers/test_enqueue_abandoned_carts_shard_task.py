@@ -0,0 +1,96 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from arq.jobs import Job
+from redis.asyncio import RedisError
+
+from app.api.events.tasks.abandoned_carts import process_abandoned_carts_shard
+from app.app_layer.interfaces.tasks.exceptions import TaskProducingError
+from app.infra.events.arq.producers import ArqTaskProducer
+from app.infra.events.queues import QueueNameEnum
+
+SHARD = 1
+SHARDS_QTY = 4
+
+
+@pytest.fixture()
+def expected_broker_call() -> dict[str, Any]:
+    return {
+        "function": process_abandoned_carts_shard.__name__,
+        "shard": SHARD,
+        "shards_qty": SHARDS_QTY,
+        "updated_after": None,
+        "updated_before": None,
+        "_job_id": f"{process_abandoned_carts_shard.__name__}:{SHARD}:{SHARDS_QTY}",
+        "_queue_name": QueueNameEnum.ABANDONED_CARTS_QUEUE.value,
+    }
+
+
+@pytest.mark.parametrize(
+    "broker",
+    [
+        pytest.param({"returns": AsyncMock(spec=Job)}, id="successfully enqueued"),
+        pytest.param({"returns": None}, id="already enqueued"),
+    ],
+    indirect=True,
+)
+async def test_ok(
+    producer: ArqTaskProducer,
+    broker: AsyncMock,
+    expected_broker_call: dict[str, Any],
+) -> None:
+    await producer.enqueue_abandoned_carts_shard_task(shard=SHARD, shards_qty=SHARDS_QTY)
+    broker.enqueue_job.assert_awaited_once_with(**expected_broker_call)
+
+
+@pytest.mark.parametrize("broker", [{"returns": AsyncMock(spec=Job)}], indirect=True)
+async def test_window(
+    producer: ArqTaskProducer,
+    broker: AsyncMock,
+    expected_broker_call: dict[str, Any],
+) -> None:
+    updated_before = datetime.now()
+    updated_after = updated_before - timedelta(minutes=1)
+
+    await producer.enqueue_abandoned_carts_shard_task(
+        shard=SHARD,
+        shards_qty=SHARDS_QTY,
+        updated_after=updated_after,
+        updated_before=updated_before,
+    )
+
+    broker.enqueue_job.assert_awaited_once_with(
+        **{
+            **expected_broker_call,
+            "updated_after": updated_after,
+            "updated_before": updated_before,
+            "_job_id": f"{expected_broker_call['_job_id']}:{updated_after.isoformat()}",
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "broker",
+    [
+        pytest.param({"raises": ConnectionError("test")}, id="ConnectionError"),
+        pytest.param({"raises": OSError("test")}, id="OSError"),
+        pytest.param({"raises": RedisError("test")}, id="RedisError"),
+        pytest.param({"raises": asyncio.TimeoutError("test")}, id="asyncio.TimeoutError"),
+    ],
+    indirect=True,
+)
+async def test_failed(
+    producer: ArqTaskProducer,
+    broker: AsyncMock,
+    expected_broker_call: dict[str, Any],
+) -> None:
+    with pytest.raises(TaskProducingError, match="test"):
+        await producer.enqueue_abandoned_carts_shard_task(
+            shard=SHARD,
+            shards_qty=SHARDS_QTY,
+        )
+
+    broker.enqueue_job.assert_awaited_once_with(**expected_broker_call)
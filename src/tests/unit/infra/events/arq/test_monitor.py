@@ -0,0 +1,56 @@
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from arq import ArqRedis
+from pytest_mock import MockerFixture
+from redis.asyncio import RedisError
+
+from app.app_layer.interfaces.tasks.exceptions import TaskQueuesMonitorError
+from app.infra.events.arq.monitor import ArqTaskQueuesMonitor
+from app.infra.events.queues import QueueNameEnum
+
+
+@pytest.fixture()
+def pipeline(mocker: MockerFixture) -> MagicMock:
+    return mocker.MagicMock()
+
+
+@pytest.fixture()
+def monitor(mocker: MockerFixture, pipeline: MagicMock) -> ArqTaskQueuesMonitor:
+    broker = mocker.AsyncMock(spec=ArqRedis)
+    broker.pipeline = mocker.MagicMock()
+    broker.pipeline.return_value.__aenter__.return_value = pipeline
+
+    return ArqTaskQueuesMonitor(broker=broker)
+
+
+async def test_ok(monitor: ArqTaskQueuesMonitor, pipeline: MagicMock) -> None:
+    oldest_score = time.time() * 1000 - 2000
+    pipeline.execute = AsyncMock(
+        return_value=[
+            *(3, 2, [(b"job", oldest_score)]),
+            *(
+                value
+                for _ in range(len(QueueNameEnum) - 1)
+                for value in (1, 0, [(b"deferred", time.time() * 1000 + 10_000)])
+            ),
+        ],
+    )
+
+    stats = await monitor.get_stats()
+
+    assert [queue.name for queue in stats] == [queue.value for queue in QueueNameEnum]
+    assert (stats[0].depth, stats[0].ready_qty) == (3, 2)
+    assert stats[0].lag_sec == pytest.approx(2, abs=0.5)
+    assert all(
+        (queue.depth, queue.ready_qty, queue.lag_sec) == (1, 0, 0) for queue in stats[1:]
+    )
+    assert pipeline.zcard.call_count == len(QueueNameEnum)
+
+
+async def test_failed(monitor: ArqTaskQueuesMonitor, pipeline: MagicMock) -> None:
+    pipeline.execute = AsyncMock(side_effect=RedisError("test"))
+
+    with pytest.raises(TaskQueuesMonitorError, match="test"):
+        await monitor.get_stats()
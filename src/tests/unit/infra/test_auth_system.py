@@ -0,0 +1,206 @@
+import time
+from typing import Any
+from unittest.mock import AsyncMock
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from pydantic_core import Url
+from pytest_asyncio.plugin import SubRequest
+from pytest_mock import MockerFixture
+
+from app.app_layer.interfaces.auth_system.exceptions import (
+    InvalidAuthDataError,
+    OperationForbiddenError,
+)
+from app.config import AuthBackendEnum, AuthConfig
+from app.infra.auth_system import FakeJWTAuthSystem, JWTAuthSystem
+from app.infra.http.transports.base import HttpTransportError
+from tests.utils import fake
+
+_KID = "test-key"
+
+
+@pytest.fixture(scope="module")
+def private_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture()
+def jwks(private_key: rsa.RSAPrivateKey) -> dict[str, Any]:
+    jwk = jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    return {"keys": [{**jwk, "kid": _KID, "use": "sig", "alg": "RS256"}]}
+
+
+@pytest.fixture()
+def transport(mocker: MockerFixture, jwks: dict[str, Any]) -> AsyncMock:
+    return mocker.AsyncMock(request=mocker.AsyncMock(return_value=jwks))
+
+
+@pytest.fixture()
+def auth_system(transport: AsyncMock) -> JWTAuthSystem:
+    return JWTAuthSystem(
+        config=AuthConfig(
+            backend=AuthBackendEnum.JWT,
+            jwks_url=Url("http://auth.test/.well-known/jwks.json"),
+            audience="carts",
+        ),
+        transport=transport,
+    )
+
+
+@pytest.fixture()
+def claims(request: SubRequest) -> dict[str, Any]:
+    extra_claims = getattr(request, "param", {})
+
+    return {
+        "sub": str(fake.numeric.integer_number(start=1)),
+        "aud": "carts",
+        "exp": int(time.time()) + 60,
+        "roles": ["customer"],
+        **extra_claims,
+    }
+
+
+@pytest.fixture()
+def token(private_key: rsa.RSAPrivateKey, claims: dict[str, Any]) -> str:
+    return jwt.encode(claims, private_key, algorithm="RS256", headers={"kid": _KID})
+
+
+async def test_get_user_data(
+    auth_system: JWTAuthSystem,
+    transport: AsyncMock,
+    token: str,
+    claims: dict[str, Any],
+) -> None:
+    user = await auth_system.get_user_data(auth_data=f"Bearer {token}")
+
+    assert user.id == int(claims["sub"])
+    assert not user.is_admin
+    transport.request.assert_awaited_once()
+
+
+async def test_get_user_data_cached(
+    mocker: MockerFixture,
+    auth_system: JWTAuthSystem,
+    transport: AsyncMock,
+    token: str,
+) -> None:
+    decode = mocker.spy(jwt, "decode")
+
+    first = await auth_system.get_user_data(auth_data=f"Bearer {token}")
+    second = await auth_system.get_user_data(auth_data=f"Bearer {token}")
+
+    assert first is second
+    decode.assert_called_once()
+    transport.request.assert_awaited_once()
+
+
+async def test_get_user_data_cache_expired(
+    mocker: MockerFixture,
+    auth_system: JWTAuthSystem,
+    token: str,
+    claims: dict[str, Any],
+) -> None:
+    decode = mocker.spy(jwt, "decode")
+
+    await auth_system.get_user_data(auth_data=f"Bearer {token}")
+    mocker.patch("app.infra.auth_system.time.time", return_value=claims["exp"])
+    await auth_system.get_user_data(auth_data=f"Bearer {token}")
+
+    assert decode.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        {"exp": 0},
+        {"aud": "other"},
+        {"sub": "not-a-number"},
+    ],
+    indirect=True,
+)
+async def test_get_user_data_invalid_claims(
+    auth_system: JWTAuthSystem,
+    token: str,
+) -> None:
+    with pytest.raises(InvalidAuthDataError):
+        await auth_system.get_user_data(auth_data=f"Bearer {token}")
+
+
+@pytest.mark.parametrize("auth_data", ["token", "Bearer token"])
+async def test_get_user_data_malformed(
+    auth_system: JWTAuthSystem, auth_data: str
+) -> None:
+    with pytest.raises(InvalidAuthDataError):
+        auth_system.validate_auth_data(auth_data=auth_data)
+
+    with pytest.raises(InvalidAuthDataError):
+        await auth_system.get_user_data(auth_data=auth_data)
+
+
+async def test_get_user_data_bad_signature(
+    auth_system: JWTAuthSystem,
+    claims: dict[str, Any],
+) -> None:
+    other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    token = jwt.encode(claims, other_key, algorithm="RS256", headers={"kid": _KID})
+
+    with pytest.raises(InvalidAuthDataError):
+        await auth_system.get_user_data(auth_data=f"Bearer {token}")
+
+
+async def test_get_user_data_unknown_key(
+    auth_system: JWTAuthSystem,
+    transport: AsyncMock,
+    private_key: rsa.RSAPrivateKey,
+    claims: dict[str, Any],
+    token: str,
+) -> None:
+    await auth_system.get_user_data(auth_data=f"Bearer {token}")
+    unknown_token = jwt.encode(
+        claims, private_key, algorithm="RS256", headers={"kid": "unknown"}
+    )
+
+    with pytest.raises(InvalidAuthDataError):
+        await auth_system.get_user_data(auth_data=f"Bearer {unknown_token}")
+
+    # keys were fetched recently, so the unknown key does not trigger a refetch
+    transport.request.assert_awaited_once()
+
+
+async def test_get_user_data_keys_unavailable(
+    auth_system: JWTAuthSystem,
+    transport: AsyncMock,
+    token: str,
+) -> None:
+    transport.request.side_effect = HttpTransportError(message="Unavailable", code=503)
+
+    with pytest.raises(InvalidAuthDataError):
+        await auth_system.get_user_data(auth_data=f"Bearer {token}")
+
+
+@pytest.mark.parametrize("claims", [{"roles": ["admin"]}], indirect=True)
+async def test_check_for_admin(auth_system: JWTAuthSystem, token: str) -> None:
+    await auth_system.check_for_admin(auth_data=f"Bearer {token}")
+
+
+async def test_check_for_admin_forbidden(auth_system: JWTAuthSystem, token: str) -> None:
+    with pytest.raises(OperationForbiddenError):
+        await auth_system.check_for_admin(auth_data=f"Bearer {token}")
+
+
+@pytest.mark.parametrize(
+    ("auth_data", "user_id"),
+    [
+        ("Bearer customer.1", 1),
+        ("Bearer customer.2", 2),
+    ],
+)
+async def test_fake_auth_system_is_stateless(auth_data: str, user_id: int) -> None:
+    auth_system = FakeJWTAuthSystem()
+
+    auth_system.validate_auth_data(auth_data="Bearer admin.1")
+    user = await auth_system.get_user_data(auth_data=auth_data)
+
+    assert user.id == user_id
@@ -0,0 +1,89 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_mock import MockerFixture
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError
+
+from app.app_layer.interfaces.active_carts_cache.dto import ActiveCartDTO
+from app.config import ActiveCartsCacheConfig
+from app.infra.redis_active_carts_cache import RedisActiveCartsCache
+from tests.utils import fake
+
+
+@pytest.fixture()
+def redis(mocker: MockerFixture) -> AsyncMock:
+    mock = mocker.AsyncMock(spec=Redis)
+    mock.get = mocker.AsyncMock(return_value=None)
+    mock.set = mocker.AsyncMock()
+    mock.delete = mocker.AsyncMock()
+
+    return mock
+
+
+@pytest.fixture()
+def config() -> ActiveCartsCacheConfig:
+    return ActiveCartsCacheConfig(ttl_sec=60)
+
+
+@pytest.fixture()
+def cache(redis: AsyncMock, config: ActiveCartsCacheConfig) -> RedisActiveCartsCache:
+    return RedisActiveCartsCache(redis=redis, config=config)
+
+
+async def test_set_and_get(
+    cache: RedisActiveCartsCache,
+    redis: AsyncMock,
+    config: ActiveCartsCacheConfig,
+) -> None:
+    user_id = fake.numeric.integer_number(start=1)
+    data = ActiveCartDTO(
+        cart_id=fake.cryptographic.uuid_object(),
+        config_version=fake.numeric.integer_number(start=1),
+    )
+
+    await cache.set(user_id=user_id, data=data)
+
+    redis.set.assert_awaited_once_with(
+        f"active-cart-{user_id}", data.model_dump_json(), ex=config.ttl_sec
+    )
+
+    redis.get.return_value = data.model_dump_json().encode()
+
+    assert await cache.get(user_id=user_id) == data
+    redis.get.assert_awaited_once_with(f"active-cart-{user_id}")
+
+
+async def test_get_missing(cache: RedisActiveCartsCache) -> None:
+    assert await cache.get(user_id=fake.numeric.integer_number(start=1)) is None
+
+
+async def test_get_invalid(cache: RedisActiveCartsCache, redis: AsyncMock) -> None:
+    redis.get.return_value = str(fake.cryptographic.uuid_object()).encode()
+
+    assert await cache.get(user_id=fake.numeric.integer_number(start=1)) is None
+
+
+async def test_delete(cache: RedisActiveCartsCache, redis: AsyncMock) -> None:
+    user_id = fake.numeric.integer_number(start=1)
+
+    await cache.delete(user_id=user_id)
+
+    redis.delete.assert_awaited_once_with(f"active-cart-{user_id}")
+
+
+async def test_redis_errors_are_suppressed(
+    cache: RedisActiveCartsCache,
+    redis: AsyncMock,
+) -> None:
+    user_id = fake.numeric.integer_number(start=1)
+    redis.get.side_effect = (
+        redis.set.side_effect
+    ) = redis.delete.side_effect = ConnectionError
+
+    assert await cache.get(user_id=user_id) is None
+    await cache.set(
+        user_id=user_id,
+        data=ActiveCartDTO(cart_id=fake.cryptographic.uuid_object()),
+    )
+    await cache.delete(user_id=user_id)
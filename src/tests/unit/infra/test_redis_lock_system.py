@@ -0,0 +1,125 @@
+import asyncio
+from contextlib import AsyncExitStack
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+from redis.asyncio import Redis
+
+from app.app_layer.interfaces.distributed_lock_system.exceptions import AlreadyLockedError
+from app.config import RedisLockConfig
+from app.infra.redis_lock_system import RedisLockSystem
+from tests.utils import fake
+
+
+@pytest.fixture()
+def redis(mocker: MockerFixture) -> AsyncMock:
+    mock = mocker.AsyncMock(spec=Redis)
+    mock.register_script.return_value = mocker.AsyncMock()
+    mock.set = mocker.AsyncMock(return_value=True)
+
+    return mock
+
+
+@pytest.fixture()
+def pipeline(mocker: MockerFixture, redis: AsyncMock) -> MagicMock:
+    pipe = mocker.MagicMock()
+    redis.pipeline.return_value.__aenter__.return_value = pipe
+
+    return pipe
+
+
+@pytest.fixture()
+def lock_system(redis: AsyncMock) -> RedisLockSystem:
+    return RedisLockSystem(
+        redis=redis,
+        config=RedisLockConfig(
+            host="localhost",
+            port=6379,
+            pool_size=1,
+            ttl_sec=10,
+            wait_mode=False,
+        ),
+    )
+
+
+async def test_concurrent_locks(lock_system: RedisLockSystem, redis: AsyncMock) -> None:
+    names = [fake.text.word() + str(idx) for idx in range(3)]
+
+    async def lock(name: str) -> None:
+        async with lock_system(name=name):
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(lock(name) for name in names))
+
+    assert sorted(call.args[0] for call in redis.set.await_args_list) == sorted(names)
+
+
+async def test_many_locks_in_one_task(
+    lock_system: RedisLockSystem,
+    redis: AsyncMock,
+) -> None:
+    names = [fake.text.word() + str(idx) for idx in range(3)]
+
+    async with AsyncExitStack() as stack:
+        handles = [
+            await stack.enter_async_context(lock_system(name=name)) for name in names
+        ]
+
+    assert [handle._name for handle in handles] == names
+    assert redis.set.await_count == len(names)
+
+
+async def test_already_locked(lock_system: RedisLockSystem, redis: AsyncMock) -> None:
+    redis.set.return_value = False
+
+    with pytest.raises(AlreadyLockedError):
+        async with lock_system(name=fake.text.word()):
+            pass  # pragma: no cover
+
+
+async def test_batch_locks(
+    lock_system: RedisLockSystem,
+    redis: AsyncMock,
+    pipeline: MagicMock,
+) -> None:
+    names = [fake.text.word() + str(idx) for idx in range(3)]
+    pipeline.execute = AsyncMock(return_value=[True, None, True])
+    release_script = redis.register_script.return_value
+    release_script.return_value = 2
+
+    async with lock_system.batch(names=[*names, names[0]]) as locks:
+        assert locks.acquired == {names[0], names[2]}
+
+    assert [call.args[0] for call in pipeline.set.call_args_list] == names
+    token = pipeline.set.call_args.args[1]
+    release_script.assert_awaited_once()
+    assert set(release_script.await_args.kwargs["keys"]) == {names[0], names[2]}
+    assert release_script.await_args.kwargs["args"] == [token]
+
+
+async def test_batch_locks_none_acquired(
+    lock_system: RedisLockSystem,
+    redis: AsyncMock,
+    pipeline: MagicMock,
+) -> None:
+    pipeline.execute = AsyncMock(return_value=[None, None])
+
+    async with lock_system.batch(
+        names=[fake.text.word(), fake.text.word() + "1"]
+    ) as locks:
+        assert not locks.acquired
+
+    redis.register_script.return_value.assert_not_awaited()
+
+
+@pytest.mark.parametrize("taken", [True, None])
+async def test_lease(lock_system: RedisLockSystem, redis: AsyncMock, taken: bool) -> None:
+    name = fake.text.word()
+    redis.set.return_value = taken
+
+    assert await lock_system.lease(name=name, ttl_sec=1.5) is bool(taken)
+
+    redis.set.assert_awaited_once()
+    assert redis.set.await_args.args[0] == name
+    assert redis.set.await_args.kwargs == {"nx": True, "px": 1500}
@@ -0,0 +1,116 @@
+import asyncio
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from asyncpg import Connection, Pool
+from asyncpg.transaction import Transaction
+from pytest_mock import MockerFixture
+
+from app.infra.unit_of_work.asyncpg import AsyncpgUow
+from app.infra.unit_of_work.sqla import Uow, UowHandle
+
+
+@pytest.fixture()
+def session_factory(mocker: MockerFixture) -> MagicMock:
+    return mocker.MagicMock(side_effect=lambda: mocker.AsyncMock())
+
+
+async def test_handles_are_independent(session_factory: MagicMock) -> None:
+    uow = Uow(session_factory=session_factory)
+
+    async def enter(autocommit: bool) -> UowHandle:
+        uow_handle = uow(autocommit=autocommit)
+        async with uow_handle:
+            await asyncio.sleep(0)
+
+        return uow_handle
+
+    committed, not_committed = await asyncio.gather(enter(True), enter(False))
+    committed_session = cast(AsyncMock, committed._session)
+    not_committed_session = cast(AsyncMock, not_committed._session)
+
+    assert committed.carts is not not_committed.carts
+    committed_session.commit.assert_awaited_once()
+    not_committed_session.commit.assert_not_awaited()
+    committed_session.close.assert_awaited_once()
+    not_committed_session.close.assert_awaited_once()
+
+
+async def test_nested_handles(session_factory: MagicMock) -> None:
+    uow = Uow(session_factory=session_factory)
+
+    outer, inner = uow(autocommit=False), uow(autocommit=True)
+    async with outer:
+        async with inner:
+            pass
+
+    inner_session = cast(AsyncMock, inner._session)
+    outer_session = cast(AsyncMock, outer._session)
+
+    assert outer_session is not inner_session
+    inner_session.commit.assert_awaited_once()
+    outer_session.commit.assert_not_awaited()
+    outer_session.close.assert_awaited_once()
+
+
+@pytest.fixture()
+def pool(mocker: MockerFixture) -> MagicMock:
+    def acquire() -> MagicMock:
+        connection = mocker.MagicMock(spec=Connection)
+        transaction = connection.transaction.return_value = mocker.MagicMock(
+            spec=Transaction,
+        )
+        transaction.start = mocker.AsyncMock()
+        transaction.commit = mocker.AsyncMock()
+        transaction.rollback = mocker.AsyncMock()
+
+        return connection
+
+    mock = mocker.MagicMock(spec=Pool)
+    mock.acquire = mocker.AsyncMock(side_effect=acquire)
+    mock.release = mocker.AsyncMock()
+
+    return mock
+
+
+async def test_asyncpg_handle_commits(pool: MagicMock) -> None:
+    uow = AsyncpgUow(pool=pool)
+
+    uow_handle = uow(autocommit=True)
+    async with uow_handle:
+        transaction = uow_handle._connection.transaction.return_value
+
+    transaction.start.assert_awaited_once()
+    transaction.commit.assert_awaited_once()
+    transaction.rollback.assert_not_awaited()
+    pool.release.assert_awaited_once_with(uow_handle._connection)
+
+
+async def test_asyncpg_handle_rolls_back_not_committed(pool: MagicMock) -> None:
+    uow = AsyncpgUow(pool=pool)
+
+    uow_handle = uow(autocommit=False)
+    async with uow_handle:
+        transaction = uow_handle._connection.transaction.return_value
+
+    transaction.commit.assert_not_awaited()
+    transaction.rollback.assert_awaited_once()
+    pool.release.assert_awaited_once_with(uow_handle._connection)
+
+
+async def test_asyncpg_handle_rolls_back_on_error(pool: MagicMock) -> None:
+    uow = AsyncpgUow(pool=pool)
+    uow_handle = uow(autocommit=True)
+
+    async def fail() -> None:
+        async with uow_handle:
+            raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError, match="failed"):
+        await fail()
+
+    transaction = uow_handle._connection.transaction.return_value
+    transaction.commit.assert_not_awaited()
+    transaction.rollback.assert_awaited_once()
+    pool.release.assert_awaited_once_with(uow_handle._connection)
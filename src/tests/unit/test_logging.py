@@ -0,0 +1,151 @@
+import io
+import logging
+from contextvars import copy_context
+from types import MappingProxyType
+
+import orjson
+import pytest
+from pytest_mock import MockerFixture
+
+from app.domain.ids import uuid7
+from app.logging import (
+    ContextQueueHandler,
+    CtxJsonFormatter,
+    DebugSnapshotConfig,
+    DebugSnapshotLogger,
+    LoggingConfig,
+    ctx,
+    get_logging_config,
+    update_context,
+)
+from tests.utils import fake
+
+
+@pytest.fixture()
+def record() -> logging.LogRecord:
+    return logging.LogRecord(
+        name=fake.text.word(),
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg="Got %s",
+        args=(fake.text.word(),),
+        exc_info=None,
+    )
+
+
+async def test_update_context_merges_and_drops_empty_values() -> None:
+    cart_id = fake.cryptographic.uuid_object()
+    user_id = fake.numeric.integer_number(start=1)
+
+    async def run() -> None:
+        await update_context(cart_id=cart_id, user_id=user_id)
+        await update_context(user_id=None)
+
+        assert ctx.get() == {"cart_id": cart_id}
+        assert isinstance(ctx.get(), MappingProxyType)
+
+    await copy_context().run(run)
+
+
+def test_json_formatter(record: logging.LogRecord) -> None:
+    cart_id = fake.cryptographic.uuid_object()
+    extra_field = fake.text.word()
+    record.extra_field = extra_field
+    formatter = CtxJsonFormatter(transaction_ctx=ctx)
+
+    token = ctx.set(MappingProxyType({"cart_id": cart_id}))
+    try:
+        log_record = orjson.loads(formatter.format(record))
+    finally:
+        ctx.reset(token)
+
+    assert log_record["message"] == record.getMessage()
+    assert log_record["levelname"] == "INFO"
+    assert log_record["extra_field"] == extra_field
+    assert log_record["cart_id"] == str(cart_id)
+    assert "args" not in log_record
+    assert "msg" not in log_record
+
+
+def test_queue_handler_writes_in_listener(record: logging.LogRecord) -> None:
+    cart_id = fake.cryptographic.uuid_object()
+    stream = io.StringIO()
+    handler = ContextQueueHandler(stream=stream, transaction_ctx=ctx)
+    handler.setFormatter(CtxJsonFormatter(transaction_ctx=ctx))
+
+    token = ctx.set(MappingProxyType({"cart_id": cart_id}))
+    try:
+        handler.handle(record)
+    finally:
+        ctx.reset(token)
+    handler.close()
+
+    log_record = orjson.loads(stream.getvalue())
+
+    assert log_record["message"] == record.getMessage()
+    assert log_record["cart_id"] == str(cart_id)
+
+
+def test_get_logging_config() -> None:
+    config = get_logging_config(
+        transaction_ctx=ctx,
+        config=LoggingConfig(level="INFO", json_enabled=True),
+    )
+
+    assert config["handlers"]["console"]["()"] is ContextQueueHandler
+    assert config["handlers"]["console"]["formatter"] == "json"
+
+
+@pytest.fixture()
+def snapshot_logger() -> logging.Logger:
+    logger = logging.getLogger(fake.text.word())
+    logger.setLevel(logging.DEBUG)
+
+    return logger
+
+
+@pytest.mark.parametrize(
+    ("config", "logger_level"),
+    [
+        (DebugSnapshotConfig(enabled=False), logging.DEBUG),
+        (DebugSnapshotConfig(enabled=True), logging.INFO),
+        (DebugSnapshotConfig(enabled=True, sample_rate=0), logging.DEBUG),
+        (
+            DebugSnapshotConfig(enabled=True, cart_ids={uuid7()}),
+            logging.DEBUG,
+        ),
+    ],
+    ids=["disabled", "level", "sampled out", "cart not in subset"],
+)
+def test_debug_snapshot_is_skipped(
+    mocker: MockerFixture,
+    snapshot_logger: logging.Logger,
+    config: DebugSnapshotConfig,
+    logger_level: int,
+) -> None:
+    snapshot_logger.setLevel(logger_level)
+    payload = mocker.MagicMock()
+    log_mock = mocker.patch.object(snapshot_logger, "log")
+
+    DebugSnapshotLogger(config).log(snapshot_logger, "Got %s", payload)
+
+    payload.assert_not_called()
+    log_mock.assert_not_called()
+
+
+def test_debug_snapshot_is_truncated(
+    caplog: pytest.LogCaptureFixture,
+    snapshot_logger: logging.Logger,
+) -> None:
+    cart_id = fake.cryptographic.uuid_object()
+    config = DebugSnapshotConfig(enabled=True, max_payload_size=10, cart_ids={cart_id})
+
+    token = ctx.set(MappingProxyType({"cart_id": cart_id}))
+    try:
+        with caplog.at_level(logging.DEBUG, logger=snapshot_logger.name):
+            DebugSnapshotLogger(config).log(snapshot_logger, "Got %s", lambda: "x" * 20)
+    finally:
+        ctx.reset(token)
+
+    assert caplog.messages == [f"Got {'x' * 10}... (20 chars)"]